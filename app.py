@@ -14,8 +14,11 @@ from config_files.ui_config import (
     get_submenu_config, 
     get_menu_layout, 
     get_submenu_styles,
-    SIDEBAR_MENU_STRUCTURE
+    SIDEBAR_MENU_STRUCTURE,
+    ACCESS_LEVEL_HIERARCHY,
+    MENU_REQUIRED_ACCESS_LEVELS
 )
+from utils.permission_engine import get_permission_matrix
 
 # 환경 변수 강제 설정
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -54,7 +57,8 @@ from config.database_config import (
     get_work_status_manager,
     get_weekly_report_manager,
     get_monthly_sales_manager,
-    get_note_manager
+    get_note_manager,
+    warm_up_managers
 )
 
 # 모든 매니저들이 이제 database_config를 통해 관리됩니다 (PostgreSQL 우선)
@@ -253,68 +257,17 @@ def get_text(key, lang_dict=None, **kwargs):
 
 def check_access_level(required_level, user_access_level):
     """권한 레벨 확인 함수"""
-    access_hierarchy = {
-        'user': 1,      # 일반 직원
-        'admin': 2,     # 총무
-        'ceo': 3,       # 법인장 (CEO)
-        'master': 4     # 마스터 (전체 권한)
-    }
-    
-    user_level = access_hierarchy.get(user_access_level, 0)
-    required = access_hierarchy.get(required_level, 0)
+    user_level = ACCESS_LEVEL_HIERARCHY.get(user_access_level, 0)
+    required = ACCESS_LEVEL_HIERARCHY.get(required_level, 0)
     
     return user_level >= required
 
-def check_menu_access(menu_key, user_access_level):
-    """메뉴별 접근 권한 확인"""
-    menu_permissions = {
-        # 모든 사용자 접근 가능
-        'dashboard': 'user',
-        'work_report_management': 'user',
-        'work_status_management': 'user',
-        'personal_status': 'user',
-        'exchange_rate_management': 'user',
-        'system_guide': 'user',
-        'sales_management': 'user',
-        'product_management': 'user',
-        
-        # 총무 이상 접근 가능
-        'admin_management': 'admin',
-        
-        # 법인장과 마스터만 접근 가능
-        'executive_management': 'ceo',
-        
-        # 서브메뉴들
-        'customer_management': 'user',
-        'quotation_management': 'user',
-        'order_management': 'user',
-        'shipping_management': 'user',
-        'monthly_sales_management': 'user',
-        'business_process_v2_management': 'user',
-        'supplier_management': 'user',
-        'master_product_management': 'user',
-        'sales_product_management': 'user',
-        'supply_product_management': 'user',
-        'hr_product_registration': 'user',
-        
-        # 총무 전용 메뉴
-        'expense_request_management': 'admin',
-        'cash_flow_management': 'admin',
-        'employee_management': 'admin',
-        'asset_management': 'admin',
-        'contract_management': 'admin',
-        'schedule_task_management': 'admin',
-        'purchase_management': 'admin',
-        
-        # 법인장 전용 메뉴
-        'approval_management': 'ceo',
-        'pdf_design_management': 'ceo',
-        'system_config_management': 'ceo',
-        'backup_management': 'ceo',
-        'language_management': 'ceo'
-    }
-    
-    required_level = menu_permissions.get(menu_key, 'user')
+def check_menu_access(menu_key, user_access_level=None):
+    """메뉴별 접근 권한 확인 (현재 세션 권한 매트릭스의 메뉴 집합, 다른 레벨을 주면 레벨 비교)"""
+    permission_matrix = get_permission_matrix()
+    if user_access_level is None or user_access_level == permission_matrix.access_level:
+        return permission_matrix.can_access_menu(menu_key)
+    required_level = MENU_REQUIRED_ACCESS_LEVELS.get(menu_key, 'user')
     return check_access_level(required_level, user_access_level)
 
 def show_language_selector(location="header"):
@@ -866,45 +819,28 @@ def show_main_app(lang_dict):
         # 현재 메뉴 표시
         current_system = st.session_state.selected_system
         
-        # 메뉴 버튼들 (ui_config.py에서 가져오기)
-        from config_files.ui_config import SIDEBAR_MENU_STRUCTURE
-        menu_structure = {}
-        for key, config in SIDEBAR_MENU_STRUCTURE.items():
+        # 권한 매트릭스 (로그인당 1회 컴파일, 세션 캐싱) 기반 메뉴 필터링
+        permission_matrix = get_permission_matrix()
+        
+        for system_key in permission_matrix.visible_menus():
+            config = SIDEBAR_MENU_STRUCTURE[system_key]
             # title_key가 있으면 번역된 텍스트 사용, 없으면 기존 title 사용
             if 'title_key' in config:
-                translated_title = get_text(config['title_key'])
+                name = get_text(config['title_key'])
             else:
-                translated_title = config.get('title', key)
-            menu_structure[key] = (config['icon'], translated_title)
-        
-        # 권한 기반 메뉴 필터링
-        from config_files.ui_config import get_allowed_menus
-        access_level = st.session_state.get('access_level', 'user')
-        allowed_menus = get_allowed_menus(access_level)
-        
-        # 권한 체크 함수
-        def has_permission(system_key):
-            """사용자가 해당 시스템에 접근 권한이 있는지 확인"""
-            if not st.session_state.get('logged_in'):
-                return False
-            
-            # check_menu_access 함수 사용
-            user_access = st.session_state.get('access_level', 'user')
-            return check_menu_access(system_key, user_access)
-        
-        for system_key, (icon, name) in menu_structure.items():
-            # 권한이 있는 메뉴만 표시
-            if has_permission(system_key):
-                if system_key == current_system:
-                    st.button(f"{icon} {name}", key=f"current_{system_key}", use_container_width=True, type="primary", disabled=True)
-                else:
-                    if st.button(f"{icon} {name}", key=f"menu_{system_key}", use_container_width=True):
-                        st.session_state.selected_system = system_key
-                        # 언어 변경 직후가 아닌 경우에만 rerun
-                        if not st.session_state.get('language_just_changed', False):
-                            st.rerun()
-                        else:
-                            st.session_state.language_just_changed = False
+                name = config.get('title', system_key)
+            icon = config['icon']
+            
+            if system_key == current_system:
+                st.button(f"{icon} {name}", key=f"current_{system_key}", use_container_width=True, type="primary", disabled=True)
+            else:
+                if st.button(f"{icon} {name}", key=f"menu_{system_key}", use_container_width=True):
+                    st.session_state.selected_system = system_key
+                    # 언어 변경 직후가 아닌 경우에만 rerun
+                    if not st.session_state.get('language_just_changed', False):
+                        st.rerun()
+                    else:
+                        st.session_state.language_just_changed = False
         
         st.markdown("---")
         logout_text = get_text("logout")
@@ -1904,18 +1840,19 @@ def show_business_process_v2_page():
                 st.subheader("📊 프로세스 타입별 분포")
                 
                 # 워크플로우 타입 카운트
-                type_counts = {}
-                for workflow in workflows_df:
-                    wf_type = workflow.get('workflow_type', 'unknown')
-                    type_counts[wf_type] = type_counts.get(wf_type, 0) + 1
+                type_counts = pd.Series(
+                    [workflow.get('workflow_type', 'unknown') for workflow in workflows_df], dtype=object
+                ).value_counts().rename_axis('workflow_type').reset_index(name='count')
                 
-                if type_counts:
+                if not type_counts.empty:
                     import plotly.express as px
-                    fig = px.pie(
-                        values=list(type_counts.values()), 
-                        names=list(type_counts.keys()),
+                    from utils.chart_cache import cached_figure
+                    fig = cached_figure('workflow_type_distribution', type_counts, lambda data: px.pie(
+                        data,
+                        values='count', 
+                        names='workflow_type',
                         title="프로세스 타입별 분포"
-                    )
+                    ))
                     st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("분석할 데이터가 없습니다.")
@@ -1923,37 +1860,15 @@ def show_business_process_v2_page():
 def show_page_for_menu(system_key):
     """각 메뉴의 실제 기능 페이지를 표시합니다."""
     try:
-        # 사용자 권한 가져오기 (마스터는 모든 권한)
-        current_user_type = st.session_state.get('user_type', '')
-        current_user_id = st.session_state.get('user_id', '')
-        
-        if current_user_type == "master":
-            # 마스터 계정은 모든 권한 부여
-            user_permissions = {
-                'can_access_employee_management': True,
-                'can_access_customer_management': True,
-                'can_access_product_management': True,
-
-                'can_access_supplier_management': True,
-
-                'can_access_purchase_order_management': True,
-                'can_access_inventory_management': True,
-                'can_access_shipping_management': True,
-                'can_access_approval_management': True,
-                'can_access_monthly_sales_management': True,
-                'can_access_cash_flow_management': True,
-                'can_access_invoice_management': True,
-                'can_access_sales_product_management': True,
-                'can_access_order_management': True,
-                'can_access_exchange_rate_management': True,
-
-                'can_access_personal_status': True,
-                'can_access_vacation_management': True,
-                'can_delete_data': True
-            }
-        else:
-            # 직원 계정은 저장된 권한 사용
-            user_permissions = st.session_state.auth_manager.get_user_permissions(current_user_id, current_user_type)
+        # 사용자 권한 가져오기 (세션에 캐싱된 권한 매트릭스, 마스터는 모든 권한)
+        permission_matrix = get_permission_matrix()
+        if not permission_matrix.can_access_menu(system_key):
+            st.error("❌ 이 메뉴에 접근할 권한이 없습니다.")
+            if st.button("돌아가기", key=f"denied_back_{system_key}"):
+                st.session_state.selected_system = "dashboard"
+                st.rerun()
+            return
+        user_permissions = permission_matrix.to_dict()
         if system_key == "dashboard":
             from pages.menu_dashboard import show_main_dashboard
             
@@ -2106,8 +2021,7 @@ def show_page_for_menu(system_key):
                     st.rerun()
             
             # 법인장과 마스터만 접근 가능
-            user_access = st.session_state.get('access_level', 'user')
-            if not check_access_level('ceo', user_access):
+            if not check_menu_access("approval_management"):
                 st.error("❌ 승인관리는 법인장 이상만 접근할 수 있습니다.")
                 if st.button("돌아가기"):
                     st.session_state.selected_system = None
@@ -3031,6 +2945,12 @@ def main():
                 if st.button("로그아웃", key="emergency_logout"):
                     st.session_state.logged_in = False
                     st.rerun()
+        
+        # 첫 화면이 그려진 뒤 나머지 매니저를 백그라운드에서 병렬 초기화 (프로세스당 1회)
+        try:
+            warm_up_managers()
+        except Exception as warm_up_error:
+            print(f"⚠️ 매니저 사전 초기화 시작 실패: {warm_up_error}")
             
     except Exception as main_error:
         st.error(f"앱 실행 중 심각한 오류 발생: {main_error}")
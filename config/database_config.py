@@ -1,73 +1,64 @@
 # -*- coding: utf-8 -*-
 """
 데이터베이스 설정 및 매니저 팩토리
+
+프로세스당 하나의 백엔드(SQLite 또는 PostgreSQL)만 사용하므로 매니저 모듈은
+선택된 백엔드 계열만 필요할 때 import 하고, 매니저 인스턴스는 (백엔드, 매니저) 별로
+프로세스에서 한 번만 생성해 재사용합니다. 매니저 생성자는 테이블 DDL을 실행하므로
+호출마다 새로 만들지 않습니다.
 """
 
 import os
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-from typing import Union
-
-# SQLite 매니저들 (전체 import - 하위 호환성)
-from managers.sqlite.sqlite_employee_manager import SQLiteEmployeeManager
-from managers.sqlite.sqlite_customer_manager import SQLiteCustomerManager
-from managers.sqlite.sqlite_quotation_manager import SQLiteQuotationManager
-from managers.sqlite.sqlite_order_manager import SQLiteOrderManager
-from managers.sqlite.sqlite_product_manager import SQLiteProductManager
-from managers.sqlite.sqlite_supplier_manager import SQLiteSupplierManager
-from managers.sqlite.sqlite_auth_manager import SQLiteAuthManager
-from managers.sqlite.sqlite_approval_manager import SQLiteApprovalManager
-
-# 보조 SQLite 매니저들 (하위 호환성)
-from managers.sqlite.sqlite_cash_flow_manager import SQLiteCashFlowManager
-from managers.sqlite.sqlite_inventory_manager import SQLiteInventoryManager
-from managers.sqlite.sqlite_shipping_manager import SQLiteShippingManager
-from managers.sqlite.sqlite_invoice_manager import SQLiteInvoiceManager
-from managers.sqlite.sqlite_business_process_manager import SQLiteBusinessProcessManager
-from managers.sqlite.sqlite_expense_request_manager import SQLiteExpenseRequestManager
-from managers.sqlite.sqlite_vacation_manager import SQLiteVacationManager
-from managers.sqlite.sqlite_sales_product_manager import SQLiteSalesProductManager
-from managers.sqlite.sqlite_finished_product_manager import SQLiteFinishedProductManager
-from managers.sqlite.sqlite_cash_transaction_manager import SQLiteCashTransactionManager
-from managers.sqlite.sqlite_master_product_manager import SQLiteMasterProductManager
-from managers.sqlite.sqlite_notice_manager import SQLiteNoticeManager
-from managers.sqlite.sqlite_exchange_rate_manager import SQLiteExchangeRateManager
-from managers.sqlite.sqlite_system_config_manager import SQLiteSystemConfigManager
-from managers.sqlite.sqlite_product_code_manager import SQLiteProductCodeManager
-from managers.sqlite.sqlite_work_status_manager import SQLiteWorkStatusManager
-from managers.sqlite.sqlite_weekly_report_manager import SQLiteWeeklyReportManager
-from managers.sqlite.sqlite_monthly_sales_manager import SQLiteMonthlySalesManager
-from managers.sqlite.sqlite_note_manager import SQLiteNoteManager
-
-# PostgreSQL 매니저들 (전체 import)
-from managers.postgresql.postgresql_employee_manager import PostgreSQLEmployeeManager
-from managers.postgresql.postgresql_customer_manager import PostgreSQLCustomerManager
-from managers.postgresql.postgresql_quotation_manager import PostgreSQLQuotationManager
-from managers.postgresql.postgresql_order_manager import PostgreSQLOrderManager
-from managers.postgresql.postgresql_product_manager import PostgreSQLProductManager
-from managers.postgresql.postgresql_supplier_manager import PostgreSQLSupplierManager
-from managers.postgresql.postgresql_auth_manager import PostgreSQLAuthManager
-from managers.postgresql.postgresql_approval_manager import PostgreSQLApprovalManager
-
-# 보조 PostgreSQL 매니저들
-from managers.postgresql.postgresql_cash_flow_manager import PostgreSQLCashFlowManager
-from managers.postgresql.postgresql_inventory_manager import PostgreSQLInventoryManager
-from managers.postgresql.postgresql_shipping_manager import PostgreSQLShippingManager
-from managers.postgresql.postgresql_invoice_manager import PostgreSQLInvoiceManager
-from managers.postgresql.postgresql_business_process_manager import PostgreSQLBusinessProcessManager
-from managers.postgresql.postgresql_expense_request_manager import PostgreSQLExpenseRequestManager
-from managers.postgresql.postgresql_vacation_manager import PostgreSQLVacationManager
-from managers.postgresql.postgresql_sales_product_manager import PostgreSQLSalesProductManager
-from managers.postgresql.postgresql_finished_product_manager import PostgreSQLFinishedProductManager
-from managers.postgresql.postgresql_cash_transaction_manager import PostgreSQLCashTransactionManager
-from managers.postgresql.postgresql_master_product_manager import PostgreSQLMasterProductManager
-from managers.postgresql.postgresql_notice_manager import PostgreSQLNoticeManager
-from managers.postgresql.postgresql_exchange_rate_manager import PostgreSQLExchangeRateManager
-from managers.postgresql.postgresql_system_config_manager import PostgreSQLSystemConfigManager
-from managers.postgresql.postgresql_product_code_manager import PostgreSQLProductCodeManager
-from managers.postgresql.postgresql_work_status_manager import PostgreSQLWorkStatusManager
-from managers.postgresql.postgresql_weekly_report_manager import PostgreSQLWeeklyReportManager
-from managers.postgresql.postgresql_monthly_sales_manager import PostgreSQLMonthlySalesManager
-from managers.postgresql.postgresql_note_manager import PostgreSQLNoteManager
+
+# 매니저 키 → 클래스 이름 접미사
+# SQLite: managers.sqlite.sqlite_<키>_manager.SQLite<접미사>Manager
+# PostgreSQL: managers.postgresql.postgresql_<키>_manager.PostgreSQL<접미사>Manager
+MANAGER_REGISTRY = {
+    'employee': 'Employee',
+    'customer': 'Customer',
+    'quotation': 'Quotation',
+    'order': 'Order',
+    'product': 'Product',
+    'supplier': 'Supplier',
+    'auth': 'Auth',
+    'approval': 'Approval',
+    'cash_flow': 'CashFlow',
+    'inventory': 'Inventory',
+    'shipping': 'Shipping',
+    'invoice': 'Invoice',
+    'business_process': 'BusinessProcess',
+    'expense_request': 'ExpenseRequest',
+    'vacation': 'Vacation',
+    'sales_product': 'SalesProduct',
+    'finished_product': 'FinishedProduct',
+    'cash_transaction': 'CashTransaction',
+    'master_product': 'MasterProduct',
+    'notice': 'Notice',
+    'exchange_rate': 'ExchangeRate',
+    'system_config': 'SystemConfig',
+    'product_code': 'ProductCode',
+    'work_status': 'WorkStatus',
+    'weekly_report': 'WeeklyReport',
+    'monthly_sales': 'MonthlySales',
+    'note': 'Note',
+}
+
+# 백엔드별 모듈 경로 / 클래스 이름 접두사
+BACKEND_FAMILIES = {
+    'sqlite': ('managers.sqlite.sqlite_{key}_manager', 'SQLite{name}Manager'),
+    'postgresql': ('managers.postgresql.postgresql_{key}_manager', 'PostgreSQL{name}Manager'),
+}
+
+# 첫 화면 이후 백그라운드에서 미리 초기화할 기본 매니저들 (자주 쓰는 순서)
+DEFAULT_WARM_UP_MANAGERS = (
+    'auth', 'employee', 'customer', 'quotation', 'product', 'master_product',
+    'approval', 'exchange_rate', 'vacation', 'supplier', 'sales_product',
+    'expense_request', 'order', 'business_process',
+)
 
 class DatabaseConfig:
     """데이터베이스 설정 관리"""
@@ -93,251 +84,261 @@ class DatabaseConfig:
             st.session_state.database_type = db_type
 
 class ManagerFactory:
-    """매니저 팩토리 클래스"""
+    """백엔드 범위 매니저 레지스트리
+
+    - 선택된 백엔드 계열의 모듈만 import
+    - (백엔드, 매니저 키) 당 인스턴스 하나를 프로세스 전역에서 메모이제이션 (스레드 안전)
+    - warm_up()으로 백그라운드 병렬 초기화
+    """
+    
+    _instances = {}
+    _classes = {}
+    _key_locks = {}
+    _registry_lock = threading.Lock()
+    _warm_up_started = set()
+    
+    @classmethod
+    def _get_key_lock(cls, cache_key):
+        """매니저별 생성 잠금 반환 (서로 다른 매니저는 동시에 생성 가능)"""
+        with cls._registry_lock:
+            lock = cls._key_locks.get(cache_key)
+            if lock is None:
+                lock = threading.Lock()
+                cls._key_locks[cache_key] = lock
+            return lock
     
     @staticmethod
-    def get_employee_manager() -> Union[SQLiteEmployeeManager, PostgreSQLEmployeeManager]:
+    def resolve_db_type(db_type: str = None):
+        """실제로 사용할 백엔드 (미지정 시 설정값, 알 수 없는 값은 sqlite)"""
+        db_type = db_type or DatabaseConfig.get_database_type()
+        return db_type if db_type in BACKEND_FAMILIES else 'sqlite'
+    
+    @classmethod
+    def get_manager_class(cls, key: str, db_type: str = None):
+        """매니저 클래스 반환 - 선택된 백엔드 모듈만 import"""
+        if key not in MANAGER_REGISTRY:
+            raise KeyError(f"알 수 없는 매니저: {key}")
+        
+        db_type = cls.resolve_db_type(db_type)
+        
+        cache_key = (db_type, key)
+        manager_class = cls._classes.get(cache_key)
+        if manager_class is None:
+            module_template, class_template = BACKEND_FAMILIES[db_type]
+            module = importlib.import_module(module_template.format(key=key))
+            manager_class = getattr(module, class_template.format(name=MANAGER_REGISTRY[key]))
+            cls._classes[cache_key] = manager_class
+        return manager_class
+    
+    @classmethod
+    def get_manager(cls, key: str, db_type: str = None):
+        """매니저 인스턴스 반환 (프로세스당 1회 생성)"""
+        db_type = cls.resolve_db_type(db_type)
+        cache_key = (db_type, key)
+        
+        manager = cls._instances.get(cache_key)
+        if manager is not None:
+            return manager
+        
+        with cls._get_key_lock(cache_key):
+            # 잠금 대기 중 다른 스레드가 생성했을 수 있음
+            manager = cls._instances.get(cache_key)
+            if manager is None:
+                manager = cls.get_manager_class(key, db_type)()
+                cls._instances[cache_key] = manager
+        return manager
+    
+    @classmethod
+    def reset(cls, db_type: str = None):
+        """메모이제이션된 인스턴스 제거 (백엔드 전환/테스트용)"""
+        if db_type is not None:
+            db_type = cls.resolve_db_type(db_type)
+        with cls._registry_lock:
+            for cache_key in list(cls._instances):
+                if db_type is None or cache_key[0] == db_type:
+                    del cls._instances[cache_key]
+            if db_type is None:
+                cls._warm_up_started.clear()
+            else:
+                cls._warm_up_started.discard(db_type)
+    
+    @classmethod
+    def warm_up(cls, keys=None, db_type: str = None, max_workers: int = 4):
+        """매니저들을 백그라운드 스레드에서 병렬로 미리 초기화
+        
+        첫 페이지 렌더링 직후 호출합니다. 백엔드는 호출 스레드(세션 상태 접근 가능)에서
+        결정해 작업 스레드로 넘깁니다. 백엔드당 한 번만 실행되며 즉시 반환합니다.
+        """
+        db_type = cls.resolve_db_type(db_type)
+        with cls._registry_lock:
+            if db_type in cls._warm_up_started:
+                return None
+            cls._warm_up_started.add(db_type)
+        
+        keys = [key for key in (keys or DEFAULT_WARM_UP_MANAGERS) if key in MANAGER_REGISTRY]
+        
+        def _warm_one(key):
+            try:
+                cls.get_manager(key, db_type)
+            except Exception as e:
+                print(f"⚠️ {key} 매니저 사전 초기화 실패: {e}")
+        
+        def _run():
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="manager-warmup") as executor:
+                list(executor.map(_warm_one, keys))
+            print(f"✅ 매니저 사전 초기화 완료 ({db_type}, {len(keys)}개)")
+            
+            # 견적서 품목 검색 인덱스도 첫 검색 전에 구축
+            if db_type == 'sqlite':
+                try:
+                    from utils.product_search_index import get_product_index
+                    get_product_index().ensure_fresh()
+                except Exception as e:
+                    print(f"⚠️ 제품 검색 인덱스 사전 구축 실패: {e}")
+            
+            # PDF 폰트/설정/스타일도 첫 출력 전에 준비
+            from utils.pdf_runtime import warm_up as warm_up_pdf_runtime
+            warm_up_pdf_runtime()
+        
+        thread = threading.Thread(target=_run, name="manager-warmup", daemon=True)
+        thread.start()
+        return thread
+    
+    @staticmethod
+    def get_employee_manager():
         """Employee 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLEmployeeManager()
-        else:
-            return SQLiteEmployeeManager()
+        return ManagerFactory.get_manager('employee')
     
     @staticmethod
-    def get_customer_manager() -> Union[SQLiteCustomerManager, PostgreSQLCustomerManager]:
+    def get_customer_manager():
         """Customer 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLCustomerManager()
-        else:
-            return SQLiteCustomerManager()
+        return ManagerFactory.get_manager('customer')
     
     @staticmethod
-    def get_quotation_manager() -> Union[SQLiteQuotationManager, PostgreSQLQuotationManager]:
+    def get_quotation_manager():
         """Quotation 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLQuotationManager()
-        else:
-            return SQLiteQuotationManager()
+        return ManagerFactory.get_manager('quotation')
     
     @staticmethod
-    def get_order_manager() -> Union[SQLiteOrderManager, PostgreSQLOrderManager]:
+    def get_order_manager():
         """Order 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLOrderManager()
-        else:
-            return SQLiteOrderManager()
+        return ManagerFactory.get_manager('order')
     
     @staticmethod
-    def get_product_manager() -> Union[SQLiteProductManager, PostgreSQLProductManager]:
+    def get_product_manager():
         """Product 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLProductManager()
-        else:
-            return SQLiteProductManager()
+        return ManagerFactory.get_manager('product')
     
     @staticmethod
-    def get_supplier_manager() -> Union[SQLiteSupplierManager, PostgreSQLSupplierManager]:
+    def get_supplier_manager():
         """Supplier 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLSupplierManager()
-        else:
-            return SQLiteSupplierManager()
+        return ManagerFactory.get_manager('supplier')
     
     @staticmethod
-    def get_auth_manager() -> Union[SQLiteAuthManager, PostgreSQLAuthManager]:
+    def get_auth_manager():
         """Auth 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLAuthManager()
-        else:
-            return SQLiteAuthManager()
+        return ManagerFactory.get_manager('auth')
     
     @staticmethod
-    def get_approval_manager() -> Union[SQLiteApprovalManager, PostgreSQLApprovalManager]:
+    def get_approval_manager():
         """Approval 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLApprovalManager()
-        else:
-            return SQLiteApprovalManager()
+        return ManagerFactory.get_manager('approval')
     
     # 보조 매니저들
     @staticmethod
     def get_cash_flow_manager():
         """Cash Flow 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLCashFlowManager()
-        else:
-            return SQLiteCashFlowManager()
+        return ManagerFactory.get_manager('cash_flow')
     
     @staticmethod
     def get_inventory_manager():
         """Inventory 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLInventoryManager()
-        else:
-            return SQLiteInventoryManager()
+        return ManagerFactory.get_manager('inventory')
     
     @staticmethod
     def get_shipping_manager():
         """Shipping 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLShippingManager()
-        else:
-            return SQLiteShippingManager()
+        return ManagerFactory.get_manager('shipping')
     
     @staticmethod
     def get_invoice_manager():
         """Invoice 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLInvoiceManager()
-        else:
-            return SQLiteInvoiceManager()
+        return ManagerFactory.get_manager('invoice')
     
     @staticmethod
     def get_business_process_manager():
         """Business Process 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLBusinessProcessManager()
-        else:
-            return SQLiteBusinessProcessManager()
+        return ManagerFactory.get_manager('business_process')
     
     @staticmethod
     def get_expense_request_manager():
         """Expense Request 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLExpenseRequestManager()
-        else:
-            return SQLiteExpenseRequestManager()
+        return ManagerFactory.get_manager('expense_request')
     
     @staticmethod
     def get_vacation_manager():
         """Vacation 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLVacationManager()
-        else:
-            return SQLiteVacationManager()
+        return ManagerFactory.get_manager('vacation')
     
     @staticmethod
     def get_sales_product_manager():
         """Sales Product 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLSalesProductManager()
-        else:
-            return SQLiteSalesProductManager()
+        return ManagerFactory.get_manager('sales_product')
     
     @staticmethod
     def get_finished_product_manager():
         """Finished Product 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLFinishedProductManager()
-        else:
-            return SQLiteFinishedProductManager()
+        return ManagerFactory.get_manager('finished_product')
     
     @staticmethod
     def get_cash_transaction_manager():
         """Cash Transaction 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLCashTransactionManager()
-        else:
-            return SQLiteCashTransactionManager()
+        return ManagerFactory.get_manager('cash_transaction')
     
     @staticmethod
     def get_master_product_manager():
         """Master Product 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLMasterProductManager()
-        else:
-            return SQLiteMasterProductManager()
+        return ManagerFactory.get_manager('master_product')
     
     @staticmethod
     def get_notice_manager():
         """Notice 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLNoticeManager()
-        else:
-            return SQLiteNoticeManager()
+        return ManagerFactory.get_manager('notice')
     
     @staticmethod
     def get_exchange_rate_manager():
         """Exchange Rate 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLExchangeRateManager()
-        else:
-            return SQLiteExchangeRateManager()
+        return ManagerFactory.get_manager('exchange_rate')
     
     @staticmethod
     def get_system_config_manager():
         """System Config 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLSystemConfigManager()
-        else:
-            return SQLiteSystemConfigManager()
+        return ManagerFactory.get_manager('system_config')
     
     @staticmethod
     def get_product_code_manager():
         """Product Code 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLProductCodeManager()
-        else:
-            return SQLiteProductCodeManager()
+        return ManagerFactory.get_manager('product_code')
     
     @staticmethod
     def get_work_status_manager():
         """Work Status 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLWorkStatusManager()
-        else:
-            return SQLiteWorkStatusManager()
+        return ManagerFactory.get_manager('work_status')
     
     @staticmethod
     def get_weekly_report_manager():
         """Weekly Report 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLWeeklyReportManager()
-        else:
-            return SQLiteWeeklyReportManager()
+        return ManagerFactory.get_manager('weekly_report')
     
     @staticmethod
     def get_monthly_sales_manager():
         """Monthly Sales 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLMonthlySalesManager()
-        else:
-            return SQLiteMonthlySalesManager()
+        return ManagerFactory.get_manager('monthly_sales')
     
     @staticmethod
     def get_note_manager():
         """Note 매니저 반환"""
-        db_type = DatabaseConfig.get_database_type()
-        if db_type == 'postgresql':
-            return PostgreSQLNoteManager()
-        else:
-            return SQLiteNoteManager()
+        return ManagerFactory.get_manager('note')
     
     @staticmethod
     def get_database_status():
@@ -391,6 +392,9 @@ def get_approval_manager():
 def get_database_status():
     return ManagerFactory.get_database_status()
 
+def warm_up_managers(keys=None):
+    return ManagerFactory.warm_up(keys)
+
 # 보조 매니저 편의 함수들
 def get_cash_flow_manager():
     return ManagerFactory.get_cash_flow_manager()
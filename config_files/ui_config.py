@@ -103,32 +103,61 @@ SIDEBAR_MENU_STRUCTURE = {
     }
 }
 
-def get_allowed_menus(access_level):
-    """사용자 권한에 따른 허용 메뉴 목록 반환"""
-    if access_level == 'master':
-        # 마스터는 모든 메뉴 접근 가능
-        return list(SIDEBAR_MENU_STRUCTURE.keys())
-    elif access_level == 'ceo':
-        # 법인장은 executive_management 포함
-        return [
-            'dashboard', 'work_report_management', 'work_status_management', 
-            'personal_status', 'exchange_rate_management', 'sales_management',
-            'product_management', 'executive_management', 'admin_management', 'system_guide'
-        ]
-    elif access_level == 'admin':
-        # 총무는 admin_management 포함, executive_management 제외
-        return [
-            'dashboard', 'work_report_management', 'work_status_management',
-            'personal_status', 'exchange_rate_management', 'sales_management',
-            'product_management', 'admin_management', 'system_guide'
-        ]
-    else:  # 'user' 또는 기타
-        # 일반 직원은 기본 메뉴만
-        return [
-            'dashboard', 'work_report_management', 'work_status_management',
-            'personal_status', 'exchange_rate_management', 'sales_management',
-            'product_management', 'system_guide'
-        ]
+# 권한 레벨 계층 (숫자가 클수록 상위 권한)
+ACCESS_LEVEL_HIERARCHY = {
+    'user': 1,      # 일반 직원
+    'admin': 2,     # 총무
+    'ceo': 3,       # 법인장 (CEO)
+    'master': 4     # 마스터 (전체 권한)
+}
+
+# 메뉴별 최소 접근 권한 레벨 (정의되지 않은 메뉴는 'user')
+MENU_REQUIRED_ACCESS_LEVELS = {
+    # 모든 사용자 접근 가능
+    'dashboard': 'user',
+    'work_report_management': 'user',
+    'work_status_management': 'user',
+    'personal_status': 'user',
+    'exchange_rate_management': 'user',
+    'system_guide': 'user',
+    'sales_management': 'user',
+    'product_management': 'user',
+    
+    # 총무 이상 접근 가능
+    'admin_management': 'admin',
+    
+    # 법인장과 마스터만 접근 가능
+    'executive_management': 'ceo',
+    
+    # 서브메뉴들
+    'customer_management': 'user',
+    'quotation_management': 'user',
+    'order_management': 'user',
+    'shipping_management': 'user',
+    'monthly_sales_management': 'user',
+    'business_process_v2_management': 'user',
+    'supplier_management': 'user',
+    'master_product_management': 'user',
+    'sales_product_management': 'user',
+    'supply_product_management': 'user',
+    'hr_product_registration': 'user',
+    
+    # 총무 전용 메뉴
+    'expense_request_management': 'admin',
+    'cash_flow_management': 'admin',
+    'employee_management': 'admin',
+    'asset_management': 'admin',
+    'contract_management': 'admin',
+    'schedule_task_management': 'admin',
+    'purchase_management': 'admin',
+    
+    # 법인장 전용 메뉴
+    'approval_management': 'ceo',
+    'pdf_design_management': 'ceo',
+    'system_config_management': 'ceo',
+    'backup_management': 'ceo',
+    'language_management': 'ceo'
+}
 
 # 개별 페이지 정의 (서브메뉴용)
 INDIVIDUAL_PAGES = {
@@ -364,16 +393,3 @@ PERMISSION_MAPPING = {
 def get_permission_mapping():
     """권한 매핑을 반환합니다."""
     return PERMISSION_MAPPING
-
-def get_allowed_menus(access_level):
-    """사용자 권한에 따른 접근 가능한 메뉴 목록을 반환합니다."""
-    EMPLOYEE_ALLOWED_MENUS = [
-        'dashboard', 'notice_management', 'work_status_management',
-        'personal_status', 'exchange_rate_management', 
-        'sales_management', 'product_management', 'admin_management'
-    ]
-    
-    if access_level == "master":
-        return list(SIDEBAR_MENU_STRUCTURE.keys())
-    else:
-        return EMPLOYEE_ALLOWED_MENUS
\ No newline at end of file
@@ -280,6 +280,10 @@ class AuthManager:
                 permissions_df = pd.concat([permissions_df, pd.DataFrame([new_permissions])], ignore_index=True)
             
             permissions_df.to_csv(self.permissions_file, index=False, encoding='utf-8-sig')
+            
+            # 세션에 캐싱된 권한 매트릭스 무효화
+            from utils.permission_engine import invalidate_permissions
+            invalidate_permissions(user_id)
             return True
         except Exception as e:
             print(f"권한 업데이트 중 오류: {e}")
@@ -133,11 +133,11 @@ class CashFlowManager:
         if len(self.cash_flow_df) == 0:
             return summary
         
-        df = self.cash_flow_df.copy()
+        df = self.cash_flow_df
         
         # Filter by date range if provided
         if start_date or end_date:
-            df['transaction_date'] = pd.to_datetime(df['transaction_date'])
+            df = self._dated_cash_flow()
             if start_date:
                 df = df[df['transaction_date'] >= start_date]
             if end_date:
@@ -161,16 +161,12 @@ class CashFlowManager:
             return []
         
         try:
-            df = self.cash_flow_df.copy()
-            # 날짜 형식을 먼저 정리
-            df['transaction_date'] = pd.to_datetime(df['transaction_date'], format='%Y-%m-%d', errors='coerce')
-            df = df.dropna(subset=['transaction_date'])
+            # 날짜를 파싱해 둔 거래 (거래가 바뀌지 않았으면 이전 결과 재사용)
+            df = self._dated_cash_flow().dropna(subset=['transaction_date'])
             
             if len(df) == 0:
                 return []
             
-            df['month'] = df['transaction_date'].dt.to_period('M')
-            
             monthly_summary = df.groupby(['month', 'transaction_type'])['amount'].sum().unstack(fill_value=0)
             monthly_summary = monthly_summary.reset_index()
             monthly_summary['month'] = monthly_summary['month'].astype(str)
@@ -189,6 +185,21 @@ class CashFlowManager:
             print(f"Error generating monthly cash flow: {e}")
             return []
     
+    def _dated_cash_flow(self):
+        """transaction_date를 datetime으로, month를 기간으로 변환한 거래 DataFrame
+
+        cash_flow_df가 교체되거나 건수가 바뀔 때만 다시 파싱합니다.
+        """
+        df = self.cash_flow_df
+        key = (id(df), len(df))
+        cached = getattr(self, '_dated_cache', None)
+        if cached is None or cached[0] != key:
+            dated = df.copy()
+            dated['transaction_date'] = pd.to_datetime(dated['transaction_date'], errors='coerce')
+            dated['month'] = dated['transaction_date'].dt.to_period('M')
+            self._dated_cache = cached = (key, dated)
+        return cached[1]
+    
     def get_all_transactions(self):
         """Get all cash flow transactions"""
         if len(self.cash_flow_df) > 0:
@@ -265,19 +276,18 @@ class CashFlowManager:
             if len(quotations_list) == 0:
                 return True
             
+            # 이미 기록된 견적서 ID (견적서마다 전체 거래 내역을 다시 검색하지 않도록 한 번만 수집)
+            recorded_ids = set(
+                self.cash_flow_df.loc[self.cash_flow_df['reference_type'] == 'quotation', 'reference_id']
+            )
+            
             # 승인된 견적서들을 수입으로 기록
             for quotation in quotations_list:
                 if quotation.get('status') == 'approved':
                     quotation_id = quotation.get('quotation_id', '')
                     total_amount = quotation.get('grand_total', 0)
                     
-                    # 이미 기록된 거래인지 확인
-                    existing = self.cash_flow_df[
-                        (self.cash_flow_df['reference_id'] == quotation_id) & 
-                        (self.cash_flow_df['reference_type'] == 'quotation')
-                    ]
-                    
-                    if len(existing) == 0 and total_amount > 0:
+                    if quotation_id not in recorded_ids and total_amount > 0:
                         # 새로운 수입 거래 기록
                         self.record_cash_flow_transaction(
                             reference_id=quotation_id,
@@ -286,6 +296,7 @@ class CashFlowManager:
                             amount=total_amount,
                             description=f'Approved quotation income: {quotation.get("quotation_title", quotation_id)}'
                         )
+                        recorded_ids.add(quotation_id)
             
             self.save_cash_flow()
             return True
@@ -428,6 +439,7 @@ class CashFlowManager:
             for key, value in updated_data.items():
                 if key in self.cash_flow_df.columns:
                     self.cash_flow_df.loc[transaction_index[0], key] = value
+            self._dated_cache = None
             
             return self.save_cash_flow()
             
@@ -1,7 +1,7 @@
 import pandas as pd
 import os
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 
 class ExchangeRateManager:
     def __init__(self):
@@ -76,101 +76,90 @@ class ExchangeRateManager:
             print(f"{date_str} 과거 환율 조회 실패: {e}")
             return None
     
-    def populate_historical_data(self):
-        """2025년 1월 1일부터 현재까지의 환율 데이터를 수집합니다."""
+    def populate_historical_data(self, start_date='2025-01-01', end_date=None, source=None,
+                                 max_workers=4, requests_per_second=5.0):
+        """2025년 1월 1일부터 현재까지의 환율 데이터를 수집합니다.
+
+        날짜별 요청은 백필 엔진에서 동시에 처리하고(체크포인트로 중단 후 재개),
+        수집이 끝나면 CSV에 한 번만 저장합니다.
+        """
+        from utils.exchange_rate_backfill import ExchangeRateBackfill, OpenExchangeRatesSource
+
         try:
-            start_date = datetime(2025, 1, 1)
-            current_date = datetime.now()
-            
-            print(f"환율 데이터 수집 시작: {start_date.strftime('%Y-%m-%d')}부터 {current_date.strftime('%Y-%m-%d')}까지")
-            
-            # 날짜별로 환율 데이터 수집
-            current = start_date
-            success_count = 0
-            
-            while current <= current_date:
-                date_str = current.strftime('%Y-%m-%d')
-                rates = self.fetch_historical_rates(date_str)
-                
-                if rates:
-                    # 환율 데이터 저장
-                    self.save_historical_rates(rates, current)
-                    success_count += 1
-                    print(f"{date_str} 환율 데이터 저장 완료")
-                else:
-                    print(f"{date_str} 환율 데이터 수집 실패")
-                
-                # 다음 날로 이동
-                current += timedelta(days=1)
-                
-                # API 호출 제한을 고려한 지연 (무료 계정은 1000회/월 제한)
-                import time
-                time.sleep(0.1)
-            
-            print(f"환율 데이터 수집 완료: 총 {success_count}일의 데이터 수집")
-            return success_count > 0
+            backfill = ExchangeRateBackfill(
+                source or OpenExchangeRatesSource(self.api_key, self.base_url),
+                max_workers=max_workers,
+                requests_per_second=requests_per_second,
+            )
+            result = backfill.run(start_date, end_date, writer=self.save_historical_rates_bulk)
+            return bool(result['rates'])
             
         except Exception as e:
             print(f"과거 환율 데이터 수집 중 오류: {e}")
             return False
     
+    # 과거 환율 저장 대상 주요 통화
+    HISTORICAL_CURRENCIES = {
+        'KRW': '대한민국 원',
+        'VND': '베트남 동', 
+        'THB': '태국 바트',
+        'CNY': '중국 위안',
+        'EUR': '유로',
+        'JPY': '일본 엔',
+        'SGD': '싱가포르 달러',
+        'MYR': '말레이시아 링깃',
+        'IDR': '인도네시아 루피아'
+    }
+    
     def save_historical_rates(self, rates, rate_date):
-        """과거 환율 데이터를 저장합니다."""
+        """과거 환율 데이터를 저장합니다. (오류는 save_historical_rates_bulk에서 출력 후 전달)"""
+        self.save_historical_rates_bulk({rate_date.strftime('%Y-%m-%d'): rates})
+    
+    def save_historical_rates_bulk(self, rates_by_date, source='OpenExchangeRates API (Historical)'):
+        """여러 날짜의 과거 환율을 CSV에 한 번에 저장합니다. {날짜: {통화: 환율}} → 저장 건수"""
         try:
-            # 주요 통화만 저장
-            target_currencies = {
-                'KRW': '대한민국 원',
-                'VND': '베트남 동', 
-                'THB': '태국 바트',
-                'CNY': '중국 위안',
-                'EUR': '유로',
-                'JPY': '일본 엔',
-                'SGD': '싱가포르 달러',
-                'MYR': '말레이시아 링깃',
-                'IDR': '인도네시아 루피아'
-            }
-            
             new_rates = []
             timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+            updated_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            for currency_code, currency_name in target_currencies.items():
-                if currency_code in rates:
-                    rate_id = f"RATE{timestamp}{currency_code}"
-                    rate_data = {
-                        'rate_id': rate_id,
-                        'currency_code': currency_code,
-                        'currency_name': currency_name,
-                        'rate': float(rates[currency_code]) if rates[currency_code] is not None else 0.0,
-                        'base_currency': 'USD',
-                        'rate_date': rate_date.strftime('%Y-%m-%d'),
-                        'source': 'OpenExchangeRates API (Historical)',
-                        'input_date': rate_date.strftime('%Y-%m-%d %H:%M:%S'),
-                        'updated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    new_rates.append(rate_data)
-            
-            if new_rates:
-                # 기존 데이터 읽기
-                if os.path.exists(self.data_file):
-                    existing_df = pd.read_csv(self.data_file, encoding='utf-8-sig')
-                else:
-                    existing_df = pd.DataFrame()
-                
-                # 새 데이터 추가
-                new_df = pd.DataFrame(new_rates)
-                combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                
-                # 중복 제거 (같은 날짜, 같은 통화)
-                combined_df = combined_df.drop_duplicates(
-                    subset=['currency_code', 'rate_date'], 
-                    keep='last'
-                )
-                
-                # 저장
-                combined_df.to_csv(self.data_file, index=False, encoding='utf-8-sig')
+            for rate_date, rates in sorted(rates_by_date.items()):
+                for currency_code, currency_name in self.HISTORICAL_CURRENCIES.items():
+                    if currency_code in rates:
+                        new_rates.append({
+                            'rate_id': f"RATE{timestamp}{rate_date.replace('-', '')}{currency_code}",
+                            'currency_code': currency_code,
+                            'currency_name': currency_name,
+                            'rate': float(rates[currency_code]) if rates[currency_code] is not None else 0.0,
+                            'base_currency': 'USD',
+                            'rate_date': rate_date,
+                            'source': source,
+                            'input_date': f"{rate_date} 00:00:00",
+                            'updated_date': updated_date
+                        })
+            
+            if not new_rates:
+                return 0
+            
+            # 기존 데이터 읽기
+            if os.path.exists(self.data_file):
+                existing_df = pd.read_csv(self.data_file, encoding='utf-8-sig')
+            else:
+                existing_df = pd.DataFrame()
+            
+            # 새 데이터 추가 후 중복 제거 (같은 날짜, 같은 통화)
+            combined_df = pd.concat([existing_df, pd.DataFrame(new_rates)], ignore_index=True)
+            combined_df = combined_df.drop_duplicates(
+                subset=['currency_code', 'rate_date'], 
+                keep='last'
+            )
+            
+            # 저장
+            combined_df.to_csv(self.data_file, index=False, encoding='utf-8-sig')
+            return len(new_rates)
                 
         except Exception as e:
             print(f"과거 환율 데이터 저장 중 오류: {e}")
+            raise
     
     def update_exchange_rates(self):
         """환율을 업데이트합니다."""
@@ -8,6 +8,9 @@ import json
 from datetime import datetime, timedelta
 from currency_helper import CurrencyHelper
 
+# 환율 데이터가 없을 때 사용하는 USD→VND 기본 환율
+DEFAULT_USD_VND_RATE = 24500
+
 class MonthlySalesManager:
     def __init__(self):
         self.data_dir = "data"
@@ -244,6 +247,23 @@ class MonthlySalesManager:
         except Exception as e:
             print(f"현금흐름 데이터 연동 오류: {str(e)}")
     
+    def _to_usd_vnd(self, amount, currency, as_of=None):
+        """금액 → (USD 금액, VND 금액) - 환율 서비스의 기준일 환율 사용, 환율이 없으면 기본값"""
+        try:
+            from utils.exchange_rate_service import get_rate_service
+            service = get_rate_service()
+            usd_vnd = service.rate('USD', 'VND', as_of) or DEFAULT_USD_VND_RATE
+            to_usd = 1.0 if currency in ('USD', 'VND') else service.rate(currency, 'USD', as_of)
+        except Exception as e:
+            print(f"환율 조회 오류: {str(e)}")
+            usd_vnd, to_usd = DEFAULT_USD_VND_RATE, None
+        
+        if currency == 'VND':
+            return amount / usd_vnd, amount
+        # 환율이 없는 기타 통화는 기존처럼 USD 금액으로 간주
+        amount_usd = amount * (to_usd or 1.0)
+        return amount_usd, amount_usd * usd_vnd
+    
     def _add_sales_from_source(self, source_type, source_id, year_month, customer_id, 
                               customer_name, product_code, product_name, category, 
                               quantity, unit_price, currency, sales_date, payment_status, sales_rep):
@@ -260,16 +280,8 @@ class MonthlySalesManager:
             if len(duplicate_check) > 0:
                 return  # 이미 존재하는 데이터
             
-            # 환율 변환
-            if currency == 'USD':
-                amount_usd = quantity * unit_price
-                amount_vnd = amount_usd * 24500
-            elif currency == 'VND':
-                amount_vnd = quantity * unit_price
-                amount_usd = amount_vnd / 24500
-            else:
-                amount_usd = quantity * unit_price
-                amount_vnd = amount_usd * 24500
+            # 환율 변환 (매출일 기준 환율)
+            amount_usd, amount_vnd = self._to_usd_vnd(quantity * unit_price, currency, sales_date)
             
             # 기본 이익률 설정
             profit_margins = {
@@ -556,17 +568,8 @@ class MonthlySalesManager:
         try:
             df = pd.read_csv(self.monthly_sales_file, encoding='utf-8')
             
-            # 환율 변환
-            if currency == 'USD':
-                amount_usd = quantity * unit_price
-                amount_vnd = amount_usd * 24500
-            elif currency == 'VND':
-                amount_vnd = quantity * unit_price
-                amount_usd = amount_vnd / 24500
-            else:
-                # 기타 통화는 USD로 변환 후 처리
-                amount_usd = quantity * unit_price
-                amount_vnd = amount_usd * 24500
+            # 환율 변환 (기타 통화는 USD 경유)
+            amount_usd, amount_vnd = self._to_usd_vnd(quantity * unit_price, currency)
             
             # 기본 이익률 설정 (카테고리별)
             profit_margins = {
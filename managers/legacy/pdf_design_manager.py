@@ -5,8 +5,20 @@ import json
 import os
 import pandas as pd
 from language_manager import LanguageManager
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase import pdfmetrics
+from utils.document_renderer import register_unicode_fonts
+from utils.pdf_runtime import load_json, SIMPLE_PDF_SETTINGS_FILE
+
+# 렌더러 클래스 (첫 PDF 생성 시 한 번만 import)
+_renderer_class = None
+
+
+def _get_renderer_class():
+    global _renderer_class
+    if _renderer_class is None:
+        from pdf_studio_modern_renderer import StudioModernPDFRenderer
+        _renderer_class = StudioModernPDFRenderer
+    return _renderer_class
+
 
 class PDFDesignManager:
     def __init__(self):
@@ -14,26 +26,8 @@ class PDFDesignManager:
         # 언어 매니저 초기화
         self.language_manager = LanguageManager()
         
-        # 유니코드 폰트 등록
-        self.unicode_font = "DejaVuSans"
-        self.unicode_font_bold = "DejaVuSans-Bold"
-        
-        try:
-            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-            font_bold_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
-            
-            if os.path.exists(font_path):
-                pdfmetrics.registerFont(TTFont(self.unicode_font, font_path))
-                print(f"Unicode font registered: {font_path}")
-            
-            if os.path.exists(font_bold_path):
-                pdfmetrics.registerFont(TTFont(self.unicode_font_bold, font_bold_path))
-                print(f"Unicode bold font registered: {font_bold_path}")
-                
-        except Exception as e:
-            print(f"폰트 등록 실패: {e}")
-            self.unicode_font = "Helvetica"
-            self.unicode_font_bold = "Helvetica-Bold"
+        # 유니코드 폰트 (프로세스당 한 번만 등록, 실패 시 Helvetica)
+        self.unicode_font, self.unicode_font_bold = register_unicode_fonts()
         
         # 회사 설정 로드
         self.load_company_settings()
@@ -81,8 +75,7 @@ class PDFDesignManager:
                 return self.language_manager.get_text(key, default or key)
             
             # Studio Modern 렌더러 사용
-            from pdf_studio_modern_renderer import StudioModernPDFRenderer
-            renderer = StudioModernPDFRenderer(
+            renderer = _get_renderer_class()(
                 self.language_manager, 
                 self.unicode_font, 
                 self.unicode_font_bold
@@ -103,14 +96,10 @@ class PDFDesignManager:
             return None
 
     def load_simple_settings(self):
-        """간단한 PDF 설정 로드"""
-        try:
-            settings_file = 'data/simple_pdf_settings.json'
-            if os.path.exists(settings_file):
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"설정 파일 로드 실패: {e}")
+        """간단한 PDF 설정 로드 (파일이 바뀌지 않았으면 파싱 결과 재사용)"""
+        settings = load_json(SIMPLE_PDF_SETTINGS_FILE)
+        if settings is not None:
+            return settings
         
         # 기본 설정 반환
         return {
@@ -143,6 +132,10 @@ class PDFDesignManager:
             
             # 저장 후 설정 다시 로드
             self.load_company_settings()
+            
+            # 회사/PDF 설정이 바뀌면 렌더링 문서 캐시 전체 무효화
+            from utils.render_cache import invalidate_all
+            invalidate_all()
             return True
             
         except Exception as e:
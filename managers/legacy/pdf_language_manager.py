@@ -248,6 +248,9 @@ class PDFLanguageManager:
                 'ko': '약관 및 조건'
             }
         }
+        
+        # get_all_texts() 결과 캐시 {언어: {키: 텍스트}}
+        self._all_texts_cache = {}
     
     def get_supported_languages(self):
         """지원되는 언어 목록을 반환합니다."""
@@ -260,11 +263,14 @@ class PDFLanguageManager:
         return key
     
     def get_all_texts(self, language='en'):
-        """특정 언어의 모든 텍스트를 딕셔너리로 반환합니다."""
-        result = {}
-        for key, translations in self.translations.items():
-            result[key] = translations.get(language, translations['en'])
-        return result
+        """특정 언어의 모든 텍스트를 딕셔너리로 반환합니다. (언어별로 한 번만 구성)"""
+        cache = self._all_texts_cache
+        if language not in cache:
+            cache[language] = {
+                key: translations.get(language, translations['en'])
+                for key, translations in self.translations.items()
+            }
+        return dict(cache[language])
     
     def validate_language(self, language):
         """언어 코드가 유효한지 확인합니다."""
@@ -272,4 +278,4 @@ class PDFLanguageManager:
     
     def get_language_name(self, language_code):
         """언어 코드에 해당하는 언어명을 반환합니다."""
-        return self.supported_languages.get(language_code, 'Unknown')
\ No newline at end of file
+        return self.supported_languages.get(language_code, 'Unknown')
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+PostgreSQL 문서 연결 인덱스 매니저 (견적서 → 주문 전용)
+조회 API는 SQLite 매니저와 같지만 연결은 견적서 → 주문만 기록됨
+
+- PostgreSQL 배송/인보이스/현금흐름 매니저는 조회 전용이라 해당 문서를 만들거나 지우는 경로가 없음
+  → 체인의 'shipment' / 'invoice' / 'cash_flow'는 항상 빈 목록
+- 주문 생성 시 같은 트랜잭션에서 link(), 주문 삭제 시 unlink_document()
+- 테이블이 처음 만들어질 때 orders.quotation_id에서 연결을 채움
+- 전체 체인을 보장하지 않으므로 MANAGER_REGISTRY에는 등록하지 않고
+  get_document_link_manager()로만 사용
+"""
+
+import threading
+
+from .base_postgresql_manager import BasePostgreSQLManager
+
+CHAIN_TYPES = ('order', 'shipment', 'invoice', 'cash_flow')
+MAX_CHAIN_DEPTH = 8
+
+_LINK_INSERT_SQL = """
+    INSERT INTO document_links (source_type, source_id, target_type, target_id, relation)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (source_type, source_id, target_type, target_id) DO NOTHING
+"""
+
+_shared_manager = None
+_shared_lock = threading.Lock()
+
+
+def get_document_link_manager():
+    """프로세스 공유 인스턴스 (테이블 초기화 DDL은 처음 한 번만 실행)"""
+    global _shared_manager
+    if _shared_manager is None:
+        with _shared_lock:
+            if _shared_manager is None:
+                _shared_manager = PostgreSQLDocumentLinkManager()
+    return _shared_manager
+
+
+class PostgreSQLDocumentLinkManager(BasePostgreSQLManager):
+    """PostgreSQL 문서 연결 인덱스 조회/관리"""
+
+    def __init__(self):
+        super().__init__()
+        self.init_tables()
+
+    def init_tables(self):
+        """문서 연결 테이블 초기화"""
+        try:
+            created = not self.table_exists('document_links')
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS document_links (
+                        id SERIAL PRIMARY KEY,
+                        source_type VARCHAR(20) NOT NULL,
+                        source_id VARCHAR(100) NOT NULL,
+                        target_type VARCHAR(20) NOT NULL,
+                        target_id VARCHAR(100) NOT NULL,
+                        relation VARCHAR(20),
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(source_type, source_id, target_type, target_id)
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_document_links_target
+                    ON document_links(target_type, target_id)
+                """)
+                conn.commit()
+                self.log_info("문서 연결 테이블 초기화 완료")
+            if created:
+                self.backfill_links()
+        except Exception as e:
+            self.log_error(f"문서 연결 테이블 초기화 실패: {e}")
+
+    def backfill_links(self):
+        """orders.quotation_id에서 견적서 → 주문 연결 채우기 (반복 실행해도 안전)"""
+        if not self.table_exists('orders'):
+            return 0
+        try:
+            linked = self.execute_query("""
+                INSERT INTO document_links (source_type, source_id, target_type, target_id, relation)
+                SELECT 'quotation', quotation_id, 'order', order_id, 'ordered' FROM orders
+                WHERE COALESCE(quotation_id, '') != ''
+                ON CONFLICT (source_type, source_id, target_type, target_id) DO NOTHING
+            """) or 0
+        except Exception as e:
+            self.log_error(f"문서 연결 백필 오류: {e}")
+            return 0
+        if linked:
+            self.log_info(f"문서 연결 백필: {linked}건")
+        return linked
+
+    def link(self, source_type, source_id, target_type, target_id, relation=None, cursor=None):
+        """문서 연결 추가 (중복은 무시)
+
+        cursor를 주면 호출한 쪽 트랜잭션에 포함 (커밋/오류 처리는 호출한 쪽)
+        """
+        if not source_id or not target_id:
+            return False
+        params = (source_type, str(source_id), target_type, str(target_id), relation)
+        if cursor is not None:
+            cursor.execute(_LINK_INSERT_SQL, params)
+            return True
+        try:
+            self.execute_query(_LINK_INSERT_SQL, params)
+            return True
+        except Exception as e:
+            self.log_error(f"문서 연결 추가 오류: {e}")
+            return False
+
+    def unlink_document(self, doc_type, doc_id):
+        """문서 삭제 시 해당 문서의 연결 제거"""
+        try:
+            self.execute_query("""
+                DELETE FROM document_links
+                WHERE (source_type = %s AND source_id = %s) OR (target_type = %s AND target_id = %s)
+            """, (doc_type, str(doc_id), doc_type, str(doc_id)))
+            return True
+        except Exception as e:
+            self.log_error(f"문서 연결 삭제 오류: {e}")
+            return False
+
+    def get_chains(self, quotation_ids):
+        """견적서 여러 건의 하위 문서 체인 (쿼리 1회)
+
+        Returns:
+            dict: {quotation_id: {'order': [ID...], 'shipment': [...],
+                                  'invoice': [...], 'cash_flow': [...]}}
+        """
+        quotation_ids = [str(qid) for qid in dict.fromkeys(quotation_ids or []) if qid]
+        chains = {qid: {doc_type: [] for doc_type in CHAIN_TYPES} for qid in quotation_ids}
+        if not quotation_ids:
+            return chains
+
+        try:
+            rows = self.execute_query("""
+                WITH RECURSIVE chain(root_id, doc_type, doc_id, depth) AS (
+                    SELECT qid, 'quotation'::VARCHAR, qid, 0 FROM UNNEST(%s::VARCHAR[]) AS qid
+                    UNION
+                    SELECT chain.root_id, l.target_type, l.target_id, chain.depth + 1
+                    FROM chain
+                    JOIN document_links l
+                      ON l.source_type = chain.doc_type AND l.source_id = chain.doc_id
+                    WHERE chain.depth < %s
+                )
+                SELECT root_id, doc_type, doc_id, MIN(depth) AS depth
+                FROM chain
+                WHERE depth > 0
+                GROUP BY root_id, doc_type, doc_id
+                ORDER BY root_id, depth, doc_id
+            """, (quotation_ids, MAX_CHAIN_DEPTH), fetch_all=True) or []
+        except Exception as e:
+            self.log_error(f"문서 체인 조회 오류: {e}")
+            return chains
+
+        for row in rows:
+            chains[row['root_id']].setdefault(row['doc_type'], []).append(row['doc_id'])
+        return chains
+
+    def get_chain(self, quotation_id):
+        """견적서 1건의 하위 문서 체인"""
+        return self.get_chains([quotation_id]).get(
+            str(quotation_id), {doc_type: [] for doc_type in CHAIN_TYPES})
+
+    def get_root_quotation(self, doc_type, doc_id):
+        """하위 문서에서 거슬러 올라가 원본 견적서 ID 찾기 (없으면 None)"""
+        if doc_type == 'quotation':
+            return doc_id
+        try:
+            row = self.execute_query("""
+                WITH RECURSIVE ancestors(doc_type, doc_id, depth) AS (
+                    SELECT %s::VARCHAR, %s::VARCHAR, 0
+                    UNION
+                    SELECT l.source_type, l.source_id, ancestors.depth + 1
+                    FROM ancestors
+                    JOIN document_links l
+                      ON l.target_type = ancestors.doc_type AND l.target_id = ancestors.doc_id
+                    WHERE ancestors.depth < %s
+                )
+                SELECT doc_id FROM ancestors WHERE doc_type = 'quotation'
+                ORDER BY depth LIMIT 1
+            """, (doc_type, str(doc_id), MAX_CHAIN_DEPTH), fetch_one=True)
+        except Exception as e:
+            self.log_error(f"원본 견적서 조회 오류: {e}")
+            return None
+        return row['doc_id'] if row else None
+
+    def get_linked_ids(self, source_type, source_ids, target_type):
+        """직접 연결된 하위 문서 ID {source_id: [target_id...]}"""
+        source_ids = [str(sid) for sid in source_ids if sid]
+        linked = {sid: [] for sid in source_ids}
+        if not source_ids:
+            return linked
+        try:
+            rows = self.execute_query("""
+                SELECT source_id, target_id FROM document_links
+                WHERE source_type = %s AND target_type = %s
+                  AND source_id = ANY(%s::VARCHAR[])
+                ORDER BY id
+            """, (source_type, target_type, source_ids), fetch_all=True) or []
+        except Exception as e:
+            self.log_error(f"연결 문서 조회 오류: {e}")
+            return linked
+        for row in rows:
+            linked[row['source_id']].append(row['target_id'])
+        return linked
@@ -90,6 +90,11 @@ class PostgreSQLExchangeRateManager(BasePostgreSQLManager):
             self.log_error(f"통계 조회 실패: {e}")
             return {'total_count': 0}
     
+    def _invalidate_rate_service(self):
+        """환율 변경 후 공유 환율 서비스(utils.exchange_rate_service) 다시 적재 표시"""
+        from utils.exchange_rate_service import invalidate_rates, POSTGRESQL_SOURCE
+        invalidate_rates(POSTGRESQL_SOURCE)
+    
     def get_yearly_management_rates(self, year=None):
         """연간 관리 환율 조회
         
@@ -154,6 +159,7 @@ class PostgreSQLExchangeRateManager(BasePostgreSQLManager):
             
             params = (year, target_currency, rate, source, current_time, current_time)
             result = self.execute_query(query, params, fetch_one=True)
+            self._invalidate_rate_service()
             
             logger.info(f"연간 관리 환율 저장 성공: {year}년 {target_currency} = {rate}")
             return {'success': True, 'id': result['id']}
@@ -219,6 +225,7 @@ class PostgreSQLExchangeRateManager(BasePostgreSQLManager):
             rows_affected = self.execute_query(query, params)
             
             if rows_affected > 0:
+                self._invalidate_rate_service()
                 logger.info(f"연간 관리 환율 업데이트 성공: {year}년 {target_currency} = {rate}")
                 return {'success': True, 'rows_affected': rows_affected}
             else:
@@ -245,6 +252,7 @@ class PostgreSQLExchangeRateManager(BasePostgreSQLManager):
             rows_affected = self.execute_query(query, params)
             
             if rows_affected > 0:
+                self._invalidate_rate_service()
                 logger.info(f"연간 관리 환율 삭제 성공: {year}년 {target_currency}")
                 return {'success': True, 'rows_affected': rows_affected}
             else:
@@ -77,6 +77,21 @@ class PostgreSQLOfficePurchaseManager(BasePostgreSQLManager):
                 """)
                 
                 # 인덱스 생성
+                # 부서 예산 실적 집계 (SQLite budget_rollups와 같은 구조, 구매 트랜잭션 안에서 갱신)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS budget_rollups (
+                        source VARCHAR(50) NOT NULL DEFAULT '',
+                        department VARCHAR(100) NOT NULL DEFAULT '',
+                        category VARCHAR(100) NOT NULL DEFAULT '',
+                        subcategory VARCHAR(100) NOT NULL DEFAULT '',
+                        period VARCHAR(7) NOT NULL DEFAULT '',
+                        currency VARCHAR(10) NOT NULL DEFAULT '',
+                        actual_amount DECIMAL(15,2) NOT NULL DEFAULT 0,
+                        entry_count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (source, department, category, subcategory, period, currency)
+                    )
+                """)
+                
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_office_purchases_date 
                     ON office_purchases(purchase_date DESC)
@@ -240,6 +255,9 @@ class PostgreSQLOfficePurchaseManager(BasePostgreSQLManager):
                             item.get('item_notes', '')
                         ))
                 
+                if purchase_data['status'] != 'cancelled':
+                    self._record_budget_actual(cursor, purchase_data, items, 1)
+                
                 conn.commit()
                 logger.info(f"구매 기록 생성 완료: {purchase_data['purchase_id']}")
                 return True, f"구매 기록이 성공적으로 생성되었습니다. (ID: {purchase_data['purchase_id']})"
@@ -251,6 +269,35 @@ class PostgreSQLOfficePurchaseManager(BasePostgreSQLManager):
             logger.error(f"구매 기록 생성 중 오류: {e}")
             return False, f"구매 기록 생성 중 오류가 발생했습니다: {str(e)}"
     
+    def _record_budget_actual(self, cursor, purchase: Dict[str, Any], items: List[Dict[str, Any]], sign: int):
+        """부서 예산 실적 집계(PostgreSQL budget_rollups)에 구매 금액 반영 (sign: 1 = 등록, -1 = 취소/삭제)
+        
+        호출한 쪽 구매 트랜잭션의 cursor로 갱신하므로 구매 저장과 함께 커밋/롤백됨.
+        예산 카테고리는 지출요청과 같은 '사무용품', 물품 카테고리는 세부 카테고리로 집계
+        """
+        period = str(purchase.get('purchase_date') or date.today())[:7]
+        base = (purchase.get('department') or '', '사무용품')
+        rows = [
+            (*base, item.get('category') or '기타', period,
+             sign * float(item.get('total_price') or
+                          float(item.get('unit_price') or 0) * float(item.get('quantity') or 1)))
+            for item in items if item.get('item_name')
+        ]
+        if not rows:
+            rows = [(*base, '', period, sign * float(purchase.get('total_amount') or 0))]
+        
+        cursor.executemany("""
+            INSERT INTO budget_rollups
+            (source, department, category, subcategory, period, currency, actual_amount, entry_count)
+            VALUES ('office_purchase', %s, %s, %s, %s, 'VND', %s, %s)
+            ON CONFLICT (source, department, category, subcategory, period, currency) DO UPDATE SET
+                actual_amount = budget_rollups.actual_amount + EXCLUDED.actual_amount,
+                entry_count = budget_rollups.entry_count + EXCLUDED.entry_count
+        """, [(*row, sign) for row in rows])
+        cursor.execute(
+            "DELETE FROM budget_rollups WHERE source = 'office_purchase' AND entry_count <= 0"
+        )
+    
     def _validate_purchase_data(self, data: Dict[str, Any]) -> Tuple[bool, str]:
         """구매 데이터 유효성 검증"""
         required_fields = ['requester_name']
@@ -406,6 +453,14 @@ class PostgreSQLOfficePurchaseManager(BasePostgreSQLManager):
                     status_note += f" ({notes})"
                 
                 cursor.execute(update_query, (status, status_note, purchase_id))
+                
+                # 취소 ↔ 진행 상태 전환 시 예산 실적 반영/차감 (같은 트랜잭션)
+                if (old_status == 'cancelled') != (status == 'cancelled'):
+                    purchase = self.get_purchase_by_id(purchase_id)
+                    if purchase:
+                        self._record_budget_actual(cursor, purchase, purchase['items'],
+                                                   -1 if status == 'cancelled' else 1)
+                
                 conn.commit()
                 
                 logger.info(f"구매 상태 업데이트: {purchase_id} -> {status}")
@@ -666,8 +721,12 @@ class PostgreSQLOfficePurchaseManager(BasePostgreSQLManager):
                 if not result:
                     return False, "해당 구매 기록을 찾을 수 없습니다."
                 
+                purchase = self.get_purchase_by_id(purchase_id)
+                
                 # 연관된 물품들이 외래키 제약으로 자동 삭제됨 (CASCADE)
                 cursor.execute("DELETE FROM office_purchases WHERE purchase_id = %s", (purchase_id,))
+                if purchase and purchase.get('status') != 'cancelled':
+                    self._record_budget_actual(cursor, purchase, purchase['items'], -1)
                 
                 conn.commit()
                 logger.info(f"구매 기록 삭제 완료: {purchase_id}")
@@ -4,6 +4,7 @@ PostgreSQL 기반 주문 관리 시스템
 """
 
 import pandas as pd
+import psycopg2.extras
 from datetime import datetime
 import logging
 from .base_postgresql_manager import BasePostgreSQLManager
@@ -125,7 +126,8 @@ class PostgreSQLOrderManager(BasePostgreSQLManager):
             return pd.DataFrame()
     
     def add_order(self, order_data, items_data=None):
-        """새 주문을 추가합니다."""
+        """새 주문을 추가합니다. (견적서 → 주문 문서 연결은 주문 행과 같은 트랜잭션)"""
+        connection = None
         try:
             current_time = self.format_timestamp()
             
@@ -176,7 +178,17 @@ class PostgreSQLOrderManager(BasePostgreSQLManager):
                 current_time
             )
             
-            result = self.execute_query(order_query, order_params, fetch_one=True)
+            connection = self.get_connection()
+            with connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                cursor.execute(order_query, order_params)
+                result = cursor.fetchone()
+                
+                # 문서 연결 인덱스 (견적서 → 주문)
+                if order_data.get('quotation_id'):
+                    from .postgresql_document_link_manager import get_document_link_manager
+                    get_document_link_manager().link('quotation', order_data['quotation_id'], 'order',
+                                                     order_id, 'ordered', cursor=cursor)
+            connection.commit()
             
             # 주문 아이템 추가
             if items_data:
@@ -190,8 +202,13 @@ class PostgreSQLOrderManager(BasePostgreSQLManager):
             }
             
         except Exception as e:
+            if connection:
+                connection.rollback()
             logger.error(f"주문 추가 오류: {e}")
             return {'success': False, 'error': str(e)}
+        finally:
+            if connection:
+                self.return_connection(connection)
     
     def _add_order_items(self, order_id, items_data):
         """주문 아이템들을 추가합니다."""
@@ -325,6 +342,10 @@ class PostgreSQLOrderManager(BasePostgreSQLManager):
                 (order_id,)
             )
             
+            # 문서 연결 인덱스에서 주문 제거
+            from .postgresql_document_link_manager import get_document_link_manager
+            get_document_link_manager().unlink_document('order', order_id)
+            
             return {'success': True, 'rows_affected': rows_affected}
         except Exception as e:
             logger.error(f"주문 삭제 오류: {e}")
@@ -379,7 +400,7 @@ class PostgreSQLOrderManager(BasePostgreSQLManager):
                     'notes': item['notes']
                 })
             
-            # 주문 생성
+            # 주문 생성 (문서 연결 인덱스는 add_order에서 같은 트랜잭션으로 기록)
             return self.add_order(new_order_data, order_items)
             
         except Exception as e:
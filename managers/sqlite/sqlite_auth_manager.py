@@ -3,6 +3,7 @@
 SQLite 기반 인증 관리 시스템
 """
 
+import json
 import sqlite3
 import pandas as pd
 from datetime import datetime
@@ -55,6 +56,15 @@ class SQLiteAuthManager:
                 )
             ''')
             
+            # 사용자별 개별 권한 테이블 (can_* 값 JSON)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS user_permissions (
+                    user_id TEXT PRIMARY KEY,
+                    permissions TEXT NOT NULL,
+                    updated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             conn.commit()
             logger.info("인증 관련 테이블 초기화 완료")
     
@@ -442,7 +452,7 @@ class SQLiteAuthManager:
             logger.error(f"패스워드 변경 오류: {str(e)}")
             return False
     
-    def get_user_permissions(self, user_id, user_type):
+    def get_user_permissions(self, user_id, user_type='employee'):
         """사용자 권한 조회"""
         try:
             if user_type == 'master':
@@ -458,8 +468,8 @@ class SQLiteAuthManager:
                     'can_manage_system': True
                 }
             elif user_type == 'employee':
-                # 직원 기본 권한 (추후 직급/부서별로 세분화 가능)
-                return {
+                # 직원 기본 권한 + 개별 지정 권한
+                permissions = {
                     'can_manage_employees': False,
                     'can_manage_customers': True,
                     'can_manage_products': True,
@@ -469,6 +479,13 @@ class SQLiteAuthManager:
                     'can_view_reports': True,
                     'can_manage_system': False
                 }
+                with self.get_connection() as conn:
+                    row = conn.execute(
+                        "SELECT permissions FROM user_permissions WHERE user_id = ?", (str(user_id),)
+                    ).fetchone()
+                if row:
+                    permissions.update(json.loads(row['permissions']))
+                return permissions
             else:
                 return {}
                 
@@ -476,6 +493,39 @@ class SQLiteAuthManager:
             logger.error(f"권한 조회 오류: {str(e)}")
             return {}
 
+    def update_user_permissions(self, user_id, permissions):
+        """사용자 개별 권한 저장 후 세션에 캐싱된 권한 매트릭스 무효화"""
+        try:
+            values = {key: bool(value) for key, value in permissions.items() if key.startswith('can_')}
+            with self.get_connection() as conn:
+                conn.execute('''
+                    INSERT INTO user_permissions (user_id, permissions, updated_date)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(user_id) DO UPDATE SET
+                        permissions = excluded.permissions,
+                        updated_date = excluded.updated_date
+                ''', (str(user_id), json.dumps(values)))
+                conn.commit()
+            
+            from utils.permission_engine import invalidate_permissions
+            invalidate_permissions(user_id)
+            return True
+        except Exception as e:
+            logger.error(f"권한 업데이트 오류: {str(e)}")
+            return False
+    
+    def get_access_level(self, user_id):
+        """직원의 현재 권한 레벨 (없으면 None)"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT access_level FROM employees WHERE employee_id = ?", (str(user_id),)
+                ).fetchone()
+            return row['access_level'] if row else None
+        except Exception as e:
+            logger.error(f"권한 레벨 조회 오류: {str(e)}")
+            return None
+
     def get_all_users(self):
         """모든 사용자 목록 조회 (직원 + 마스터)"""
         try:
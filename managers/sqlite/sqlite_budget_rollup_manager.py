@@ -0,0 +1,432 @@
+"""
+SQLite 예산 실적 집계 (부서 × 카테고리 × 월 실적 합계)
+예산 대비 실적, 지출요청 제출 시 잔여 예산 확인, 관리 화면 요약을 집계 행 조회로 처리
+
+- budget_rollups: (출처, 부서, 카테고리, 세부 카테고리, 월, 통화)별 실적 합계와 건수
+  출처: cash_flow(현금 유출), expense_request(반려/취소 제외 지출요청), office_purchase(사무용품 구매)
+- cash_flows / expense_requests 추가·수정·삭제 시 트리거가 같은 트랜잭션 안에서 증분 갱신
+- 다른 저장소에 있는 실적(사무용품 구매 등)은 record_actuals()로 반영
+- department_budgets: 부서 × 카테고리 × 월 예산 (data/department_budgets.csv의 SQLite 버전)
+  지출요청 관리 화면에서 입력하거나 import_budgets_csv()로 CSV에서 가져옴
+"""
+
+import os
+import sqlite3
+import logging
+from datetime import datetime
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ('cash_flow', 'expense_request', 'office_purchase')
+
+# 기존 CSV 예산 파일 (budget_id, department, year, month, category, budget_amount, ...)
+DEPARTMENT_BUDGETS_CSV = os.path.join('data', 'department_budgets.csv')
+
+# 잔여 예산 계산에 포함하는 출처 (현금 유출은 지출요청/구매의 결제와 겹칠 수 있어 제외)
+COMMITTED_SOURCES = ('expense_request', 'office_purchase')
+
+# 실적에서 제외하는 지출요청 상태
+EXCLUDED_EXPENSE_STATUSES = ('rejected', '반려', 'cancelled', '취소')
+
+ROLLUP_DIMENSIONS = ('source', 'department', 'category', 'subcategory', 'period', 'currency')
+
+_ROLLUP_TABLES_SQL = (
+    f'''
+    CREATE TABLE IF NOT EXISTS budget_rollups (
+        {", ".join(f"{name} TEXT NOT NULL DEFAULT ''" for name in ROLLUP_DIMENSIONS)},
+        actual_amount REAL NOT NULL DEFAULT 0,
+        entry_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY ({", ".join(ROLLUP_DIMENSIONS)})
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_budget_rollups_department
+    ON budget_rollups (department, category, period)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS department_budgets (
+        department TEXT NOT NULL,
+        category TEXT NOT NULL,
+        period TEXT NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'VND',
+        budget_amount REAL NOT NULL DEFAULT 0,
+        notes TEXT,
+        updated_by TEXT,
+        updated_date TEXT,
+        PRIMARY KEY (department, category, period, currency)
+    )
+    ''',
+)
+
+_excluded_statuses = ", ".join(f"'{status}'" for status in EXCLUDED_EXPENSE_STATUSES)
+
+# 출처별 원본 행(NEW/OLD/테이블명) → 집계 값 식
+_SOURCE_EXPRESSIONS = {
+    'cash_flow': {
+        'table': 'cash_flows',
+        'department': "''",
+        'category': "COALESCE({row}.category, '')",
+        'subcategory': "COALESCE({row}.subcategory, '')",
+        'period': "substr({row}.transaction_date, 1, 7)",
+        'currency': "COALESCE(NULLIF({row}.currency, ''), 'VND')",
+        'amount': "COALESCE({row}.amount, 0)",
+        'counted': "{row}.flow_type = 'outflow'",
+        'columns': 'transaction_date, category, subcategory, amount, currency, flow_type',
+    },
+    'expense_request': {
+        'table': 'expense_requests',
+        'department': "COALESCE({row}.department, '')",
+        'category': "COALESCE({row}.category, '')",
+        'subcategory': "''",
+        'period': "substr(COALESCE(NULLIF({row}.expected_date, ''), {row}.request_date), 1, 7)",
+        'currency': "COALESCE(NULLIF({row}.currency, ''), 'VND')",
+        'amount': "COALESCE({row}.amount, 0)",
+        'counted': f"COALESCE({{row}}.status, '') NOT IN ({_excluded_statuses})",
+        'columns': 'department, category, expected_date, request_date, currency, amount, status',
+    },
+}
+
+
+# 트리거가 참조하지만 이전 스키마에는 없는 원본 컬럼 (초기화 순서와 무관하게 여기서 추가)
+_SOURCE_COLUMNS = {
+    'expense_request': {'department': 'TEXT'},
+}
+
+
+def _apply_sql(source, row, sign):
+    """원본 행 1건을 집계에 더하거나(sign=1) 빼는(sign=-1) SQL (트리거 본문용)"""
+    expr = {key: value.format(row=row) for key, value in _SOURCE_EXPRESSIONS[source].items()
+            if key not in ('table', 'columns')}
+    keys = [f"'{source}'", expr['department'], expr['category'], expr['subcategory'],
+            expr['period'], expr['currency']]
+    match = " AND ".join(f"{name} = {key}" for name, key in zip(ROLLUP_DIMENSIONS, keys))
+    sql = f'''
+        INSERT INTO budget_rollups ({", ".join(ROLLUP_DIMENSIONS)}, actual_amount, entry_count)
+        SELECT {", ".join(keys)}, {sign} * {expr['amount']}, {sign}
+        WHERE {expr['counted']}
+        ON CONFLICT ({", ".join(ROLLUP_DIMENSIONS)}) DO UPDATE SET
+            actual_amount = actual_amount + excluded.actual_amount,
+            entry_count = entry_count + excluded.entry_count;
+    '''
+    if sign < 0:
+        sql += f"DELETE FROM budget_rollups WHERE {match} AND entry_count <= 0;"
+    return sql
+
+
+def _source_triggers(source):
+    """출처 테이블의 추가/수정/삭제 트리거 {이름: DDL}"""
+    table = _SOURCE_EXPRESSIONS[source]['table']
+    columns = _SOURCE_EXPRESSIONS[source]['columns']
+    return {
+        f'trg_budget_rollup_{source}_insert': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_budget_rollup_{source}_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                {_apply_sql(source, "NEW", 1)}
+            END
+        ''',
+        f'trg_budget_rollup_{source}_update': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_budget_rollup_{source}_update
+            AFTER UPDATE OF {columns} ON {table}
+            BEGIN
+                {_apply_sql(source, "OLD", -1)}
+                {_apply_sql(source, "NEW", 1)}
+            END
+        ''',
+        f'trg_budget_rollup_{source}_delete': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_budget_rollup_{source}_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                {_apply_sql(source, "OLD", -1)}
+            END
+        ''',
+    }
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _ensure_source_columns(conn, source):
+    """트리거에 필요한 원본 컬럼이 없으면 추가"""
+    table = _SOURCE_EXPRESSIONS[source]['table']
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for column, column_type in _SOURCE_COLUMNS.get(source, {}).items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def ensure_budget_rollups(conn):
+    """집계/예산 테이블 생성, 존재하는 원본 테이블에 트리거 설치 (새로 설치된 출처는 다시 집계)"""
+    for sql in _ROLLUP_TABLES_SQL:
+        conn.execute(sql)
+    installed = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_budget_rollup%'")}
+
+    rebuilt = []
+    for source, expressions in _SOURCE_EXPRESSIONS.items():
+        if not _table_exists(conn, expressions['table']):
+            continue
+        _ensure_source_columns(conn, source)
+        triggers = _source_triggers(source)
+        for ddl in triggers.values():
+            conn.execute(ddl)
+        if not set(triggers) <= installed:
+            rebuild_source(conn, source)
+            rebuilt.append(source)
+    return rebuilt
+
+
+def rebuild_source(conn, source):
+    """출처 1개의 집계를 원본 테이블 전체에서 다시 계산"""
+    expressions = _SOURCE_EXPRESSIONS[source]
+    expr = {key: value.format(row=expressions['table']) for key, value in expressions.items()
+            if key not in ('table', 'columns')}
+    keys = [f"'{source}'", expr['department'], expr['category'], expr['subcategory'],
+            expr['period'], expr['currency']]
+    conn.execute("DELETE FROM budget_rollups WHERE source = ?", (source,))
+    conn.execute(f'''
+        INSERT INTO budget_rollups ({", ".join(ROLLUP_DIMENSIONS)}, actual_amount, entry_count)
+        SELECT {", ".join(keys)}, SUM({expr['amount']}), COUNT(*)
+        FROM {expressions['table']}
+        WHERE {expr['counted']}
+        GROUP BY {", ".join(keys[1:])}
+    ''')
+
+
+def apply_actuals(conn, source, entries, sign=1):
+    """외부 실적 반영 (호출한 쪽 트랜잭션에 포함)
+
+    Args:
+        entries: [{'department', 'category', 'period' 또는 'date', 'amount', 'currency', 'subcategory'}]
+        sign: 1 = 추가, -1 = 취소/삭제
+    """
+    rows = []
+    for entry in entries:
+        period = str(entry.get('period') or entry.get('date') or '')[:7]
+        if not period:
+            continue
+        rows.append((
+            source, entry.get('department') or '', entry.get('category') or '',
+            entry.get('subcategory') or '', period, entry.get('currency') or 'VND',
+            sign * float(entry.get('amount') or 0), sign,
+        ))
+    if not rows:
+        return 0
+    conn.executemany(f'''
+        INSERT INTO budget_rollups ({", ".join(ROLLUP_DIMENSIONS)}, actual_amount, entry_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT ({", ".join(ROLLUP_DIMENSIONS)}) DO UPDATE SET
+            actual_amount = actual_amount + excluded.actual_amount,
+            entry_count = entry_count + excluded.entry_count
+    ''', rows)
+    conn.execute("DELETE FROM budget_rollups WHERE source = ? AND entry_count <= 0", (source,))
+    return len(rows)
+
+
+def _period(value=None):
+    """날짜/월 값 → 'YYYY-MM' (None이면 이번 달)"""
+    if value is None:
+        return datetime.now().strftime('%Y-%m')
+    return str(value)[:7]
+
+
+def _upsert_budgets(conn, rows):
+    """예산 행 저장 (있으면 수정) - rows: (부서, 카테고리, 월, 통화, 금액, 메모, 수정자)"""
+    updated_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    conn.executemany('''
+        INSERT INTO department_budgets
+        (department, category, period, currency, budget_amount, notes, updated_by, updated_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (department, category, period, currency) DO UPDATE SET
+            budget_amount = excluded.budget_amount,
+            notes = excluded.notes,
+            updated_by = excluded.updated_by,
+            updated_date = excluded.updated_date
+    ''', [(*row, updated_date) for row in rows])
+
+
+class SQLiteBudgetRollupManager:
+    """부서 예산 / 실적 집계 조회"""
+
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+        self.init_tables()
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_tables(self):
+        with self.get_connection() as conn:
+            ensure_budget_rollups(conn)
+            conn.commit()
+
+    def rebuild(self):
+        """트리거 출처 전체 다시 집계 (외부 출처 실적은 유지)"""
+        with self.get_connection() as conn:
+            for source, expressions in _SOURCE_EXPRESSIONS.items():
+                if _table_exists(conn, expressions['table']):
+                    rebuild_source(conn, source)
+            conn.commit()
+
+    def record_actuals(self, source, entries, sign=1):
+        """외부 저장소 실적 반영 (예: 사무용품 구매 등록 +1, 취소/삭제 -1)"""
+        try:
+            with self.get_connection() as conn:
+                count = apply_actuals(conn, source, entries, sign)
+                conn.commit()
+            return count
+        except Exception as e:
+            logger.error(f"예산 실적 반영 오류: {e}")
+            return 0
+
+    # ---------- 예산 ----------
+
+    def set_department_budget(self, department, category, period, budget_amount,
+                              currency='VND', notes='', updated_by=''):
+        """부서 × 카테고리 × 월 예산 저장 (있으면 수정)"""
+        try:
+            with self.get_connection() as conn:
+                _upsert_budgets(conn, [(department, category, _period(period), currency,
+                                        float(budget_amount), notes, updated_by)])
+                conn.commit()
+            return True, "예산이 저장되었습니다."
+        except Exception as e:
+            logger.error(f"부서 예산 저장 오류: {e}")
+            return False, f"예산 저장 중 오류가 발생했습니다: {str(e)}"
+
+    def import_budgets_csv(self, path=DEPARTMENT_BUDGETS_CSV, updated_by=''):
+        """CSV 예산 가져오기 (year/month 또는 period 컬럼, currency 없으면 VND) → (성공 여부, 메시지)"""
+        try:
+            df = pd.read_csv(path, encoding='utf-8-sig', dtype=str).fillna('')
+        except FileNotFoundError:
+            return False, f"예산 파일이 없습니다: {path}"
+        except Exception as e:
+            logger.error(f"예산 CSV 읽기 오류: {e}")
+            return False, f"예산 파일을 읽을 수 없습니다: {str(e)}"
+
+        if 'period' in df.columns:
+            periods = df['period'].str.slice(0, 7)
+        elif {'year', 'month'} <= set(df.columns):
+            years = pd.to_numeric(df['year'], errors='coerce')
+            months = pd.to_numeric(df['month'], errors='coerce')
+            periods = years.astype('Int64').astype(str) + '-' + months.astype('Int64').astype(str).str.zfill(2)
+            periods = periods.where(years.notna() & months.between(1, 12), '')
+        else:
+            return False, "예산 파일에 period 또는 year/month 컬럼이 필요합니다."
+        amounts = pd.to_numeric(df.get('budget_amount', pd.Series('', index=df.index)), errors='coerce')
+        currencies = df['currency'] if 'currency' in df.columns else pd.Series('VND', index=df.index)
+
+        valid = (df.get('department', '') != '') & (df.get('category', '') != '') & (periods != '') & amounts.notna()
+        rows = [
+            (department, category, period, currency or 'VND', float(amount),
+             'CSV 가져오기', updated_by)
+            for department, category, period, currency, amount in zip(
+                df.loc[valid, 'department'], df.loc[valid, 'category'], periods[valid],
+                currencies[valid], amounts[valid])
+        ]
+        if not rows:
+            return False, "가져올 예산 행이 없습니다."
+        try:
+            with self.get_connection() as conn:
+                _upsert_budgets(conn, rows)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"예산 CSV 저장 오류: {e}")
+            return False, f"예산 저장 중 오류가 발생했습니다: {str(e)}"
+        skipped = len(df) - len(rows)
+        return True, f"예산 {len(rows)}건을 가져왔습니다." + (f" (건너뜀 {skipped}건)" if skipped else "")
+
+    # ---------- 조회 ----------
+
+    def get_actual(self, department, category, period=None, currency='VND', sources=COMMITTED_SOURCES):
+        """부서 × 카테고리 × 월 실적 합계 (기본 키 조회)"""
+        placeholders = ", ".join("?" * len(sources))
+        with self.get_connection() as conn:
+            row = conn.execute(f'''
+                SELECT COALESCE(SUM(actual_amount), 0) AS actual, COALESCE(SUM(entry_count), 0) AS count
+                FROM budget_rollups
+                WHERE source IN ({placeholders})
+                  AND department = ? AND category = ? AND period = ? AND currency = ?
+            ''', (*sources, department or '', category or '', _period(period), currency)).fetchone()
+        return {'actual': row['actual'], 'count': row['count']}
+
+    def get_remaining_budget(self, department, category, period=None, currency='VND',
+                             sources=COMMITTED_SOURCES):
+        """잔여 예산 {'budget', 'actual', 'remaining', 'has_budget'} (예산 미설정이면 has_budget=False)"""
+        period = _period(period)
+        with self.get_connection() as conn:
+            budget = conn.execute('''
+                SELECT budget_amount FROM department_budgets
+                WHERE department = ? AND category = ? AND period = ? AND currency = ?
+            ''', (department or '', category or '', period, currency)).fetchone()
+        actual = self.get_actual(department, category, period, currency, sources)['actual']
+        budget_amount = budget['budget_amount'] if budget else 0
+        return {
+            'budget': budget_amount,
+            'actual': actual,
+            'remaining': budget_amount - actual,
+            'has_budget': budget is not None,
+        }
+
+    def check_expense(self, department, category, amount, period=None, currency='VND'):
+        """지출 제출 전 잔여 예산 확인 → (통과 여부, 잔여 예산 정보)
+
+        예산이 설정되지 않은 부서/카테고리는 통과로 봅니다.
+        """
+        status = self.get_remaining_budget(department, category, period, currency)
+        status['requested'] = float(amount or 0)
+        status['remaining_after'] = status['remaining'] - status['requested']
+        passed = not status['has_budget'] or status['remaining_after'] >= 0
+        return passed, status
+
+    def get_budget_vs_actual(self, start_period, end_period=None, department=None,
+                             currency=None, sources=COMMITTED_SOURCES):
+        """부서 × 카테고리 × 월 예산 대비 실적 DataFrame (집계 행 조회)"""
+        start_period, end_period = _period(start_period), _period(end_period or start_period)
+        placeholders = ", ".join("?" * len(sources))
+        conditions, params = ["period BETWEEN ? AND ?"], [start_period, end_period]
+        if department is not None:
+            conditions.append("department = ?")
+            params.append(department)
+        if currency is not None:
+            conditions.append("currency = ?")
+            params.append(currency)
+        where = " AND ".join(conditions)
+
+        with self.get_connection() as conn:
+            df = pd.read_sql_query(f'''
+                SELECT department, category, period, currency,
+                       SUM(budgeted) AS budgeted, SUM(actual) AS actual, SUM(entry_count) AS entry_count
+                FROM (
+                    SELECT department, category, period, currency,
+                           budget_amount AS budgeted, 0 AS actual, 0 AS entry_count
+                    FROM department_budgets WHERE {where}
+                    UNION ALL
+                    SELECT department, category, period, currency,
+                           0, actual_amount, entry_count
+                    FROM budget_rollups WHERE source IN ({placeholders}) AND {where}
+                )
+                GROUP BY department, category, period, currency
+                ORDER BY period, department, category
+            ''', conn, params=params + list(sources) + params)
+
+        df['variance'] = df['actual'] - df['budgeted']
+        df['remaining'] = df['budgeted'] - df['actual']
+        df['variance_pct'] = (df['variance'] / df['budgeted'].where(df['budgeted'] != 0) * 100).fillna(0)
+        return df
+
+    def get_department_summary(self, period=None, currency='VND'):
+        """관리 화면용 부서별 월 예산/실적 요약 [{'department', 'budgeted', 'actual', 'remaining', 'count'}]"""
+        df = self.get_budget_vs_actual(period, period, currency=currency)
+        if df.empty:
+            return []
+        summary = df.groupby('department', as_index=False)[['budgeted', 'actual', 'entry_count']].sum()
+        summary['remaining'] = summary['budgeted'] - summary['actual']
+        return summary.rename(columns={'entry_count': 'count'}).to_dict('records')
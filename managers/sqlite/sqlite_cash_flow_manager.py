@@ -17,6 +17,12 @@ class SQLiteCashFlowManager:
         self.db_path = db_path
         self.init_tables()
     
+    @property
+    def ledger(self):
+        """현금 원장 (기준일 잔액, 월 마감 스냅샷)"""
+        from managers.sqlite.sqlite_cash_ledger_manager import SQLiteCashLedgerManager
+        return SQLiteCashLedgerManager(self.db_path)
+    
     def get_connection(self):
         """데이터베이스 연결 반환"""
         conn = sqlite3.connect(self.db_path)
@@ -87,6 +93,14 @@ class SQLiteCashFlowManager:
                 )
             ''')
             
+            # 계좌·통화별 누적 잔액 원장 (cash_flows 트리거로 증분 갱신)
+            from managers.sqlite.sqlite_cash_ledger_manager import ensure_ledger
+            ensure_ledger(conn)
+            
+            # 부서·카테고리·월별 실적 집계 (cash_flows 트리거로 증분 갱신)
+            from managers.sqlite.sqlite_budget_rollup_manager import ensure_budget_rollups
+            ensure_budget_rollups(conn)
+            
             conn.commit()
             logger.info("현금흐름 관련 테이블 초기화 완료")
     
@@ -142,6 +156,13 @@ class SQLiteCashFlowManager:
                     flow_data.get('notes', '')
                 ))
                 
+                # 문서 연결 인덱스 (견적서/주문/배송/인보이스 → 현금흐름)
+                reference_type = flow_data.get('reference_type', '')
+                if reference_type in ('quotation', 'order', 'shipment', 'invoice'):
+                    from managers.sqlite.sqlite_document_link_manager import link_documents
+                    link_documents(conn, reference_type, flow_data.get('reference_id'),
+                                   'cash_flow', flow_data['flow_id'], 'settled')
+                
                 conn.commit()
                 logger.info(f"현금흐름 추가 성공: {flow_data['flow_id']}")
                 return True, "현금흐름이 성공적으로 추가되었습니다."
@@ -247,7 +268,7 @@ class SQLiteCashFlowManager:
                     '''
                     params = (str(year), f"{month:02d}")
                 else:
-                    # 최근 12개월
+                    # 최근 12개월 (특정 년월과 같이 모든 상태 합계 - 원장은 확정 거래만 집계하므로 사용하지 않음)
                     query = '''
                         SELECT 
                             strftime('%Y-%m', transaction_date) as month,
@@ -267,6 +288,22 @@ class SQLiteCashFlowManager:
             logger.error(f"월별 현금흐름 조회 오류: {str(e)}")
             return pd.DataFrame()
     
+    def get_balance_as_of(self, as_of_date=None, account=None, currency=None):
+        """계좌·통화별 기준일 잔액 목록 (원장 인덱스 조회)"""
+        try:
+            return self.ledger.get_balances(as_of_date, account, currency)
+        except Exception as e:
+            logger.error(f"기준일 잔액 조회 오류: {e}")
+            return []
+    
+    def get_period_flows(self, start_period, end_period=None, account=None, currency=None):
+        """월별 기초/입금/출금/기말 잔액 ('YYYY-MM' 기간, 지난 달은 마감 스냅샷)"""
+        try:
+            return self.ledger.get_period_flows(start_period, end_period, account, currency)
+        except Exception as e:
+            logger.error(f"월별 잔액 흐름 조회 오류: {e}")
+            return pd.DataFrame()
+    
     def get_category_analysis(self, start_date=None, end_date=None):
         """카테고리별 현금흐름 분석"""
         try:
@@ -345,7 +382,7 @@ class SQLiteCashFlowManager:
             return False, f"예산 계획 추가 중 오류가 발생했습니다: {str(e)}"
     
     def get_budget_vs_actual(self, start_date, end_date):
-        """예산 대비 실적 분석"""
+        """예산 대비 실적 분석 (월 단위 기간은 월별 실적 집계 조회)"""
         try:
             with self.get_connection() as conn:
                 # 예산 조회
@@ -355,18 +392,29 @@ class SQLiteCashFlowManager:
                     WHERE period_start <= ? AND period_end >= ?
                     GROUP BY category, subcategory
                 '''
-                
-                # 실적 조회
-                actual_query = '''
-                    SELECT category, subcategory, SUM(amount) as actual
-                    FROM cash_flows
-                    WHERE DATE(transaction_date) BETWEEN ? AND ?
-                    AND flow_type = 'outflow'
-                    GROUP BY category, subcategory
-                '''
-                
                 budget_df = pd.read_sql_query(budget_query, conn, params=(start_date, end_date))
-                actual_df = pd.read_sql_query(actual_query, conn, params=(start_date, end_date))
+                
+                # 실적 조회 - 월 초~월 말 기간이면 budget_rollups, 아니면 cash_flows 직접 합계
+                start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+                if start.is_month_start and end.is_month_end:
+                    actual_query = '''
+                        SELECT NULLIF(category, '') as category, NULLIF(subcategory, '') as subcategory,
+                               SUM(actual_amount) as actual
+                        FROM budget_rollups
+                        WHERE source = 'cash_flow' AND period BETWEEN ? AND ?
+                        GROUP BY category, subcategory
+                    '''
+                    params = (start.strftime('%Y-%m'), end.strftime('%Y-%m'))
+                else:
+                    actual_query = '''
+                        SELECT category, subcategory, SUM(amount) as actual
+                        FROM cash_flows
+                        WHERE DATE(transaction_date) BETWEEN ? AND ?
+                        AND flow_type = 'outflow'
+                        GROUP BY category, subcategory
+                    '''
+                    params = (start_date, end_date)
+                actual_df = pd.read_sql_query(actual_query, conn, params=params)
                 
                 # 데이터 병합
                 result = budget_df.merge(actual_df, on=['category', 'subcategory'], how='outer').fillna(0)
@@ -386,6 +434,8 @@ class SQLiteCashFlowManager:
                 cursor = conn.execute('DELETE FROM cash_flows WHERE flow_id = ?', (flow_id,))
                 
                 if cursor.rowcount > 0:
+                    from managers.sqlite.sqlite_document_link_manager import unlink_documents
+                    unlink_documents(conn, 'cash_flow', flow_id)
                     conn.commit()
                     logger.info(f"현금흐름 삭제 성공: {flow_id}")
                     return True, "현금흐름이 성공적으로 삭제되었습니다."
@@ -488,26 +538,15 @@ class SQLiteCashFlowManager:
             logger.error(f"카테고리별 거래 조회 오류: {e}")
             return []
 
-    def get_balance_summary(self):
-        """현금 잔액 요약"""
+    def get_balance_summary(self, as_of_date=None):
+        """현금 잔액 요약 (원장 누적값, as_of_date 기준일까지)"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT 
-                        SUM(CASE WHEN flow_type = "inflow" THEN amount ELSE 0 END) as total_inflow,
-                        SUM(CASE WHEN flow_type = "outflow" THEN amount ELSE 0 END) as total_outflow,
-                        SUM(CASE WHEN flow_type = "inflow" THEN amount ELSE -amount END) as net_balance
-                    FROM cash_flows
-                    WHERE status = "confirmed"
-                """)
-                result = cursor.fetchone()
-                if result:
-                    return {
-                        "total_inflow": result["total_inflow"] or 0,
-                        "total_outflow": result["total_outflow"] or 0,
-                        "net_balance": result["net_balance"] or 0
-                    }
-                return {"total_inflow": 0, "total_outflow": 0, "net_balance": 0}
+            balances = self.ledger.get_balances(as_of_date)
+            return {
+                "total_inflow": sum(row['inflow'] for row in balances),
+                "total_outflow": sum(row['outflow'] for row in balances),
+                "net_balance": sum(row['balance'] for row in balances)
+            }
         except Exception as e:
             logger.error(f"잔액 요약 조회 오류: {e}")
             return {"total_inflow": 0, "total_outflow": 0, "net_balance": 0}
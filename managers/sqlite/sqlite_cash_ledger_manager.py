@@ -0,0 +1,369 @@
+"""
+SQLite 현금 원장 (계좌 × 통화별 누적 잔액)
+cash_flows 각 거래를 원장 행으로 보관하고 누적 입금/출금/잔액을 미리 계산
+
+- cash_flows 추가/수정/삭제 시 트리거가 같은 트랜잭션 안에서 원장 행과
+  이후 행들의 누적값을 증분 갱신 (보통 마지막에 추가되므로 뒤따르는 행 없음)
+- 기준일 잔액: (계좌, 통화, 거래일, 순번) 인덱스에서 기준일 이전 마지막 행 1건 조회 (O(log n))
+- 월 마감 스냅샷(cash_ledger_closings): 기초/입금/출금/기말 잔액, 과거 거래가 바뀌면
+  해당 월 이후 마감을 해제하고 다음 조회 때 다시 마감
+- 확정(status = 'confirmed') 거래만 잔액에 반영 (get_balance_summary와 같은 기준)
+"""
+
+import sqlite3
+import logging
+from datetime import datetime
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기준일 미지정 시 사용하는 최대 날짜 (모든 거래 포함)
+LATEST_DATE = '9999-12-31'
+
+_LEDGER_TABLES_SQL = (
+    '''
+    CREATE TABLE IF NOT EXISTS cash_ledger (
+        flow_id TEXT PRIMARY KEY,
+        account TEXT NOT NULL DEFAULT '',
+        currency TEXT NOT NULL DEFAULT 'VND',
+        entry_date TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        inflow REAL NOT NULL DEFAULT 0,
+        outflow REAL NOT NULL DEFAULT 0,
+        cumulative_inflow REAL NOT NULL DEFAULT 0,
+        cumulative_outflow REAL NOT NULL DEFAULT 0,
+        running_balance REAL NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_cash_ledger_position
+    ON cash_ledger (account, currency, entry_date, seq)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cash_ledger_accounts (
+        account TEXT NOT NULL,
+        currency TEXT NOT NULL,
+        PRIMARY KEY (account, currency)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cash_ledger_closings (
+        account TEXT NOT NULL,
+        currency TEXT NOT NULL,
+        period TEXT NOT NULL,
+        opening_balance REAL NOT NULL DEFAULT 0,
+        inflow REAL NOT NULL DEFAULT 0,
+        outflow REAL NOT NULL DEFAULT 0,
+        closing_balance REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (account, currency, period)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cash_ledger_periods (
+        period TEXT PRIMARY KEY,
+        closed_at TEXT
+    )
+    ''',
+)
+
+
+def _entry_values(row):
+    """cash_flows 행(NEW/OLD) → 원장 값 식 (계좌, 통화, 거래일, 입금, 출금)"""
+    confirmed = f"COALESCE({row}.status, '') = 'confirmed'"
+    return {
+        'account': f"COALESCE({row}.account_type, '')",
+        'currency': f"COALESCE(NULLIF({row}.currency, ''), 'VND')",
+        'entry_date': f"substr({row}.transaction_date, 1, 10)",
+        'inflow': f"(CASE WHEN {confirmed} AND {row}.flow_type = 'inflow' THEN COALESCE({row}.amount, 0) ELSE 0 END)",
+        'outflow': f"(CASE WHEN {confirmed} AND {row}.flow_type = 'outflow' THEN COALESCE({row}.amount, 0) ELSE 0 END)",
+    }
+
+
+def _shift_later_sql(row, sign):
+    """거래 1건 추가(sign=1)/제거(sign=-1) 시 같은 계좌·통화의 이후 원장 행 누적값 이동"""
+    v = _entry_values(row)
+    return f'''
+        UPDATE cash_ledger SET
+            cumulative_inflow = cumulative_inflow + {sign} * {v['inflow']},
+            cumulative_outflow = cumulative_outflow + {sign} * {v['outflow']},
+            running_balance = running_balance + {sign} * ({v['inflow']} - {v['outflow']})
+        WHERE account = {v['account']} AND currency = {v['currency']}
+          AND (entry_date, seq) > ({v['entry_date']}, {row}.id)
+          AND ({v['inflow']} != 0 OR {v['outflow']} != 0);
+        DELETE FROM cash_ledger_periods WHERE period >= substr({v['entry_date']}, 1, 7);
+    '''
+
+
+def _add_entry_sql(row):
+    """원장 행 추가 (직전 행 누적값 + 이번 거래) 후 이후 행 이동"""
+    v = _entry_values(row)
+    previous = f'''
+        (SELECT {{column}} FROM cash_ledger
+         WHERE account = {v['account']} AND currency = {v['currency']}
+           AND (entry_date, seq) < ({v['entry_date']}, {row}.id)
+         ORDER BY entry_date DESC, seq DESC LIMIT 1)
+    '''
+    return f'''
+        INSERT OR IGNORE INTO cash_ledger_accounts (account, currency)
+        VALUES ({v['account']}, {v['currency']});
+        INSERT OR REPLACE INTO cash_ledger (
+            flow_id, account, currency, entry_date, seq, inflow, outflow,
+            cumulative_inflow, cumulative_outflow, running_balance
+        ) VALUES (
+            {row}.flow_id, {v['account']}, {v['currency']}, {v['entry_date']}, {row}.id,
+            {v['inflow']}, {v['outflow']},
+            COALESCE({previous.format(column='cumulative_inflow')}, 0) + {v['inflow']},
+            COALESCE({previous.format(column='cumulative_outflow')}, 0) + {v['outflow']},
+            COALESCE({previous.format(column='running_balance')}, 0) + {v['inflow']} - {v['outflow']}
+        );
+        {_shift_later_sql(row, 1)}
+    '''
+
+
+def _remove_entry_sql(row):
+    """원장 행 제거 후 이후 행 이동"""
+    return f'''
+        DELETE FROM cash_ledger WHERE flow_id = {row}.flow_id;
+        {_shift_later_sql(row, -1)}
+    '''
+
+
+# cash_flows 변경 시 같은 트랜잭션 안에서 원장을 증분 갱신하는 트리거
+_LEDGER_TRIGGERS = {
+    'trg_cash_ledger_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_cash_ledger_insert
+        AFTER INSERT ON cash_flows
+        BEGIN
+            {_add_entry_sql("NEW")}
+        END
+    ''',
+    'trg_cash_ledger_update': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_cash_ledger_update
+        AFTER UPDATE OF flow_id, transaction_date, amount, currency, flow_type, account_type, status
+        ON cash_flows
+        BEGIN
+            {_remove_entry_sql("OLD")}
+            {_add_entry_sql("NEW")}
+        END
+    ''',
+    'trg_cash_ledger_delete': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_cash_ledger_delete
+        AFTER DELETE ON cash_flows
+        BEGIN
+            {_remove_entry_sql("OLD")}
+        END
+    ''',
+}
+
+
+def ensure_ledger(conn):
+    """원장 테이블/트리거 생성 (트리거가 새로 설치된 경우 cash_flows 전체로 원장을 만듦)"""
+    for sql in _LEDGER_TABLES_SQL:
+        conn.execute(sql)
+    installed = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_cash_ledger%'")}
+    for ddl in _LEDGER_TRIGGERS.values():
+        conn.execute(ddl)
+    if not set(_LEDGER_TRIGGERS) <= installed:
+        rebuild_ledger(conn)
+        return True
+    return False
+
+
+def rebuild_ledger(conn):
+    """cash_flows 전체에서 원장 다시 만들기 (윈도 함수로 누적값 한 번에 계산)"""
+    v = _entry_values('cash_flows')
+    conn.execute("DELETE FROM cash_ledger")
+    conn.execute("DELETE FROM cash_ledger_accounts")
+    conn.execute("DELETE FROM cash_ledger_closings")
+    conn.execute("DELETE FROM cash_ledger_periods")
+    conn.execute(f'''
+        INSERT INTO cash_ledger (
+            flow_id, account, currency, entry_date, seq, inflow, outflow,
+            cumulative_inflow, cumulative_outflow, running_balance
+        )
+        SELECT flow_id, account, currency, entry_date, seq, inflow, outflow,
+               SUM(inflow) OVER w, SUM(outflow) OVER w, SUM(inflow - outflow) OVER w
+        FROM (
+            SELECT flow_id, {v['account']} AS account, {v['currency']} AS currency,
+                   {v['entry_date']} AS entry_date, id AS seq,
+                   {v['inflow']} AS inflow, {v['outflow']} AS outflow
+            FROM cash_flows
+        )
+        WINDOW w AS (PARTITION BY account, currency ORDER BY entry_date, seq
+                     ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+    ''')
+    conn.execute('''
+        INSERT OR IGNORE INTO cash_ledger_accounts (account, currency)
+        SELECT DISTINCT account, currency FROM cash_ledger
+    ''')
+    count = conn.execute("SELECT COUNT(*) FROM cash_ledger").fetchone()[0]
+    logger.info(f"현금 원장 재구성: {count}건")
+    return count
+
+
+def _period_bounds(period):
+    """'YYYY-MM' → (월 시작일, 월 마지막일 이상 문자열)"""
+    return f"{period}-01", f"{period}-31"
+
+
+def _previous_period(period):
+    year, month = int(period[:4]), int(period[5:7])
+    return f"{year - 1}-12" if month == 1 else f"{year}-{month - 1:02d}"
+
+
+def _periods_between(start_period, end_period):
+    periods = []
+    year, month = int(start_period[:4]), int(start_period[5:7])
+    while f"{year}-{month:02d}" <= end_period:
+        periods.append(f"{year}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return periods
+
+
+# 계좌·통화별 기준일 마지막 원장 행의 누적값 (인덱스 탐색 1회씩)
+_POSITION_SQL = '''
+    SELECT a.account, a.currency,
+           COALESCE((SELECT {column} FROM cash_ledger l
+                     WHERE l.account = a.account AND l.currency = a.currency AND l.entry_date <= ?
+                     ORDER BY l.entry_date DESC, l.seq DESC LIMIT 1), 0) AS value
+    FROM cash_ledger_accounts a
+'''
+
+
+class SQLiteCashLedgerManager:
+    """현금 원장 조회 (기준일 잔액, 월 마감 스냅샷, 월별 흐름)"""
+
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def rebuild(self):
+        """원장 전체 재구성 (트리거 밖에서 cash_flows를 직접 고친 경우)"""
+        with self.get_connection() as conn:
+            count = rebuild_ledger(conn)
+            conn.commit()
+        return count
+
+    def _positions(self, conn, as_of, account=None, currency=None):
+        """{(계좌, 통화): {'inflow', 'outflow', 'balance'}} - 기준일까지 누적"""
+        conditions, params = [], []
+        if account is not None:
+            conditions.append("a.account = ?")
+            params.append(account)
+        if currency is not None:
+            conditions.append("a.currency = ?")
+            params.append(currency)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        positions = {}
+        for column, name in (('cumulative_inflow', 'inflow'), ('cumulative_outflow', 'outflow'),
+                             ('running_balance', 'balance')):
+            for row in conn.execute(_POSITION_SQL.format(column=column) + where, [as_of] + params):
+                positions.setdefault((row['account'], row['currency']), {})[name] = row['value']
+        return positions
+
+    def get_balances(self, as_of_date=None, account=None, currency=None):
+        """계좌·통화별 기준일 잔액 목록 [{'account', 'currency', 'inflow', 'outflow', 'balance'}]"""
+        as_of = str(as_of_date)[:10] if as_of_date else LATEST_DATE
+        with self.get_connection() as conn:
+            positions = self._positions(conn, as_of, account, currency)
+        return [
+            {'account': key[0], 'currency': key[1], **values}
+            for key, values in sorted(positions.items())
+        ]
+
+    def get_balance(self, as_of_date=None, account=None, currency=None):
+        """기준일 잔액 합계 (계좌/통화 미지정 시 해당 전체 합)"""
+        return sum(row['balance'] for row in self.get_balances(as_of_date, account, currency))
+
+    def close_period(self, period, conn=None):
+        """월 마감 스냅샷 저장 (period: 'YYYY-MM') - 기초/입금/출금/기말 잔액"""
+        if conn is None:
+            with self.get_connection() as conn:
+                self.close_period(period, conn)
+                conn.commit()
+            return
+
+        _, period_end = _period_bounds(period)
+        _, previous_end = _period_bounds(_previous_period(period))
+        closing = self._positions(conn, period_end)
+        opening = self._positions(conn, previous_end)
+
+        conn.execute("DELETE FROM cash_ledger_closings WHERE period = ?", (period,))
+        conn.executemany('''
+            INSERT INTO cash_ledger_closings
+            (account, currency, period, opening_balance, inflow, outflow, closing_balance)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (account, currency, period,
+             opening[(account, currency)]['balance'],
+             values['inflow'] - opening[(account, currency)]['inflow'],
+             values['outflow'] - opening[(account, currency)]['outflow'],
+             values['balance'])
+            for (account, currency), values in closing.items()
+        ])
+        conn.execute('''
+            INSERT OR REPLACE INTO cash_ledger_periods (period, closed_at) VALUES (?, ?)
+        ''', (period, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+    def get_period_flows(self, start_period, end_period=None, account=None, currency=None):
+        """월별 기초/입금/출금/기말 잔액 DataFrame
+
+        지난 달은 마감 스냅샷을 읽고(없거나 해제됐으면 이번에 마감), 이번 달은 원장에서 계산합니다.
+        """
+        current_period = datetime.now().strftime('%Y-%m')
+        end_period = end_period or current_period
+        periods = _periods_between(start_period, end_period)
+        if not periods:
+            return pd.DataFrame()
+
+        with self.get_connection() as conn:
+            closed = {row['period'] for row in conn.execute(
+                "SELECT period FROM cash_ledger_periods WHERE period BETWEEN ? AND ?",
+                (periods[0], periods[-1]))}
+            missing = [p for p in periods if p < current_period and p not in closed]
+            for period in missing:
+                self.close_period(period, conn)
+            if missing:
+                conn.commit()
+
+            conditions, params = ["period BETWEEN ? AND ?"], [periods[0], periods[-1]]
+            if account is not None:
+                conditions.append("account = ?")
+                params.append(account)
+            if currency is not None:
+                conditions.append("currency = ?")
+                params.append(currency)
+            df = pd.read_sql_query(f'''
+                SELECT period, account, currency, opening_balance, inflow, outflow, closing_balance
+                FROM cash_ledger_closings WHERE {' AND '.join(conditions)}
+            ''', conn, params=params)
+
+            # 마감 전 월(이번 달 이후)은 원장에서 바로 계산
+            open_rows = []
+            for period in (p for p in periods if p >= current_period):
+                _, period_end = _period_bounds(period)
+                _, previous_end = _period_bounds(_previous_period(period))
+                closing = self._positions(conn, period_end, account, currency)
+                opening = self._positions(conn, previous_end, account, currency)
+                for key, values in closing.items():
+                    open_rows.append({
+                        'period': period, 'account': key[0], 'currency': key[1],
+                        'opening_balance': opening[key]['balance'],
+                        'inflow': values['inflow'] - opening[key]['inflow'],
+                        'outflow': values['outflow'] - opening[key]['outflow'],
+                        'closing_balance': values['balance'],
+                    })
+
+        if open_rows:
+            df = pd.concat([df, pd.DataFrame(open_rows)], ignore_index=True)
+        if df.empty:
+            return df
+        df['net_flow'] = df['inflow'] - df['outflow']
+        return df.sort_values(['period', 'account', 'currency']).reset_index(drop=True)
@@ -0,0 +1,315 @@
+"""
+SQLite 문서 연결 인덱스 매니저
+견적서 → 주문 → 배송 → 인보이스 → 현금흐름 문서 관계를 연결 테이블 하나로 관리
+
+- 각 매니저가 문서를 생성할 때 같은 트랜잭션 안에서 link_documents()로 연결 기록
+- 재귀 CTE 한 번으로 견적서 여러 건의 전체 문서 체인 조회
+- 테이블이 처음 만들어질 때 기존 참조 컬럼(orders.quotation_id 등)에서 연결을 채움
+"""
+
+import json
+import sqlite3
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# 문서 타입 → (테이블, ID 컬럼) - 체인 조회 시 문서 행을 함께 읽을 때 사용
+DOCUMENT_TABLES = {
+    'quotation': ('quotations', 'quotation_id'),
+    'order': ('orders', 'order_id'),
+    'shipment': ('shipments', 'shipping_id'),
+    'invoice': ('invoices', 'invoice_id'),
+    'cash_flow': ('cash_flows', 'flow_id'),
+}
+CHAIN_TYPES = ('order', 'shipment', 'invoice', 'cash_flow')
+
+# 순환 연결이 있어도 끝나도록 탐색 깊이 제한
+MAX_CHAIN_DEPTH = 8
+
+_LINK_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS document_links (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source_type TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        target_type TEXT NOT NULL,
+        target_id TEXT NOT NULL,
+        relation TEXT,
+        created_at TEXT,
+        UNIQUE(source_type, source_id, target_type, target_id)
+    )
+'''
+_LINK_INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS idx_document_links_source ON document_links(source_type, source_id)',
+    'CREATE INDEX IF NOT EXISTS idx_document_links_target ON document_links(target_type, target_id)',
+)
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def ensure_link_table(conn):
+    """연결 테이블 생성 (새로 만든 경우 기존 데이터에서 연결을 채움)"""
+    if _table_exists(conn, 'document_links'):
+        return False
+    conn.execute(_LINK_TABLE_SQL)
+    for sql in _LINK_INDEX_SQL:
+        conn.execute(sql)
+    backfill_links(conn)
+    return True
+
+
+def link_documents(conn, source_type, source_id, target_type, target_id, relation=None):
+    """문서 연결 기록 (호출한 쪽 트랜잭션에 포함, 중복은 무시)"""
+    if not source_id or not target_id:
+        return
+    ensure_link_table(conn)
+    conn.execute('''
+        INSERT OR IGNORE INTO document_links
+        (source_type, source_id, target_type, target_id, relation, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', (source_type, str(source_id), target_type, str(target_id), relation,
+          datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+
+def unlink_documents(conn, doc_type, doc_id):
+    """문서 삭제 시 해당 문서가 포함된 연결 제거 (호출한 쪽 트랜잭션에 포함)"""
+    if not _table_exists(conn, 'document_links'):
+        return
+    conn.execute('''
+        DELETE FROM document_links
+        WHERE (source_type = ? AND source_id = ?) OR (target_type = ? AND target_id = ?)
+    ''', (doc_type, str(doc_id), doc_type, str(doc_id)))
+
+
+def shipment_link_source(conn, quotation_id, order_id=None):
+    """배송을 연결할 상위 문서 (source_type, source_id) - 백필과 같은 규칙
+
+    주문이 지정되면 주문, 아니면 견적서의 주문이 1건뿐일 때 그 주문, 그 외에는 견적서
+    """
+    if order_id:
+        return 'order', order_id
+    if quotation_id and _table_exists(conn, 'orders'):
+        rows = conn.execute(
+            "SELECT order_id FROM orders WHERE quotation_id = ? LIMIT 2", (str(quotation_id),)
+        ).fetchall()
+        if len(rows) == 1:
+            return 'order', rows[0][0]
+    return 'quotation', quotation_id
+
+
+def backfill_links(conn):
+    """기존 참조 컬럼에서 연결 채우기 (INSERT OR IGNORE라 반복 실행해도 안전)"""
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    sources = []
+    if _table_exists(conn, 'orders'):
+        sources.append(('''
+            SELECT 'quotation', quotation_id, 'order', order_id, 'ordered' FROM orders
+            WHERE COALESCE(quotation_id, '') != ''
+        '''))
+    if _table_exists(conn, 'shipments'):
+        # 주문이 있으면 주문 기준 (shipment_link_source와 같은 규칙)
+        order_sql = "COALESCE(s.order_id, '')" if 'order_id' in _columns(conn, 'shipments') else "''"
+        if _table_exists(conn, 'orders'):
+            single_order_sql = '''(SELECT MIN(o.order_id) FROM orders o WHERE o.quotation_id = s.quotation_id
+                                   HAVING COUNT(*) = 1)'''
+        else:
+            single_order_sql = 'NULL'
+        sources.append((f'''
+            SELECT CASE WHEN parent_order != '' THEN 'order' ELSE 'quotation' END,
+                   CASE WHEN parent_order != '' THEN parent_order ELSE quotation_id END,
+                   'shipment', shipping_id, 'shipped'
+            FROM (
+                SELECT s.shipping_id, s.quotation_id,
+                       CASE WHEN {order_sql} != '' THEN {order_sql}
+                            ELSE COALESCE({single_order_sql}, '') END AS parent_order
+                FROM shipments s
+            )
+            WHERE parent_order != '' OR COALESCE(quotation_id, '') != ''
+        '''))
+    if _table_exists(conn, 'invoices'):
+        # 주문이 있으면 주문 기준, 없으면 견적서에 직접 연결
+        sources.append(('''
+            SELECT CASE WHEN COALESCE(order_id, '') != '' THEN 'order' ELSE 'quotation' END,
+                   CASE WHEN COALESCE(order_id, '') != '' THEN order_id ELSE quotation_id END,
+                   'invoice', invoice_id, 'invoiced'
+            FROM invoices
+            WHERE COALESCE(order_id, '') != '' OR COALESCE(quotation_id, '') != ''
+        '''))
+    if _table_exists(conn, 'cash_flows') and 'reference_type' in _columns(conn, 'cash_flows'):
+        sources.append(('''
+            SELECT reference_type, reference_id, 'cash_flow', flow_id, 'settled' FROM cash_flows
+            WHERE reference_type IN ('quotation', 'order', 'shipment', 'invoice')
+              AND COALESCE(reference_id, '') != ''
+        '''))
+
+    linked = 0
+    for select_sql in sources:
+        cursor = conn.execute(f'''
+            INSERT OR IGNORE INTO document_links
+            (source_type, source_id, target_type, target_id, relation, created_at)
+            SELECT *, ? FROM ({select_sql})
+        ''', (now,))
+        linked += max(cursor.rowcount, 0)
+    if linked:
+        logger.info(f"문서 연결 백필: {linked}건")
+    return linked
+
+
+class SQLiteDocumentLinkManager:
+    """문서 연결 인덱스 조회/관리"""
+
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+        self.init_tables()
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_tables(self):
+        with self.get_connection() as conn:
+            ensure_link_table(conn)
+            conn.commit()
+
+    def link(self, source_type, source_id, target_type, target_id, relation=None):
+        """문서 연결 추가 (별도 트랜잭션)"""
+        try:
+            with self.get_connection() as conn:
+                link_documents(conn, source_type, source_id, target_type, target_id, relation)
+                conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"문서 연결 추가 오류: {e}")
+            return False
+
+    def unlink_document(self, doc_type, doc_id):
+        """문서 삭제 시 해당 문서의 연결 제거"""
+        try:
+            with self.get_connection() as conn:
+                unlink_documents(conn, doc_type, doc_id)
+                conn.commit()
+            return True
+        except Exception as e:
+            logger.error(f"문서 연결 삭제 오류: {e}")
+            return False
+
+    def rebuild_links(self):
+        """참조 컬럼에서 누락된 연결 다시 채우기"""
+        with self.get_connection() as conn:
+            linked = backfill_links(conn)
+            conn.commit()
+        return linked
+
+    def get_chains(self, quotation_ids, include_documents=False):
+        """견적서 여러 건의 하위 문서 체인 (쿼리 1회)
+
+        Returns:
+            dict: {quotation_id: {'order': [ID...], 'shipment': [...],
+                                  'invoice': [...], 'cash_flow': [...]}}
+            include_documents=True면 ID 대신 각 문서 행(dict) 목록
+        """
+        quotation_ids = [str(qid) for qid in dict.fromkeys(quotation_ids or []) if qid]
+        chains = {qid: {doc_type: [] for doc_type in CHAIN_TYPES} for qid in quotation_ids}
+        if not quotation_ids:
+            return chains
+
+        with self.get_connection() as conn:
+            rows = conn.execute('''
+                WITH RECURSIVE chain(root_id, doc_type, doc_id, depth) AS (
+                    SELECT value, 'quotation', value, 0 FROM json_each(?)
+                    UNION
+                    SELECT chain.root_id, l.target_type, l.target_id, chain.depth + 1
+                    FROM chain
+                    JOIN document_links l
+                      ON l.source_type = chain.doc_type AND l.source_id = chain.doc_id
+                    WHERE chain.depth < ?
+                )
+                SELECT root_id, doc_type, doc_id, MIN(depth) AS depth
+                FROM chain
+                WHERE depth > 0
+                GROUP BY root_id, doc_type, doc_id
+                ORDER BY root_id, depth, doc_id
+            ''', (json.dumps(quotation_ids), MAX_CHAIN_DEPTH)).fetchall()
+
+            for row in rows:
+                bucket = chains[row['root_id']].setdefault(row['doc_type'], [])
+                bucket.append(row['doc_id'])
+
+            if include_documents:
+                self._attach_documents(conn, chains)
+        return chains
+
+    def get_chain(self, quotation_id, include_documents=False):
+        """견적서 1건의 하위 문서 체인"""
+        return self.get_chains([quotation_id], include_documents).get(
+            str(quotation_id), {doc_type: [] for doc_type in CHAIN_TYPES})
+
+    def _attach_documents(self, conn, chains):
+        """체인의 문서 ID를 문서 행으로 교체 (타입별 IN 조회 1회)"""
+        wanted = {}
+        for chain in chains.values():
+            for doc_type, doc_ids in chain.items():
+                wanted.setdefault(doc_type, set()).update(doc_ids)
+
+        documents = {}
+        for doc_type, doc_ids in wanted.items():
+            table_info = DOCUMENT_TABLES.get(doc_type)
+            if not doc_ids or not table_info or not _table_exists(conn, table_info[0]):
+                continue
+            table, id_column = table_info
+            rows = conn.execute(
+                f"SELECT * FROM {table} WHERE {id_column} IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(doc_ids)),)
+            ).fetchall()
+            documents[doc_type] = {str(row[id_column]): dict(row) for row in rows}
+
+        for chain in chains.values():
+            for doc_type, doc_ids in chain.items():
+                found = documents.get(doc_type, {})
+                chain[doc_type] = [found[doc_id] for doc_id in doc_ids if doc_id in found]
+
+    def get_root_quotation(self, doc_type, doc_id):
+        """하위 문서에서 거슬러 올라가 원본 견적서 ID 찾기 (없으면 None)"""
+        if doc_type == 'quotation':
+            return doc_id
+        with self.get_connection() as conn:
+            row = conn.execute('''
+                WITH RECURSIVE ancestors(doc_type, doc_id, depth) AS (
+                    SELECT ?, ?, 0
+                    UNION
+                    SELECT l.source_type, l.source_id, ancestors.depth + 1
+                    FROM ancestors
+                    JOIN document_links l
+                      ON l.target_type = ancestors.doc_type AND l.target_id = ancestors.doc_id
+                    WHERE ancestors.depth < ?
+                )
+                SELECT doc_id FROM ancestors WHERE doc_type = 'quotation'
+                ORDER BY depth LIMIT 1
+            ''', (doc_type, str(doc_id), MAX_CHAIN_DEPTH)).fetchone()
+        return row['doc_id'] if row else None
+
+    def get_linked_ids(self, source_type, source_ids, target_type):
+        """직접 연결된 하위 문서 ID {source_id: [target_id...]}"""
+        source_ids = [str(sid) for sid in source_ids if sid]
+        linked = {sid: [] for sid in source_ids}
+        if not source_ids:
+            return linked
+        with self.get_connection() as conn:
+            rows = conn.execute('''
+                SELECT source_id, target_id FROM document_links
+                WHERE source_type = ? AND target_type = ?
+                  AND source_id IN (SELECT value FROM json_each(?))
+                ORDER BY id
+            ''', (source_type, target_type, json.dumps(source_ids))).fetchall()
+        for row in rows:
+            linked[row['source_id']].append(row['target_id'])
+        return linked
@@ -236,6 +236,7 @@ class SQLiteEmployeeManager:
                         (employee_data['access_level'], datetime.now().strftime('%Y-%m-%d %H:%M:%S'), str(employee_id))
                     )
                     conn.commit()
+                    self._invalidate_permissions(employee_id)
                     logger.info(f"직원 {employee_id} 권한이 성공적으로 업데이트되었습니다.")
                     return True, f"권한이 성공적으로 업데이트되었습니다."
                 
@@ -293,6 +294,7 @@ class SQLiteEmployeeManager:
                 conn.commit()
                 
                 if affected_rows > 0:
+                    self._invalidate_permissions(employee_id)
                     logger.info(f"직원 {employee_id} 정보가 성공적으로 업데이트되었습니다.")
                     return True, f"직원 {employee_data.get('name', employee_id)} 정보가 성공적으로 업데이트되었습니다."
                 else:
@@ -303,6 +305,11 @@ class SQLiteEmployeeManager:
             logger.error(f"직원 업데이트 오류: {e}")
             return False, f"직원 업데이트 중 오류가 발생했습니다: {str(e)}"
     
+    def _invalidate_permissions(self, employee_id):
+        """권한 레벨 변경을 세션에 캐싱된 권한 매트릭스에 반영"""
+        from utils.permission_engine import invalidate_permissions
+        invalidate_permissions(employee_id)
+    
     def delete_employee(self, employee_id):
         """직원을 삭제합니다."""
         try:
@@ -134,6 +134,20 @@ class SQLiteExchangeRateManager:
             logger.error(f"테이블 초기화 실패: {str(e)}")
             raise
 
+    def _invalidate_rate_service(self):
+        """환율 저장 후 메모리 환율 행렬 다시 적재 표시"""
+        from utils.exchange_rate_service import invalidate_rates
+        invalidate_rates(self.db_path)
+
+    def get_exchange_rate(self, from_currency, to_currency, rate_date=None, kind='daily'):
+        """기준일 환율 (직접/역/USD 경유 교차 환율, 없으면 None)"""
+        from utils.exchange_rate_service import get_rate_service
+        try:
+            return get_rate_service(self.db_path).rate(from_currency, to_currency, rate_date, kind)
+        except Exception as e:
+            logger.error(f"환율 조회 실패: {str(e)}")
+            return None
+
     def add_quarterly_rate(self, year, quarter, target_currency, rate, created_by='admin'):
         """분기별 기준 환율 추가"""
         try:
@@ -150,6 +164,7 @@ class SQLiteExchangeRateManager:
                       datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
                 
                 conn.commit()
+                self._invalidate_rate_service()
                 return True, f"분기별 환율이 성공적으로 저장되었습니다."
                 
         except Exception as e:
@@ -310,6 +325,7 @@ class SQLiteExchangeRateManager:
                       rate_data['rate'], rate_data['rate_date'], rate_data.get('source', 'manual')))
                 
                 conn.commit()
+                self._invalidate_rate_service()
                 logger.info(f"환율 추가 완료: {rate_data['base_currency']}/{rate_data['target_currency']} = {rate_data['rate']}")
                 return True
                 
@@ -359,33 +375,10 @@ class SQLiteExchangeRateManager:
             if from_currency == to_currency:
                 return amount
             
-            # 지정된 날짜의 환율 조회
-            if rate_date:
-                with sqlite3.connect(self.db_path) as conn:
-                    query = '''
-                        SELECT rate FROM exchange_rates 
-                        WHERE base_currency = ? AND target_currency = ? 
-                            AND rate_date <= ? AND is_active = 1
-                        ORDER BY rate_date DESC, created_date DESC
-                        LIMIT 1
-                    '''
-                    cursor = conn.cursor()
-                    cursor.execute(query, (from_currency, to_currency, rate_date))
-                    result = cursor.fetchone()
-                    
-                    if result:
-                        return amount * result[0]
-                    else:
-                        # 역방향 확인
-                        cursor.execute(query, (to_currency, from_currency, rate_date))
-                        result = cursor.fetchone()
-                        if result:
-                            return amount / result[0]
-            
-            # 최신 환율 사용
-            rate_info = self.get_latest_rate(from_currency, to_currency)
-            if rate_info is not None:
-                return amount * rate_info['rate']
+            # 메모리 환율 행렬에서 기준일 환율 조회 (기준일 이전 환율이 없으면 최신 환율)
+            rate = self.get_exchange_rate(from_currency, to_currency, rate_date)
+            if rate is not None:
+                return amount * rate
             
             logger.warning(f"환율 정보 없음: {from_currency} -> {to_currency}")
             return amount
@@ -445,6 +438,65 @@ class SQLiteExchangeRateManager:
             logger.error(f"환율 API 호출 실패: {str(e)}")
             return False
 
+    def save_historical_rates_bulk(self, rates_by_date, base_currency='USD', source='api'):
+        """여러 날짜의 환율 일괄 저장 {날짜: {통화: 환율}} → 저장 건수 (트랜잭션 1회)"""
+        current_time = datetime.now().isoformat()
+        rows = [
+            (f"{base_currency}_{currency}_{rate_date}", base_currency, currency, float(rate),
+             rate_date, source, current_time, current_time)
+            for rate_date, rates in sorted(rates_by_date.items())
+            for currency, rate in sorted(rates.items())
+            if rate is not None and currency != base_currency
+        ]
+        if not rows:
+            return 0
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO exchange_rates (
+                    rate_id, base_currency, target_currency, rate, rate_date,
+                    source, is_active, created_date, updated_date
+                ) VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ''', rows)
+            conn.executemany('''
+                INSERT OR REPLACE INTO exchange_rate_history (
+                    history_id, base_currency, target_currency, rate, rate_date, source
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', [(f"HIST_{rate_date}_{base}_{target}", base, target, rate, rate_date, row_source)
+                  for _, base, target, rate, rate_date, row_source, _, _ in rows])
+            conn.commit()
+        self._invalidate_rate_service()
+        logger.info(f"환율 일괄 저장 완료: {len(rows)}건")
+        return len(rows)
+
+    def backfill_historical_rates(self, start_date, end_date=None, source=None, currencies=None, **options):
+        """과거 환율 백필 (동시 수집, 체크포인트 재개, 마지막에 일괄 저장)
+
+        Args:
+            source: 환율 소스 (기본 OpenExchangeRates API, 오프라인은 FileRateSource)
+            currencies: 수집 통화 (기본 DEFAULT_CURRENCIES)
+            options: ExchangeRateBackfill 옵션 (max_workers, requests_per_second, checkpoint_path 등)
+
+        Returns:
+            dict: 백필 결과 (requested, resumed, fetched, failed, saved ...)
+        """
+        from utils.exchange_rate_backfill import (
+            DEFAULT_CURRENCIES, ExchangeRateBackfill, OpenExchangeRatesSource
+        )
+
+        if source is None:
+            if not self.api_key:
+                logger.warning("환율 API 키가 설정되지 않음")
+                return None
+            source = OpenExchangeRatesSource(self.api_key)
+
+        source_label = 'api' if isinstance(source, OpenExchangeRatesSource) else source.name
+        backfill = ExchangeRateBackfill(source, **options)
+        return backfill.run(
+            start_date, end_date, currencies=currencies or DEFAULT_CURRENCIES,
+            writer=lambda rates_by_date: self.save_historical_rates_bulk(rates_by_date, source=source_label),
+        )
+
     def get_currencies(self, is_active=True):
         """통화 목록 조회"""
         try:
@@ -562,6 +614,7 @@ class SQLiteExchangeRateManager:
                                 pass
                         
                         conn.commit()
+                        self._invalidate_rate_service()
                     
                     logger.info(f"통화 정보 CSV 데이터 마이그레이션 완료: {len(df)}건")
             
@@ -588,6 +641,7 @@ class SQLiteExchangeRateManager:
                       datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
                 
                 conn.commit()
+                self._invalidate_rate_service()
                 return True, f"연도별 관리 환율이 성공적으로 저장되었습니다."
                 
         except Exception as e:
@@ -696,6 +750,7 @@ class SQLiteExchangeRateManager:
                 
                 if cursor.rowcount > 0:
                     conn.commit()
+                    self._invalidate_rate_service()
                     return True, f"{year}년 {target_currency} 관리 환율이 수정되었습니다."
                 else:
                     return False, "수정할 데이터를 찾을 수 없습니다."
@@ -718,6 +773,7 @@ class SQLiteExchangeRateManager:
                 
                 if cursor.rowcount > 0:
                     conn.commit()
+                    self._invalidate_rate_service()
                     return True, f"{year}년 {target_currency} 관리 환율이 삭제되었습니다."
                 else:
                     return False, "삭제할 데이터를 찾을 수 없습니다."
@@ -768,6 +824,7 @@ class SQLiteExchangeRateManager:
                         logger.error(f"{currency} 환율 입력 실패: {str(e)}")
                 
                 conn.commit()
+                self._invalidate_rate_service()
                 return True, f"{success_count}개 통화의 {year}년 관리 환율이 저장되었습니다."
                 
         except Exception as e:
@@ -65,9 +65,55 @@ class SQLiteExpenseRequestManager:
             )
         ''')
         
+        # 부서·카테고리·월별 실적 집계 (department 컬럼이 없으면 추가, expense_requests 트리거로 증분 갱신)
+        from managers.sqlite.sqlite_budget_rollup_manager import ensure_budget_rollups
+        ensure_budget_rollups(conn)
+        
+        # 부서가 비어 있는 요청서는 신청자 부서로 채움 (컬럼을 누가 추가했는지와 무관)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'employees'")
+        if cursor.fetchone():
+            cursor.execute('''
+                UPDATE expense_requests
+                SET department = (SELECT e.department FROM employees e WHERE e.employee_id = expense_requests.requester_id)
+                WHERE department IS NULL
+                  AND EXISTS (SELECT 1 FROM employees e
+                              WHERE e.employee_id = expense_requests.requester_id
+                                AND COALESCE(e.department, '') != '')
+            ''')
+        
         conn.commit()
         conn.close()
         logger.info("지출 요청 관련 테이블 초기화 완료")
+    
+    def get_requester_department(self, requester_id, cursor=None):
+        """신청자 부서 (직원 정보가 없으면 빈 문자열)"""
+        try:
+            if cursor is None:
+                with sqlite3.connect(self.db_path) as conn:
+                    return self.get_requester_department(requester_id, conn.cursor())
+            cursor.execute('SELECT department FROM employees WHERE employee_id = ?', (requester_id,))
+            row = cursor.fetchone()
+            return (row[0] or '') if row else ''
+        except sqlite3.Error:
+            return ''
+    
+    def check_budget(self, request_data):
+        """제출 전 부서 잔여 예산 확인 → (통과 여부, 잔여 예산 정보)
+        
+        예산이 설정되지 않은 부서/카테고리는 통과로 봅니다.
+        """
+        from managers.sqlite.sqlite_budget_rollup_manager import SQLiteBudgetRollupManager
+        
+        department = request_data.get('department') or self.get_requester_department(request_data.get('requester_id'))
+        passed, status = SQLiteBudgetRollupManager(self.db_path).check_expense(
+            department,
+            request_data.get('category'),
+            request_data.get('amount', 0),
+            period=request_data.get('expected_date') or request_data.get('request_date'),
+            currency=request_data.get('currency') or 'VND',
+        )
+        status['department'] = department
+        return passed, status
 
     def get_pending_approvals(self, approver_id):
         """특정 승인자의 승인 대기 지출 요청 조회"""
@@ -162,13 +208,16 @@ class SQLiteExpenseRequestManager:
             first_approver = request_data.get('first_approver', {})
             second_approver = request_data.get('second_approver', {})
             
+            # 부서 잔여 예산 확인 (초과해도 제출은 진행, 결과 메시지에 안내)
+            budget_ok, budget_status = self.check_budget(request_data)
+            
             cursor.execute('''
                 INSERT INTO expense_requests (
                     requester_id, requester_name, expense_title, category, 
                     amount, currency, expected_date, expense_description, 
                     notes, first_approver_id, first_approver_name,
-                    second_approver_id, second_approver_name, status, attachment
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    second_approver_id, second_approver_name, status, attachment, department
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 request_data['requester_id'],
                 request_data['requester_name'],
@@ -184,7 +233,8 @@ class SQLiteExpenseRequestManager:
                 second_approver.get('approver_id', '') if second_approver else '',
                 second_approver.get('approver_name', '') if second_approver else '',
                 request_data.get('status', 'pending'),
-                request_data.get('attachment', '')
+                request_data.get('attachment', ''),
+                budget_status['department']
             ))
             
             request_id = cursor.lastrowid
@@ -230,7 +280,11 @@ class SQLiteExpenseRequestManager:
             conn.commit()
             conn.close()
             
-            return True, f"지출요청서가 성공적으로 제출되었습니다. (요청번호: {request_id})"
+            message = f"지출요청서가 성공적으로 제출되었습니다. (요청번호: {request_id})"
+            if not budget_ok:
+                message += (f" ⚠️ {budget_status['department']} {request_data['category']} 예산 초과: "
+                            f"잔여 {budget_status['remaining']:,.0f} / 요청 {budget_status['requested']:,.0f}")
+            return True, message
             
         except Exception as e:
             return False, f"지출요청서 제출 중 오류가 발생했습니다: {str(e)}"
@@ -387,8 +441,8 @@ class SQLiteExpenseRequestManager:
                 INSERT INTO expense_requests (
                     requester_id, requester_name, expense_title, category,
                     amount, currency, expected_date, expense_description,
-                    notes, status, request_date, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    notes, status, request_date, created_at, updated_at, department
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 request_data['requester_id'],
                 request_data['requester_name'],
@@ -402,7 +456,8 @@ class SQLiteExpenseRequestManager:
                 'pending',
                 request_data['request_date'],
                 datetime.now(),
-                datetime.now()
+                datetime.now(),
+                request_data.get('department') or self.get_requester_department(request_data['requester_id'], cursor)
             ))
             
             # 생성된 요청서 ID 가져오기
@@ -560,8 +615,8 @@ class SQLiteExpenseRequestManager:
             cursor.execute('''
                 INSERT INTO expense_requests (
                     requester_id, requester_name, expense_title, category,
-                    amount, currency, expected_date, expense_description, notes, request_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    amount, currency, expected_date, expense_description, notes, request_date, department
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 request_data.get('requester_id'),
                 request_data.get('requester_name'),
@@ -572,7 +627,8 @@ class SQLiteExpenseRequestManager:
                 request_data.get('expected_date'),
                 request_data.get('expense_description'),
                 request_data.get('notes'),
-                request_data.get('request_date')
+                request_data.get('request_date'),
+                request_data.get('department') or self.get_requester_department(request_data.get('requester_id'), cursor)
             ))
             
             request_id = cursor.lastrowid
@@ -0,0 +1,296 @@
+"""
+SQLite 매출 / 현금흐름 예측 관리자
+월별 집계(monthly_sales_cube, cash_ledger)로 시계열을 만들고 utils.forecasting 모델로 일괄 적합한 결과를 캐시
+
+- sales: 전체 / 고객 / 제품 카테고리 / 영업 담당자별 월 매출(USD)
+- cash_flow: 통화별 월 유입 / 유출 / 순현금흐름 (확정 거래)
+- 마감된 달(이번 달 이전)까지만 사용, forecast_runs.fitted_through가 마지막 마감 월과 같으면 다시 적합하지 않음
+- 화면에서는 get_forecast()로 캐시만 읽고, 적합은 refresh_async()의 백그라운드 스레드(+프로세스 풀)에서 실행
+"""
+
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.forecasting import DEFAULT_HORIZON, MODELS, fit_batch, month_range, add_months
+
+logger = logging.getLogger(__name__)
+
+# 적합에 사용하는 최대 과거 개월 수 / 예측에 필요한 최소 개월 수
+HISTORY_MONTHS = 36
+MIN_HISTORY_MONTHS = 3
+
+# 범위 → {차원: 시계열 키 SQL}
+SALES_DIMENSIONS = {
+    'total': "''",
+    'customer': "COALESCE(NULLIF(customer_name, ''), customer_id)",
+    'category': "category",
+    'sales_rep': "sales_rep",
+}
+CASH_FLOW_DIMENSIONS = ('inflow', 'outflow', 'net')
+
+_FORECAST_TABLES_SQL = (
+    '''
+    CREATE TABLE IF NOT EXISTS forecast_runs (
+        scope TEXT PRIMARY KEY,
+        fitted_through TEXT NOT NULL,
+        series_count INTEGER NOT NULL DEFAULT 0,
+        horizon INTEGER NOT NULL,
+        computed_at TEXT NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS forecast_series (
+        scope TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        series_key TEXT NOT NULL,
+        selected_model TEXT NOT NULL,
+        mae_seasonal_naive REAL,
+        mae_exp_smoothing REAL,
+        mae_linear_trend REAL,
+        PRIMARY KEY (scope, dimension, series_key)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS forecast_values (
+        scope TEXT NOT NULL,
+        dimension TEXT NOT NULL,
+        series_key TEXT NOT NULL,
+        model TEXT NOT NULL,
+        period TEXT NOT NULL,
+        value REAL NOT NULL,
+        PRIMARY KEY (scope, dimension, series_key, model, period)
+    )
+    ''',
+)
+
+# 백그라운드 적합 중인 (db_path, scope)
+_running = set()
+_running_lock = threading.Lock()
+
+
+def last_closed_month(today=None):
+    """마지막 마감 월 (이번 달 직전 달)"""
+    return add_months((today or datetime.now()).strftime('%Y-%m'), -1)
+
+
+class SQLiteForecastManager:
+    """월별 매출/현금흐름 예측 캐시"""
+
+    SCOPES = ('sales', 'cash_flow')
+
+    def __init__(self, db_path='erp_system.db', horizon=DEFAULT_HORIZON, max_workers=None):
+        self.db_path = db_path
+        self.horizon = horizon
+        self.max_workers = max_workers
+        self.init_tables()
+
+    def get_connection(self):
+        return sqlite3.connect(self.db_path)
+
+    def init_tables(self):
+        with self.get_connection() as conn:
+            for sql in _FORECAST_TABLES_SQL:
+                conn.execute(sql)
+            conn.commit()
+
+    # ---------- 시계열 ----------
+
+    def _table_exists(self, conn, table):
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone() is not None
+
+    def _monthly_frame(self, conn, scope, first, last):
+        """[dimension, series_key, period, value] 월별 집계"""
+        if scope == 'sales':
+            if not self._table_exists(conn, 'monthly_sales_cube'):
+                return pd.DataFrame(columns=['dimension', 'series_key', 'period', 'value'])
+            query = " UNION ALL ".join(f'''
+                SELECT '{dimension}' AS dimension, {key} AS series_key,
+                       year_month AS period, SUM(amount_usd) AS value
+                FROM monthly_sales_cube
+                WHERE year_month BETWEEN :first AND :last
+                GROUP BY series_key, year_month
+            ''' for dimension, key in SALES_DIMENSIONS.items())
+        else:
+            if not self._table_exists(conn, 'cash_ledger'):
+                return pd.DataFrame(columns=['dimension', 'series_key', 'period', 'value'])
+            measures = {'inflow': 'SUM(inflow)', 'outflow': 'SUM(outflow)', 'net': 'SUM(inflow - outflow)'}
+            query = " UNION ALL ".join(f'''
+                SELECT '{dimension}' AS dimension, currency AS series_key,
+                       substr(entry_date, 1, 7) AS period, {measures[dimension]} AS value
+                FROM cash_ledger
+                WHERE substr(entry_date, 1, 7) BETWEEN :first AND :last
+                GROUP BY currency, period
+            ''' for dimension in CASH_FLOW_DIMENSIONS)
+        return pd.read_sql_query(query, conn, params={'first': first, 'last': last})
+
+    def build_series(self, scope, fitted_through=None):
+        """(시계열 인덱스 DataFrame[dimension, series_key], 월 목록, 값 행렬)
+
+        빈 달은 0, 데이터가 있는 첫 달부터 fitted_through까지 (최대 HISTORY_MONTHS)
+        """
+        fitted_through = fitted_through or last_closed_month()
+        first = add_months(fitted_through, -(HISTORY_MONTHS - 1))
+        with self.get_connection() as conn:
+            frame = self._monthly_frame(conn, scope, first, fitted_through)
+        frame = frame.dropna(subset=['period'])
+        if frame.empty:
+            return pd.DataFrame(columns=['dimension', 'series_key']), [], np.zeros((0, 0))
+
+        frame['series_key'] = frame['series_key'].fillna('')
+        months = month_range(frame['period'].min(), fitted_through)
+        pivot = frame.pivot_table(index=['dimension', 'series_key'], columns='period',
+                                  values='value', aggfunc='sum', fill_value=0.0)
+        pivot = pivot.reindex(columns=months, fill_value=0.0)
+        return pivot.index.to_frame(index=False), months, pivot.to_numpy(dtype=np.float64)
+
+    # ---------- 적합 / 캐시 ----------
+
+    def is_stale(self, scope):
+        """마지막 적합 이후 새로 마감된 달이 있는지"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT fitted_through FROM forecast_runs WHERE scope = ?", (scope,)).fetchone()
+        return row is None or row[0] < last_closed_month()
+
+    def refresh(self, scope=None, force=False):
+        """예측 다시 계산 (force=False면 새로 마감된 달이 있을 때만)
+
+        Returns:
+            dict: {scope: 적합한 시계열 수 (건너뛰면 None)}
+        """
+        results = {}
+        for name in ([scope] if scope else self.SCOPES):
+            if not force and not self.is_stale(name):
+                results[name] = None
+                continue
+            results[name] = self._refresh_scope(name)
+        return results
+
+    def _refresh_scope(self, scope):
+        fitted_through = last_closed_month()
+        index, months, values = self.build_series(scope, fitted_through)
+        if len(months) < MIN_HISTORY_MONTHS or not len(values):
+            # 적합할 데이터가 없으면 fitted_through를 기록하지 않음 (데이터가 들어오면 같은 달에도 다시 적합)
+            logger.info(f"{scope} 예측 건너뜀 - 마감 데이터 {len(months)}개월")
+            return 0
+
+        started = datetime.now()
+        fitted = fit_batch(values, self.horizon, max_workers=self.max_workers)
+        future = [add_months(fitted_through, step + 1) for step in range(self.horizon)]
+
+        series_rows, value_rows = [], []
+        for row, (dimension, series_key) in enumerate(index.itertuples(index=False)):
+            series_rows.append((
+                scope, dimension, series_key, fitted['selected'][row],
+                *(float(fitted['mae'][model][row]) for model in MODELS),
+            ))
+            for model in MODELS:
+                value_rows.extend(
+                    (scope, dimension, series_key, model, period, float(value))
+                    for period, value in zip(future, fitted['forecasts'][model][row])
+                )
+
+        with self.get_connection() as conn:
+            conn.execute("DELETE FROM forecast_series WHERE scope = ?", (scope,))
+            conn.execute("DELETE FROM forecast_values WHERE scope = ?", (scope,))
+            conn.executemany('''
+                INSERT INTO forecast_series
+                (scope, dimension, series_key, selected_model,
+                 mae_seasonal_naive, mae_exp_smoothing, mae_linear_trend)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', series_rows)
+            conn.executemany('''
+                INSERT INTO forecast_values (scope, dimension, series_key, model, period, value)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', value_rows)
+            conn.execute('''
+                INSERT OR REPLACE INTO forecast_runs (scope, fitted_through, series_count, horizon, computed_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (scope, fitted_through, len(series_rows), self.horizon,
+                  datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            conn.commit()
+
+        logger.info(f"{scope} 예측 {len(series_rows)}개 시계열 적합 완료 "
+                    f"({fitted_through}까지, {(datetime.now() - started).total_seconds():.1f}초)")
+        return len(series_rows)
+
+    def refresh_async(self, scope=None):
+        """오래된 예측이 있으면 백그라운드 스레드에서 다시 계산 (이미 실행 중이면 무시)
+
+        Returns:
+            bool: 새로 시작했는지 여부
+        """
+        scopes = [name for name in ([scope] if scope else self.SCOPES) if self.is_stale(name)]
+        with _running_lock:
+            scopes = [name for name in scopes if (self.db_path, name) not in _running]
+            if not scopes:
+                return False
+            _running.update((self.db_path, name) for name in scopes)
+
+        def run():
+            for name in scopes:
+                try:
+                    self._refresh_scope(name)
+                except Exception as e:
+                    logger.error(f"{name} 예측 계산 오류: {e}")
+                finally:
+                    with _running_lock:
+                        _running.discard((self.db_path, name))
+
+        threading.Thread(target=run, name='forecast-refresh', daemon=True).start()
+        return True
+
+    def is_refreshing(self, scope):
+        with _running_lock:
+            return (self.db_path, scope) in _running
+
+    # ---------- 조회 ----------
+
+    def get_run_info(self, scope):
+        """마지막 적합 정보 dict (없으면 None)"""
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM forecast_runs WHERE scope = ?", (scope,)).fetchone()
+        return dict(row) if row else None
+
+    def get_series_keys(self, scope, dimension):
+        """예측이 있는 시계열 키 목록"""
+        with self.get_connection() as conn:
+            return [row[0] for row in conn.execute('''
+                SELECT series_key FROM forecast_series
+                WHERE scope = ? AND dimension = ? ORDER BY series_key
+            ''', (scope, dimension))]
+
+    def get_forecast(self, scope, dimension, series_key='', model=None):
+        """캐시된 예측 DataFrame[period, value, model] (model=None이면 선택된 모델)"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT v.period, v.value, v.model
+                FROM forecast_values v
+                JOIN forecast_series s
+                  ON s.scope = v.scope AND s.dimension = v.dimension AND s.series_key = v.series_key
+                WHERE v.scope = ? AND v.dimension = ? AND v.series_key = ?
+                  AND v.model = COALESCE(?, s.selected_model)
+                ORDER BY v.period
+            ''', conn, params=(scope, dimension, series_key or '', model))
+
+    def get_forecast_summary(self, scope, dimension):
+        """차원 전체 시계열의 선택 모델 / 예측 합계 DataFrame"""
+        with self.get_connection() as conn:
+            return pd.read_sql_query('''
+                SELECT s.series_key, s.selected_model, SUM(v.value) AS forecast_total,
+                       MIN(v.period) AS first_period, MAX(v.period) AS last_period
+                FROM forecast_series s
+                JOIN forecast_values v
+                  ON v.scope = s.scope AND v.dimension = s.dimension
+                 AND v.series_key = s.series_key AND v.model = s.selected_model
+                WHERE s.scope = ? AND s.dimension = ?
+                GROUP BY s.series_key, s.selected_model
+                ORDER BY forecast_total DESC
+            ''', conn, params=(scope, dimension))
@@ -242,6 +242,13 @@ class SQLiteInvoiceManager:
                             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                         ''', tuple(item_record.values()))
                 
+                # 문서 연결 인덱스 (주문 → 인보이스, 주문이 없으면 견적서 → 인보이스)
+                from managers.sqlite.sqlite_document_link_manager import link_documents
+                if invoice_record['order_id']:
+                    link_documents(conn, 'order', invoice_record['order_id'], 'invoice', invoice_record['invoice_id'], 'invoiced')
+                else:
+                    link_documents(conn, 'quotation', invoice_record['quotation_id'], 'invoice', invoice_record['invoice_id'], 'invoiced')
+                
                 conn.commit()
                 logger.info(f"인보이스 추가 완료: {invoice_data['invoice_id']}")
                 return True
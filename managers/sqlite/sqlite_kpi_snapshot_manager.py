@@ -0,0 +1,376 @@
+"""
+SQLite 대시보드 KPI 스냅샷 관리자
+메인 대시보드 지표를 백그라운드에서 미리 계산해 저장하고, 화면은 스냅샷 한 번 조회로 표시
+
+- kpi_snapshots: 지표별 최신 값 / 계산 시각 / 계산 당시 변경 버전
+- kpi_history: 지표별 일자 값 (스파크라인 추이용, 하루 한 행 - 마지막 값)
+- kpi_state.version: 직원/고객/제품/견적/휴가/승인/공급업체/판매가 테이블 변경 시 트리거가 증가
+- PostgreSQL 백엔드는 트리거 대신 감시 테이블의 pg_stat_user_tables 변경 행 수 합계를 버전으로 사용
+  (통계 반영까지 수 초 지연), 스냅샷은 계산한 백엔드를 기록하고 같은 백엔드에서만 fresh
+- KPIRefresher: 주기(interval)마다, 그리고 버전이 바뀌면(poll) 다시 계산하는 데몬 스레드
+  (db_path × 백엔드당 하나, 스냅샷 매니저도 함께 재사용)
+- 스냅샷이 오래됐거나(max_age) 계산 후 변경이 있으면 get_snapshot()이 fresh=False → 화면은 실시간 계산
+"""
+
+import sqlite3
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 600
+DEFAULT_REFRESH_INTERVAL = 300
+DEFAULT_POLL_SECONDS = 5
+HISTORY_DAYS = 90
+
+# 대시보드 지표 → 표시 이름
+KPI_METRICS = {
+    'employee_count': '총 직원 수',
+    'active_employees': '재직 직원 수',
+    'working_employees': '근무 인원',
+    'vacation_employees': '휴가 인원',
+    'customer_count': '고객 수',
+    'product_count': '제품 수',
+    'quotation_count': '견적서 수',
+    'quotation_draft': '임시저장 견적',
+    'quotation_pending': '대기 견적',
+    'quotation_approved': '승인 견적',
+    'pending_approvals': '승인 대기',
+    'supplier_count': '공급업체 수',
+    'sales_products': '판매가 등록 제품',
+}
+
+# 지표 계산에 쓰는 매니저 (dashboard managers 딕셔너리 키 → ManagerFactory 키)
+KPI_MANAGERS = {
+    'employee_manager': 'employee',
+    'customer_manager': 'customer',
+    'product_manager': 'product',
+    'quotation_manager': 'quotation',
+    'vacation_manager': 'vacation',
+    'approval_manager': 'approval',
+    'supplier_manager': 'supplier',
+    'sales_product_manager': 'sales_product',
+}
+
+# 변경 시 스냅샷을 무효화하는 SQLite 테이블
+WATCHED_TABLES = (
+    'employees', 'customers', 'products', 'master_products', 'quotations',
+    'vacation_requests', 'expense_approvals', 'suppliers', 'sales_prices',
+)
+
+# PostgreSQL 백엔드에서 변경을 감지하는 테이블
+POSTGRESQL_WATCHED_TABLES = (
+    'employees', 'customers', 'products', 'master_products', 'quotations',
+    'vacation_requests', 'approval_requests', 'suppliers', 'sales_products',
+)
+
+_KPI_TABLES_SQL = (
+    '''
+    CREATE TABLE IF NOT EXISTS kpi_snapshots (
+        metric TEXT PRIMARY KEY,
+        value REAL,
+        computed_at TEXT NOT NULL,
+        source_version INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS kpi_history (
+        metric TEXT NOT NULL,
+        snapshot_date TEXT NOT NULL,
+        value REAL,
+        computed_at TEXT NOT NULL,
+        PRIMARY KEY (metric, snapshot_date)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS kpi_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    "INSERT OR IGNORE INTO kpi_state (id, version) VALUES (1, 0)",
+)
+
+
+def _bump_trigger_sql(table, event):
+    return f'''
+        CREATE TRIGGER IF NOT EXISTS trg_kpi_{table}_{event.lower()}
+        AFTER {event} ON {table}
+        BEGIN
+            UPDATE kpi_state SET version = version + 1 WHERE id = 1;
+        END
+    '''
+
+
+def _records(data):
+    """DataFrame / 리스트 → dict 리스트"""
+    if data is None:
+        return []
+    if isinstance(data, pd.DataFrame):
+        return data.to_dict('records')
+    return [row for row in data if isinstance(row, dict)]
+
+
+def _count(data):
+    try:
+        return len(data) if data is not None else 0
+    except TypeError:
+        return 0
+
+
+def compute_dashboard_kpis(managers, today=None):
+    """메인 대시보드 지표 계산 (매니저가 없거나 조회에 실패한 지표는 0)"""
+    today = pd.Timestamp(today or datetime.now().date())
+    kpis = dict.fromkeys(KPI_METRICS, 0)
+
+    def fetch(manager_key, method, *args):
+        manager = managers.get(manager_key)
+        if manager is None:
+            return None
+        try:
+            return getattr(manager, method)(*args)
+        except Exception as e:
+            logger.warning(f"KPI 조회 실패 ({manager_key}.{method}): {e}")
+            return None
+
+    employees = fetch('employee_manager', 'get_all_employees')
+    kpis['employee_count'] = _count(employees)
+    if isinstance(employees, pd.DataFrame) and 'work_status' in employees.columns:
+        kpis['active_employees'] = int((employees['work_status'] == '재직').sum())
+    else:
+        kpis['active_employees'] = kpis['employee_count']
+
+    vacations = fetch('vacation_manager', 'get_all_vacation_requests')
+    if isinstance(vacations, pd.DataFrame) and not vacations.empty and \
+            {'status', 'start_date', 'end_date', 'employee_id'} <= set(vacations.columns):
+        approved = vacations[vacations['status'] == '승인']
+        start = pd.to_datetime(approved['start_date'], format='%Y-%m-%d', errors='coerce')
+        end = pd.to_datetime(approved['end_date'], format='%Y-%m-%d', errors='coerce')
+        kpis['vacation_employees'] = int(approved.loc[(start <= today) & (today <= end), 'employee_id'].nunique())
+    kpis['working_employees'] = max(0, kpis['active_employees'] - kpis['vacation_employees'])
+
+    kpis['customer_count'] = _count(fetch('customer_manager', 'get_all_customers'))
+    kpis['product_count'] = _count(fetch('product_manager', 'get_all_products'))
+
+    quotations = _records(fetch('quotation_manager', 'get_all_quotations'))
+    kpis['quotation_count'] = len(quotations)
+    statuses = pd.Series([q.get('status', '') for q in quotations], dtype=object)
+    kpis['quotation_draft'] = int((statuses == '임시저장').sum())
+    kpis['quotation_pending'] = int((statuses == '대기').sum())
+    kpis['quotation_approved'] = int((statuses == '승인').sum())
+
+    kpis['pending_approvals'] = _count(fetch('approval_manager', 'get_pending_requests'))
+    kpis['supplier_count'] = _count(fetch('supplier_manager', 'get_all_suppliers'))
+    kpis['sales_products'] = _count(fetch('sales_product_manager', 'get_all_prices'))
+    return kpis
+
+
+def postgresql_data_version(manager, tables=POSTGRESQL_WATCHED_TABLES):
+    """PostgreSQL 감시 테이블 변경 행 수 합계 (INSERT/UPDATE/DELETE마다 증가)"""
+    conn = manager.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute('''
+                SELECT COALESCE(SUM(n_tup_ins + n_tup_upd + n_tup_del), 0)
+                FROM pg_stat_user_tables WHERE relname = ANY(%s)
+            ''', (list(tables),))
+            return int(cursor.fetchone()[0])
+    finally:
+        manager.return_connection(conn)
+
+
+class SQLiteKPISnapshotManager:
+    """대시보드 KPI 스냅샷 저장/조회 (backend: 지표를 계산하는 데이터베이스 타입)"""
+
+    def __init__(self, db_path='erp_system.db', backend='sqlite'):
+        self.db_path = db_path
+        self.backend = backend
+        self._postgresql_manager = None
+        self.init_tables()
+
+    def get_connection(self):
+        return sqlite3.connect(self.db_path)
+
+    def init_tables(self):
+        """스냅샷 테이블 생성, 존재하는 감시 테이블에 변경 버전 트리거 설치"""
+        with self.get_connection() as conn:
+            for sql in _KPI_TABLES_SQL:
+                conn.execute(sql)
+            try:
+                conn.execute("ALTER TABLE kpi_snapshots ADD COLUMN backend TEXT NOT NULL DEFAULT 'sqlite'")
+            except sqlite3.OperationalError:
+                pass  # 컬럼이 이미 존재하면 무시
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for table in WATCHED_TABLES:
+                if table in existing:
+                    for event in ('INSERT', 'UPDATE', 'DELETE'):
+                        conn.execute(_bump_trigger_sql(table, event))
+            conn.commit()
+
+    def get_version(self):
+        """감시 테이블 변경 버전 (백엔드 기준)"""
+        if self.backend == 'postgresql':
+            if self._postgresql_manager is None:
+                from managers.postgresql.base_postgresql_manager import BasePostgreSQLManager
+                self._postgresql_manager = BasePostgreSQLManager()
+            return postgresql_data_version(self._postgresql_manager)
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT version FROM kpi_state WHERE id = 1").fetchone()
+        return row[0] if row else 0
+
+    def save_snapshot(self, kpis, source_version=None):
+        """지표 저장 + 오늘 추이 갱신 + 보관 기간이 지난 추이 삭제"""
+        now = datetime.now()
+        computed_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        today = now.strftime('%Y-%m-%d')
+        source_version = self.get_version() if source_version is None else source_version
+        with self.get_connection() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO kpi_snapshots (metric, value, computed_at, source_version, backend)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [(metric, value, computed_at, source_version, self.backend) for metric, value in kpis.items()])
+            conn.executemany('''
+                INSERT OR REPLACE INTO kpi_history (metric, snapshot_date, value, computed_at)
+                VALUES (?, ?, ?, ?)
+            ''', [(metric, today, value, computed_at) for metric, value in kpis.items()])
+            conn.execute("DELETE FROM kpi_history WHERE snapshot_date < ?",
+                         ((now - timedelta(days=HISTORY_DAYS)).strftime('%Y-%m-%d'),))
+            conn.commit()
+        return computed_at
+
+    def refresh(self, managers):
+        """지표 계산 후 저장 (계산 시작 시점 버전 기록 → 계산 중 변경은 다음 갱신에서 반영)"""
+        version = self.get_version()
+        started = time.monotonic()
+        kpis = compute_dashboard_kpis(managers)
+        self.save_snapshot(kpis, version)
+        logger.info(f"대시보드 KPI 스냅샷 갱신 ({time.monotonic() - started:.2f}초)")
+        return kpis
+
+    def get_snapshot(self, max_age_seconds=DEFAULT_MAX_AGE_SECONDS):
+        """최신 스냅샷 → (지표 dict, 계산 시각, fresh 여부)
+
+        fresh=False: 스냅샷이 없거나, max_age보다 오래됐거나, 다른 백엔드에서 계산됐거나,
+        계산 이후 감시 테이블이 바뀐 경우
+        """
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT metric, value, computed_at, source_version, backend FROM kpi_snapshots").fetchall()
+        if not rows:
+            return {}, None, False
+
+        kpis = {row[0]: row[1] for row in rows}
+        computed_at = min(row[2] for row in rows)
+        same_backend = all(row[4] == self.backend for row in rows)
+        # 버전은 계산 시작 시점 값 → 그 뒤 변경이 있으면 현재 버전과 달라짐 (PostgreSQL 통계 초기화 포함)
+        unchanged = same_backend and {row[3] for row in rows} == {self.get_version()}
+        age = (datetime.now() - datetime.strptime(computed_at, '%Y-%m-%d %H:%M:%S')).total_seconds()
+        fresh = age <= max_age_seconds and unchanged and set(KPI_METRICS) <= set(kpis)
+        return kpis, computed_at, fresh
+
+    def get_history(self, metrics=None, days=30):
+        """지표별 일자 추이 DataFrame[snapshot_date, 지표...]"""
+        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        with self.get_connection() as conn:
+            df = pd.read_sql_query('''
+                SELECT metric, snapshot_date, value FROM kpi_history
+                WHERE snapshot_date >= ? ORDER BY snapshot_date
+            ''', conn, params=(since,))
+        if metrics is not None:
+            df = df[df['metric'].isin(list(metrics))]
+        if df.empty:
+            return pd.DataFrame(columns=['snapshot_date'])
+        return df.pivot(index='snapshot_date', columns='metric', values='value').reset_index()
+
+
+class KPIRefresher:
+    """KPI 스냅샷 백그라운드 갱신 스레드 (interval마다 + 변경 버전이 바뀌면)"""
+
+    def __init__(self, snapshot_manager, manager_provider, interval=DEFAULT_REFRESH_INTERVAL,
+                 poll_seconds=DEFAULT_POLL_SECONDS):
+        self.snapshot_manager = snapshot_manager
+        self.manager_provider = manager_provider
+        self.interval = interval
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='kpi-refresher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def request_refresh(self):
+        """다음 폴링을 기다리지 않고 바로 갱신 (쓰기 직후 호출용)"""
+        self._wake.set()
+
+    def _run(self):
+        last_run = 0.0
+        last_version = None
+        while not self._stop.is_set():
+            try:
+                version = self.snapshot_manager.get_version()
+                due = time.monotonic() - last_run >= self.interval
+                if due or version != last_version or self._wake.is_set():
+                    self._wake.clear()
+                    self.snapshot_manager.refresh(self.manager_provider())
+                    last_run, last_version = time.monotonic(), version
+            except Exception as e:
+                logger.error(f"KPI 스냅샷 갱신 오류: {e}")
+            self._wake.wait(self.poll_seconds)
+
+
+_refreshers = {}
+_refreshers_lock = threading.Lock()
+
+
+def factory_manager_provider(db_type=None):
+    """ManagerFactory에서 KPI 매니저들을 가져오는 함수 (백엔드는 호출 스레드에서 결정)"""
+    from config.database_config import DatabaseConfig, ManagerFactory
+
+    db_type = db_type or DatabaseConfig.get_database_type()
+
+    def provide():
+        managers = {}
+        for name, key in KPI_MANAGERS.items():
+            try:
+                managers[name] = ManagerFactory.get_manager(key, db_type)
+            except Exception as e:
+                logger.warning(f"KPI 매니저 로드 실패 ({key}): {e}")
+        return managers
+    return provide
+
+
+def start_kpi_refresher(db_path='erp_system.db', manager_provider=None, db_type=None, **options):
+    """db_path × 백엔드당 하나의 KPI 갱신 스레드 시작 (이미 실행 중이면 기존 스레드 반환)
+
+    스냅샷 매니저(refresher.snapshot_manager)도 여기서 한 번만 만들어 화면에서 재사용
+    """
+    if db_type is None:
+        from config.database_config import DatabaseConfig
+        db_type = DatabaseConfig.get_database_type()
+    with _refreshers_lock:
+        refresher = _refreshers.get((db_path, db_type))
+        if refresher is None:
+            refresher = KPIRefresher(SQLiteKPISnapshotManager(db_path, db_type),
+                                     manager_provider or factory_manager_provider(db_type), **options)
+            _refreshers[(db_path, db_type)] = refresher
+        return refresher.start()
+
+
+def request_kpi_refresh(db_path='erp_system.db'):
+    """실행 중인 KPI 갱신 스레드에 즉시 갱신 요청 (버전 폴링을 기다리지 않을 때)"""
+    with _refreshers_lock:
+        refreshers = [refresher for (path, _), refresher in _refreshers.items() if path == db_path]
+    for refresher in refreshers:
+        refresher.request_refresh()
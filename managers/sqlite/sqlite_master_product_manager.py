@@ -210,6 +210,13 @@ class SQLiteMasterProductManager:
             logger.error(f"모든 제품 조회 실패: {str(e)}")
             return pd.DataFrame()
 
+    def _notify_search_index(self, *master_product_ids):
+        """제품 검색 인덱스에 변경 제품 반영"""
+        from utils.product_search_index import notify_product_changed
+        for master_product_id in master_product_ids:
+            if master_product_id:
+                notify_product_changed(master_product_id, self.db_path)
+    
     def add_master_product(self, product_data):
         """통합 제품 추가 (기존 삭제된 제품이 있으면 업데이트)"""
         try:
@@ -364,6 +371,8 @@ class SQLiteMasterProductManager:
                     logger.info(f"신규 제품 추가 완료: {product_data['master_product_id']}")
                 
                 conn.commit()
+                self._notify_search_index(existing_product[0] if existing_product else None,
+                                          product_data['master_product_id'])
                 return True
                 
         except Exception as e:
@@ -784,7 +793,9 @@ class SQLiteMasterProductManager:
                 ''', values)
                 
                 if cursor.rowcount > 0:
+                    conn.commit()
                     logger.info(f"통합 제품 수정 완료: {master_product_id}")
+                    self._notify_search_index(master_product_id)
                     return True
                 else:
                     logger.warning(f"수정할 제품을 찾을 수 없음: {master_product_id}")
@@ -822,7 +833,9 @@ class SQLiteMasterProductManager:
                     ''', (master_product_id,))
                     
                     if cursor.rowcount > 0:
+                        conn.commit()
                         logger.info(f"통합 제품 완전 삭제 완료: {master_product_id}")
+                        self._notify_search_index(master_product_id)
                         return True
                     else:
                         logger.warning(f"삭제할 제품을 찾을 수 없음: {master_product_id}")
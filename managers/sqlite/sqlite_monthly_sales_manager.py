@@ -1,6 +1,10 @@
 """
 SQLite 월별 매출 관리자 - 월별 매출 분석, 트렌드, 목표 관리
 CSV 기반에서 SQLite 기반으로 전환
+
+매출 분석/목표 대비 실적 조회는 monthly_sales_cube 집계 테이블을 읽음
+(월 × 고객 × 카테고리 × 제품 × 담당자별 건수/수량/VND·USD 합계,
+monthly_sales 추가/수정/삭제 시 트리거가 같은 트랜잭션 안에서 증분 갱신)
 """
 
 import sqlite3
@@ -9,11 +13,80 @@ import os
 import json
 from datetime import datetime, timedelta
 from utils.currency_helper import CurrencyHelper
+from utils.revaluation import revalue
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 집계 차원 (NULL은 ''로 저장 - 기본 키 비교용, 조회 시 NULLIF로 되돌림)
+CUBE_DIMENSIONS = ('year_month', 'customer_id', 'customer_name', 'category', 'product_name', 'sales_rep')
+
+# 집계 측정값 → monthly_sales 행 1건의 기여분
+CUBE_MEASURES = {
+    'sales_count': '1',
+    'total_quantity': 'COALESCE({row}.quantity, 0)',
+    'total_amount': 'COALESCE({row}.total_amount, 0)',
+    'amount_vnd': 'COALESCE({row}.amount_vnd, 0)',
+    'amount_usd': 'COALESCE({row}.amount_usd, 0)',
+    'unit_price_sum': 'COALESCE({row}.unit_price, 0)',
+    'profit_margin_sum': 'COALESCE({row}.profit_margin, 0)',
+}
+
+_CUBE_TABLE_SQL = f'''
+    CREATE TABLE IF NOT EXISTS monthly_sales_cube (
+        {", ".join(f"{name} TEXT NOT NULL DEFAULT ''" for name in CUBE_DIMENSIONS)},
+        sales_count INTEGER NOT NULL DEFAULT 0,
+        {", ".join(f"{name} REAL NOT NULL DEFAULT 0" for name in CUBE_MEASURES if name != 'sales_count')},
+        PRIMARY KEY ({", ".join(CUBE_DIMENSIONS)})
+    )
+'''
+
+
+def _cube_apply_sql(row, sign):
+    """monthly_sales 행 1건(NEW/OLD)을 집계에 더하거나(sign=1) 빼는(sign=-1) SQL (트리거 본문용)"""
+    dimensions = ", ".join(CUBE_DIMENSIONS)
+    keys = ", ".join(f"COALESCE({row}.{name}, '')" for name in CUBE_DIMENSIONS)
+    values = ", ".join(f"{sign} * ({expr.format(row=row)})" for expr in CUBE_MEASURES.values())
+    updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in CUBE_MEASURES)
+    sql = f'''
+        INSERT INTO monthly_sales_cube ({dimensions}, {", ".join(CUBE_MEASURES)})
+        VALUES ({keys}, {values})
+        ON CONFLICT ({dimensions}) DO UPDATE SET {updates};
+    '''
+    if sign < 0:
+        match = " AND ".join(f"{name} = COALESCE({row}.{name}, '')" for name in CUBE_DIMENSIONS)
+        sql += f"DELETE FROM monthly_sales_cube WHERE {match} AND sales_count <= 0;"
+    return sql
+
+
+# 매출 추가/수정/삭제 시 같은 트랜잭션 안에서 집계를 증분 갱신하는 트리거
+_CUBE_TRIGGERS = {
+    'trg_monthly_sales_cube_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_monthly_sales_cube_insert
+        AFTER INSERT ON monthly_sales
+        BEGIN
+            {_cube_apply_sql("NEW", 1)}
+        END
+    ''',
+    'trg_monthly_sales_cube_update': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_monthly_sales_cube_update
+        AFTER UPDATE OF {", ".join(CUBE_DIMENSIONS)}, quantity, total_amount, amount_vnd,
+                        amount_usd, unit_price, profit_margin ON monthly_sales
+        BEGIN
+            {_cube_apply_sql("OLD", -1)}
+            {_cube_apply_sql("NEW", 1)}
+        END
+    ''',
+    'trg_monthly_sales_cube_delete': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_monthly_sales_cube_delete
+        AFTER DELETE ON monthly_sales
+        BEGIN
+            {_cube_apply_sql("OLD", -1)}
+        END
+    ''',
+}
+
 class SQLiteMonthlySalesManager:
     def __init__(self, db_path="erp_system.db"):
         self.db_path = db_path
@@ -72,6 +145,18 @@ class SQLiteMonthlySalesManager:
                     )
                 ''')
                 
+                # 매출 집계 테이블 - 트리거가 새로 설치된 경우 원본에서 한 번 다시 집계
+                cursor.execute(_CUBE_TABLE_SQL)
+                cursor.execute('''
+                    SELECT name FROM sqlite_master
+                    WHERE type = 'trigger' AND name LIKE 'trg_monthly_sales_cube%'
+                ''')
+                installed = {row[0] for row in cursor.fetchall()}
+                for ddl in _CUBE_TRIGGERS.values():
+                    cursor.execute(ddl)
+                if not set(_CUBE_TRIGGERS) <= installed:
+                    self._rebuild_cube(cursor)
+                
                 conn.commit()
                 logger.info("월별 매출 관련 테이블 초기화 완료")
                 
@@ -79,6 +164,28 @@ class SQLiteMonthlySalesManager:
             logger.error(f"테이블 초기화 실패: {str(e)}")
             raise
 
+    def _rebuild_cube(self, cursor):
+        """monthly_sales 전체에서 집계 테이블 다시 만들기"""
+        dimensions = ", ".join(CUBE_DIMENSIONS)
+        keys = ", ".join(f"COALESCE({name}, '')" for name in CUBE_DIMENSIONS)
+        sums = ", ".join(f"SUM({expr.format(row='monthly_sales')})" for expr in CUBE_MEASURES.values())
+        cursor.execute("DELETE FROM monthly_sales_cube")
+        cursor.execute(f'''
+            INSERT INTO monthly_sales_cube ({dimensions}, {", ".join(CUBE_MEASURES)})
+            SELECT {keys}, {sums} FROM monthly_sales GROUP BY {keys}
+        ''')
+
+    def refresh_sales_cube(self):
+        """매출 집계 전체 재계산 (트리거 밖에서 monthly_sales를 직접 고친 경우)"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._rebuild_cube(conn.cursor())
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"매출 집계 재계산 실패: {str(e)}")
+            return False
+
     def get_monthly_sales(self, year=None, month=None):
         """월별 매출 데이터 조회"""
         try:
@@ -286,14 +393,14 @@ class SQLiteMonthlySalesManager:
                 if month:
                     query = """
                         SELECT 
-                            COUNT(*) as total_sales,
+                            SUM(sales_count) as total_sales,
                             SUM(total_amount) as total_revenue,
                             SUM(amount_vnd) as total_vnd,
                             SUM(amount_usd) as total_usd,
-                            AVG(profit_margin) as avg_profit_margin,
-                            category,
-                            COUNT(*) as category_count
-                        FROM monthly_sales 
+                            SUM(profit_margin_sum) / SUM(sales_count) as avg_profit_margin,
+                            NULLIF(category, '') as category,
+                            SUM(sales_count) as category_count
+                        FROM monthly_sales_cube 
                         WHERE year_month = ?
                         GROUP BY category
                     """
@@ -301,14 +408,14 @@ class SQLiteMonthlySalesManager:
                 else:
                     query = """
                         SELECT 
-                            COUNT(*) as total_sales,
+                            SUM(sales_count) as total_sales,
                             SUM(total_amount) as total_revenue,
                             SUM(amount_vnd) as total_vnd,
                             SUM(amount_usd) as total_usd,
-                            AVG(profit_margin) as avg_profit_margin,
+                            SUM(profit_margin_sum) / SUM(sales_count) as avg_profit_margin,
                             year_month,
-                            COUNT(*) as monthly_count
-                        FROM monthly_sales 
+                            SUM(sales_count) as monthly_count
+                        FROM monthly_sales_cube 
                         WHERE year_month LIKE ?
                         GROUP BY year_month
                         ORDER BY year_month
@@ -361,16 +468,24 @@ class SQLiteMonthlySalesManager:
                 orders_df = pd.read_sql_query(query, conn)
                 
                 if not orders_df.empty:
-                    # 기존 매출 데이터와 중복 제거
+                    # 주문 통화 금액을 주문일 환율로 VND/USD 환산 (통화별 1회 조회)
+                    orders_df = orders_df.loc[:, ~orders_df.columns.duplicated()]
+                    for target in ('VND', 'USD'):
+                        column = f"amount_{target.lower()}"
+                        revalued = revalue(orders_df, target, amount_col='total_amount',
+                                           date_col='sales_date', output_col=column,
+                                           rate_col=None, db_path=self.db_path)
+                        orders_df[column] = revalued[column].fillna(orders_df[column])
+                    
+                    # 기존 매출 데이터와 중복 제거 (기존 ID 1회 조회)
+                    existing_ids = {
+                        row[0] for row in conn.execute("SELECT sales_id FROM monthly_sales")
+                    }
                     for _, row in orders_df.iterrows():
                         sales_id = f"SALES_{row['order_id']}_{row['product_code']}"
                         
-                        # 이미 존재하는지 확인
-                        existing_query = "SELECT COUNT(*) FROM monthly_sales WHERE sales_id = ?"
-                        cursor = conn.cursor()
-                        cursor.execute(existing_query, (sales_id,))
-                        
-                        if cursor.fetchone()[0] == 0:  # 존재하지 않으면 추가
+                        if sales_id not in existing_ids:  # 존재하지 않으면 추가
+                            existing_ids.add(sales_id)
                             sales_data = {
                                 'sales_id': sales_id,
                                 'year_month': row['year_month'],
@@ -444,12 +559,12 @@ class SQLiteMonthlySalesManager:
                 query = """
                     SELECT 
                         year_month,
-                        COUNT(*) as total_transactions,
+                        SUM(sales_count) as total_transactions,
                         SUM(amount_vnd) as total_vnd,
                         SUM(amount_usd) as total_usd,
-                        AVG(amount_vnd) as avg_vnd,
-                        AVG(amount_usd) as avg_usd
-                    FROM monthly_sales
+                        SUM(amount_vnd) / SUM(sales_count) as avg_vnd,
+                        SUM(amount_usd) / SUM(sales_count) as avg_usd
+                    FROM monthly_sales_cube
                 """
                 params = []
                 if year_month:
@@ -481,7 +596,7 @@ class SQLiteMonthlySalesManager:
                             year_month,
                             SUM(amount_vnd) as actual_vnd,
                             SUM(amount_usd) as actual_usd
-                        FROM monthly_sales
+                        FROM monthly_sales_cube
                         GROUP BY year_month
                     ) s ON t.year_month = s.year_month
                 """
@@ -504,19 +619,19 @@ class SQLiteMonthlySalesManager:
             with sqlite3.connect(self.db_path) as conn:
                 query = """
                     SELECT 
-                        customer_name,
-                        COUNT(*) as transaction_count,
+                        NULLIF(customer_name, '') as customer_name,
+                        SUM(sales_count) as transaction_count,
                         SUM(amount_vnd) as total_vnd,
                         SUM(amount_usd) as total_usd,
-                        AVG(amount_vnd) as avg_vnd
-                    FROM monthly_sales
+                        SUM(amount_vnd) / SUM(sales_count) as avg_vnd
+                    FROM monthly_sales_cube
                 """
                 params = []
                 if year_month:
                     query += " WHERE year_month = ?"
                     params.append(year_month)
                 
-                query += " GROUP BY customer_name ORDER BY total_vnd DESC"
+                query += " GROUP BY 1 ORDER BY total_vnd DESC"
                 
                 df = pd.read_sql_query(query, conn, params=params)
                 return df
@@ -530,20 +645,20 @@ class SQLiteMonthlySalesManager:
             with sqlite3.connect(self.db_path) as conn:
                 query = """
                     SELECT 
-                        product_name,
-                        category,
-                        SUM(quantity) as total_quantity,
+                        NULLIF(product_name, '') as product_name,
+                        NULLIF(category, '') as category,
+                        SUM(total_quantity) as total_quantity,
                         SUM(amount_vnd) as total_vnd,
                         SUM(amount_usd) as total_usd,
-                        AVG(unit_price) as avg_price
-                    FROM monthly_sales
+                        SUM(unit_price_sum) / SUM(sales_count) as avg_price
+                    FROM monthly_sales_cube
                 """
                 params = []
                 if year_month:
                     query += " WHERE year_month = ?"
                     params.append(year_month)
                 
-                query += " GROUP BY product_name, category ORDER BY total_vnd DESC"
+                query += " GROUP BY 1, 2 ORDER BY total_vnd DESC"
                 
                 df = pd.read_sql_query(query, conn, params=params)
                 return df
@@ -560,14 +675,14 @@ class SQLiteMonthlySalesManager:
                         year_month,
                         SUM(amount_vnd) as total_vnd,
                         SUM(amount_usd) as total_usd,
-                        COUNT(*) as transaction_count
-                    FROM monthly_sales
-                    WHERE year_month >= datetime("now", "-{} months")
+                        SUM(sales_count) as transaction_count
+                    FROM monthly_sales_cube
+                    WHERE year_month >= strftime('%Y-%m', 'now', ?)
                     GROUP BY year_month
                     ORDER BY year_month
-                """.format(months)
+                """
                 
-                df = pd.read_sql_query(query, conn)
+                df = pd.read_sql_query(query, conn, params=[f"-{int(months)} months"])
                 return df
         except Exception as e:
             logger.error(f"매출 트렌드 분석 오류: {e}")
@@ -230,6 +230,10 @@ class SQLiteOrderManager:
                 # 상태 변경 이력 추가
                 self._add_status_history(conn, order_id, None, 'pending', created_by, '주문 생성')
                 
+                # 문서 연결 인덱스 (견적서 → 주문)
+                from managers.sqlite.sqlite_document_link_manager import link_documents
+                link_documents(conn, 'quotation', order_data['quotation_id'], 'order', order_id, 'ordered')
+                
                 conn.commit()
                 logger.info(f"주문 생성 성공: {order_id}")
                 return order_id
@@ -539,6 +543,9 @@ class SQLiteOrderManager:
                 conn.execute('DELETE FROM order_items WHERE order_id = ?', (order_id,))
                 conn.execute('DELETE FROM orders WHERE order_id = ?', (order_id,))
                 
+                from managers.sqlite.sqlite_document_link_manager import unlink_documents
+                unlink_documents(conn, 'order', order_id)
+                
                 conn.commit()
                 logger.info(f"주문 삭제 성공: {order_id}")
                 return True
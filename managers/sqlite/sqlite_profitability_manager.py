@@ -0,0 +1,606 @@
+"""
+SQLite 고객 / 제품 수익성 관리자
+monthly_sales 매출 행에 실제 공급 원가, 배송비, 배부 간접비를 붙여 월별 고객·제품 이익 테이블로 저장
+
+- 공급 원가: 제품 코드별 단가 이력(master_product_prices 구매가 + 공급 협정/공급가 변동 이력 CSV)을
+  매출일 기준 merge_asof(직전 유효 단가)로 조인, 단가가 없는 행은 monthly_sales.cost_amount(기본 이익률 추정)
+  (비활성 협정은 제외, 협정 종료일이 지난 매출은 기간 안의 다른 단가로 다시 매칭)
+- 배송비: shipments.quotation_id가 같은 매출 행(모든 월)에 매출액 비율로 배분
+- 간접비: 같은 달 사무용품 구매 실적(budget_rollups 'office_purchase')을 그 달 매출액 비율로 배분
+- 금액은 모두 USD (원가/배송비/간접비는 해당 날짜 환율로 환산)
+- 증분 갱신: 트리거가 바뀐 월을 profitability_dirty_months에 기록하고 refresh()는 그 월만 다시 계산
+  (단가 이력은 CSV라 파일/테이블 서명이 바뀌면 전체 월을 다시 계산)
+- 조회는 저장된 테이블만 읽고, 갱신은 refresh_async()의 백그라운드 스레드에서 실행
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from utils.revaluation import revalue
+
+logger = logging.getLogger(__name__)
+
+SUPPLIER_AGREEMENTS_FILE = os.path.join('data', 'supplier_agreements.csv')
+SUPPLY_PRICE_HISTORY_FILE = os.path.join('data', 'supply_price_history.csv')
+
+# 공급 협정 is_active로 활성 처리하는 값 (컬럼이 없으면 모두 활성)
+ACTIVE_FLAG_VALUES = ('true', '1', 'yes', 'y')
+
+# 백그라운드 갱신 중인 db_path
+_running = set()
+_running_lock = threading.Lock()
+
+LINE_MEASURES = ('revenue_usd', 'supply_cost_usd', 'shipping_cost_usd', 'overhead_usd', 'total_cost_usd', 'margin_usd')
+
+_PROFITABILITY_TABLES_SQL = (
+    f'''
+    CREATE TABLE IF NOT EXISTS sales_line_profitability (
+        sales_id TEXT PRIMARY KEY,
+        year_month TEXT NOT NULL,
+        sales_date TEXT,
+        customer_id TEXT NOT NULL DEFAULT '',
+        customer_name TEXT NOT NULL DEFAULT '',
+        product_code TEXT NOT NULL DEFAULT '',
+        product_name TEXT NOT NULL DEFAULT '',
+        category TEXT NOT NULL DEFAULT '',
+        quantity REAL NOT NULL DEFAULT 0,
+        {", ".join(f"{name} REAL NOT NULL DEFAULT 0" for name in LINE_MEASURES)},
+        cost_source TEXT NOT NULL DEFAULT 'estimated'
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_sales_line_profitability_month
+    ON sales_line_profitability (year_month)
+    ''',
+    f'''
+    CREATE TABLE IF NOT EXISTS customer_profitability (
+        year_month TEXT NOT NULL,
+        customer_id TEXT NOT NULL,
+        customer_name TEXT NOT NULL DEFAULT '',
+        line_count INTEGER NOT NULL DEFAULT 0,
+        {", ".join(f"{name} REAL NOT NULL DEFAULT 0" for name in LINE_MEASURES)},
+        PRIMARY KEY (year_month, customer_id)
+    )
+    ''',
+    f'''
+    CREATE TABLE IF NOT EXISTS product_profitability (
+        year_month TEXT NOT NULL,
+        product_code TEXT NOT NULL,
+        product_name TEXT NOT NULL DEFAULT '',
+        category TEXT NOT NULL DEFAULT '',
+        quantity REAL NOT NULL DEFAULT 0,
+        line_count INTEGER NOT NULL DEFAULT 0,
+        {", ".join(f"{name} REAL NOT NULL DEFAULT 0" for name in LINE_MEASURES)},
+        PRIMARY KEY (year_month, product_code)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS profitability_dirty_months (
+        year_month TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 1
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS profitability_state (
+        state_key TEXT PRIMARY KEY,
+        state_value TEXT
+    )
+    ''',
+)
+
+
+def _mark_sql(month_expr):
+    return f'''
+        INSERT INTO profitability_dirty_months (year_month)
+        SELECT {month_expr} WHERE {month_expr} IS NOT NULL
+        ON CONFLICT (year_month) DO UPDATE SET version = version + 1;
+    '''
+
+
+def _mark_quotation_sql(row):
+    return f'''
+        INSERT INTO profitability_dirty_months (year_month)
+        SELECT DISTINCT year_month FROM monthly_sales
+        WHERE quotation_id = {row}.quotation_id AND year_month IS NOT NULL
+        ON CONFLICT (year_month) DO UPDATE SET version = version + 1;
+    '''
+
+
+# {원본 테이블: {트리거 이름: DDL}} - 변경된 월을 다시 계산 대상으로 표시
+_DIRTY_TRIGGERS = {
+    'monthly_sales': {
+        'trg_profitability_sales_insert': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_insert
+            AFTER INSERT ON monthly_sales
+            BEGIN {_mark_sql("NEW.year_month")} END
+        ''',
+        'trg_profitability_sales_update': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_update
+            AFTER UPDATE ON monthly_sales
+            BEGIN {_mark_sql("OLD.year_month")} {_mark_sql("NEW.year_month")} END
+        ''',
+        'trg_profitability_sales_delete': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_delete
+            AFTER DELETE ON monthly_sales
+            BEGIN {_mark_sql("OLD.year_month")} END
+        ''',
+        # 견적서 배송비는 견적서의 모든 월 매출 행에 배분되므로 매출이 바뀌면 그 견적서의 모든 월을 다시 계산
+        'trg_profitability_sales_quotation_insert': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_quotation_insert
+            AFTER INSERT ON monthly_sales WHEN NEW.quotation_id IS NOT NULL
+            BEGIN {_mark_quotation_sql("NEW")} END
+        ''',
+        'trg_profitability_sales_quotation_update': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_quotation_update
+            AFTER UPDATE OF quotation_id, amount_usd, year_month ON monthly_sales
+            BEGIN {_mark_quotation_sql("OLD")} {_mark_quotation_sql("NEW")} END
+        ''',
+        'trg_profitability_sales_quotation_delete': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_sales_quotation_delete
+            AFTER DELETE ON monthly_sales WHEN OLD.quotation_id IS NOT NULL
+            BEGIN {_mark_quotation_sql("OLD")} END
+        ''',
+    },
+    'shipments': {
+        'trg_profitability_shipment_insert': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_shipment_insert
+            AFTER INSERT ON shipments
+            BEGIN {_mark_quotation_sql("NEW")} END
+        ''',
+        'trg_profitability_shipment_update': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_shipment_update
+            AFTER UPDATE OF quotation_id, shipping_cost, currency, shipping_date ON shipments
+            BEGIN {_mark_quotation_sql("OLD")} {_mark_quotation_sql("NEW")} END
+        ''',
+        'trg_profitability_shipment_delete': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_shipment_delete
+            AFTER DELETE ON shipments
+            BEGIN {_mark_quotation_sql("OLD")} END
+        ''',
+    },
+    'budget_rollups': {
+        'trg_profitability_overhead_insert': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_overhead_insert
+            AFTER INSERT ON budget_rollups WHEN NEW.source = 'office_purchase'
+            BEGIN {_mark_sql("NEW.period")} END
+        ''',
+        'trg_profitability_overhead_update': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_overhead_update
+            AFTER UPDATE ON budget_rollups WHEN NEW.source = 'office_purchase'
+            BEGIN {_mark_sql("NEW.period")} END
+        ''',
+        'trg_profitability_overhead_delete': f'''
+            CREATE TRIGGER IF NOT EXISTS trg_profitability_overhead_delete
+            AFTER DELETE ON budget_rollups WHEN OLD.source = 'office_purchase'
+            BEGIN {_mark_sql("OLD.period")} END
+        ''',
+    },
+}
+
+
+class SQLiteProfitabilityManager:
+    """고객/제품 월별 수익성 (실제 원가 기반)"""
+
+    def __init__(self, db_path='erp_system.db', agreements_file=SUPPLIER_AGREEMENTS_FILE,
+                 price_history_file=SUPPLY_PRICE_HISTORY_FILE):
+        self.db_path = db_path
+        self.agreements_file = agreements_file
+        self.price_history_file = price_history_file
+        self.init_tables()
+
+    def get_connection(self):
+        return sqlite3.connect(self.db_path)
+
+    def _table_exists(self, conn, table):
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone() is not None
+
+    def init_tables(self):
+        """테이블/트리거 생성 (새로 설치된 트리거가 있으면 전체 월을 다시 계산 대상으로 표시)"""
+        with self.get_connection() as conn:
+            for sql in _PROFITABILITY_TABLES_SQL:
+                conn.execute(sql)
+            installed = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_profitability%'")}
+            newly_installed = False
+            for table, triggers in _DIRTY_TRIGGERS.items():
+                if not self._table_exists(conn, table):
+                    continue
+                for ddl in triggers.values():
+                    conn.execute(ddl)
+                newly_installed = newly_installed or not set(triggers) <= installed
+            if newly_installed:
+                self._mark_all_months(conn)
+            conn.commit()
+
+    def _mark_all_months(self, conn):
+        if not self._table_exists(conn, 'monthly_sales'):
+            return
+        conn.execute('''
+            INSERT INTO profitability_dirty_months (year_month)
+            SELECT year_month FROM (
+                SELECT DISTINCT year_month FROM monthly_sales WHERE year_month IS NOT NULL
+                UNION SELECT year_month FROM sales_line_profitability
+            )
+            WHERE true
+            ON CONFLICT (year_month) DO UPDATE SET version = version + 1
+        ''')
+
+    # ---------- 원가 데이터 ----------
+
+    def _cost_signature(self, conn):
+        """단가 이력 서명 (CSV 수정 시각 + master_product_prices 변경)"""
+        parts = []
+        for path in (self.agreements_file, self.price_history_file):
+            parts.append(f"{path}:{os.path.getmtime(path) if os.path.exists(path) else 0}")
+        if self._table_exists(conn, 'master_product_prices'):
+            row = conn.execute("SELECT COUNT(*), MAX(updated_date) FROM master_product_prices").fetchone()
+            parts.append(f"prices:{row[0]}:{row[1]}")
+        return "|".join(parts)
+
+    def _read_csv(self, path):
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        try:
+            return pd.read_csv(path, encoding='utf-8-sig', dtype=str)
+        except Exception as e:
+            logger.warning(f"단가 이력 파일 읽기 실패 ({path}): {e}")
+            return pd.DataFrame()
+
+    def load_unit_costs(self, conn=None):
+        """제품 코드별 단가 이력 DataFrame[product_code, effective_date, expiry_date, unit_cost_usd, cost_source]
+
+        expiry_date: 공급 협정 종료일 (협정가/협정 변동 이력만, 그 밖의 단가는 NaT)
+        """
+        frames = []
+
+        agreements = self._read_csv(self.agreements_file)
+        if not agreements.empty and {'product_code', 'agreement_price_usd'} <= set(agreements.columns):
+            if 'is_active' in agreements.columns:
+                active = agreements['is_active'].fillna('').str.strip().str.lower().isin(ACTIVE_FLAG_VALUES)
+            else:
+                active = pd.Series(True, index=agreements.index)
+            end_dates = agreements.get('agreement_end_date', pd.Series(None, index=agreements.index, dtype=object))
+            frames.append(pd.DataFrame({
+                'product_code': agreements['product_code'],
+                'effective_date': agreements.get('agreement_start_date'),
+                'expiry_date': end_dates,
+                'unit_cost': agreements['agreement_price_usd'],
+                'currency': 'USD',
+                'cost_source': 'supplier_agreement',
+            })[active])
+
+            history = self._read_csv(self.price_history_file)
+            if not history.empty and {'agreement_id', 'new_price_usd'} <= set(history.columns):
+                by_agreement = agreements.assign(active=active, end_date=end_dates) \
+                    .drop_duplicates('agreement_id').set_index('agreement_id')
+                known = history['agreement_id'].isin(by_agreement.index)
+                # 협정이 있으면 협정의 활성 여부/종료일을 따르고, 없는 협정 ID는 제품 ID로 매칭
+                history = history[~known | history['agreement_id'].map(by_agreement['active']).fillna(False).astype(bool)]
+                frames.append(pd.DataFrame({
+                    'product_code': history['agreement_id'].map(by_agreement['product_code']).fillna(history.get('product_id')),
+                    'effective_date': history.get('effective_date', history.get('change_date')),
+                    'expiry_date': history['agreement_id'].map(by_agreement['end_date']),
+                    'unit_cost': history['new_price_usd'],
+                    'currency': 'USD',
+                    'cost_source': 'supply_price_history',
+                }))
+
+        close = conn is None
+        conn = conn or self.get_connection()
+        try:
+            if self._table_exists(conn, 'master_product_prices') and self._table_exists(conn, 'master_products'):
+                frames.append(pd.read_sql_query('''
+                    SELECT m.product_code,
+                           COALESCE(p.valid_from, p.created_date) AS effective_date,
+                           COALESCE(NULLIF(p.cost_price, 0), p.price) AS unit_cost,
+                           p.currency,
+                           'master_product_price' AS cost_source
+                    FROM master_product_prices p
+                    JOIN master_products m ON m.master_product_id = p.master_product_id
+                    WHERE p.price_type = 'purchase' AND COALESCE(p.is_active, 1) = 1
+                ''', conn))
+        finally:
+            if close:
+                conn.close()
+
+        if not frames:
+            return pd.DataFrame(columns=['product_code', 'effective_date', 'expiry_date', 'unit_cost_usd', 'cost_source'])
+
+        costs = pd.concat(frames, ignore_index=True)
+        costs['effective_date'] = pd.to_datetime(costs['effective_date'].astype(str).str[:10], errors='coerce')
+        costs['expiry_date'] = pd.to_datetime(costs['expiry_date'].astype(str).str[:10], errors='coerce')
+        costs['unit_cost'] = pd.to_numeric(costs['unit_cost'], errors='coerce')
+        costs = costs.dropna(subset=['product_code', 'effective_date', 'unit_cost'])
+        costs = costs[costs['unit_cost'] > 0]
+        costs = revalue(costs, 'USD', amount_col='unit_cost', date_col='effective_date',
+                        output_col='unit_cost_usd', rate_col=None, db_path=self.db_path)
+        costs = costs.dropna(subset=['unit_cost_usd'])
+        return costs[['product_code', 'effective_date', 'expiry_date', 'unit_cost_usd', 'cost_source']]
+
+    @staticmethod
+    def _match_unit_costs(lines, unit_costs):
+        """매출일 직전 유효 단가 as-of 조인 (종료된 협정가가 잡힌 행은 기간 안의 가장 최근 단가로 다시 매칭)"""
+        lines = pd.merge_asof(
+            lines, unit_costs.sort_values('effective_date', kind='stable'),
+            left_on='sales_day', right_on='effective_date', by='product_code', direction='backward',
+        )
+        expired = (lines['sales_day'] > lines['expiry_date']).to_numpy()
+        if not expired.any():
+            return lines
+
+        candidates = lines.loc[expired, ['sales_id', 'product_code', 'sales_day']].merge(unit_costs, on='product_code')
+        candidates = candidates[(candidates['effective_date'] <= candidates['sales_day'])
+                                & ~(candidates['sales_day'] > candidates['expiry_date'])]
+        best = candidates.sort_values('effective_date', kind='stable') \
+            .drop_duplicates('sales_id', keep='last').set_index('sales_id')
+        retried = lines.loc[expired, 'sales_id']
+        for column in ('effective_date', 'expiry_date', 'unit_cost_usd', 'cost_source'):
+            lines.loc[expired, column] = retried.map(best[column]).to_numpy()
+        return lines
+
+    # ---------- 계산 ----------
+
+    def compute_lines(self, conn, months, unit_costs=None):
+        """지정 월 매출 행별 원가/배송비/간접비/이익 DataFrame"""
+        placeholders = ", ".join("?" * len(months))
+        lines = pd.read_sql_query(f'''
+            SELECT sales_id, year_month,
+                   COALESCE(sales_date, year_month || '-01') AS sales_date,
+                   COALESCE(customer_id, '') AS customer_id, COALESCE(customer_name, '') AS customer_name,
+                   COALESCE(product_code, '') AS product_code, COALESCE(product_name, '') AS product_name,
+                   COALESCE(category, '') AS category, COALESCE(quantity, 0) AS quantity,
+                   COALESCE(amount_usd, 0) AS revenue_usd,
+                   COALESCE(cost_amount, 0) AS estimated_cost_usd,
+                   COALESCE(quotation_id, '') AS quotation_id
+            FROM monthly_sales
+            WHERE year_month IN ({placeholders})
+        ''', conn, params=list(months))
+        if lines.empty:
+            return lines
+
+        # 1) 공급 원가 - 제품 코드별 매출일 직전 유효 단가 (as-of 조인)
+        unit_costs = self.load_unit_costs(conn) if unit_costs is None else unit_costs
+        lines['sales_day'] = pd.to_datetime(lines['sales_date'].astype(str).str[:10], errors='coerce')
+        lines['sales_day'] = lines['sales_day'].fillna(pd.to_datetime(lines['year_month'] + '-01'))
+        lines = lines.sort_values('sales_day', kind='stable')
+        if not unit_costs.empty:
+            lines = self._match_unit_costs(lines, unit_costs)
+        else:
+            lines['unit_cost_usd'] = np.nan
+            lines['cost_source'] = None
+        has_cost = lines['unit_cost_usd'].notna().to_numpy()
+        lines['supply_cost_usd'] = np.where(
+            has_cost, lines['unit_cost_usd'].fillna(0).to_numpy() * lines['quantity'].to_numpy(),
+            lines['estimated_cost_usd'].to_numpy())
+        lines['cost_source'] = np.where(has_cost, lines['cost_source'].fillna(''), 'estimated')
+
+        # 2) 배송비 - 견적서별 배송비를 그 견적서의 모든 월 매출 행에 매출액 비율로 배분
+        lines['shipping_cost_usd'] = 0.0
+        quotations = sorted(set(lines['quotation_id']) - {''})
+        if quotations and self._table_exists(conn, 'shipments'):
+            quotation_placeholders = ", ".join("?" * len(quotations))
+            shipments = pd.read_sql_query(f'''
+                SELECT quotation_id, COALESCE(shipping_cost, 0) AS shipping_cost,
+                       COALESCE(currency, 'VND') AS currency,
+                       COALESCE(shipping_date, created_date) AS shipping_date
+                FROM shipments
+                WHERE quotation_id IN ({quotation_placeholders}) AND shipping_cost > 0
+            ''', conn, params=quotations)
+            if not shipments.empty:
+                shipments = revalue(shipments, 'USD', amount_col='shipping_cost', date_col='shipping_date',
+                                    output_col='shipping_usd', rate_col=None, fill_missing=True,
+                                    db_path=self.db_path)
+                by_quotation = shipments.groupby('quotation_id')['shipping_usd'].sum()
+                # 배분 기준은 계산 대상 월이 아니라 견적서 전체 매출 행
+                totals = pd.read_sql_query(f'''
+                    SELECT quotation_id, SUM(COALESCE(amount_usd, 0)) AS revenue_total, COUNT(*) AS line_count
+                    FROM monthly_sales
+                    WHERE quotation_id IN ({quotation_placeholders})
+                    GROUP BY quotation_id
+                ''', conn, params=quotations).set_index('quotation_id')
+                lines['shipping_cost_usd'] = self._allocate(lines, 'quotation_id', by_quotation, totals)
+
+        # 3) 간접비 - 월 사무용품 구매 실적을 그 달 매출액 비율로 배분
+        lines['overhead_usd'] = 0.0
+        if self._table_exists(conn, 'budget_rollups'):
+            overhead = pd.read_sql_query(f'''
+                SELECT period AS year_month, currency, SUM(actual_amount) AS amount,
+                       period || '-01' AS rate_date
+                FROM budget_rollups
+                WHERE source = 'office_purchase' AND period IN ({placeholders})
+                GROUP BY period, currency
+            ''', conn, params=list(months))
+            if not overhead.empty:
+                overhead = revalue(overhead, 'USD', date_col='rate_date', output_col='overhead_usd',
+                                   rate_col=None, fill_missing=True, db_path=self.db_path)
+                by_month = overhead.groupby('year_month')['overhead_usd'].sum()
+                lines['overhead_usd'] = self._allocate(lines, 'year_month', by_month)
+
+        lines['total_cost_usd'] = lines['supply_cost_usd'] + lines['shipping_cost_usd'] + lines['overhead_usd']
+        lines['margin_usd'] = lines['revenue_usd'] - lines['total_cost_usd']
+        lines['sales_date'] = lines['sales_day'].dt.strftime('%Y-%m-%d')
+        return lines
+
+    @staticmethod
+    def _allocate(lines, key, pool, totals=None):
+        """그룹별 금액(pool)을 그룹 내 매출액 비율로 배분 (매출이 0이면 행 수로 균등 배분)
+
+        totals: 그룹별 전체 revenue_total / line_count (없으면 lines 안에서 계산)
+        """
+        if totals is None:
+            group = lines.groupby(key)['revenue_usd']
+            revenue_total = group.transform('sum').to_numpy()
+            line_count = group.transform('size').to_numpy()
+        else:
+            revenue_total = lines[key].map(totals['revenue_total']).fillna(0.0).to_numpy()
+            line_count = lines[key].map(totals['line_count']).fillna(1).to_numpy()
+        share = np.where(revenue_total != 0,
+                         lines['revenue_usd'].to_numpy() / np.where(revenue_total != 0, revenue_total, 1),
+                         1.0 / line_count)
+        return lines[key].map(pool).fillna(0.0).to_numpy() * share
+
+    # ---------- 증분 갱신 ----------
+
+    def needs_refresh(self):
+        """다시 계산할 월이 있거나 단가 이력이 바뀌었는지"""
+        with self.get_connection() as conn:
+            if not self._table_exists(conn, 'monthly_sales'):
+                return False
+            if conn.execute("SELECT 1 FROM profitability_dirty_months LIMIT 1").fetchone():
+                return True
+            stored = conn.execute(
+                "SELECT state_value FROM profitability_state WHERE state_key = 'cost_signature'").fetchone()
+            return stored is None or stored[0] != self._cost_signature(conn)
+
+    def refresh_async(self):
+        """갱신할 내용이 있으면 백그라운드 스레드에서 refresh() (이미 실행 중이면 무시)
+
+        Returns:
+            bool: 새로 시작했는지 여부
+        """
+        if not self.needs_refresh():
+            return False
+        with _running_lock:
+            if self.db_path in _running:
+                return False
+            _running.add(self.db_path)
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"수익성 갱신 오류: {e}")
+            finally:
+                with _running_lock:
+                    _running.discard(self.db_path)
+
+        threading.Thread(target=run, name='profitability-refresh', daemon=True).start()
+        return True
+
+    def is_refreshing(self):
+        with _running_lock:
+            return self.db_path in _running
+
+    def refresh(self, full=False):
+        """다시 계산 대상 월만 갱신 (full=True면 전체 월)
+
+        Returns:
+            list: 갱신한 월 목록
+        """
+        with self.get_connection() as conn:
+            if not self._table_exists(conn, 'monthly_sales'):
+                return []
+            signature = self._cost_signature(conn)
+            stored = conn.execute(
+                "SELECT state_value FROM profitability_state WHERE state_key = 'cost_signature'").fetchone()
+            if full or stored is None or stored[0] != signature:
+                self._mark_all_months(conn)
+                conn.commit()
+
+            dirty = conn.execute("SELECT year_month, version FROM profitability_dirty_months").fetchall()
+            if not dirty:
+                return []
+            months = [row[0] for row in dirty]
+            started = datetime.now()
+            lines = self.compute_lines(conn, months)
+
+            placeholders = ", ".join("?" * len(months))
+            for table in ('sales_line_profitability', 'customer_profitability', 'product_profitability'):
+                conn.execute(f"DELETE FROM {table} WHERE year_month IN ({placeholders})", months)
+
+            if not lines.empty:
+                line_columns = ['sales_id', 'year_month', 'sales_date', 'customer_id', 'customer_name',
+                                'product_code', 'product_name', 'category', 'quantity',
+                                *LINE_MEASURES, 'cost_source']
+                self._insert(conn, 'sales_line_profitability', lines[line_columns])
+
+                measures = list(LINE_MEASURES)
+                customers = lines.groupby(['year_month', 'customer_id'], as_index=False).agg(
+                    customer_name=('customer_name', 'first'), line_count=('sales_id', 'size'),
+                    **{name: (name, 'sum') for name in measures})
+                self._insert(conn, 'customer_profitability', customers)
+
+                products = lines.groupby(['year_month', 'product_code'], as_index=False).agg(
+                    product_name=('product_name', 'first'), category=('category', 'first'),
+                    quantity=('quantity', 'sum'), line_count=('sales_id', 'size'),
+                    **{name: (name, 'sum') for name in measures})
+                self._insert(conn, 'product_profitability', products)
+
+            # 계산 중 다시 바뀐 월(version 증가)은 다음 갱신 대상으로 남김
+            conn.executemany("DELETE FROM profitability_dirty_months WHERE year_month = ? AND version = ?", dirty)
+            conn.execute('''
+                INSERT OR REPLACE INTO profitability_state (state_key, state_value)
+                VALUES ('cost_signature', ?)
+            ''', (signature,))
+            conn.commit()
+
+        logger.info(f"수익성 {len(months)}개월 갱신 완료 ({len(lines)}건, "
+                    f"{(datetime.now() - started).total_seconds():.1f}초)")
+        return sorted(months)
+
+    @staticmethod
+    def _insert(conn, table, frame):
+        columns = list(frame.columns)
+        conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None),
+        )
+
+    # ---------- 조회 ----------
+
+    def _summary(self, table, keys, year_month=None, start_month=None, end_month=None):
+        conditions, params = [], []
+        if year_month:
+            conditions.append("year_month = ?")
+            params.append(year_month)
+        if start_month:
+            conditions.append("year_month >= ?")
+            params.append(start_month)
+        if end_month:
+            conditions.append("year_month <= ?")
+            params.append(end_month)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.get_connection() as conn:
+            df = pd.read_sql_query(f'''
+                SELECT {keys}, SUM(line_count) AS line_count,
+                       {", ".join(f"SUM({name}) AS {name}" for name in LINE_MEASURES)}
+                FROM {table} {where}
+                GROUP BY 1 ORDER BY margin_usd DESC
+            ''', conn, params=params)
+        df['margin_rate'] = (df['margin_usd'] / df['revenue_usd'].where(df['revenue_usd'] != 0)).fillna(0)
+        return df
+
+    def get_customer_profitability(self, year_month=None, start_month=None, end_month=None):
+        """고객별 매출/원가/이익 (이익 큰 순)"""
+        return self._summary('customer_profitability',
+                             "customer_id, MAX(customer_name) AS customer_name",
+                             year_month, start_month, end_month)
+
+    def get_product_profitability(self, year_month=None, start_month=None, end_month=None):
+        """제품별 매출/원가/이익 (이익 큰 순)"""
+        return self._summary('product_profitability',
+                             "product_code, MAX(product_name) AS product_name, MAX(category) AS category, "
+                             "SUM(quantity) AS quantity",
+                             year_month, start_month, end_month)
+
+    def get_cost_coverage(self, year_month=None):
+        """원가 출처별 매출 행 수 / 매출액 (실제 단가 적용 비율 확인용)"""
+        with self.get_connection() as conn:
+            query = '''
+                SELECT cost_source, COUNT(*) AS line_count, SUM(revenue_usd) AS revenue_usd
+                FROM sales_line_profitability
+            '''
+            params = []
+            if year_month:
+                query += " WHERE year_month = ?"
+                params.append(year_month)
+            query += " GROUP BY cost_source ORDER BY line_count DESC"
+            return pd.read_sql_query(query, conn, params=params)
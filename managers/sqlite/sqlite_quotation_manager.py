@@ -6,6 +6,112 @@ import pandas as pd
 from datetime import datetime, timedelta
 import json
 
+# IN (...) 절 하나에 넣는 최대 ID 수 (SQLite 변수 제한 999 이하)
+_ID_CHUNK_SIZE = 500
+
+# 저장된 총액과 품목 합계의 허용 오차 (검증 모드)
+TOTALS_TOLERANCE = 0.5
+
+
+def _totals_update_sql(quotation_id_expr, delta_expr):
+    """견적서 총액에 품목 금액 변화분을 반영하는 UPDATE (트리거 본문용)"""
+    subtotal = f"(COALESCE(subtotal_excl_vat, 0) + ({delta_expr}))"
+    return f'''
+        UPDATE quotations SET
+            subtotal_excl_vat = {subtotal},
+            vat_amount = {subtotal} * COALESCE(vat_percentage, 10.0) / 100,
+            total_incl_vat = {subtotal} * (1 + COALESCE(vat_percentage, 10.0) / 100)
+        WHERE quotation_id = {quotation_id_expr};
+    '''
+
+
+# 품목 추가/수정/삭제 시 같은 트랜잭션 안에서 견적서 총액을 증분 갱신하는 트리거
+_TOTALS_TRIGGERS = {
+    'trg_quotations_totals_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_quotations_totals_insert
+        AFTER INSERT ON quotations
+        BEGIN
+            UPDATE quotations SET subtotal_excl_vat = 0, vat_amount = 0, total_incl_vat = 0
+            WHERE quotation_id = NEW.quotation_id;
+            {_totals_update_sql("NEW.quotation_id",
+                                "SELECT COALESCE(SUM(amount), 0) FROM quotation_items "
+                                "WHERE quotation_id = NEW.quotation_id")}
+        END
+    ''',
+    'trg_quotation_items_totals_insert': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_quotation_items_totals_insert
+        AFTER INSERT ON quotation_items
+        BEGIN
+            {_totals_update_sql("NEW.quotation_id", "COALESCE(NEW.amount, 0)")}
+        END
+    ''',
+    'trg_quotation_items_totals_update': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_quotation_items_totals_update
+        AFTER UPDATE OF amount, quotation_id ON quotation_items
+        BEGIN
+            {_totals_update_sql("OLD.quotation_id", "-COALESCE(OLD.amount, 0)")}
+            {_totals_update_sql("NEW.quotation_id", "COALESCE(NEW.amount, 0)")}
+        END
+    ''',
+    'trg_quotation_items_totals_delete': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_quotation_items_totals_delete
+        AFTER DELETE ON quotation_items
+        BEGIN
+            {_totals_update_sql("OLD.quotation_id", "-COALESCE(OLD.amount, 0)")}
+        END
+    ''',
+    'trg_quotations_vat_update': f'''
+        CREATE TRIGGER IF NOT EXISTS trg_quotations_vat_update
+        AFTER UPDATE OF vat_percentage ON quotations
+        BEGIN
+            {_totals_update_sql("NEW.quotation_id", "0")}
+        END
+    ''',
+}
+
+
+class QuotationDocument:
+    """견적서 문서 묶음 (헤더 + 품목 + 고객 + 환율)
+
+    load_quotation_document / load_quotation_documents 반환 타입.
+    header는 quotations 행 dict, items는 line_number 순 품목 dict 목록,
+    customer는 customer_company와 회사명이 일치하는 고객 행 (없으면 None),
+    exchange_rate는 견적일 기준 최신 USD→견적 통화 환율 (없으면 None).
+    """
+
+    __slots__ = ('quotation_id', 'header', 'items', 'customer', 'exchange_rate')
+
+    def __init__(self, header, items=None, customer=None, exchange_rate=None):
+        self.quotation_id = header.get('quotation_id')
+        self.header = header
+        self.items = items if items is not None else []
+        self.customer = customer
+        self.exchange_rate = exchange_rate
+
+    def get(self, key, default=None):
+        """헤더 필드 조회 (기존 dict 기반 호출부 호환)"""
+        return self.header.get(key, default)
+
+    @property
+    def quotation_number(self):
+        return self.header.get('quotation_number')
+
+    @property
+    def currency(self):
+        return self.header.get('currency') or 'VND'
+
+    def items_dataframe(self):
+        """품목 DataFrame (get_quotation_items와 같은 형태)"""
+        return pd.DataFrame(self.items)
+
+    def to_dict(self):
+        return {
+            'quotation': dict(self.header),
+            'items': [dict(item) for item in self.items],
+            'customer': dict(self.customer) if self.customer else None,
+            'exchange_rate': self.exchange_rate,
+        }
+
 
 class SQLiteQuotationManager:
     def __init__(self, db_path='erp_system.db'):
@@ -74,6 +180,12 @@ class SQLiteQuotationManager:
         except sqlite3.OperationalError:
             pass
         
+        # 이전 리비전은 품목 행을 리비전 이력(quotation_revisions)으로 보관
+        try:
+            cursor.execute('ALTER TABLE quotations ADD COLUMN items_archived INTEGER DEFAULT 0')
+        except sqlite3.OperationalError:
+            pass
+        
         # quotation_items 테이블 - YUMOLD 양식 기준으로 재설계
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS quotation_items (
@@ -97,9 +209,57 @@ class SQLiteQuotationManager:
             )
         ''')
         
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_quotation_items_quotation
+            ON quotation_items (quotation_id, line_number)
+        ''')
+        
+        # 총액 증분 갱신 트리거 - 새로 설치된 경우 기존 총액을 품목 합계로 한 번 맞춤
+        cursor.execute('''
+            SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_quotation%'
+        ''')
+        installed = {row[0] for row in cursor.fetchall()}
+        for name, ddl in _TOTALS_TRIGGERS.items():
+            cursor.execute(ddl)
+        if not set(_TOTALS_TRIGGERS) <= installed:
+            self._recalculate_totals(cursor)
+        
         conn.commit()
         conn.close()
     
+    def _recalculate_totals(self, cursor, quotation_ids=None):
+        """품목 합계로 견적서 총액 재계산 (전체 또는 지정 견적서)"""
+        sql = '''
+            UPDATE quotations SET
+                subtotal_excl_vat = (SELECT COALESCE(SUM(amount), 0) FROM quotation_items i
+                                     WHERE i.quotation_id = quotations.quotation_id)
+        '''
+        vat_sql = '''
+            UPDATE quotations SET
+                vat_amount = subtotal_excl_vat * COALESCE(vat_percentage, 10.0) / 100,
+                total_incl_vat = subtotal_excl_vat * (1 + COALESCE(vat_percentage, 10.0) / 100)
+        '''
+        # 품목 행이 보관된 이전 리비전은 저장된 총액 유지
+        live = " WHERE COALESCE(items_archived, 0) = 0"
+        if quotation_ids is None:
+            cursor.execute(sql + live)
+            cursor.execute(vat_sql + live)
+            return
+        ids = list(quotation_ids)
+        for start in range(0, len(ids), _ID_CHUNK_SIZE):
+            chunk = ids[start:start + _ID_CHUNK_SIZE]
+            where = f"{live} AND quotation_id IN ({','.join('?' * len(chunk))})"
+            cursor.execute(sql + where, chunk)
+            cursor.execute(vat_sql + where, chunk)
+    
+    def _invalidate_render_cache(self, quotation_id):
+        """견적서 변경 시 렌더링 문서 캐시 정리"""
+        try:
+            from utils.render_cache import invalidate_quotation
+            invalidate_quotation(quotation_id)
+        except Exception as e:
+            print(f"렌더링 캐시 무효화 오류: {e}")
+    
     def generate_quotation_number(self):
         """견적서 번호 자동 생성 (YMV-Q250903-001 형식)"""
         today = datetime.now()
@@ -355,6 +515,7 @@ class SQLiteQuotationManager:
             
             conn.commit()
             conn.close()
+            self._invalidate_render_cache(item_data.get('quotation_id'))
             return True
         except Exception as e:
             print(f"Error saving quotation item: {e}")
@@ -363,21 +524,9 @@ class SQLiteQuotationManager:
     def get_all_quotations(self):
         """모든 견적서 조회"""
         try:
+            # 테이블은 init_tables에서 생성되므로 존재 확인/COUNT 없이 바로 조회
             conn = sqlite3.connect(self.db_path)
             
-            # 먼저 테이블과 데이터 존재 확인
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='quotations';")
-            if not cursor.fetchone():
-                print("Quotations table does not exist")
-                conn.close()
-                return pd.DataFrame()
-            
-            cursor.execute("SELECT COUNT(*) FROM quotations;")
-            count = cursor.fetchone()[0]
-            # 성능 최적화: 디버그 로그 제거
-            # print(f"Found {count} quotations in database")
-            
             # 데이터 조회 (모든 필드 포함)
             df = pd.read_sql_query('''
                 SELECT quotation_id, quotation_number, quote_date, 
@@ -388,9 +537,6 @@ class SQLiteQuotationManager:
                 ORDER BY customer_company ASC, created_at DESC
             ''', conn)
             conn.close()
-            
-            # 성능 최적화: 디버그 로그 제거
-            # print(f"Retrieved {len(df)} quotations from database")
             return df
         except Exception as e:
             print(f"Error getting quotations: {e}")
@@ -399,16 +545,30 @@ class SQLiteQuotationManager:
             return pd.DataFrame()
     
     def get_quotation_items(self, quotation_id):
-        """견적서의 제품 라인들 조회"""
+        """견적서의 제품 라인들 조회 (보관된 이전 리비전은 리비전 이력에서 복원)"""
         conn = sqlite3.connect(self.db_path)
         df = pd.read_sql_query('''
             SELECT * FROM quotation_items 
             WHERE quotation_id = ? 
             ORDER BY line_number
         ''', conn, params=[quotation_id])
+        archived = df.empty and self._is_items_archived(conn.cursor(), quotation_id)
         conn.close()
+        if archived:
+            return pd.DataFrame(self._archived_items(quotation_id))
         return df
     
+    def _is_items_archived(self, cursor, quotation_id):
+        cursor.execute('''
+            SELECT COALESCE(items_archived, 0) FROM quotations WHERE quotation_id = ?
+        ''', (quotation_id,))
+        row = cursor.fetchone()
+        return bool(row and row[0])
+    
+    def _archived_items(self, quotation_id):
+        from managers.sqlite.sqlite_quotation_revision_manager import SQLiteQuotationRevisionManager
+        return SQLiteQuotationRevisionManager(self.db_path).materialize_items(quotation_id)
+    
     def delete_quotation(self, quotation_id):
         """견적서 삭제 (승인 전만 가능)"""
         try:
@@ -434,8 +594,12 @@ class SQLiteQuotationManager:
             # 견적서 삭제
             cursor.execute('DELETE FROM quotations WHERE quotation_id = ?', (quotation_id,))
             
+            from managers.sqlite.sqlite_document_link_manager import unlink_documents
+            unlink_documents(conn, 'quotation', quotation_id)
+            
             conn.commit()
             conn.close()
+            self._invalidate_render_cache(quotation_id)
             return True, "Quotation deleted successfully."
             
         except Exception as e:
@@ -466,42 +630,84 @@ class SQLiteQuotationManager:
             return False, f"Error occurred while checking status: {str(e)}"
 
     def update_quotation_totals(self, quotation_id):
-        """견적서 총액 업데이트"""
+        """견적서 총액을 품목 합계로 다시 계산
+        
+        총액은 품목 저장/삭제 시 트리거로 증분 갱신되므로 평소에는 호출할 필요가 없고,
+        드리프트 복구용으로만 사용합니다.
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        # 제품 라인들의 총합 계산
+        self._recalculate_totals(cursor, [quotation_id])
         cursor.execute('''
-            SELECT SUM(line_total) FROM quotation_items WHERE quotation_id = ?
+            SELECT subtotal_excl_vat, vat_amount, total_incl_vat
+            FROM quotations WHERE quotation_id = ?
         ''', (quotation_id,))
-        
-        result = cursor.fetchone()
-        subtotal = result[0] if result[0] else 0
-        
-        # 부가세율 조회
-        cursor.execute('''
-            SELECT tax_rate FROM quotations WHERE quotation_id = ?
-        ''', (quotation_id,))
-        
-        tax_result = cursor.fetchone()
-        tax_rate = tax_result[0] if tax_result and tax_result[0] else 10.0
-        
-        # 세금 및 총액 계산
-        tax_amount = subtotal * (tax_rate / 100)
-        total_amount = subtotal + tax_amount
-        
-        # 견적서 업데이트
-        now = datetime.now().isoformat()
-        cursor.execute('''
-            UPDATE quotations 
-            SET subtotal = ?, tax_amount = ?, total_amount = ?, updated_at = ?
-            WHERE quotation_id = ?
-        ''', (subtotal, tax_amount, total_amount, now, quotation_id))
+        subtotal, tax_amount, total_amount = cursor.fetchone() or (0, 0, 0)
         
         conn.commit()
         conn.close()
+        self._invalidate_render_cache(quotation_id)
         return subtotal, tax_amount, total_amount
     
+    def verify_quotation_totals(self, quotation_ids=None, repair=False, tolerance=TOTALS_TOLERANCE):
+        """저장된 총액과 품목 합계 비교 (드리프트 검증)
+        
+        Args:
+            quotation_ids: 검사할 견적서 ID 목록 (None이면 전체)
+            repair: True면 어긋난 견적서를 품목 합계로 재계산
+            tolerance: 허용 오차
+        
+        Returns:
+            list[dict]: 어긋난 견적서 목록
+                {'quotation_id', 'stored_subtotal', 'items_subtotal',
+                 'stored_total', 'expected_total'}
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        sql = '''
+            SELECT q.quotation_id,
+                   COALESCE(q.subtotal_excl_vat, 0),
+                   COALESCE(s.items_subtotal, 0),
+                   COALESCE(q.total_incl_vat, 0),
+                   COALESCE(s.items_subtotal, 0) * (1 + COALESCE(q.vat_percentage, 10.0) / 100)
+            FROM quotations q
+            LEFT JOIN (
+                SELECT quotation_id, SUM(amount) AS items_subtotal
+                FROM quotation_items GROUP BY quotation_id
+            ) s ON s.quotation_id = q.quotation_id
+            WHERE COALESCE(q.items_archived, 0) = 0
+        '''
+        rows = []
+        if quotation_ids is None:
+            cursor.execute(sql)
+            rows = cursor.fetchall()
+        else:
+            ids = list(quotation_ids)
+            for start in range(0, len(ids), _ID_CHUNK_SIZE):
+                chunk = ids[start:start + _ID_CHUNK_SIZE]
+                cursor.execute(sql + f" AND q.quotation_id IN ({','.join('?' * len(chunk))})", chunk)
+                rows.extend(cursor.fetchall())
+        
+        drifted = [
+            {'quotation_id': qid, 'stored_subtotal': stored, 'items_subtotal': expected,
+             'stored_total': stored_total, 'expected_total': expected_total}
+            for qid, stored, expected, stored_total, expected_total in rows
+            if abs(stored - expected) > tolerance or abs(stored_total - expected_total) > tolerance
+        ]
+        
+        if repair and drifted:
+            self._recalculate_totals(cursor, [row['quotation_id'] for row in drifted])
+            conn.commit()
+            print(f"견적서 총액 재계산: {len(drifted)}건")
+        conn.close()
+        
+        if repair:
+            for row in drifted:
+                self._invalidate_render_cache(row['quotation_id'])
+        return drifted
+    
     def get_quotation_by_id(self, quotation_id):
         """견적서 상세 정보 조회"""
         conn = sqlite3.connect(self.db_path)
@@ -567,7 +773,7 @@ class SQLiteQuotationManager:
             return False
     
     def update_quotation(self, quotation_data):
-        """견적서 정보 업데이트"""
+        """견적서 정보 업데이트 (총액은 품목 트리거가 관리하므로 갱신하지 않음)"""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -577,7 +783,6 @@ class SQLiteQuotationManager:
                     quote_date = ?, currency = ?, customer_company = ?, 
                     customer_address = ?, customer_contact_person = ?, 
                     customer_phone = ?, customer_email = ?, vat_percentage = ?,
-                    subtotal_excl_vat = ?, vat_amount = ?, total_incl_vat = ?,
                     quotation_status = ?, updated_at = ?
                 WHERE quotation_id = ?
             ''', (
@@ -589,9 +794,6 @@ class SQLiteQuotationManager:
                 quotation_data.get('customer_phone'),
                 quotation_data.get('customer_email'),
                 quotation_data.get('vat_percentage'),
-                quotation_data.get('subtotal_excl_vat'),
-                quotation_data.get('vat_amount'),
-                quotation_data.get('total_incl_vat'),
                 quotation_data.get('quotation_status'),
                 quotation_data.get('updated_at'),
                 quotation_data.get('quotation_id')
@@ -599,6 +801,7 @@ class SQLiteQuotationManager:
             
             conn.commit()
             conn.close()
+            self._invalidate_render_cache(quotation_data.get('quotation_id'))
             return True
         except Exception as e:
             print(f"Error updating quotation: {e}")
@@ -614,11 +817,141 @@ class SQLiteQuotationManager:
             
             conn.commit()
             conn.close()
+            self._invalidate_render_cache(quotation_id)
             return True
         except Exception as e:
             print(f"Error deleting quotation items: {e}")
             return False
     
+    def _optional_tables(self, cursor):
+        """고객/환율 테이블 존재 여부 (연결 단위로 한 번만 확인)"""
+        cursor.execute('''
+            SELECT name FROM sqlite_master
+            WHERE type = 'table' AND name IN ('customers', 'exchange_rates')
+        ''')
+        return {row[0] for row in cursor.fetchall()}
+    
+    def _document_header_query(self, tables, where):
+        """헤더 + 환율 + 고객을 한 번에 가져오는 SELECT (고객 컬럼은 _exchange_rate 뒤)"""
+        if 'exchange_rates' in tables:
+            rate_sql = '''
+                CASE WHEN COALESCE(q.currency, 'VND') = 'USD' THEN 1.0 ELSE (
+                    SELECT r.rate FROM exchange_rates r
+                    WHERE r.base_currency = 'USD'
+                      AND r.target_currency = COALESCE(q.currency, 'VND')
+                      AND r.is_active = 1
+                      AND r.rate_date <= COALESCE(q.quote_date, date('now'))
+                    ORDER BY r.rate_date DESC LIMIT 1
+                ) END
+            '''
+        else:
+            rate_sql = 'NULL'
+        
+        if 'customers' in tables:
+            # 회사명별 대표 고객을 한 번만 집계해 조인 (견적서마다 고객 테이블을 훑지 않음)
+            customer_sql = '''c.* FROM quotations q
+                LEFT JOIN (
+                    SELECT company_name, MIN(customer_id) AS customer_id
+                    FROM customers GROUP BY company_name
+                ) cm ON cm.company_name = q.customer_company
+                LEFT JOIN customers c ON c.customer_id = cm.customer_id'''
+        else:
+            customer_sql = 'NULL AS customer_id FROM quotations q'
+        
+        return f"SELECT q.*, {rate_sql} AS _exchange_rate, {customer_sql} WHERE {where}"
+    
+    def _fetch_documents(self, cursor, tables, where, params):
+        """헤더 쿼리 실행 → {quotation_id: QuotationDocument} (조회 순서 유지)"""
+        cursor.execute(self._document_header_query(tables, where), params)
+        columns = [description[0] for description in cursor.description]
+        split = columns.index('_exchange_rate')
+        
+        documents = {}
+        for row in cursor.fetchall():
+            header = dict(zip(columns[:split], row[:split]))
+            customer = dict(zip(columns[split + 1:], row[split + 1:]))
+            documents[header['quotation_id']] = QuotationDocument(
+                header,
+                customer=customer if customer.get('customer_id') else None,
+                exchange_rate=row[split],
+            )
+        return documents
+    
+    def _attach_items(self, cursor, documents):
+        """품목을 견적서 ID 묶음 단위로 한 번에 조회해 문서에 연결"""
+        ids = list(documents)
+        for start in range(0, len(ids), _ID_CHUNK_SIZE):
+            chunk = ids[start:start + _ID_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'''
+                SELECT * FROM quotation_items
+                WHERE quotation_id IN ({placeholders})
+                ORDER BY quotation_id, line_number
+            ''', chunk)
+            columns = [description[0] for description in cursor.description]
+            for row in cursor.fetchall():
+                item = dict(zip(columns, row))
+                documents[item['quotation_id']].items.append(item)
+        
+        # 보관된 이전 리비전은 리비전 이력에서 복원
+        for document in documents.values():
+            if not document.items and document.header.get('items_archived'):
+                document.items = self._archived_items(document.quotation_id)
+    
+    def load_quotation_document(self, quotation_id):
+        """견적서 헤더/품목/고객/환율을 한 연결에서 조회
+        
+        get_quotation_by_id + get_quotation_items + 고객/환율 조회를 대체합니다.
+        
+        Returns:
+            QuotationDocument 또는 None (견적서 없음)
+        """
+        documents = self.load_quotation_documents([quotation_id])
+        return documents[0] if documents else None
+    
+    def load_quotation_documents(self, quotation_ids=None, date_from=None, date_to=None):
+        """여러 견적서를 품목과 함께 일괄 조회 (목록/일괄 출력/내보내기용)
+        
+        Args:
+            quotation_ids: 견적서 ID 목록 (None이면 기간 조건으로 조회)
+            date_from, date_to: quote_date 범위 (YYYY-MM-DD, 포함)
+        
+        Returns:
+            list[QuotationDocument]: quotation_ids 순서 (ID 미지정 시 견적일 내림차순)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            tables = self._optional_tables(cursor)
+            
+            documents = {}
+            if quotation_ids is not None:
+                ids = list(dict.fromkeys(quotation_ids))
+                for start in range(0, len(ids), _ID_CHUNK_SIZE):
+                    chunk = ids[start:start + _ID_CHUNK_SIZE]
+                    where = f"q.quotation_id IN ({','.join('?' * len(chunk))})"
+                    documents.update(self._fetch_documents(cursor, tables, where, chunk))
+            else:
+                conditions, params = ['1 = 1'], []
+                if date_from:
+                    conditions.append('q.quote_date >= ?')
+                    params.append(str(date_from))
+                if date_to:
+                    conditions.append('q.quote_date <= ?')
+                    params.append(str(date_to))
+                where = ' AND '.join(conditions) + ' ORDER BY q.quote_date DESC, q.created_at DESC'
+                documents = self._fetch_documents(cursor, tables, where, params)
+            
+            self._attach_items(cursor, documents)
+            conn.close()
+            
+            if quotation_ids is not None:
+                return [documents[qid] for qid in dict.fromkeys(quotation_ids) if qid in documents]
+            return list(documents.values())
+        except Exception as e:
+            print(f"Error loading quotation documents: {e}")
+            return []
+    
     def get_quotation_by_number(self, quotation_number):
         """견적서 번호로 특정 견적서 조회"""
         try:
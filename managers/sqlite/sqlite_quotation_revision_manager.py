@@ -0,0 +1,470 @@
+"""
+SQLite 기반 견적서 리비전 이력 매니저
+리비전마다 견적서/품목 전체를 복사하지 않고 기준 스냅샷 + 리비전별 변경분(delta)으로 보관
+
+- 리비전 체인: 견적번호의 "-Rv" 앞부분이 같은 견적서들 (예: YMV-Q250101-001, ...-Rv01, ...-Rv02)
+- 체인의 첫 견적서는 스냅샷, 이후 리비전은 부모 리비전(parent_quotation_id) 대비 변경분만 저장
+  (부모 경로에서 SNAPSHOT_INTERVAL개마다 또는 변경분이 스냅샷보다 커지면 스냅샷)
+- 같은 부모에서 여러 리비전이 갈라져도 materialize()는 부모 경로를 따라 가장 가까운 스냅샷부터
+  변경분을 적용해 복원
+- 품목은 item_id로 식별 (line_number가 중복되거나 비어 있어도 합쳐지지 않음)
+- record_revision()은 새 리비전 품목 행 저장 + 이력 기록 + 부모 리비전 품목 행 보관을 한 트랜잭션으로 처리
+  → 체인에서 품목 행은 최신 리비전만 유지, 이전 리비전은 이력(스냅샷/변경분)으로만 보관
+- 보관은 이력 복원 결과가 현재 품목 행과 정확히 같을 때만 (quotations.items_archived = 1,
+  헤더와 총액은 그대로 유지), 기존 전체 복사 체인은 compact(archive=True)로 정리
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+# 부모 경로에서 이 개수의 변경분마다 스냅샷을 한 번 저장 (복원 시 적용할 변경분 수 상한)
+SNAPSHOT_INTERVAL = 10
+
+# 헤더 비교/저장에서 제외하는 컬럼
+HEADER_EXCLUDE = ('quotation_id', 'created_at', 'updated_at', 'items_archived')
+# 품목 비교/저장에서 제외하는 컬럼 (품목 식별은 item_id)
+ITEM_EXCLUDE = ('quotation_id',)
+# record_revision(items=...)이 저장하는 품목 컬럼 (SQLiteQuotationManager.save_quotation_item과 동일)
+ITEM_COLUMNS = (
+    'item_id', 'quotation_id', 'line_number', 'source_product_code', 'item_code', 'item_name_en',
+    'item_name_vn', 'quantity', 'standard_price', 'selling_price', 'discount_rate', 'unit_price',
+    'amount', 'remark', 'created_at', 'updated_at',
+)
+
+
+def chain_id_for(quotation_number):
+    """리비전 체인 ID (견적번호의 기준 번호)"""
+    return str(quotation_number or '').split('-Rv')[0]
+
+
+def _header_state(header):
+    return {key: value for key, value in header.items() if key not in HEADER_EXCLUDE}
+
+
+def _item_state(item):
+    return {key: value for key, value in item.items() if key not in ITEM_EXCLUDE}
+
+
+def _item_order(item):
+    """quotation_items 조회 순서 (ORDER BY line_number, item_id - NULL이 먼저)"""
+    line = item.get('line_number')
+    return (line is not None, line or 0, str(item.get('item_id')))
+
+
+def _sql_value(value):
+    """numpy 스칼라(DataFrame 행에서 온 값)를 sqlite3가 받는 파이썬 값으로"""
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _items_by_id(items):
+    return {str(item.get('item_id')): item for item in items}
+
+
+def match_items(old_items, new_items):
+    """두 리비전의 품목 짝 맞추기 (같은 line_number끼리 순서대로, 리비전마다 item_id가 다르므로)
+
+    Returns:
+        tuple: ([(이전 품목, 새 품목)], 삭제된 품목 목록, 추가된 품목 목록)
+    """
+    remaining = {}
+    for item in sorted(old_items, key=_item_order):
+        remaining.setdefault(item.get('line_number'), []).append(item)
+    pairs, added = [], []
+    for item in sorted(new_items, key=_item_order):
+        candidates = remaining.get(item.get('line_number'))
+        if candidates:
+            pairs.append((candidates.pop(0), item))
+        else:
+            added.append(item)
+    removed = [item for candidates in remaining.values() for item in candidates]
+    return pairs, removed, added
+
+
+def make_delta(old_state, new_state):
+    """두 리비전 상태의 변경분 (old_state는 부모 리비전)
+
+    Returns:
+        dict: {'key': 'item_id', 'header': {필드: 새 값}, 'removed': [부모 item_id],
+               'added': [품목], 'changed': {부모 item_id: {필드: 새 값}}}
+    """
+    old_header, new_header = old_state['header'], new_state['header']
+    header = {key: value for key, value in new_header.items() if old_header.get(key) != value}
+    header.update({key: None for key in old_header if key not in new_header})
+
+    pairs, removed, added = match_items(old_state['items'], new_state['items'])
+    changed = {}
+    for previous, item in pairs:
+        fields = {key: value for key, value in item.items() if previous.get(key) != value}
+        fields.update({key: None for key in previous if key not in item})
+        if fields:
+            changed[str(previous.get('item_id'))] = fields
+    return {
+        'key': 'item_id',
+        'header': header,
+        'removed': [str(item.get('item_id')) for item in removed],
+        'added': added,
+        'changed': changed,
+    }
+
+
+def apply_delta(state, delta):
+    """부모 리비전 상태에 변경분 적용 → 새 상태
+
+    'key'가 없는 변경분은 품목을 line_number로 식별하던 이전 형식으로 적용합니다.
+    """
+    key = delta.get('key', 'line_number')
+    header = dict(state['header'])
+    header.update(delta.get('header', {}))
+    removed = {str(value) for value in delta.get('removed', [])}
+    changed = delta.get('changed', {})
+    items = []
+    for item in state['items']:
+        identity = str(item.get(key))
+        if identity in removed:
+            continue
+        fields = changed.get(identity)
+        items.append({**item, **fields} if fields else item)
+    items.extend(delta.get('added', []))
+    items.sort(key=_item_order)
+    return {'header': header, 'items': items}
+
+
+class SQLiteQuotationRevisionManager:
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+        self.init_tables()
+
+    def init_tables(self):
+        """리비전 이력 테이블 초기화"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS quotation_revisions (
+                quotation_id TEXT PRIMARY KEY,
+                chain_id TEXT NOT NULL,
+                sequence INTEGER NOT NULL,
+                parent_quotation_id TEXT,
+                storage TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TEXT,
+                UNIQUE(chain_id, sequence)
+            )
+        ''')
+
+        try:
+            cursor.execute('ALTER TABLE quotations ADD COLUMN items_archived INTEGER DEFAULT 0')
+        except sqlite3.OperationalError:
+            pass  # 컬럼이 이미 존재하면 무시
+
+        conn.commit()
+        conn.close()
+
+    # ---------- 내부 조회 ----------
+
+    def _rows(self, cursor, sql, params=()):
+        cursor.execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _live_state(self, cursor, quotation_id):
+        """quotations/quotation_items 행에서 현재 상태 조회 (없으면 None)"""
+        headers = self._rows(cursor, 'SELECT * FROM quotations WHERE quotation_id = ?', (quotation_id,))
+        if not headers:
+            return None
+        items = self._rows(cursor, '''
+            SELECT * FROM quotation_items WHERE quotation_id = ? ORDER BY line_number, item_id
+        ''', (quotation_id,))
+        return {'header': _header_state(headers[0]), 'items': [_item_state(item) for item in items]}
+
+    def _materialize_path(self, cursor, quotation_id):
+        """이력에서 리비전 상태 복원 (부모 경로를 따라 가장 가까운 스냅샷부터 변경분 적용)
+
+        Returns:
+            tuple: (상태, 스냅샷 이후 변경분 수) - 이력이 없거나 경로가 끊기면 (None, 0)
+        """
+        path, seen = [], set()
+        current = quotation_id
+        while current is not None and current not in seen:
+            seen.add(current)
+            rows = self._rows(cursor, '''
+                SELECT parent_quotation_id, storage, payload FROM quotation_revisions WHERE quotation_id = ?
+            ''', (current,))
+            if not rows:
+                return None, 0
+            path.append(rows[0])
+            if rows[0]['storage'] == 'snapshot':
+                break
+            current = rows[0]['parent_quotation_id']
+        else:
+            return None, 0
+
+        state = json.loads(path[-1]['payload'])
+        for entry in reversed(path[:-1]):
+            state = apply_delta(state, json.loads(entry['payload']))
+        return state, len(path) - 1
+
+    def _materialize(self, cursor, quotation_id):
+        return self._materialize_path(cursor, quotation_id)[0]
+
+    def _append(self, cursor, chain_id, quotation_id, parent_id, state, parent_state, since_snapshot,
+                snapshot_interval=SNAPSHOT_INTERVAL):
+        """체인에 리비전 추가 (스냅샷 또는 부모 대비 변경분)
+
+        since_snapshot: 부모 경로에서 스냅샷 이후 변경분 수
+        """
+        cursor.execute('SELECT COALESCE(MAX(sequence), -1) + 1 FROM quotation_revisions WHERE chain_id = ?',
+                       (chain_id,))
+        sequence = cursor.fetchone()[0]
+
+        snapshot = json.dumps(state, ensure_ascii=False, default=str)
+        storage, payload = 'snapshot', snapshot
+        if parent_state is not None and since_snapshot < snapshot_interval:
+            delta = json.dumps(make_delta(parent_state, state), ensure_ascii=False, default=str)
+            if len(delta) < len(snapshot):
+                storage, payload = 'delta', delta
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO quotation_revisions (
+                quotation_id, chain_id, sequence, parent_quotation_id, storage, payload, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (quotation_id, chain_id, sequence, parent_id, storage, payload, datetime.now().isoformat()))
+        return storage
+
+    def _verified_restore(self, cursor, quotation_id):
+        """이력 복원 품목이 현재 품목 행과 정확히 같은지 (JSON 왕복 포함)"""
+        restored = self._materialize(cursor, quotation_id)
+        live = self._live_state(cursor, quotation_id)
+        if restored is None or live is None or not live['items']:
+            return False
+        live_items = json.loads(json.dumps(live['items'], ensure_ascii=False, default=str))
+        return _items_by_id(restored['items']) == _items_by_id(live_items)
+
+    def _archive_items(self, cursor, quotation_id):
+        """이전 리비전 품목 행 정리 (헤더 총액은 유지 - 품목 삭제 트리거 영향 복구)
+
+        이력 복원 결과가 현재 품목 행과 정확히 같을 때만 삭제합니다.
+
+        Returns:
+            bool: 보관 처리 여부
+        """
+        cursor.execute('''
+            SELECT subtotal_excl_vat, vat_amount, total_incl_vat, COALESCE(items_archived, 0)
+            FROM quotations WHERE quotation_id = ?
+        ''', (quotation_id,))
+        row = cursor.fetchone()
+        if not row or row[3]:
+            return False
+        if not self._verified_restore(cursor, quotation_id):
+            print(f"리비전 이력 복원 결과가 품목 행과 달라 보관하지 않음: {quotation_id}")
+            return False
+        cursor.execute('DELETE FROM quotation_items WHERE quotation_id = ?', (quotation_id,))
+        cursor.execute('''
+            UPDATE quotations SET subtotal_excl_vat = ?, vat_amount = ?, total_incl_vat = ?,
+                                  items_archived = 1
+            WHERE quotation_id = ?
+        ''', (row[0], row[1], row[2], quotation_id))
+        return True
+
+    # ---------- 공개 API ----------
+
+    def record_revision(self, quotation_id, parent_quotation_id, items=None):
+        """새 리비전 품목 저장 + 부모 리비전 대비 변경분 기록 + 부모 품목 행 보관 (한 트랜잭션)
+
+        새 리비전의 quotations 행이 저장된 뒤 호출합니다. items(품목 dict 목록)를 주면
+        새 리비전 품목 행을 여기서 저장합니다 (이미 저장된 경우 None).
+        부모가 아직 이력에 없으면(기존 견적서) 스냅샷으로 먼저 기록하고, 이력 복원 결과가
+        부모 품목 행과 같으면 부모 품목 행은 보관 처리합니다 (최신 리비전만 품목 행 유지).
+
+        Returns:
+            str: 저장 방식 ('delta' 또는 'snapshot'), 실패 시 None
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            if items:
+                cursor.executemany(f'''
+                    INSERT INTO quotation_items ({", ".join(ITEM_COLUMNS)})
+                    VALUES ({", ".join("?" for _ in ITEM_COLUMNS)})
+                ''', [tuple(_sql_value({**item, 'quotation_id': quotation_id}.get(column)) for column in ITEM_COLUMNS)
+                      for item in items])
+
+            state = self._live_state(cursor, quotation_id)
+            if state is None:
+                conn.rollback()
+                return None
+            chain_id = chain_id_for(state['header'].get('quotation_number'))
+
+            parent_state, since_snapshot = self._materialize_path(cursor, parent_quotation_id)
+            if parent_state is None:
+                since_snapshot = 0
+                parent_state = self._live_state(cursor, parent_quotation_id)
+                if parent_state is not None:
+                    self._append(cursor, chain_id, parent_quotation_id, None, parent_state, None, 0)
+
+            storage = self._append(cursor, chain_id, quotation_id,
+                                   parent_quotation_id if parent_state is not None else None,
+                                   state, parent_state, since_snapshot)
+            if parent_state is not None and parent_state['items']:
+                self._archive_items(cursor, parent_quotation_id)
+
+            conn.commit()
+            return storage
+        except Exception as e:
+            conn.rollback()
+            print(f"Error recording quotation revision: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def materialize(self, quotation_id):
+        """리비전 상태 복원
+
+        Returns:
+            dict: {'header': 헤더 dict, 'items': 품목 dict 목록} 또는 None (이력 없음)
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return self._materialize(conn.cursor(), quotation_id)
+        finally:
+            conn.close()
+
+    def materialize_items(self, quotation_id):
+        """보관된 리비전의 품목 행 복원 (quotation_items 행과 같은 키)"""
+        state = self.materialize(quotation_id)
+        if state is None:
+            return []
+        return [{'quotation_id': quotation_id, **item} for item in state['items']]
+
+    def get_revision_chain(self, quotation_id):
+        """견적서가 속한 리비전 체인 목록 (순서대로)
+
+        Returns:
+            list[dict]: quotation_id, sequence, parent_quotation_id, storage, created_at, payload_size
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        chain = self._rows(cursor, 'SELECT chain_id FROM quotation_revisions WHERE quotation_id = ?',
+                           (quotation_id,))
+        if not chain:
+            conn.close()
+            return []
+        entries = self._rows(cursor, '''
+            SELECT quotation_id, sequence, parent_quotation_id, storage, created_at,
+                   LENGTH(payload) AS payload_size
+            FROM quotation_revisions WHERE chain_id = ? ORDER BY sequence
+        ''', (chain[0]['chain_id'],))
+        conn.close()
+        return entries
+
+    def diff_revisions(self, from_quotation_id, to_quotation_id):
+        """두 리비전 비교
+
+        Returns:
+            dict: {'header': {필드: (이전, 이후)}, 'added': [품목], 'removed': [품목],
+                   'changed': [{'line_number', 'fields': {필드: (이전, 이후)}}]}
+            비교할 수 없으면 None
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        states = []
+        for quotation_id in (from_quotation_id, to_quotation_id):
+            state = self._materialize(cursor, quotation_id) or self._live_state(cursor, quotation_id)
+            states.append(state)
+        conn.close()
+        old, new = states
+        if old is None or new is None:
+            return None
+
+        keys = set(old['header']) | set(new['header'])
+        header = {key: (old['header'].get(key), new['header'].get(key)) for key in sorted(keys)
+                  if old['header'].get(key) != new['header'].get(key)}
+        pairs, removed, added = match_items(old['items'], new['items'])
+        changed = []
+        for before, after in pairs:
+            # 리비전마다 새로 부여되는 식별/시각 컬럼은 비교에서 제외
+            fields = {key: (before.get(key), after.get(key)) for key in sorted(set(before) | set(after))
+                      if key not in ('item_id', 'created_at', 'updated_at') and before.get(key) != after.get(key)}
+            if fields:
+                changed.append({'line_number': after.get('line_number'), 'fields': fields})
+        return {
+            'header': header,
+            'added': added,
+            'removed': removed,
+            'changed': changed,
+        }
+
+    def compact(self, chain_id=None, snapshot_interval=SNAPSHOT_INTERVAL, archive=False):
+        """리비전 이력 정리
+
+        - 이력에 없는 기존 전체 복사 리비전 체인(같은 기준 번호의 견적서 2건 이상)을 이력으로 전환
+          (이력에 없는 견적서의 부모는 체인에서 바로 앞 견적서)
+        - 기록된 부모 관계를 유지한 채 체인을 다시 써서 부모 경로의 스냅샷 사이 변경분이
+          snapshot_interval개 이하가 되도록 맞춤 (복원 시간 상한)
+        - archive=True면 최신 리비전을 제외하고 이력 복원 결과가 품목 행과 정확히 같은 견적서만 품목 행 보관 처리
+
+        Returns:
+            dict: {'chains': 정리한 체인 수, 'archived': 보관 처리한 견적서 수,
+                   'bytes_before': 이력 크기, 'bytes_after': 정리 후 이력 크기}
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM quotation_revisions')
+        bytes_before = cursor.fetchone()[0]
+
+        # 체인별 견적서 (견적번호 기준, 생성 순)
+        quotations = self._rows(cursor, '''
+            SELECT quotation_id, quotation_number, created_at FROM quotations
+            ORDER BY created_at, quotation_number
+        ''')
+        chains = {}
+        for row in quotations:
+            chains.setdefault(chain_id_for(row['quotation_number']), []).append(row['quotation_id'])
+        recorded, parents = {}, {}
+        for row in self._rows(cursor, '''
+            SELECT quotation_id, chain_id, parent_quotation_id FROM quotation_revisions ORDER BY sequence
+        '''):
+            recorded.setdefault(row['chain_id'], []).append(row['quotation_id'])
+            parents[row['quotation_id']] = row['parent_quotation_id']
+
+        targets = [chain_id] if chain_id else sorted(set(chains) | set(recorded))
+        compacted, archived = 0, 0
+        for target in targets:
+            members = list(recorded.get(target, []))
+            members += [qid for qid in chains.get(target, []) if qid not in members]
+            if len(members) < 2:
+                continue
+
+            # 전체 상태 복원 후 체인 다시 쓰기 (부모가 항상 자식보다 먼저 기록됨)
+            states = []
+            for index, quotation_id in enumerate(members):
+                state = self._materialize(cursor, quotation_id) or self._live_state(cursor, quotation_id)
+                if state is not None:
+                    parent_id = parents[quotation_id] if quotation_id in parents else (
+                        members[index - 1] if index else None)
+                    states.append((quotation_id, parent_id, state))
+            cursor.execute('DELETE FROM quotation_revisions WHERE chain_id = ?', (target,))
+            written, depth = {}, {}
+            for quotation_id, parent_id, state in states:
+                parent_state = written.get(parent_id)
+                since_snapshot = depth.get(parent_id, 0)
+                storage = self._append(cursor, target, quotation_id,
+                                       parent_id if parent_state is not None else None,
+                                       state, parent_state, since_snapshot, snapshot_interval)
+                written[quotation_id] = state
+                depth[quotation_id] = since_snapshot + 1 if storage == 'delta' else 0
+
+            if archive:
+                for quotation_id, _, _ in states[:-1]:
+                    if self._archive_items(cursor, quotation_id):
+                        archived += 1
+            compacted += 1
+
+        conn.commit()
+        cursor.execute('SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM quotation_revisions')
+        bytes_after = cursor.fetchone()[0]
+        conn.close()
+        print(f"견적서 리비전 이력 정리: 체인 {compacted}개, 품목 보관 {archived}건")
+        return {'chains': compacted, 'archived': archived,
+                'bytes_before': bytes_before, 'bytes_after': bytes_after}
@@ -226,6 +226,12 @@ class SQLiteShippingManager:
                     ''
                 )
                 
+                # 문서 연결 인덱스 (주문 → 배송, 주문을 정할 수 없으면 견적서 → 배송)
+                from managers.sqlite.sqlite_document_link_manager import link_documents, shipment_link_source
+                source_type, source_id = shipment_link_source(
+                    conn, shipment_data.get('quotation_id'), shipment_data.get('order_id'))
+                link_documents(conn, source_type, source_id, 'shipment', shipping_id, 'shipped')
+                
                 conn.commit()
                 return shipping_id
         except Exception as e:
@@ -287,6 +293,10 @@ class SQLiteShippingManager:
                 # 관련 이벤트도 함께 삭제
                 conn.execute('DELETE FROM shipping_events WHERE shipping_id = ?', (str(shipping_id),))
                 conn.execute('DELETE FROM shipments WHERE shipping_id = ?', (str(shipping_id),))
+                
+                from managers.sqlite.sqlite_document_link_manager import unlink_documents
+                unlink_documents(conn, 'shipment', shipping_id)
+                
                 conn.commit()
                 return True
         except Exception as e:
@@ -586,6 +596,13 @@ class SQLiteShippingManager:
                         'total_amount': quotation.get('total_amount', 0),
                         'currency': quotation.get('currency', 'VND')
                     }
+                    
+                    # 이미 생성된 주문/배송은 문서 연결 인덱스에서 한 번에 조회
+                    from managers.sqlite.sqlite_document_link_manager import SQLiteDocumentLinkManager
+                    chain = SQLiteDocumentLinkManager(self.db_path).get_chain(quotation_id)
+                    shipping_data['order_ids'] = chain['order']
+                    shipping_data['order_id'] = chain['order'][0] if chain['order'] else ''
+                    shipping_data['existing_shipments'] = chain['shipment']
                     return shipping_data
             return None
         except Exception as e:
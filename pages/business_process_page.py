@@ -6,6 +6,8 @@ import pandas as pd
 import plotly.express as px
 from datetime import datetime, timedelta
 
+from utils.chart_cache import cached_value, cached_figure, invalidate
+
 
 def show_business_process_page(business_process_manager, quotation_manager, user_permissions, get_text, hide_header=False):
     """비즈니스 프로세스 관리 메인 페이지"""
@@ -90,6 +92,7 @@ def show_workflow_status(business_process_manager, get_text=lambda x: x):
                                 get_text("manual_progress")
                             )
                             if success:
+                                invalidate('business_process_statistics')
                                 st.success(get_text("stage_advanced_success"))
                                 st.rerun()
                             else:
@@ -171,6 +174,7 @@ def show_stage_management(business_process_manager):
                                 f"{stage_name} 완료"
                             )
                             if success:
+                                invalidate('business_process_statistics')
                                 st.success(f"{stage_name}이(가) 완료되었습니다.")
                                 st.rerun()
                             else:
@@ -183,8 +187,9 @@ def show_process_statistics(business_process_manager):
     """프로세스 통계 탭 내용"""
     st.header("📈 프로세스 통계")
     
-    # 통계 가져오기
-    stats = business_process_manager.get_workflow_statistics()
+    # 통계 가져오기 (데이터 버전별 캐시)
+    stats = cached_value('business_process_statistics', business_process_manager.get_workflow_statistics,
+                         source=business_process_manager)
     
     if stats:
         col1, col2, col3 = st.columns(3)
@@ -203,7 +208,8 @@ def show_process_statistics(business_process_manager):
             stage_data = stats['stage_distribution']
             if stage_data:
                 df = pd.DataFrame(list(stage_data.items()), columns=['단계', '워크플로우 수'])
-                fig = px.bar(df, x='단계', y='워크플로우 수', title="단계별 워크플로우 분포")
+                fig = cached_figure('business_process_stages', df,
+                                    lambda data: px.bar(data, x='단계', y='워크플로우 수', title="단계별 워크플로우 분포"))
                 st.plotly_chart(fig, use_container_width=True)
         
         # 월별 생성 추이
@@ -211,7 +217,8 @@ def show_process_statistics(business_process_manager):
             monthly_data = stats['monthly_creation']
             if monthly_data:
                 df = pd.DataFrame(list(monthly_data.items()), columns=['월', '생성 수'])
-                fig = px.line(df, x='월', y='생성 수', title="월별 워크플로우 생성 추이")
+                fig = cached_figure('business_process_monthly', df,
+                                    lambda data: px.line(data, x='월', y='생성 수', title="월별 워크플로우 생성 추이"))
                 st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("통계 데이터가 없습니다.")
@@ -259,6 +266,7 @@ def show_workflow_creation(business_process_manager, quotation_manager):
                     )
                     
                     if workflow_id:
+                        invalidate('business_process_statistics')
                         st.success(f"워크플로우가 생성되었습니다. ID: {workflow_id}")
                         st.rerun()
                     else:
@@ -317,6 +325,7 @@ def show_edit_workflow_modal(business_process_manager, workflow_id):
                 
                 success, message = business_process_manager.update_workflow(workflow_id, updates)
                 if success:
+                    invalidate('business_process_statistics')
                     st.success("워크플로우가 성공적으로 업데이트되었습니다!")
                     del st.session_state['edit_workflow_id']
                     st.rerun()
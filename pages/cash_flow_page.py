@@ -8,8 +8,53 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from notification_helper import NotificationHelper
+from utils.revaluation import revalue
+from utils.chart_cache import chart_data, cached_figure, source_version, DEFAULT_TTL
+from utils.exchange_rate_service import get_rate_service
 import os
 
+# 차트/통계 탭 금액 표시 통화 (거래별 통화를 거래일 환율로 환산)
+REPORTING_CURRENCY = 'USD'
+
+# 일별 현금 흐름 트렌드 최대 점 수 (LTTB 다운샘플)
+DAILY_CHART_MAX_POINTS = 500
+
+
+def _rate_db_path(cash_flow_manager):
+    """환산 환율을 읽는 SQLite 경로 (db_path가 없는 CSV/PostgreSQL 매니저는 None = 활성 백엔드 환율)"""
+    return getattr(cash_flow_manager, 'db_path', None)
+
+
+def transactions_cache_options(cash_flow_manager):
+    """환산 거래 차트 캐시 버전 인자 - 거래 저장소 버전 + 환산에 쓰는 환율 서명
+
+    거래 저장소 버전을 알 수 없으면(PostgreSQL 등) 환율 서명과 별개로 DEFAULT_TTL 만료 유지
+    """
+    versions = source_version(cash_flow_manager)
+    return {
+        'source': cash_flow_manager,
+        'version': get_rate_service(_rate_db_path(cash_flow_manager)).version(),
+        'ttl': None if versions['db_path'] or versions['files'] else DEFAULT_TTL,
+    }
+
+
+def revalue_transactions(df, cash_flow_manager, to_currency=REPORTING_CURRENCY):
+    """거래 DataFrame의 amount를 보고 통화 금액으로 교체 (원래 금액은 amount_original)
+
+    환율이 없는 거래는 원래 금액을 그대로 사용합니다.
+    """
+    if df.empty or 'amount' not in df.columns or 'currency' not in df.columns:
+        return df
+    revalued = revalue(
+        df, to_currency,
+        date_col='transaction_date' if 'transaction_date' in df.columns else None,
+        output_col='amount_reporting', default_currency='VND', fill_missing=True,
+        db_path=_rate_db_path(cash_flow_manager),
+    )
+    revalued['amount_original'] = revalued['amount']
+    revalued['amount'] = revalued.pop('amount_reporting')
+    return revalued
+
 def show_cash_flow_management_page(managers, selected_submenu, get_text, hide_header=False):
     """현금 흐름 관리 메인 페이지"""
     
@@ -388,6 +433,62 @@ def show_transaction_history(cash_flow_manager, notification, get_text=None):
     if st.session_state.get('edit_transaction_data'):
         show_edit_transaction_modal(cash_flow_manager, notification)
 
+def count_by(df, column):
+    """컬럼 값별 건수 DataFrame[column, count]"""
+    return df[column].value_counts().rename_axis(column).reset_index(name='count')
+
+
+def daily_cash_flow(all_transactions):
+    """일별 수입 / 지출 / 순현금흐름 DataFrame[date, income, expense, net_flow]"""
+    dates = pd.to_datetime(all_transactions['transaction_date'], format='%Y-%m-%d', errors='coerce')
+    daily = (all_transactions.assign(date=dates.dt.normalize())
+             .dropna(subset=['date'])
+             .pivot_table(index='date', columns='transaction_type', values='amount',
+                          aggfunc='sum', fill_value=0))
+    daily = daily.reindex(columns=['income', 'expense'], fill_value=0).reset_index()
+    daily.columns.name = None
+    daily['net_flow'] = daily['income'] - daily['expense']
+    return daily
+
+
+def build_daily_flow_figure(daily_pivot):
+    """일별 현금 흐름 트렌드 그림"""
+    fig_trend = go.Figure()
+    
+    fig_trend.add_trace(go.Scatter(
+        x=daily_pivot['date'],
+        y=daily_pivot['income'],
+        mode='lines+markers',
+        name='수입',
+        line=dict(color='green'),
+        fill='tonexty'
+    ))
+    
+    fig_trend.add_trace(go.Scatter(
+        x=daily_pivot['date'],
+        y=daily_pivot['expense'],
+        mode='lines+markers',
+        name='지출',
+        line=dict(color='red'),
+        fill='tonexty'
+    ))
+    
+    fig_trend.add_trace(go.Scatter(
+        x=daily_pivot['date'],
+        y=daily_pivot['net_flow'],
+        mode='lines+markers',
+        name='순 현금 흐름',
+        line=dict(color='blue', width=3)
+    ))
+    
+    fig_trend.update_layout(
+        title='일별 현금 흐름 트렌드',
+        xaxis_title='날짜',
+        yaxis_title='금액 (USD)',
+        height=500
+    )
+    return fig_trend
+
 def show_cash_flow_charts(cash_flow_manager, get_text=None):
     if get_text is None:
         get_text = lambda key: key
@@ -395,136 +496,117 @@ def show_cash_flow_charts(cash_flow_manager, get_text=None):
     st.subheader("📈 현금 흐름 차트 분석")
     
     try:
-        all_transactions = cash_flow_manager.get_all_transactions()
+        # 환산 거래 + 차트별 집계 (거래/환율 버전별 캐시, 세션 간 공유)
+        cache_options = transactions_cache_options(cash_flow_manager)
+        all_transactions = chart_data(
+            'cash_flow_transactions', cash_flow_manager.get_all_transactions,
+            transform=lambda df: revalue_transactions(df, cash_flow_manager),
+            **cache_options
+        )
         
         if len(all_transactions) > 0:
-            # 딕셔너리 리스트를 DataFrame으로 변환
-            if isinstance(all_transactions, list):
-                all_transactions = pd.DataFrame(all_transactions)
-            # 이미 DataFrame인 경우 그대로 사용
+            def derived(name, transform, **options):
+                return chart_data(f'cash_flow_{name}', lambda: all_transactions, transform=transform,
+                                  **cache_options, **options)
             
             # 1. 거래 유형별 파이 차트
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("#### 거래 유형별 분포")
-                type_counts = all_transactions['transaction_type'].value_counts()
+                type_counts = derived('type_counts', lambda df: count_by(df, 'transaction_type'))
                 
-                fig_pie = px.pie(
-                    values=type_counts.values,
-                    names=type_counts.index,
+                fig_pie = cached_figure('cash_flow_type_pie', type_counts, lambda data: px.pie(
+                    data,
+                    values='count',
+                    names='transaction_type',
                     title="거래 유형별 건수",
                     color_discrete_map={'income': 'green', 'expense': 'red'}
-                )
+                ))
                 st.plotly_chart(fig_pie, use_container_width=True)
             
             with col2:
                 st.markdown("#### 거래 상태별 분포")
-                status_counts = all_transactions['status'].value_counts()
+                status_counts = derived('status_counts', lambda df: count_by(df, 'status'))
                 
-                fig_status = px.pie(
-                    values=status_counts.values,
-                    names=status_counts.index,
+                fig_status = cached_figure('cash_flow_status_pie', status_counts, lambda data: px.pie(
+                    data,
+                    values='count',
+                    names='status',
                     title="거래 상태별 건수"
-                )
+                ))
                 st.plotly_chart(fig_status, use_container_width=True)
             
-            # 2. 일별 현금 흐름 트렌드
+            # 2. 일별 현금 흐름 트렌드 (기간이 길면 순현금흐름 기준 LTTB로 점 수 제한)
             st.markdown("#### 📅 일별 현금 흐름 트렌드")
             
-            # 날짜별 그룹화 - 날짜 형식 수정
-            all_transactions['transaction_date'] = pd.to_datetime(all_transactions['transaction_date'], format='%Y-%m-%d', errors='coerce')
-            all_transactions = all_transactions.dropna(subset=['transaction_date'])
-            all_transactions['date'] = all_transactions['transaction_date'].dt.date
-            
-            daily_summary = all_transactions.groupby(['date', 'transaction_type']).agg({
-                'amount': 'sum'
-            }).reset_index()
-            
-            # 피벗 테이블 생성
-            daily_pivot = daily_summary.pivot(index='date', columns='transaction_type', values='amount').fillna(0)
-            daily_pivot = daily_pivot.reset_index()
-            
-            # 순 현금 흐름 계산
-            if 'income' in daily_pivot.columns and 'expense' in daily_pivot.columns:
-                daily_pivot['net_flow'] = daily_pivot['income'] - daily_pivot['expense']
-            elif 'income' in daily_pivot.columns:
-                daily_pivot['net_flow'] = daily_pivot['income']
-                daily_pivot['expense'] = 0
-            elif 'expense' in daily_pivot.columns:
-                daily_pivot['net_flow'] = -daily_pivot['expense']
-                daily_pivot['income'] = 0
-            else:
-                daily_pivot['net_flow'] = 0
-                daily_pivot['income'] = 0
-                daily_pivot['expense'] = 0
-            
-            # 트렌드 차트
-            fig_trend = go.Figure()
-            
-            if 'income' in daily_pivot.columns:
-                fig_trend.add_trace(go.Scatter(
-                    x=daily_pivot['date'],
-                    y=daily_pivot['income'],
-                    mode='lines+markers',
-                    name='수입',
-                    line=dict(color='green'),
-                    fill='tonexty'
-                ))
-            
-            if 'expense' in daily_pivot.columns:
-                fig_trend.add_trace(go.Scatter(
-                    x=daily_pivot['date'],
-                    y=daily_pivot['expense'],
-                    mode='lines+markers',
-                    name='지출',
-                    line=dict(color='red'),
-                    fill='tonexty'
-                ))
-            
-            fig_trend.add_trace(go.Scatter(
-                x=daily_pivot['date'],
-                y=daily_pivot['net_flow'],
-                mode='lines+markers',
-                name='순 현금 흐름',
-                line=dict(color='blue', width=3)
-            ))
-            
-            fig_trend.update_layout(
-                title='일별 현금 흐름 트렌드',
-                xaxis_title='날짜',
-                yaxis_title='금액 (USD)',
-                height=500
-            )
+            daily_pivot = derived('daily_flow', daily_cash_flow, max_points=DAILY_CHART_MAX_POINTS,
+                                  x='date', y='net_flow')
+            fig_trend = cached_figure('cash_flow_daily_trend', daily_pivot, build_daily_flow_figure)
             
             st.plotly_chart(fig_trend, use_container_width=True)
             
             # 3. 계좌별 분포
             st.markdown("#### 🏦 계좌별 거래 분포")
             
-            account_summary = all_transactions.groupby('account').agg({
+            account_summary = derived('account_summary', lambda df: df.groupby('account').agg({
                 'amount': 'sum',
                 'transaction_id': 'count'
-            }).reset_index()
-            account_summary.columns = ['계좌', '총 금액', '거래 건수']
+            }).reset_index().set_axis(['계좌', '총 금액', '거래 건수'], axis=1))
             
-            fig_account = px.bar(
-                account_summary,
+            fig_account = cached_figure('cash_flow_account_bar', account_summary, lambda data: px.bar(
+                data,
                 x='계좌',
                 y='총 금액',
                 title='계좌별 총 거래 금액',
                 text='거래 건수'
-            )
-            fig_account.update_traces(texttemplate='%{text}건', textposition='outside')
+            ).update_traces(texttemplate='%{text}건', textposition='outside'))
             
             st.plotly_chart(fig_account, use_container_width=True)
             
+            show_cash_flow_forecast(cash_flow_manager)
+            
         else:
             st.info("차트를 생성할 데이터가 없습니다.")
             
     except Exception as e:
         st.error(f"차트 생성 중 오류: {str(e)}")
 
+def show_cash_flow_forecast(cash_flow_manager):
+    """통화별 월 현금흐름 예측 (캐시 조회, 적합은 백그라운드)"""
+    from managers.sqlite.sqlite_forecast_manager import SQLiteForecastManager
+    
+    db_path = getattr(cash_flow_manager, 'db_path', None)
+    if not db_path:
+        return
+    st.markdown("#### 🔮 월별 현금흐름 예측 (확정 거래 기준)")
+    forecast_manager = SQLiteForecastManager(db_path)
+    if forecast_manager.refresh_async('cash_flow') or forecast_manager.is_refreshing('cash_flow'):
+        st.caption("⏳ 새로 마감된 월을 반영해 예측을 다시 계산하는 중입니다.")
+    
+    currencies = forecast_manager.get_series_keys('cash_flow', 'net')
+    if not currencies:
+        st.info("예측 결과가 아직 없습니다. (마감된 월 3개월 이상 필요)")
+        return
+    
+    currency = st.selectbox("통화", options=currencies, key="cash_flow_forecast_currency")
+    frames = []
+    for dimension, label in (('inflow', '유입'), ('outflow', '유출'), ('net', '순현금흐름')):
+        forecast = forecast_manager.get_forecast('cash_flow', dimension, currency)
+        forecast['구분'] = label
+        frames.append(forecast)
+    forecast = pd.concat(frames, ignore_index=True)
+    
+    fig_forecast = px.line(forecast, x='period', y='value', color='구분', markers=True,
+                           labels={'period': '월', 'value': f'예측 금액 ({currency})'},
+                           color_discrete_map={'유입': 'green', '유출': 'red', '순현금흐름': 'blue'})
+    fig_forecast.update_layout(height=400)
+    st.plotly_chart(fig_forecast, use_container_width=True)
+    
+    run_info = forecast_manager.get_run_info('cash_flow')
+    if run_info:
+        st.caption(f"{run_info['fitted_through']}까지 마감 데이터로 적합 · 계산 시각 {run_info['computed_at']}")
+
 def show_cash_flow_statistics(cash_flow_manager, get_text=None):
     if get_text is None:
         get_text = lambda key: key
@@ -536,7 +618,7 @@ def show_cash_flow_statistics(cash_flow_manager, get_text=None):
         
         if len(all_transactions) > 0:
             # 딕셔너리 리스트를 DataFrame으로 변환
-            df = pd.DataFrame(all_transactions)
+            df = revalue_transactions(pd.DataFrame(all_transactions), cash_flow_manager)
             
             # 기본 통계
             st.markdown("### 📈 기본 통계")
@@ -8,7 +8,6 @@ ERP 다국어 문서 출력 시스템
 
 import streamlit as st
 import streamlit.components.v1 as components
-import json
 from datetime import datetime
 
 def show_document_print_page(get_text):
@@ -286,16 +285,7 @@ def show_document_print_page(get_text):
     # 회사 정보 로드
     company_data = get_company_data(system_config_manager, get_text)
     
-    # 고객 목록 로드
-    customers_data = get_customers_data(customer_manager, get_text)
-    
-    # 견적서 및 주문 데이터 로드 (JSON 직렬화 안전)
-    quotations_data = get_quotations_data(quotation_manager, get_text) if quotation_manager else []
-    orders_data = get_orders_data(order_manager, get_text) if order_manager else []
-    
-    # 데이터 안전성 확인
-    quotations_data = quotations_data if isinstance(quotations_data, list) else []
-    orders_data = orders_data if isinstance(orders_data, list) else []
+    # 고객/견적서/주문 전체 목록은 미리 읽지 않음 - 선택한 문서만 load_*_data()로 조회
     
     # 문서 출력 제어 섹션
     with st.container():
@@ -559,6 +549,128 @@ def show_document_print_page(get_text):
     - 사이드바 자동 숨김, A4 용지 완전 최적화
     - 품목 8개 이내 권장 (한 페이지 내 모든 내용 표시)
     """)
+    
+    # 월말 일괄 출력
+    show_batch_export_section(quotation_manager)
+
+
+# 일괄 출력 문서 종류 → (표시 이름, 날짜 컬럼, 번호 컬럼, 고객 컬럼)
+BATCH_DOCUMENT_TYPES = {
+    'quotation': ('견적서', 'quote_date', 'quotation_number', 'customer_company'),
+    'invoice': ('인보이스', 'issue_date', 'invoice_number', 'customer_name'),
+    'delivery_note': ('배송증', 'shipping_date', 'shipping_id', 'customer_name'),
+}
+
+
+def _batch_document_list(doc_type, quotation_manager):
+    """일괄 출력 대상 문서 목록 DataFrame과 ID 컬럼 (매니저가 없으면 None)"""
+    import pandas as pd
+    from config.database_config import get_invoice_manager, get_shipping_manager
+    
+    if doc_type == 'quotation':
+        if not quotation_manager or not hasattr(quotation_manager, 'get_all_quotations'):
+            return None, 'quotation_id'
+        documents, id_column = quotation_manager.get_all_quotations(), 'quotation_id'
+    elif doc_type == 'invoice':
+        documents, id_column = get_invoice_manager().get_invoices(), 'invoice_id'
+    else:
+        documents, id_column = get_shipping_manager().get_all_shipments(), 'shipping_id'
+    if isinstance(documents, list):
+        documents = pd.DataFrame(documents)
+    return documents, id_column
+
+
+def _load_batch_jobs(doc_type, quotation_manager, document_ids):
+    from config.database_config import get_invoice_manager, get_shipping_manager
+    from utils.batch_document_renderer import (
+        load_quotation_jobs, load_invoice_jobs, load_delivery_note_jobs
+    )
+    
+    if doc_type == 'quotation':
+        return load_quotation_jobs(quotation_manager, document_ids)
+    if doc_type == 'invoice':
+        return load_invoice_jobs(get_invoice_manager(), document_ids)
+    return load_delivery_note_jobs(get_shipping_manager(), document_ids, quotation_manager)
+
+
+def show_batch_export_section(quotation_manager):
+    """견적서/인보이스/배송증 일괄 출력 (프로세스 풀 병렬 렌더링 → ZIP/병합 PDF 다운로드)"""
+    import pandas as pd
+    from utils.batch_document_renderer import render_batch
+    
+    with st.expander("📦 문서 일괄 출력", expanded=False):
+        doc_type = st.radio("문서 종류", list(BATCH_DOCUMENT_TYPES), horizontal=True,
+                            format_func=lambda x: BATCH_DOCUMENT_TYPES[x][0], key="batch_export_type")
+        type_name, date_column, number_column, customer_column = BATCH_DOCUMENT_TYPES[doc_type]
+        
+        try:
+            documents, id_column = _batch_document_list(doc_type, quotation_manager)
+        except Exception as e:
+            st.error(f"{type_name} 목록 조회 오류: {e}")
+            return
+        if documents is None:
+            st.info(f"{type_name} 매니저를 사용할 수 없습니다.")
+            return
+        if documents.empty or id_column not in documents.columns:
+            st.info(f"출력할 {type_name}이(가) 없습니다.")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            month_options = ['전체'] + sorted(
+                documents[date_column].dropna().astype(str).str[:7].unique().tolist(), reverse=True
+            ) if date_column in documents.columns else ['전체']
+            month = st.selectbox("월", month_options, key=f"batch_export_month_{doc_type}")
+        with col2:
+            output_format = st.radio("형식", ['pdf', 'html'], horizontal=True, key="batch_export_format")
+        with col3:
+            bundle = st.radio("묶음", ['zip', 'merged'], horizontal=True, key="batch_export_bundle",
+                              format_func=lambda x: 'ZIP' if x == 'zip' else '하나의 PDF')
+        
+        if month != '전체':
+            documents = documents[documents[date_column].astype(str).str.startswith(month)]
+        labels = {
+            row[id_column]: f"{row.get(number_column, '') or row[id_column]} - {row.get(customer_column, '') or ''}"
+            for _, row in documents.iterrows()
+        }
+        selected_ids = st.multiselect(
+            f"{type_name} 선택 ({len(labels)}건)", list(labels), default=[],
+            format_func=lambda x: labels.get(x, x), key=f"batch_export_ids_{doc_type}"
+        )
+        if labels and st.checkbox(f"목록의 {type_name} 전체 선택 ({len(labels)}건)",
+                                  key=f"batch_export_all_{doc_type}"):
+            selected_ids = list(labels)
+        
+        if st.button("🚀 일괄 생성", disabled=not selected_ids, key="batch_export_run"):
+            progress = st.progress(0.0, text="문서 데이터 로드 중...")
+            jobs = _load_batch_jobs(doc_type, quotation_manager, selected_ids)
+            
+            def report(done, total, doc_id):
+                progress.progress(done / total, text=f"렌더링 {done}/{total} ({labels.get(doc_id, doc_id)})")
+            
+            result = render_batch(jobs, output_format=output_format, bundle=bundle,
+                                  progress_callback=report)
+            result['labels'] = {doc_id: labels.get(doc_id, doc_id) for doc_id in result['errors']}
+            st.session_state['batch_export_result'] = result
+            progress.progress(1.0, text=f"완료: {result['rendered']}건")
+        
+        result = st.session_state.get('batch_export_result')
+        if result:
+            if result['errors']:
+                # expander 안에서는 expander를 중첩할 수 없으므로 표로 표시
+                st.warning(f"⚠️ {len(result['errors'])}건 생성 실패")
+                st.dataframe(pd.DataFrame([
+                    {'문서': result['labels'].get(doc_id, doc_id), '오류': error}
+                    for doc_id, error in result['errors'].items()
+                ]), use_container_width=True, hide_index=True)
+            st.download_button(
+                label=f"📥 {result['file_name']} 다운로드 ({result['rendered']}건)",
+                data=result['content'],
+                file_name=result['file_name'],
+                mime=result['mime'],
+                use_container_width=True,
+                key="batch_export_download"
+            )
 
 def get_company_data(config_manager, get_text):
     """회사 정보를 언어별로 로드"""
@@ -901,2042 +1013,3 @@ def get_document_note(doc_type):
         return '출고 내역을 확인하시고 수령 바랍니다.'
     else:  # 지출요청서
         return '위 내역에 대한 지출을 요청드립니다.'
-
-def get_customers_data(customer_manager, get_text):
-    """SQLite에서 실제 고객 데이터 로드"""
-    try:
-        import sqlite3
-        
-        # SQLite에서 실제 고객 데이터 직접 로드
-        conn = sqlite3.connect('erp_system.db')
-        cursor = conn.execute('''
-            SELECT customer_id, company_name, contact_person, email, phone, 
-                   country, city, address, business_type
-            FROM customers 
-            WHERE status = 'active'
-            ORDER BY company_name
-        ''')
-        
-        customers_list = []
-        for row in cursor.fetchall():
-            customer_id, company_name, contact_person, email, phone, country, city, address, business_type = row
-            customers_list.append({
-                'customer_id': customer_id,
-                'company_name': company_name,
-                'contact_person': contact_person,
-                'email': email,
-                'phone': phone,
-                'country': country,
-                'city': city,
-                'address': address,
-                'business_type': business_type
-            })
-        
-        conn.close()
-        
-        if not customers_list:
-            # 마이그레이션된 데이터가 없는 경우에만 샘플 데이터 사용
-            customers_list = [{
-                'customer_id': 'sample1',
-                'company_name': '샘플 고객사 A',
-                'contact_person': '김담당자',
-                'phone': '+84-28-1234-5678',
-                'email': 'contact@sample-a.com',
-                'address': '베트남 호치민시 1구',
-                'business_number': '1234567890'
-            }]
-            
-        customers_data = {}
-        
-        for customer in customers_list:
-            customer_id = str(customer.get('customer_id', ''))
-            
-            # 기본 정보
-            base_company = customer.get('company_name', '샘플 고객사')
-            base_contact = customer.get('contact_person', '담당자')
-            base_address = customer.get('address', '베트남 호치민시')
-            base_phone = customer.get('phone', '+84-xxx-xxx-xxx')
-            base_email = customer.get('email', 'contact@customer.com')
-            base_business = customer.get('business_number', '1234567890')
-            
-            customers_data[customer_id] = {
-                'ko': {
-                    'company': base_company,
-                    'contact': base_contact,
-                    'department': customer.get('department', '영업팀'),
-                    'address': base_address,
-                    'phone': base_phone,
-                    'email': base_email,
-                    'businessNumber': base_business
-                },
-                'en': {
-                    'company': base_company + ' Co., Ltd.',
-                    'contact': base_contact + ' (Manager)',
-                    'department': customer.get('department', 'Sales Team'),
-                    'address': base_address.replace('베트남', 'Vietnam').replace('호치민시', 'Ho Chi Minh City'),
-                    'phone': base_phone,
-                    'email': base_email,
-                    'businessNumber': base_business
-                },
-                'vi': {
-                    'company': 'Công ty ' + base_company,
-                    'contact': 'Ông/Bà ' + base_contact,
-                    'department': customer.get('department', 'Phòng Kinh doanh'),
-                    'address': base_address.replace('베트남', 'Việt Nam').replace('호치민시', 'TP. Hồ Chí Minh'),
-                    'phone': base_phone,
-                    'email': base_email,
-                    'businessNumber': base_business
-                }
-            }
-        
-        return customers_data
-        
-    except Exception as e:
-        st.warning(f"고객 정보 로드 중 오류가 발생했습니다: {str(e)}")
-        return {}
-
-def get_quotations_data(quotation_manager, get_text):
-    """견적서 데이터 로드"""
-    try:
-        if quotation_manager and hasattr(quotation_manager, 'get_quotations_dataframe'):
-            quotations_df = quotation_manager.get_quotations_dataframe()
-            if not quotations_df.empty:
-                # DataFrame을 dict로 변환하고 JSON 직렬화 가능하도록 처리
-                records = quotations_df.to_dict('records')
-                return [convert_to_json_serializable(record) for record in records]
-            return []
-        elif quotation_manager and hasattr(quotation_manager, 'get_all_quotations'):
-            data = quotation_manager.get_all_quotations()
-            return [convert_to_json_serializable(item) for item in data] if isinstance(data, list) else []
-        else:
-            return []
-    except Exception as e:
-        st.warning(f"견적서 데이터 로드 중 오류: {str(e)}")
-        return []
-
-def get_orders_data(order_manager, get_text):
-    """주문 데이터 로드"""
-    try:
-        if order_manager and hasattr(order_manager, 'get_orders_dataframe'):
-            orders_df = order_manager.get_orders_dataframe()
-            if not orders_df.empty:
-                # DataFrame을 dict로 변환하고 JSON 직렬화 가능하도록 처리
-                records = orders_df.to_dict('records')
-                return [convert_to_json_serializable(record) for record in records]
-            return []
-        elif order_manager and hasattr(order_manager, 'get_all_orders'):
-            data = order_manager.get_all_orders()
-            return [convert_to_json_serializable(item) for item in data] if isinstance(data, list) else []
-        else:
-            return []
-    except Exception as e:
-        st.warning(f"주문 데이터 로드 중 오류: {str(e)}")
-        return []
-
-def convert_to_json_serializable(obj):
-    """JSON 직렬화 가능한 형태로 변환"""
-    import pandas as pd
-    import numpy as np
-    from datetime import datetime, date
-    
-    if isinstance(obj, dict):
-        return {key: convert_to_json_serializable(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_to_json_serializable(item) for item in obj]
-    elif isinstance(obj, (pd.Timestamp, datetime, date)):
-        return obj.isoformat() if hasattr(obj, 'isoformat') else str(obj)
-    elif hasattr(obj, 'dtype') and 'int' in str(obj.dtype):
-        return int(obj)
-    elif hasattr(obj, 'dtype') and 'float' in str(obj.dtype):
-        return float(obj)
-    elif pd.isna(obj) or obj is None:
-        return None
-    elif hasattr(obj, 'to_dict'):
-        return convert_to_json_serializable(obj.to_dict())
-    else:
-        return str(obj)
-
-# 기존 HTML 생성 함수는 더 이상 사용하지 않음
-def generate_print_system_html_legacy(company_data, customers_data, quotations_data, orders_data, get_text):
-    """문서 출력 시스템 HTML 생성"""
-    
-    # 언어별 번역 데이터 준비
-    translations_js = {
-        'ko': {
-            'dataLabel': '데이터 선택:',
-            'refreshBtn': '새로고침',
-            'docSelectTitle': '문서 타입 선택',
-            'taxSettingsTitle': '부가세 설정',
-            'vatApplyLabel': '부가세 적용',
-            'vatRateLabel': '부가세율:',
-            'quote': '견적서',
-            'purchase': '발주서',
-            'delivery': '출고서',
-            'payment': '지불요청서',
-            'docNumberLabel': '문서번호:',
-            'docDateLabel': '발행일:',
-            'customerInfoTitle': '고객 정보',
-            'documentInfoTitle': '문서 정보',
-            'companyLabel': '회사:',
-            'contactLabel': '담당:',
-            'addressLabel': '주소:',
-            'phoneLabel': '전화:',
-            'emailLabel': '이메일:',
-            'validityLabel': '유효기간:',
-            'paymentLabel': '결제조건:',
-            'deliveryLabel': '배송조건:',
-            'managerLabel': '담당자:',
-            'noHeader': '번호',
-            'itemHeader': '품목명',
-            'specHeader': '규격',
-            'qtyHeader': '수량',
-            'unitHeader': '단위',
-            'priceHeader': '단가',
-            'amountHeader': '금액',
-            'remarkHeader': '비고',
-            'subtotalLabel': '소계',
-            'vatLabel': '부가세',
-            'shippingLabel': '배송비',
-            'totalLabel': '총 금액',
-            'supplierSignature': '공급자 서명',
-            'customerSignature': '구매자 서명',
-            'previewBtn': '🖨️ 바로 프린트',
-            'downloadBtn': '📄 HTML 다운로드',
-            'printBtn': '문서 프린트',
-            'validateBtn': '유효성 검사 후 프린트'
-        },
-        'en': {
-            'dataLabel': 'Select Data:',
-            'refreshBtn': 'Refresh',
-            'docSelectTitle': 'Select Document Type',
-            'taxSettingsTitle': 'Tax Settings',
-            'vatApplyLabel': 'Apply VAT',
-            'vatRateLabel': 'VAT Rate:',
-            'quote': 'Quotation',
-            'purchase': 'Purchase Order',
-            'delivery': 'Delivery Note',
-            'payment': 'Payment Request',
-            'docNumberLabel': 'Doc Number:',
-            'docDateLabel': 'Issue Date:',
-            'customerInfoTitle': 'Customer Information',
-            'documentInfoTitle': 'Document Information',
-            'companyLabel': 'Company:',
-            'contactLabel': 'Contact:',
-            'addressLabel': 'Address:',
-            'phoneLabel': 'Phone:',
-            'emailLabel': 'Email:',
-            'validityLabel': 'Valid Until:',
-            'paymentLabel': 'Payment Terms:',
-            'deliveryLabel': 'Delivery Terms:',
-            'managerLabel': 'Manager:',
-            'noHeader': 'No.',
-            'itemHeader': 'Item',
-            'specHeader': 'Specification',
-            'qtyHeader': 'Qty',
-            'unitHeader': 'Unit',
-            'priceHeader': 'Price',
-            'amountHeader': 'Amount',
-            'remarkHeader': 'Remark',
-            'subtotalLabel': 'Subtotal',
-            'vatLabel': 'VAT',
-            'shippingLabel': 'Shipping',
-            'totalLabel': 'Total Amount',
-            'supplierSignature': 'Supplier Signature',
-            'customerSignature': 'Customer Signature',
-            'previewBtn': '🖨️ Direct Print',
-            'downloadBtn': '📄 Download HTML',
-            'printBtn': 'Print Document',
-            'validateBtn': 'Validate & Print'
-        },
-        'vi': {
-            'dataLabel': 'Chọn Dữ liệu:',
-            'refreshBtn': 'Làm mới',
-            'docSelectTitle': 'Chọn Loại Tài liệu',
-            'taxSettingsTitle': 'Cài đặt Thuế',
-            'vatApplyLabel': 'Áp dụng VAT',
-            'vatRateLabel': 'Thuế suất VAT:',
-            'quote': 'Báo giá',
-            'purchase': 'Đơn đặt hàng',
-            'delivery': 'Phiếu giao hàng',
-            'payment': 'Yêu cầu thanh toán',
-            'docNumberLabel': 'Số tài liệu:',
-            'docDateLabel': 'Ngày phát hành:',
-            'customerInfoTitle': 'Thông tin Khách hàng',
-            'documentInfoTitle': 'Thông tin Tài liệu',
-            'companyLabel': 'Công ty:',
-            'contactLabel': 'Liên hệ:',
-            'addressLabel': 'Địa chỉ:',
-            'phoneLabel': 'Điện thoại:',
-            'emailLabel': 'Email:',
-            'validityLabel': 'Có hiệu lực đến:',
-            'paymentLabel': 'Điều khoản thanh toán:',
-            'deliveryLabel': 'Điều khoản giao hàng:',
-            'managerLabel': 'Người phụ trách:',
-            'noHeader': 'STT',
-            'itemHeader': 'Mặt hàng',
-            'specHeader': 'Thông số',
-            'qtyHeader': 'SL',
-            'unitHeader': 'Đơn vị',
-            'priceHeader': 'Đơn giá',
-            'amountHeader': 'Thành tiền',
-            'remarkHeader': 'Ghi chú',
-            'subtotalLabel': 'Tạm tính',
-            'vatLabel': 'VAT',
-            'shippingLabel': 'Phí vận chuyển',
-            'totalLabel': 'Tổng cộng',
-            'supplierSignature': 'Chữ ký Nhà cung cấp',
-            'customerSignature': 'Chữ ký Khách hàng',
-            'previewBtn': '🖨️ In trực tiếp',
-            'downloadBtn': '📄 Tải HTML',
-            'printBtn': 'In tài liệu',
-            'validateBtn': 'Kiểm tra & In'
-        }
-    }
-    
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ERP Multi-Language Document Printing System</title>
-    <style>
-        /* 기본 스타일 */
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Arial', sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f5f5f5;
-            font-size: 11px;
-        }}
-
-        .container {{
-            width: 100% !important;
-            max-width: none !important;
-            margin: 0 !important;
-            padding: 0 !important;
-            box-sizing: border-box !important;
-            min-height: 100vh !important;
-            display: flex !important;
-            flex-direction: column !important;
-            background: #f5f5f5 !important;
-        }}
-
-        /* 언어 선택 및 문서 선택 */
-        .controls-section {{
-            background: white !important;
-            padding: 12px 20px !important;
-            border-bottom: 2px solid #e0e0e0 !important;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05) !important;
-            flex-shrink: 0 !important;
-            margin-bottom: 0 !important;
-            width: 100% !important;
-            position: relative !important;
-        }}
-
-        .controls-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 12px;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-
-        .language-selector {{
-            display: flex;
-            gap: 10px;
-            align-items: center;
-        }}
-
-        .lang-btn {{
-            padding: 6px 12px;
-            border: 1px solid #666;
-            border-radius: 4px;
-            background: white;
-            color: #333;
-            cursor: pointer;
-            font-size: 10px;
-            transition: all 0.3s;
-        }}
-
-        .lang-btn:hover {{
-            background: #f5f5f5;
-        }}
-
-        .lang-btn.active {{
-            background: #333;
-            color: white;
-        }}
-
-        .document-selector {{
-            display: flex;
-            gap: 8px;
-            flex-wrap: wrap;
-        }}
-
-        .doc-btn {{
-            padding: 8px 16px;
-            border: 1px solid #666;
-            border-radius: 5px;
-            background: white;
-            color: #333;
-            cursor: pointer;
-            font-size: 11px;
-            transition: background 0.3s;
-        }}
-
-        .doc-btn:hover {{
-            background: #f5f5f5;
-        }}
-
-        .doc-btn.active {{
-            background: #333;
-            color: white;
-        }}
-
-        .data-controls {{
-            display: flex;
-            gap: 10px;
-            align-items: center;
-        }}
-
-        .data-select {{
-            padding: 6px 10px;
-            border: 1px solid #666;
-            border-radius: 4px;
-            font-size: 10px;
-        }}
-
-        .refresh-btn {{
-            padding: 6px 12px;
-            background: #666;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 10px;
-        }}
-
-        /* 부가세 설정 */
-        .tax-controls {{
-            background: #f8f9fa;
-            padding: 12px;
-            border-radius: 6px;
-            border: 1px solid #ddd;
-        }}
-
-        .tax-controls h3 {{
-            font-size: 11px;
-            margin-bottom: 8px;
-            color: #333;
-        }}
-
-        .tax-options {{
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            flex-wrap: wrap;
-        }}
-
-        .tax-checkbox {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-            font-size: 10px;
-            cursor: pointer;
-        }}
-
-        .tax-checkbox input[type="checkbox"] {{
-            width: 14px;
-            height: 14px;
-            cursor: pointer;
-        }}
-
-        .vat-rate-input {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-            font-size: 10px;
-        }}
-
-        .vat-rate-input input[type="number"] {{
-            width: 50px;
-            padding: 3px 5px;
-            border: 1px solid #ccc;
-            border-radius: 3px;
-            font-size: 10px;
-            text-align: center;
-        }}
-
-        .vat-rate-input input[type="number"]:disabled {{
-            background: #f5f5f5;
-            color: #999;
-        }}
-
-        /* 문서 컨테이너 */
-        .document-container {{
-            flex: 1 !important;
-            display: flex !important;
-            justify-content: center !important;
-            align-items: flex-start !important;
-            padding: 40px 20px !important;
-            background: #f5f5f5 !important;
-            overflow: auto !important;
-            width: 100% !important;
-            max-width: none !important;
-        }}
-
-        .document {{
-            width: 210mm !important;
-            min-height: 297mm !important;
-            background: white !important;
-            position: relative !important;
-            box-sizing: border-box !important;
-            box-shadow: 0 8px 24px rgba(0,0,0,0.15) !important;
-            border-radius: 8px !important;
-            padding: 20mm !important;
-            font-size: 12px !important;
-            line-height: 1.4 !important;
-            transform: scale(0.8) !important;
-            transform-origin: top center !important;
-            margin: 0 auto 40px auto !important;
-        }}
-
-        /* 문서 헤더 */
-        .document-header {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            margin-bottom: 25px;
-            padding-bottom: 20px;
-            border-bottom: 3px solid #333;
-            align-items: start;
-        }}
-
-        .company-info {{
-            flex: 1;
-        }}
-
-        .company-logo {{
-            width: 64px;
-            height: 64px;
-            background: white;
-            border: 2px solid #333;
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #333;
-            font-weight: bold;
-            font-size: 19px;
-            margin-bottom: 10px;
-        }}
-
-        .company-name {{
-            font-size: 19px;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 5px;
-        }}
-
-        .company-details {{
-            font-size: 10px;
-            color: #666;
-            line-height: 1.4;
-        }}
-
-        .document-title {{
-            text-align: right;
-            flex: 1;
-        }}
-
-        .doc-type {{
-            font-size: 26px;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 10px;
-        }}
-
-        .doc-number {{
-            font-size: 11px;
-            color: #666;
-        }}
-
-        /* 고객 정보 - 컴팩트 버전 */
-        .customer-section {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 25px;
-            margin-bottom: 20px;
-            padding: 15px 0;
-        }}
-
-        .customer-info {{
-            background: #f8f9fa;
-            padding: 8px 10px;
-            border-radius: 4px;
-            border-left: 3px solid #333;
-        }}
-
-        .document-info {{
-            background: #f8f9fa;
-            padding: 8px 10px;
-            border-radius: 4px;
-            border-left: 3px solid #666;
-        }}
-
-        .section-title {{
-            font-weight: bold;
-            margin-bottom: 6px;
-            color: #333;
-            font-size: 10px;
-            text-transform: uppercase;
-        }}
-
-        .info-compact {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 8px;
-            font-size: 9px;
-        }}
-
-        .info-item {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 2px;
-        }}
-
-        .info-label {{
-            font-weight: bold;
-            color: #555;
-            min-width: 45px;
-            margin-right: 4px;
-        }}
-
-        .info-value {{
-            color: #333;
-            flex: 1;
-        }}
-
-        .doc-info-compact {{
-            font-size: 9px;
-        }}
-
-        .doc-info-row {{
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 3px;
-        }}
-
-        .doc-info-label {{
-            font-weight: bold;
-            color: #555;
-        }}
-
-        .doc-info-value {{
-            color: #333;
-        }}
-
-        /* 품목 테이블 */
-        .items-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 25px;
-            font-size: 11px;
-            table-layout: fixed;
-        }}
-
-        .items-table th:nth-child(1) {{ width: 8%; }}  /* 번호 */
-        .items-table th:nth-child(2) {{ width: 25%; }} /* 품목명 */
-        .items-table th:nth-child(3) {{ width: 15%; }} /* 규격 */
-        .items-table th:nth-child(4) {{ width: 8%; }}  /* 수량 */
-        .items-table th:nth-child(5) {{ width: 8%; }}  /* 단위 */
-        .items-table th:nth-child(6) {{ width: 12%; }} /* 단가 */
-        .items-table th:nth-child(7) {{ width: 12%; }} /* 금액 */
-        .items-table th:nth-child(8) {{ width: 12%; }} /* 비고 */
-
-        .items-table th {{
-            background: #f8f9fa;
-            border: 1px solid #333;
-            padding: 12px 8px;
-            text-align: left;
-            font-weight: bold;
-            color: #333;
-        }}
-
-        .items-table td {{
-            border: 1px solid #333;
-            padding: 10px 8px;
-            text-align: left;
-            vertical-align: top;
-        }}
-
-        .items-table .number-cell {{
-            text-align: right;
-        }}
-
-        .items-table .center-cell {{
-            text-align: center;
-        }}
-
-        /* 합계 섹션 */
-        .totals-section {{
-            margin-top: 10px;
-            display: flex;
-            justify-content: flex-end;
-        }}
-
-        .totals-table {{
-            width: 300px;
-            border-collapse: collapse;
-        }}
-
-        .totals-table td {{
-            padding: 8px 12px;
-            border: 1px solid #333;
-            font-size: 11px;
-        }}
-
-        .totals-table .label {{
-            background: #f8f9fa;
-            font-weight: bold;
-            text-align: right;
-            width: 150px;
-        }}
-
-        .totals-table .amount {{
-            text-align: right;
-            font-weight: bold;
-        }}
-
-        .total-final {{
-            background: #333 !important;
-            color: white !important;
-            font-size: 13px;
-        }}
-
-        /* 서명 섹션 */
-        .signature-section {{
-            margin-top: 20px;
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-        }}
-
-        .signature-box {{
-            text-align: center;
-            border: 1px solid #ddd;
-            padding: 30px 16px;
-            border-radius: 5px;
-        }}
-
-        .signature-title {{
-            font-weight: bold;
-            margin-bottom: 24px;
-        }}
-
-        .signature-line {{
-            border-bottom: 1px solid #333;
-            margin-bottom: 8px;
-            height: 32px;
-        }}
-
-        /* 프린트 컨트롤 */
-        .print-controls {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            display: flex;
-            gap: 10px;
-            background: white;
-            padding: 12px;
-            border-radius: 25px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-            z-index: 1000;
-        }}
-
-        .print-btn {{
-            padding: 10px 16px;
-            border: none;
-            border-radius: 20px;
-            background: #333;
-            color: white;
-            cursor: pointer;
-            font-size: 11px;
-            font-weight: 500;
-            transition: all 0.3s;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-
-        .print-btn:hover {{
-            background: #555;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-        }}
-
-        .preview-btn {{
-            background: linear-gradient(45deg, #28a745, #20c997);
-            border: none;
-            color: white;
-        }}
-
-        .preview-btn:hover {{
-            background: linear-gradient(45deg, #20c997, #28a745);
-            transform: translateY(-2px);
-        }}
-        
-        .download-btn {{
-            background: linear-gradient(45deg, #007bff, #6f42c1);
-            border: none;
-            color: white;
-        }}
-        
-        .download-btn:hover {{
-            background: linear-gradient(45deg, #6f42c1, #007bff);
-            transform: translateY(-2px);
-        }}
-
-        /* 프린트 스타일 */
-        @media print {{
-            .controls-section,
-            .print-controls,
-            .container > :not(.document-container) {{
-                display: none !important;
-            }}
-
-            @page {{
-                size: A4;
-                margin: 1cm;
-            }}
-
-            .document-container {{
-                box-shadow: none;
-                border-radius: 0;
-                margin: 0;
-                padding: 0;
-            }}
-
-            .document {{
-                width: 100%;
-                min-height: auto;
-                margin: 0;
-                padding: 0;
-                box-shadow: none;
-            }}
-
-            .company-logo {{
-                background: white !important;
-                color: black !important;
-                border: 2px solid black;
-            }}
-
-            .doc-type {{
-                color: black !important;
-            }}
-
-            .total-final {{
-                background: white !important;
-                color: black !important;
-                border: 2px solid black !important;
-                -webkit-print-color-adjust: exact;
-            }}
-
-            .items-table {{
-                page-break-inside: avoid;
-            }}
-
-            .totals-section {{
-                page-break-inside: avoid;
-            }}
-
-            .signature-section {{
-                page-break-inside: avoid;
-            }}
-
-            .items-table thead {{
-                display: table-header-group;
-            }}
-        }}
-
-        /* 반응형 디자인 */
-        @media (max-width: 1400px) {{
-            .document {{
-                transform: scale(0.7);
-            }}
-        }}
-
-        @media (max-width: 1200px) {{
-            .document {{
-                transform: scale(0.6);
-                width: 90vw;
-                max-width: 210mm;
-            }}
-            
-            .print-controls {{
-                position: static;
-                margin-top: 20px;
-                justify-content: center;
-                border-radius: 8px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            }}
-        }}
-
-        @media (max-width: 768px) {{
-            .controls-row {{
-                flex-direction: column;
-                gap: 15px;
-                align-items: stretch;
-            }}
-
-            .document {{
-                transform: scale(0.5);
-                width: 95vw;
-            }}
-
-            .document-header {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-
-            .customer-section {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-
-            .signature-section {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-            }}
-
-            .language-selector,
-            .document-selector,
-            .data-controls,
-            .tax-options {{
-                justify-content: center;
-                flex-wrap: wrap;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <!-- 컨트롤 섹션 -->
-        <div class="controls-section">
-            <div class="controls-row">
-                <div class="language-selector">
-                    <span>Language:</span>
-                    <button class="lang-btn active" onclick="changeLanguage('ko')">한국어</button>
-                    <button class="lang-btn" onclick="changeLanguage('en')">English</button>
-                    <button class="lang-btn" onclick="changeLanguage('vi')">Tiếng Việt</button>
-                </div>
-                
-                <div class="data-controls">
-                    <span id="dataLabel">데이터 선택:</span>
-                    <select class="data-select" id="customerSelect" onchange="loadCustomerData()">
-                        <!-- 동적으로 로드됨 -->
-                    </select>
-                    <button class="refresh-btn" onclick="refreshData()" id="refreshBtn">새로고침</button>
-                </div>
-            </div>
-            
-            <div class="controls-row">
-                <div>
-                    <h3 id="docSelectTitle">문서 타입 선택</h3>
-                    <div class="document-selector">
-                        <button class="doc-btn active" onclick="selectDocumentType('quote', event)" id="quoteBtn">견적서</button>
-                        <button class="doc-btn" onclick="selectDocumentType('purchase', event)" id="purchaseBtn">발주서</button>
-                        <button class="doc-btn" onclick="selectDocumentType('delivery', event)" id="deliveryBtn">출고서</button>
-                        <button class="doc-btn" onclick="selectDocumentType('payment', event)" id="paymentBtn">지불요청서</button>
-                    </div>
-                </div>
-                
-                <div class="tax-controls">
-                    <h3 id="taxSettingsTitle">부가세 설정</h3>
-                    <div class="tax-options">
-                        <label class="tax-checkbox">
-                            <input type="checkbox" id="vatApply" checked onchange="updateVatSettings()">
-                            <span id="vatApplyLabel">부가세 적용</span>
-                        </label>
-                        <div class="vat-rate-input">
-                            <label for="vatRate" id="vatRateLabel">부가세율:</label>
-                            <input type="number" id="vatRate" value="10" min="0" max="30" step="0.1" onchange="updateVatSettings()">
-                            <span>%</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- 문서 컨테이너 -->
-        <div class="document-container">
-            <div class="document" id="document">
-                <!-- 문서 헤더 -->
-                <div class="document-header">
-                    <div class="company-info">
-                        <div class="company-logo">LOGO</div>
-                        <div class="company-name" id="companyName">회사명 (주)</div>
-                        <div class="company-details" id="companyDetails">
-                            주소: 서울특별시 강남구 테헤란로 123<br>
-                            전화: 02-1234-5678<br>
-                            이메일: info@company.com<br>
-                            사업자등록번호: 123-45-67890
-                        </div>
-                    </div>
-                    <div class="document-title">
-                        <div class="doc-type" id="docType">견적서</div>
-                        <div class="doc-number">
-                            <span id="docNumberLabel">문서번호:</span> <span id="docNumber">Q202508220001</span><br>
-                            <span id="docDateLabel">발행일:</span> <span id="docDate">2025-08-22</span>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- 고객 및 문서 정보 -->
-                <div class="customer-section">
-                    <div class="customer-info">
-                        <div class="section-title" id="customerInfoTitle">고객 정보</div>
-                        <div class="info-compact">
-                            <div class="info-item">
-                                <span class="info-label" id="companyLabel">회사:</span>
-                                <span class="info-value" id="customerCompany">고객사명</span>
-                            </div>
-                            <div class="info-item">
-                                <span class="info-label" id="contactLabel">담당:</span>
-                                <span class="info-value" id="customerContact">담당자명</span>
-                            </div>
-                            <div class="info-item">
-                                <span class="info-label" id="phoneLabel">전화:</span>
-                                <span class="info-value" id="customerPhone">전화번호</span>
-                            </div>
-                            <div class="info-item">
-                                <span class="info-label" id="emailLabel">이메일:</span>
-                                <span class="info-value" id="customerEmail">이메일</span>
-                            </div>
-                        </div>
-                        <div style="margin-top: 4px; font-size: 8px;">
-                            <span class="info-label" id="addressLabel">주소:</span>
-                            <span class="info-value" id="customerAddress">고객 주소</span>
-                        </div>
-                    </div>
-                    
-                    <div class="document-info">
-                        <div class="section-title" id="documentInfoTitle">문서 정보</div>
-                        <div class="doc-info-compact">
-                            <div class="doc-info-row">
-                                <span class="doc-info-label" id="validityLabel">유효기간:</span>
-                                <span class="doc-info-value" id="docValidity">2025-09-22</span>
-                            </div>
-                            <div class="doc-info-row">
-                                <span class="doc-info-label" id="paymentLabel">결제조건:</span>
-                                <span class="doc-info-value" id="docPayment">현금 30일</span>
-                            </div>
-                            <div class="doc-info-row">
-                                <span class="doc-info-label" id="deliveryLabel">배송조건:</span>
-                                <span class="doc-info-value" id="docDelivery">착불</span>
-                            </div>
-                            <div class="doc-info-row">
-                                <span class="doc-info-label" id="managerLabel">담당자:</span>
-                                <span class="doc-info-value" id="docManager">영업담당</span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- 품목 테이블 -->
-                <table class="items-table">
-                    <thead>
-                        <tr>
-                            <th class="center-cell" id="noHeader">번호</th>
-                            <th id="itemHeader">품목명</th>
-                            <th id="specHeader">규격</th>
-                            <th class="center-cell" id="qtyHeader">수량</th>
-                            <th class="center-cell" id="unitHeader">단위</th>
-                            <th class="number-cell" id="priceHeader">단가</th>
-                            <th class="number-cell" id="amountHeader">금액</th>
-                            <th id="remarkHeader">비고</th>
-                        </tr>
-                    </thead>
-                    <tbody id="itemsTableBody">
-                        <!-- 동적으로 로드됨 -->
-                    </tbody>
-                </table>
-
-                <!-- 합계 섹션 -->
-                <div class="totals-section">
-                    <table class="totals-table">
-                        <tr>
-                            <td class="label" id="subtotalLabel">소계</td>
-                            <td class="amount" id="subtotalAmount">0 VND</td>
-                        </tr>
-                        <tr>
-                            <td class="label" id="vatLabel">부가세</td>
-                            <td class="amount" id="vatAmount">0 VND</td>
-                        </tr>
-                        <tr>
-                            <td class="label" id="shippingLabel">배송비</td>
-                            <td class="amount" id="shippingAmount">750,000 VND</td>
-                        </tr>
-                        <tr class="total-final">
-                            <td class="label total-final" id="totalLabel">총 금액</td>
-                            <td class="amount total-final" id="totalAmount">0 VND</td>
-                        </tr>
-                    </table>
-                </div>
-
-                <!-- 서명 섹션 -->
-                <div class="signature-section">
-                    <div class="signature-box">
-                        <div class="signature-title" id="supplierSignature">공급자 서명</div>
-                        <div class="signature-line"></div>
-                        <div>(인)</div>
-                    </div>
-                    <div class="signature-box">
-                        <div class="signature-title" id="customerSignature">구매자 서명</div>
-                        <div class="signature-line"></div>
-                        <div>(인)</div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- 프린트 컨트롤 -->
-            <div class="print-controls">
-                <button class="print-btn preview-btn" onclick="showPrintPreview()" id="previewBtn">🖨️ 바로 프린트</button>
-                <button class="print-btn download-btn" onclick="downloadPrintDocument()" id="downloadBtn">📄 HTML 다운로드</button>
-                <button class="print-btn" onclick="printDocument()" id="printBtn">문서 프린트</button>
-                <button class="print-btn" onclick="validateAndPrint()" id="validateBtn">유효성 검사 후 프린트</button>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // 전역 변수
-        let currentLanguage = 'ko';
-        let currentDocType = 'quote';
-        let currentCustomer = 'customer1';
-        
-        // 다국어 번역 데이터
-        const translations = {json.dumps(translations_js, ensure_ascii=False)};
-        
-        // 회사 정보 데이터
-        const companyDatabase = {json.dumps(company_data, ensure_ascii=False)};
-        
-        // 고객 정보 데이터  
-        const customersDatabase = {json.dumps(customers_data, ensure_ascii=False)};
-        
-        // 견적서 및 주문 데이터
-        const quotationsDatabase = {json.dumps(quotations_data, ensure_ascii=False)};
-        const ordersDatabase = {json.dumps(orders_data, ensure_ascii=False)};
-        
-        // 문서 타입 설정 (ERP 시스템과 동일한 형식)
-        const documentTypes = {{
-            'quote': {{ prefix: 'Q' }},      // 견적서: QYYYYMMDD####
-            'purchase': {{ prefix: 'P' }},   // 발주서: PYYYYMMDD####
-            'delivery': {{ prefix: 'D' }},   // 출고서: DYYYYMMDD####
-            'payment': {{ prefix: 'PAY' }}   // 지불요청서: PAYYYYYMMDD####
-        }};
-
-        // 문서번호 생성 함수 (ERP 시스템과 동일한 방식)
-        function generateDocumentNumber(type) {{
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const dateStr = `${{year}}${{month}}${{day}}`;
-            
-            const prefix = documentTypes[type].prefix;
-            
-            // 기본적으로 0001부터 시작 (실제로는 각 매니저에서 DB 조회해서 다음 번호 생성)
-            const sequenceNum = '0001';
-            
-            return `${{prefix}}${{dateStr}}${{sequenceNum}}`;
-        }}
-
-        // 실제 데이터베이스에서 로드할 품목 데이터 (현재는 샘플)
-        const sampleItems = {{
-            // 모든 고객에 대한 기본 샘플 품목
-            'default': [
-                {{
-                    'ko': {{ name: '산업용 히터', spec: 'SUS304, 3kW', qty: 2, unit: '개', price: 1500000, remark: '납기 1주일' }},
-                    'en': {{ name: 'Industrial Heater', spec: 'SUS304, 3kW', qty: 2, unit: 'pcs', price: 1500000, remark: '1 week delivery' }},
-                    'vi': {{ name: 'Máy sưởi công nghiệp', spec: 'SUS304, 3kW', qty: 2, unit: 'cái', price: 1500000, remark: 'Giao hàng 1 tuần' }}
-                }},
-                {{
-                    'ko': {{ name: '온도 센서', spec: 'PT100, -50~200°C', qty: 5, unit: '개', price: 250000, remark: '교정성적서 포함' }},
-                    'en': {{ name: 'Temperature Sensor', spec: 'PT100, -50~200°C', qty: 5, unit: 'pcs', price: 250000, remark: 'Includes calibration cert' }},
-                    'vi': {{ name: 'Cảm biến nhiệt độ', spec: 'PT100, -50~200°C', qty: 5, unit: 'cái', price: 250000, remark: 'Bao gồm giấy hiệu chuẩn' }}
-                }},
-                {{
-                    'ko': {{ name: '압력 게이지', spec: '0-10 bar, 디지털', qty: 3, unit: '개', price: 180000, remark: '국제 인증' }},
-                    'en': {{ name: 'Pressure Gauge', spec: '0-10 bar, Digital', qty: 3, unit: 'pcs', price: 180000, remark: 'International certified' }},
-                    'vi': {{ name: 'Đồng hồ áp suất', spec: '0-10 bar, Kỹ thuật số', qty: 3, unit: 'cái', price: 180000, remark: 'Chứng nhận quốc tế' }}
-                }}
-            ]
-        }};
-
-        // 페이지 로드 시 초기화
-        document.addEventListener('DOMContentLoaded', function() {{
-            loadCustomerList();
-            loadCustomerData();
-            loadCompanyData();
-            updateLanguage();
-            
-            // 현재 날짜 설정
-            document.getElementById('docDate').textContent = new Date().toISOString().split('T')[0];
-            
-            // 초기 문서번호 생성 (ERP 견적서 방식)
-            const initialDocNumber = generateDocumentNumber(currentDocType);
-            document.getElementById('docNumber').textContent = initialDocNumber;
-        }});
-
-        // 언어 변경
-        function changeLanguage(lang) {{
-            currentLanguage = lang;
-            
-            // 언어 버튼 활성화
-            document.querySelectorAll('.lang-btn').forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-            
-            // 언어 업데이트
-            updateLanguage();
-            loadCustomerList();
-            loadCustomerData();
-            updateVatSettings();
-        }}
-
-        // 언어별 텍스트 업데이트
-        function updateLanguage() {{
-            const t = translations[currentLanguage];
-            
-            // 각 요소별 텍스트 업데이트
-            Object.keys(t).forEach(key => {{
-                const element = document.getElementById(key);
-                if (element) {{
-                    element.textContent = t[key];
-                }}
-            }});
-            
-            // 문서 타입 버튼 업데이트
-            document.getElementById('quoteBtn').textContent = t.quote;
-            document.getElementById('purchaseBtn').textContent = t.purchase;
-            document.getElementById('deliveryBtn').textContent = t.delivery;
-            document.getElementById('paymentBtn').textContent = t.payment;
-            
-            // 현재 문서 타입 업데이트
-            document.getElementById('docType').textContent = t[currentDocType];
-            
-            // 회사 정보 로드
-            loadCompanyData();
-        }}
-
-        // 회사 정보 로드
-        function loadCompanyData() {{
-            const companyData = companyDatabase[currentLanguage];
-            
-            if (!companyData) return;
-            
-            // 회사 이름 업데이트
-            document.getElementById('companyName').textContent = companyData.name;
-            
-            // 회사 상세 정보 업데이트
-            let companyDetailsHtml = '';
-            if (currentLanguage === 'ko') {{
-                companyDetailsHtml = `
-                    주소: ${{companyData.address}}<br>
-                    전화: ${{companyData.phone}}<br>
-                    팩스: ${{companyData.fax}}<br>
-                    이메일: ${{companyData.email}}<br>
-                    사업자등록번호: ${{companyData.businessNumber}}<br>
-                    대표자: ${{companyData.representative}}<br>
-                    웹사이트: ${{companyData.website}}
-                `;
-            }} else if (currentLanguage === 'en') {{
-                companyDetailsHtml = `
-                    Address: ${{companyData.address}}<br>
-                    Phone: ${{companyData.phone}}<br>
-                    Fax: ${{companyData.fax}}<br>
-                    Email: ${{companyData.email}}<br>
-                    Business No: ${{companyData.businessNumber}}<br>
-                    CEO: ${{companyData.representative}}<br>
-                    Website: ${{companyData.website}}
-                `;
-            }} else {{
-                companyDetailsHtml = `
-                    Địa chỉ: ${{companyData.address}}<br>
-                    Điện thoại: ${{companyData.phone}}<br>
-                    Fax: ${{companyData.fax}}<br>
-                    Email: ${{companyData.email}}<br>
-                    Mã số thuế: ${{companyData.businessNumber}}<br>
-                    Giám đốc: ${{companyData.representative}}<br>
-                    Website: ${{companyData.website}}
-                `;
-            }}
-            
-            document.getElementById('companyDetails').innerHTML = companyDetailsHtml;
-        }}
-
-        // 문서 타입 변경
-        function changeDocumentType(type) {{
-            currentDocType = type;
-            const config = documentTypes[type];
-            
-            // 버튼 활성화
-            document.querySelectorAll('.doc-btn').forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-            
-            // 문서 내용 업데이트
-            const t = translations[currentLanguage];
-            document.getElementById('docType').textContent = t[type];
-            
-            // 실시간 문서번호 생성
-            const newDocNumber = generateDocumentNumber(type);
-            document.getElementById('docNumber').textContent = newDocNumber;
-        }}
-
-        // 고객 목록 로드
-        function loadCustomerList() {{
-            const customerSelect = document.getElementById('customerSelect');
-            customerSelect.innerHTML = '';
-            
-            // 기본 옵션 추가
-            const defaultOption = document.createElement('option');
-            defaultOption.value = '';
-            defaultOption.textContent = '고객을 선택하세요';
-            customerSelect.appendChild(defaultOption);
-            
-            Object.keys(customersDatabase).forEach(customerId => {{
-                const customerData = customersDatabase[customerId][currentLanguage];
-                if (customerData && customerData.company) {{
-                    const option = document.createElement('option');
-                    option.value = customerId;
-                    option.textContent = customerData.company;
-                    customerSelect.appendChild(option);
-                }}
-            }});
-            
-            // 고객이 없으면 샘플 고객 추가
-            if (customerSelect.options.length === 1) {{
-                const sampleOption = document.createElement('option');
-                sampleOption.value = 'sample';
-                sampleOption.textContent = '샘플 고객사 (Demo)';
-                customerSelect.appendChild(sampleOption);
-            }}
-        }}
-
-        // 고객 데이터 로드
-        function loadCustomerData() {{
-            currentCustomer = document.getElementById('customerSelect').value;
-            
-            if (!currentCustomer || currentCustomer === '') {{
-                // 기본값으로 초기화
-                document.getElementById('customerCompany').textContent = '고객사명';
-                document.getElementById('customerContact').textContent = '담당자명';
-                document.getElementById('customerAddress').textContent = '고객 주소';
-                document.getElementById('customerPhone').textContent = '전화번호';
-                document.getElementById('customerEmail').textContent = '이메일';
-                loadItemsData();
-                return;
-            }}
-            
-            // 샘플 고객 처리
-            if (currentCustomer === 'sample') {{
-                const sampleCustomer = {{
-                    'ko': {{
-                        company: '샘플 고객사',
-                        contact: '김담당자',
-                        department: '구매팀',
-                        address: '베트남 호치민시 1구 레탄톤거리 123',
-                        phone: '+84-28-1234-5678',
-                        email: 'contact@sample.com'
-                    }},
-                    'en': {{
-                        company: 'Sample Customer Co., Ltd.',
-                        contact: 'Kim Manager',
-                        department: 'Purchasing Team',
-                        address: '123 Le Thanh Ton St., District 1, Ho Chi Minh City, Vietnam',
-                        phone: '+84-28-1234-5678',
-                        email: 'contact@sample.com'
-                    }},
-                    'vi': {{
-                        company: 'Công ty Khách hàng Mẫu',
-                        contact: 'Ông Kim',
-                        department: 'Phòng Mua hàng',
-                        address: '123 Đường Lê Thánh Tôn, Quận 1, TP. Hồ Chí Minh, Việt Nam',
-                        phone: '+84-28-1234-5678',
-                        email: 'contact@sample.com'
-                    }}
-                }}[currentLanguage];
-                
-                document.getElementById('customerCompany').textContent = sampleCustomer.company;
-                document.getElementById('customerContact').textContent = sampleCustomer.contact + (sampleCustomer.department ? ` (${{sampleCustomer.department}})` : '');
-                document.getElementById('customerAddress').textContent = sampleCustomer.address;
-                document.getElementById('customerPhone').textContent = sampleCustomer.phone;
-                document.getElementById('customerEmail').textContent = sampleCustomer.email;
-                loadItemsData();
-                return;
-            }}
-            
-            if (!customersDatabase[currentCustomer]) return;
-            
-            // 고객 정보 로드
-            const customerData = customersDatabase[currentCustomer][currentLanguage];
-            if (!customerData) return;
-            
-            document.getElementById('customerCompany').textContent = customerData.company || '';
-            document.getElementById('customerContact').textContent = customerData.contact + (customerData.department ? ` (${{customerData.department}})` : '');
-            document.getElementById('customerAddress').textContent = customerData.address || '';
-            document.getElementById('customerPhone').textContent = customerData.phone || '';
-            document.getElementById('customerEmail').textContent = customerData.email || '';
-            
-            // 품목 데이터 로드
-            loadItemsData();
-        }}
-
-        // 품목 데이터 로드
-        function loadItemsData() {{
-            // 현재 고객의 품목이 있으면 사용, 없으면 기본 품목 사용
-            const items = sampleItems[currentCustomer] || sampleItems['default'] || [];
-            const tbody = document.getElementById('itemsTableBody');
-            tbody.innerHTML = '';
-            
-            let subtotal = 0;
-            
-            if (items.length === 0) {{
-                // 데이터가 없을 때 안내 행 추가
-                const row = tbody.insertRow();
-                row.innerHTML = `
-                    <td colspan="8" style="text-align: center; padding: 20px; color: #666;">
-                        품목 데이터가 없습니다. 실제 주문이나 견적 데이터를 연동하여 품목을 표시할 수 있습니다.
-                    </td>
-                `;
-            }} else {{
-                items.forEach((item, index) => {{
-                    const itemData = item[currentLanguage];
-                    const amount = itemData.qty * itemData.price;
-                    subtotal += amount;
-                    
-                    const row = tbody.insertRow();
-                    row.innerHTML = `
-                        <td class="center-cell">${{index + 1}}</td>
-                        <td>${{itemData.name}}</td>
-                        <td>${{itemData.spec}}</td>
-                        <td class="center-cell">${{itemData.qty}}</td>
-                        <td class="center-cell">${{itemData.unit}}</td>
-                        <td class="number-cell">${{formatCurrency(itemData.price)}}</td>
-                        <td class="number-cell">${{formatCurrency(amount)}}</td>
-                        <td>${{itemData.remark}}</td>
-                    `;
-                }});
-            }}
-            
-            // 합계 계산
-            updateTotals(subtotal);
-        }}
-
-        // 합계 업데이트
-        function updateTotals(subtotal) {{
-            const vatApply = document.getElementById('vatApply').checked;
-            const vatRate = parseFloat(document.getElementById('vatRate').value) || 0;
-            
-            const vat = vatApply ? Math.round(subtotal * vatRate / 100) : 0;
-            const shipping = 750000; // VND 고정
-            const total = subtotal + vat + shipping;
-            
-            document.getElementById('subtotalAmount').textContent = formatCurrency(subtotal);
-            document.getElementById('vatAmount').textContent = formatCurrency(vat);
-            document.getElementById('shippingAmount').textContent = formatCurrency(shipping);
-            document.getElementById('totalAmount').textContent = formatCurrency(total);
-        }}
-
-        // 부가세 설정 업데이트
-        function updateVatSettings() {{
-            const vatApply = document.getElementById('vatApply').checked;
-            const vatRateInput = document.getElementById('vatRate');
-            
-            vatRateInput.disabled = !vatApply;
-            loadItemsData();
-        }}
-
-        // 통화 포맷 (VND 통일)
-        function formatCurrency(amount) {{
-            return new Intl.NumberFormat('vi-VN').format(amount) + ' VND';
-        }}
-
-        // 데이터 새로고침
-        function refreshData() {{
-            loadCustomerList();
-            loadCustomerData();
-            loadCompanyData();
-        }}
-
-        // 문서 타입 변경 함수
-        function selectDocumentType(type, event) {{
-            event.preventDefault();
-            
-            // 모든 버튼에서 active 클래스 제거
-            document.querySelectorAll('.doc-btn').forEach(btn => btn.classList.remove('active'));
-            
-            // 클릭된 버튼에 active 클래스 추가
-            event.target.classList.add('active');
-            
-            // 전역 변수 업데이트
-            currentDocType = type;
-            
-            // 문서 정보 업데이트
-            updateDocumentDisplay();
-            
-            // 부가세 설정 표시/숨김 처리 (지불요청서는 부가세 불필요)
-            const taxControls = document.querySelector('.tax-controls');
-            if (type === 'payment') {{
-                taxControls.style.display = 'none';
-            }} else {{
-                taxControls.style.display = 'block';
-            }}
-        }}
-
-        // 프린트 기능
-        function printDocument() {{
-            window.print();
-        }}
-
-        // HTML 다운로드 기능
-        function downloadPrintDocument() {{
-            try {{
-                console.log('HTML 다운로드 시작');
-                
-                // 완전한 HTML 문서 생성
-                const documentHtml = generateOptimizedPrintDocument();
-                
-                // 파일 다운로드 준비
-                const blob = new Blob([documentHtml], {{ type: 'text/html;charset=utf-8' }});
-                const url = URL.createObjectURL(blob);
-                
-                // 다운로드 링크 생성
-                const downloadLink = document.createElement('a');
-                downloadLink.href = url;
-                
-                // 파일명 생성 (문서타입_날짜_시간.html)
-                const now = new Date();
-                const timestamp = now.toISOString().slice(0,19).replace(/:/g, '-');
-                const docTypeText = translations[currentLanguage][currentDocType] || currentDocType;
-                downloadLink.download = `${{docTypeText}}_${{timestamp}}.html`;
-                
-                // 다운로드 실행
-                document.body.appendChild(downloadLink);
-                downloadLink.click();
-                document.body.removeChild(downloadLink);
-                
-                // 메모리 정리
-                URL.revokeObjectURL(url);
-                
-                console.log('HTML 다운로드 완료');
-                alert('HTML 파일이 다운로드되었습니다. 파일을 브라우저에서 열어 프린트하세요.');
-                
-            }} catch (error) {{
-                console.error('다운로드 오류:', error);
-                alert('HTML 다운로드 중 오류가 발생했습니다: ' + error.message);
-            }}
-        }}
-        
-        // 현재 창에서 프린트
-        function showPrintPreview() {{
-            try {{
-                console.log('현재 창 프린트 모드');
-                
-                // 프린트 전용 스타일 추가
-                const printStyles = `
-                    <style id="print-only-styles">
-                        @media print {{
-                            body * {{ visibility: hidden; }}
-                            .document-container, .document-container * {{ visibility: visible; }}
-                            .document-container {{ 
-                                position: absolute !important;
-                                left: 0 !important;
-                                top: 0 !important;
-                                width: 100% !important;
-                                margin: 0 !important;
-                            }}
-                            .print-controls {{ display: none !important; }}
-                            .control-panel {{ display: none !important; }}
-                        }}
-                    </style>
-                `;
-                
-                // 기존 프린트 스타일 제거
-                const existingStyles = document.getElementById('print-only-styles');
-                if (existingStyles) existingStyles.remove();
-                
-                // 새 프린트 스타일 추가
-                document.head.insertAdjacentHTML('beforeend', printStyles);
-                
-                // 프린트 실행
-                setTimeout(() => {{
-                    window.print();
-                }}, 100);
-                
-            }} catch (error) {{
-                console.error('프린트 오류:', error);
-                alert('프린트 중 오류가 발생했습니다: ' + error.message);
-            }}
-        }}
-        
-        // 프린트 최적화된 문서 생성
-        function generateOptimizedPrintDocument() {{
-            const t = translations[currentLanguage];
-            const companyData = companyDatabase[currentLanguage];
-            const docNumber = document.getElementById('docNumber').textContent;
-            const docDate = document.getElementById('docDate').textContent;
-            
-            // 현재 고객 정보 수집
-            const customerData = {{
-                company: document.getElementById('customerCompany').textContent || '고객명 입력',
-                contact: document.getElementById('customerContact').textContent || '담당자명',
-                phone: document.getElementById('customerPhone').textContent || '전화번호',
-                email: document.getElementById('customerEmail').textContent || '이메일',
-                address: document.getElementById('customerAddress').textContent || '주소'
-            }};
-            
-            // 샘플 품목 데이터
-            const sampleItems = sampleData[currentLanguage];
-            const subtotal = sampleItems.reduce((sum, item) => sum + (item.qty * item.price), 0);
-            const vatRate = document.getElementById('vatRate')?.value || 10;
-            const vatAmount = Math.round(subtotal * vatRate / 100);
-            const total = subtotal + vatAmount;
-            
-            return `
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="UTF-8">
-                    <title>${{t[currentDocType]}} - ${{docNumber}}</title>
-                    <style>
-                        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                        
-                        body {{
-                            font-family: 'Arial', sans-serif;
-                            line-height: 1.6;
-                            color: #333;
-                            background: #f5f5f5;
-                            padding: 30px;
-                        }}
-                        
-                        .print-container {{
-                            max-width: 900px;
-                            margin: 0 auto;
-                            background: white;
-                            box-shadow: 0 8px 32px rgba(0,0,0,0.15);
-                            border-radius: 12px;
-                            overflow: hidden;
-                        }}
-                        
-                        .document {{
-                            width: 100%;
-                            background: white;
-                            padding: 40mm 30mm;
-                            font-size: 13px;
-                            line-height: 1.5;
-                        }}
-                        
-                        .document-header {{
-                            display: grid;
-                            grid-template-columns: 1fr 1fr;
-                            gap: 40px;
-                            margin-bottom: 40px;
-                            border-bottom: 3px solid #333;
-                            padding-bottom: 25px;
-                        }}
-                        
-                        .company-info h1 {{
-                            font-size: 26px;
-                            color: #333;
-                            margin-bottom: 15px;
-                            font-weight: bold;
-                        }}
-                        
-                        .company-details {{
-                            font-size: 12px;
-                            line-height: 1.8;
-                            color: #555;
-                        }}
-                        
-                        .document-title {{
-                            text-align: right;
-                        }}
-                        
-                        .document-title h2 {{
-                            font-size: 32px;
-                            color: #333;
-                            margin-bottom: 15px;
-                            font-weight: bold;
-                        }}
-                        
-                        .document-info {{
-                            font-size: 13px;
-                            text-align: right;
-                            line-height: 1.8;
-                        }}
-                        
-                        .customer-section {{
-                            display: grid;
-                            grid-template-columns: 1fr 1fr;
-                            gap: 40px;
-                            margin-bottom: 40px;
-                        }}
-                        
-                        .info-section h3 {{
-                            font-size: 16px;
-                            color: #333;
-                            margin-bottom: 20px;
-                            border-bottom: 2px solid #ddd;
-                            padding-bottom: 8px;
-                            font-weight: bold;
-                        }}
-                        
-                        .info-compact {{
-                            display: grid;
-                            grid-template-columns: 120px 1fr;
-                            gap: 15px;
-                            font-size: 12px;
-                            line-height: 1.8;
-                        }}
-                        
-                        .info-compact div:nth-child(odd) {{
-                            font-weight: bold;
-                            color: #666;
-                        }}
-                        
-                        .items-table {{
-                            width: 100%;
-                            border-collapse: collapse;
-                            margin: 30px 0;
-                            font-size: 12px;
-                        }}
-                        
-                        .items-table th,
-                        .items-table td {{
-                            border: 1px solid #333;
-                            padding: 12px 8px;
-                            text-align: center;
-                        }}
-                        
-                        .items-table th {{
-                            background: #f8f9fa;
-                            font-weight: bold;
-                            font-size: 11px;
-                        }}
-                        
-                        .items-table td:nth-child(2),
-                        .items-table td:nth-child(3),
-                        .items-table td:nth-child(8) {{
-                            text-align: left;
-                        }}
-                        
-                        .items-table td:nth-child(6),
-                        .items-table td:nth-child(7) {{
-                            text-align: right;
-                        }}
-                        
-                        .totals-section {{
-                            margin: 40px 0;
-                            display: flex;
-                            justify-content: flex-end;
-                        }}
-                        
-                        .totals-table {{
-                            border-collapse: collapse;
-                            width: 350px;
-                        }}
-                        
-                        .totals-table td {{
-                            padding: 12px 15px;
-                            border: 1px solid #333;
-                            font-size: 12px;
-                        }}
-                        
-                        .totals-table .label {{
-                            background: #f8f9fa;
-                            font-weight: bold;
-                            text-align: right;
-                            width: 180px;
-                        }}
-                        
-                        .totals-table .amount {{
-                            text-align: right;
-                            font-weight: bold;
-                        }}
-                        
-                        .total-final {{
-                            background: #333 !important;
-                            color: white !important;
-                            font-size: 14px !important;
-                            font-weight: bold !important;
-                        }}
-                        
-                        .signature-section {{
-                            margin-top: 50px;
-                            display: grid;
-                            grid-template-columns: 1fr 1fr;
-                            gap: 40px;
-                        }}
-                        
-                        .signature-box {{
-                            text-align: center;
-                            border: 2px solid #ddd;
-                            padding: 40px 20px;
-                            border-radius: 8px;
-                            background: #fafafa;
-                        }}
-                        
-                        .signature-title {{
-                            font-weight: bold;
-                            margin-bottom: 30px;
-                            font-size: 14px;
-                        }}
-                        
-                        .signature-line {{
-                            border-bottom: 2px solid #333;
-                            margin-bottom: 15px;
-                            height: 40px;
-                        }}
-                        
-                        .print-controls {{
-                            background: #2c3e50;
-                            padding: 25px;
-                            text-align: center;
-                            display: flex;
-                            justify-content: center;
-                            gap: 20px;
-                        }}
-                        
-                        .print-btn {{
-                            background: white;
-                            color: #2c3e50;
-                            border: 2px solid white;
-                            padding: 12px 30px;
-                            border-radius: 25px;
-                            cursor: pointer;
-                            font-size: 14px;
-                            font-weight: bold;
-                            transition: all 0.3s;
-                        }}
-                        
-                        .print-btn:hover {{
-                            background: #3498db;
-                            color: white;
-                            border-color: #3498db;
-                        }}
-                        
-                        .close-btn {{
-                            background: transparent;
-                            color: white;
-                            border: 2px solid white;
-                        }}
-                        
-                        .close-btn:hover {{
-                            background: #e74c3c;
-                            border-color: #e74c3c;
-                        }}
-                        
-                        @media print {{
-                            body {{ 
-                                background: white; 
-                                padding: 0; 
-                                font-size: 12px;
-                            }}
-                            .print-container {{ 
-                                box-shadow: none; 
-                                border-radius: 0;
-                                max-width: none;
-                            }}
-                            .print-controls {{ 
-                                display: none; 
-                            }}
-                            .document {{ 
-                                margin: 0; 
-                                padding: 20mm;
-                            }}
-                            
-                            .document-header {{
-                                page-break-after: avoid;
-                            }}
-                            
-                            .items-table {{
-                                page-break-inside: avoid;
-                            }}
-                            
-                            .signature-section {{
-                                page-break-before: avoid;
-                            }}
-                        }}
-                        
-                        @page {{
-                            size: A4;
-                            margin: 15mm;
-                        }}
-                    </style>
-                </head>
-                <body>
-                    <div class="print-container">
-                        <div class="document">
-                            <div class="document-header">
-                                <div class="company-info">
-                                    <h1>${{companyData.name}}</h1>
-                                    <div class="company-details">
-                                        ${{currentLanguage === 'ko' ? 
-                                            `주소: ${{companyData.address}}<br>전화: ${{companyData.phone}}<br>팩스: ${{companyData.fax}}<br>이메일: ${{companyData.email}}<br>사업자등록번호: ${{companyData.businessNumber}}` :
-                                            currentLanguage === 'en' ?
-                                            `Address: ${{companyData.address}}<br>Phone: ${{companyData.phone}}<br>Fax: ${{companyData.fax}}<br>Email: ${{companyData.email}}<br>Business No: ${{companyData.businessNumber}}` :
-                                            `Địa chỉ: ${{companyData.address}}<br>Điện thoại: ${{companyData.phone}}<br>Fax: ${{companyData.fax}}<br>Email: ${{companyData.email}}<br>Mã số thuế: ${{companyData.businessNumber}}`
-                                        }}
-                                    </div>
-                                </div>
-                                <div class="document-title">
-                                    <h2>${{t[currentDocType]}}</h2>
-                                    <div class="document-info">
-                                        ${{t.docNumberLabel}}: <strong>${{docNumber}}</strong><br>
-                                        ${{t.docDateLabel}}: <strong>${{docDate}}</strong>
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <div class="customer-section">
-                                <div class="info-section">
-                                    <h3>${{t.customerInfoTitle}}</h3>
-                                    <div class="info-compact">
-                                        <div>${{t.companyLabel}}:</div><div>${{customerData.company}}</div>
-                                        <div>${{t.contactLabel}}:</div><div>${{customerData.contact}}</div>
-                                        <div>${{t.phoneLabel}}:</div><div>${{customerData.phone}}</div>
-                                        <div>${{t.emailLabel}}:</div><div>${{customerData.email}}</div>
-                                        <div>${{t.addressLabel}}:</div><div>${{customerData.address}}</div>
-                                    </div>
-                                </div>
-                                <div class="info-section">
-                                    <h3>${{t.documentInfoTitle}}</h3>
-                                    <div class="info-compact">
-                                        <div>${{t.validityLabel}}:</div><div>30일</div>
-                                        <div>${{t.paymentLabel}}:</div><div>현금</div>
-                                        <div>${{t.deliveryLabel}}:</div><div>즉시</div>
-                                        <div>${{t.managerLabel}}:</div><div>김철수</div>
-                                    </div>
-                                </div>
-                            </div>
-                            
-                            <table class="items-table">
-                                <thead>
-                                    <tr>
-                                        <th width="5%">${{t.noHeader}}</th>
-                                        <th width="20%">${{t.itemHeader}}</th>
-                                        <th width="25%">${{t.specHeader}}</th>
-                                        <th width="8%">${{t.qtyHeader}}</th>
-                                        <th width="8%">${{t.unitHeader}}</th>
-                                        <th width="12%">${{t.priceHeader}}</th>
-                                        <th width="12%">${{t.amountHeader}}</th>
-                                        <th width="10%">${{t.remarkHeader}}</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    ${{sampleItems.map((item, index) => `
-                                        <tr>
-                                            <td>${{index + 1}}</td>
-                                            <td>${{item.name}}</td>
-                                            <td>${{item.spec}}</td>
-                                            <td>${{item.qty}}</td>
-                                            <td>${{item.unit}}</td>
-                                            <td>${{item.price.toLocaleString()}}</td>
-                                            <td>${{(item.qty * item.price).toLocaleString()}}</td>
-                                            <td>${{item.remark}}</td>
-                                        </tr>
-                                    `).join('')}}
-                                </tbody>
-                            </table>
-                            
-                            <div class="totals-section">
-                                <table class="totals-table">
-                                    <tr>
-                                        <td class="label">${{t.subtotalLabel}}</td>
-                                        <td class="amount">${{subtotal.toLocaleString()}}</td>
-                                    </tr>
-                                    <tr>
-                                        <td class="label">${{t.vatLabel}} (${{vatRate}}%)</td>
-                                        <td class="amount">${{vatAmount.toLocaleString()}}</td>
-                                    </tr>
-                                    <tr>
-                                        <td class="label">${{t.shippingLabel}}</td>
-                                        <td class="amount">0</td>
-                                    </tr>
-                                    <tr class="total-final">
-                                        <td class="label">${{t.totalLabel}}</td>
-                                        <td class="amount">${{total.toLocaleString()}}</td>
-                                    </tr>
-                                </table>
-                            </div>
-                            
-                            <div class="signature-section">
-                                <div class="signature-box">
-                                    <div class="signature-title">${{t.supplierSignature}}</div>
-                                    <div class="signature-line"></div>
-                                    <div>날짜: ___________</div>
-                                </div>
-                                <div class="signature-box">
-                                    <div class="signature-title">${{t.customerSignature}}</div>
-                                    <div class="signature-line"></div>
-                                    <div>날짜: ___________</div>
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="print-controls">
-                            <button class="print-btn" onclick="window.print()">🖨️ 프린트</button>
-                            <button class="print-btn close-btn" onclick="window.close()">✕ 닫기</button>
-                        </div>
-                    </div>
-                </body>
-                </html>
-            `;
-        }}
-
-        // 유효성 검사 후 프린트
-        function validateAndPrint() {{
-            const t = translations[currentLanguage];
-            const errors = [];
-            
-            // 고객 정보 검사
-            const customerCompany = document.getElementById('customerCompany').textContent;
-            if (!customerCompany || customerCompany.trim() === '') {{
-                errors.push('고객 정보가 없습니다.');
-            }}
-            
-            // 품목 검사
-            const items = document.querySelectorAll('#itemsTableBody tr');
-            if (items.length === 0) {{
-                errors.push('품목이 없습니다.');
-            }}
-            
-            if (errors.length > 0) {{
-                alert('다음 오류를 수정해주세요:\\n\\n' + errors.join('\\n'));
-                return;
-            }}
-            
-            alert('유효성 검사를 통과했습니다. 프린트를 시작합니다.');
-            printDocument();
-        }}
-
-        // 키보드 단축키
-        document.addEventListener('keydown', function(e) {{
-            if (e.ctrlKey && e.key === 'p') {{
-                e.preventDefault();
-                printDocument();
-            }}
-        }});
-    </script>
-</body>
-</html>
-"""
-    
-    return html_content
\ No newline at end of file
@@ -314,6 +314,10 @@ def save_settings(settings_file, settings):
         os.makedirs(os.path.dirname(settings_file), exist_ok=True)
         with open(settings_file, 'w', encoding='utf-8') as f:
             json.dump(settings, f, ensure_ascii=False, indent=2)
+        
+        # 회사/PDF 설정이 바뀌면 렌더링 문서 캐시 전체 무효화
+        from utils.render_cache import invalidate_all
+        invalidate_all()
         return True
     except Exception as e:
         st.error(f"설정 저장 실패: {e}")
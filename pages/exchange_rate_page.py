@@ -5,6 +5,11 @@ import calendar
 import plotly.express as px
 import plotly.graph_objects as go
 
+from utils.chart_cache import chart_data, cached_figure
+
+# 환율 추이 선/영역 차트 최대 점 수 (LTTB 다운샘플)
+HISTORY_CHART_MAX_POINTS = 500
+
 def show_exchange_rate_page(exchange_rate_manager, user_permissions, get_text):
     """환율 관리 페이지를 표시합니다."""
     
@@ -247,59 +252,67 @@ def show_exchange_rate_page(exchange_rate_manager, user_permissions, get_text):
                     chart_type = st.selectbox("차트 유형", ["선 그래프", "캔들스틱", "영역 차트"], key="chart_type")
                 
                 try:
-                    # 히스토리 데이터 가져오기
-                    historical_data = exchange_rate_manager.get_historical_rates(
-                        currency_code, days=selected_period
-                    )
+                    # 히스토리 데이터 (원본은 통계용, 차트는 LTTB로 줄인 데이터 사용 - 모두 캐시)
+                    def load_history():
+                        data = exchange_rate_manager.get_historical_rates(currency_code, days=selected_period)
+                        if len(data) > 0:
+                            data = data.assign(rate_date=pd.to_datetime(data['rate_date']),
+                                               rate=pd.to_numeric(data['rate'], errors='coerce'))
+                            data = data.sort_values('rate_date')[['rate_date', 'rate']]
+                        return data
+
+                    history_params = {'currency': currency_code, 'days': selected_period}
+                    historical_data = chart_data('exchange_rate_history', load_history,
+                                                 params=history_params, source=exchange_rate_manager)
                     
                     if len(historical_data) > 0:
-                        historical_data['rate_date'] = pd.to_datetime(historical_data['rate_date'])
-                        historical_data = historical_data.sort_values('rate_date')
-                        
-                        if chart_type == "선 그래프":
-                            fig = px.line(
-                                historical_data, 
-                                x='rate_date', 
-                                y='rate',
-                                title=f"{selected_currency} 환율 추이 ({selected_period}일)",
-                                labels={'rate_date': '날짜', 'rate': '환율'}
+                        chart_title = f"{selected_currency} 환율 추이 ({selected_period}일)"
+
+                        if chart_type in ("선 그래프", "영역 차트"):
+                            chart_points = chart_data(
+                                'exchange_rate_history_points', lambda: historical_data,
+                                params=history_params, source=exchange_rate_manager,
+                                max_points=HISTORY_CHART_MAX_POINTS, x='rate_date', y='rate'
                             )
-                            
-                        elif chart_type == "영역 차트":
-                            fig = px.area(
-                                historical_data,
-                                x='rate_date',
-                                y='rate',
-                                title=f"{selected_currency} 환율 추이 ({selected_period}일)",
-                                labels={'rate_date': '날짜', 'rate': '환율'}
+                            plot = px.line if chart_type == "선 그래프" else px.area
+                            fig = cached_figure(
+                                'exchange_rate_history', chart_points,
+                                lambda data: plot(
+                                    data, x='rate_date', y='rate', title=chart_title,
+                                    labels={'rate_date': '날짜', 'rate': '환율'}
+                                ).update_layout(xaxis_title="날짜", yaxis_title="환율", height=400),
+                                params={'chart_type': chart_type, 'title': chart_title}
                             )
                         
                         else:  # 캔들스틱
                             # 일일 집계 데이터 생성
-                            daily_data = historical_data.groupby(historical_data['rate_date'].dt.date).agg({
-                                'rate': ['min', 'max', 'first', 'last']
-                            }).round(4)
-                            daily_data.columns = ['low', 'high', 'open', 'close']
-                            daily_data = daily_data.reset_index()
-                            
-                            fig = go.Figure(data=go.Candlestick(
-                                x=daily_data['rate_date'],
-                                open=daily_data['open'],
-                                high=daily_data['high'],
-                                low=daily_data['low'],
-                                close=daily_data['close']
-                            ))
-                            fig.update_layout(
-                                title=f"{selected_currency} 환율 캔들스틱 차트 ({selected_period}일)",
-                                xaxis_title="날짜",
-                                yaxis_title="환율"
+                            def daily_ohlc(data):
+                                daily_data = data.groupby(data['rate_date'].dt.date).agg({
+                                    'rate': ['min', 'max', 'first', 'last']
+                                }).round(4)
+                                daily_data.columns = ['low', 'high', 'open', 'close']
+                                return daily_data.reset_index()
+
+                            daily_data = chart_data(
+                                'exchange_rate_daily_ohlc', lambda: historical_data, transform=daily_ohlc,
+                                params=history_params, source=exchange_rate_manager
+                            )
+                            fig = cached_figure(
+                                'exchange_rate_candlestick', daily_data,
+                                lambda data: go.Figure(data=go.Candlestick(
+                                    x=data['rate_date'],
+                                    open=data['open'],
+                                    high=data['high'],
+                                    low=data['low'],
+                                    close=data['close']
+                                )).update_layout(
+                                    title=f"{selected_currency} 환율 캔들스틱 차트 ({selected_period}일)",
+                                    xaxis_title="날짜",
+                                    yaxis_title="환율",
+                                    height=400
+                                ),
+                                params={'title': selected_currency}
                             )
-                        
-                        fig.update_layout(
-                            xaxis_title="날짜",
-                            yaxis_title="환율",
-                            height=400
-                        )
                         
                         st.plotly_chart(fig, use_container_width=True)
                         
@@ -10,6 +10,7 @@ import pandas as pd
 from datetime import datetime
 from managers.sqlite.sqlite_expense_request_manager import SQLiteExpenseRequestManager as SQLiteExpenseManager
 from managers.sqlite.sqlite_employee_manager import SQLiteEmployeeManager
+from utils.revaluation import revalue
 
 def show_expense_request_admin_page(expense_manager, user_id, user_name, get_text):
     """총무 전용 지출요청서 관리 페이지"""
@@ -24,10 +25,11 @@ def show_expense_request_admin_page(expense_manager, user_id, user_name, get_tex
     current_user_name = user_name or st.session_state.get('user_name', '')
     
     # 탭 메뉴 (총무 전용) - 하드코딩으로 수정
-    tab1, tab2, tab3 = st.tabs([
+    tab1, tab2, tab3, tab4 = st.tabs([
         "📝 지출요청서 작성", 
         "📋 내 요청서 진행상태", 
-        "📊 요청서 통계"
+        "📊 요청서 통계",
+        "💼 부서 예산"
     ])
     
     with tab1:
@@ -38,6 +40,9 @@ def show_expense_request_admin_page(expense_manager, user_id, user_name, get_tex
     
     with tab3:
         show_request_statistics(expense_manager, current_user_id, get_text)
+    
+    with tab4:
+        show_department_budget_settings(expense_manager, employee_manager, current_user_name)
 
 def show_expense_request_form_multi_items(expense_manager, current_user_id, current_user_name, get_text):
     """다중 항목을 지원하는 지출요청서 작성 폼"""
@@ -274,6 +279,15 @@ def show_expense_request_form_multi_items(expense_manager, current_user_id, curr
                 st.error("❌ 최소 1개의 유효한 지출 항목이 필요합니다. (설명과 금액 필수)")
                 return
             
+            # 부서 잔여 예산 확인 (초과 시 경고만 표시하고 제출 진행)
+            show_budget_check(expense_manager, {
+                'requester_id': current_user_id,
+                'category': expense_category,
+                'amount': sum(float(item['item_amount']) for item in valid_items),
+                'currency': currency,
+                'expected_date': expected_date.strftime('%Y-%m-%d'),
+            })
+            
             try:
                 # 요청서 헤더 데이터
                 request_data = {
@@ -800,6 +814,88 @@ def show_my_requests_status(expense_manager, user_id, get_text):
             if st.session_state.get(f'show_print_{request.get("request_id", i)}', False):
                 show_print_preview(request, get_text, request.get('request_id', i))
 
+def show_budget_check(expense_manager, request_data):
+    """제출 금액 대비 부서 잔여 예산 표시 (예산 미설정 시 표시 안 함)"""
+    if not hasattr(expense_manager, 'check_budget'):
+        return
+    try:
+        passed, status = expense_manager.check_budget(request_data)
+    except Exception as e:
+        st.caption(f"예산 확인 실패: {str(e)}")
+        return
+    if not status['has_budget']:
+        return
+    currency = request_data.get('currency') or 'VND'
+    text = (f"{status['department'] or '부서 미지정'} · {request_data.get('category')} 예산 "
+            f"{status['budget']:,.0f} {currency} 중 사용 {status['actual']:,.0f}, "
+            f"제출 후 잔여 {status['remaining_after']:,.0f} {currency}")
+    if passed:
+        st.info(f"💼 {text}")
+    else:
+        st.warning(f"⚠️ 예산 초과 - {text}")
+
+def show_department_budget_summary(expense_manager):
+    """이번 달 부서별 예산 대비 실적 (실적 집계 조회)"""
+    from managers.sqlite.sqlite_budget_rollup_manager import SQLiteBudgetRollupManager
+    
+    summary = SQLiteBudgetRollupManager(getattr(expense_manager, 'db_path', 'erp_system.db')).get_department_summary()
+    if not summary:
+        return
+    st.subheader(f"💼 부서별 예산 현황 ({datetime.now().strftime('%Y-%m')}, VND)")
+    st.dataframe(pd.DataFrame([{
+        '부서': row['department'] or '부서 미지정',
+        '예산': f"{row['budgeted']:,.0f}",
+        '실적': f"{row['actual']:,.0f}",
+        '잔여': f"{row['remaining']:,.0f}",
+        '건수': int(row['count']),
+    } for row in summary]), use_container_width=True)
+
+def show_department_budget_settings(expense_manager, employee_manager, current_user_name):
+    """부서 × 카테고리 × 월 예산 입력 / CSV 가져오기"""
+    from managers.sqlite.sqlite_budget_rollup_manager import SQLiteBudgetRollupManager, DEPARTMENT_BUDGETS_CSV
+    
+    budget_manager = SQLiteBudgetRollupManager(getattr(expense_manager, 'db_path', 'erp_system.db'))
+    show_department_budget_summary(expense_manager)
+    
+    st.subheader("💼 부서 예산 설정")
+    departments = employee_manager.get_departments() or []
+    with st.form("department_budget_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            if departments:
+                department = st.selectbox("부서", departments)
+            else:
+                department = st.text_input("부서")
+            category = st.selectbox("카테고리", expense_manager.get_expense_categories())
+            period = st.date_input("예산 월", value=datetime.now().date())
+        with col2:
+            budget_amount = st.number_input("예산 금액", min_value=0.0, step=100000.0, format="%.0f")
+            currency = st.selectbox("통화", ["VND", "USD", "KRW"])
+            notes = st.text_input("메모")
+        submitted = st.form_submit_button("💾 예산 저장", type="primary")
+    
+    if submitted:
+        if not str(department).strip():
+            st.error("부서를 입력해주세요.")
+        else:
+            success, message = budget_manager.set_department_budget(
+                str(department).strip(), category, period.strftime('%Y-%m'), budget_amount,
+                currency=currency, notes=notes, updated_by=current_user_name
+            )
+            if success:
+                st.success(message)
+                st.rerun()
+            else:
+                st.error(message)
+    
+    st.caption(f"기존 예산 파일({DEPARTMENT_BUDGETS_CSV})의 예산을 가져올 수 있습니다. 같은 부서·카테고리·월·통화는 덮어씁니다.")
+    if st.button("📥 CSV 예산 가져오기"):
+        success, message = budget_manager.import_budgets_csv(updated_by=current_user_name)
+        if success:
+            st.success(message)
+        else:
+            st.error(message)
+
 def show_request_statistics(expense_manager, user_id, get_text):
     """요청서 통계"""
     st.header("📊 내 요청서 통계")
@@ -812,9 +908,21 @@ def show_request_statistics(expense_manager, user_id, get_text):
             st.info("📄 통계를 표시할 요청서가 없습니다.")
             return
         
-        # 통계 계산
+        # 통계 계산 - 요청서별 통화를 지출 예정일(없으면 신청일) 환율로 VND 환산
+        requests_df = pd.DataFrame(my_requests)
+        if 'currency' not in requests_df.columns:
+            requests_df['currency'] = 'VND'
+        requests_df['rate_date'] = requests_df.get('expense_date', pd.Series(index=requests_df.index, dtype=object))
+        if 'request_date' in requests_df.columns:
+            requests_df['rate_date'] = requests_df['rate_date'].fillna(requests_df['request_date'])
+        requests_df = revalue(
+            requests_df, 'VND', date_col='rate_date', fill_missing=True,
+            db_path=getattr(expense_manager, 'db_path', None),
+        )
+        amounts_vnd = requests_df['amount_vnd'].tolist()
+        
         total_requests = len(my_requests)
-        total_amount = sum(float(req.get('amount', 0)) for req in my_requests)
+        total_amount = float(requests_df['amount_vnd'].sum())
         
         # 상태별 분류
         status_counts = {}
@@ -824,9 +932,8 @@ def show_request_statistics(expense_manager, user_id, get_text):
         
         # 유형별 분류
         type_amounts = {}
-        for req in my_requests:
+        for req, amount in zip(my_requests, amounts_vnd):
             expense_type = req.get('expense_type', '기타')
-            amount = float(req.get('amount', 0))
             type_amounts[expense_type] = type_amounts.get(expense_type, 0) + amount
         
         # 메트릭 표시
@@ -846,6 +953,8 @@ def show_request_statistics(expense_manager, user_id, get_text):
             pending_count = status_counts.get('대기', 0)
             st.metric("대기 중", f"{pending_count}건")
         
+        show_department_budget_summary(expense_manager)
+        
         # 상태별 차트
         if status_counts:
             st.subheader("📈 상태별 현황")
@@ -864,11 +973,12 @@ def show_request_statistics(expense_manager, user_id, get_text):
         st.subheader("📋 요청서 목록")
         if my_requests:
             df_data = []
-            for req in my_requests:
+            for req, amount in zip(my_requests, amounts_vnd):
                 df_data.append({
                     '요청서ID': req.get('request_id', ''),
                     '유형': req.get('expense_type', ''),
-                    '금액': f"{float(req.get('amount', 0)):,.0f} VND",
+                    '금액': f"{float(req.get('amount', 0) or 0):,.0f} {req.get('currency') or 'VND'}",
+                    '금액 (VND)': f"{amount:,.0f} VND",
                     '상태': req.get('status', ''),
                     '신청일': req.get('request_date', '')[:10] if req.get('request_date') else '',
                     '우선순위': req.get('priority', '')
@@ -15,88 +15,18 @@ def show_main_dashboard(managers, selected_submenu, get_text):
     st.subheader(f"📊 {dashboard_title}")
     
     try:
-        # 실제 데이터 수집
-        employee_count = 0
-        customer_count = 0
-        product_count = 0
-        quotation_count = 0
-        
-        # 직원 수 계산
-        employee_manager = managers.get('employee_manager')
-        if employee_manager:
-            try:
-                employees = employee_manager.get_all_employees()
-                employee_count = len(employees) if len(employees) > 0 else 0
-            except:
-                employee_count = 0
-        
-        # 고객 수 계산
-        customer_manager = managers.get('customer_manager')
-        if customer_manager:
-            try:
-                customers = customer_manager.get_all_customers()
-                customer_count = len(customers) if len(customers) > 0 else 0
-            except:
-                customer_count = 0
-        
-        # 제품 수 계산
-        product_manager = managers.get('product_manager')
-        if product_manager:
-            try:
-                products = product_manager.get_all_products()
-                product_count = len(products) if len(products) > 0 else 0
-            except:
-                product_count = 0
-        
-        # 견적서 수 계산
-        quotation_manager = managers.get('quotation_manager')
-        if quotation_manager:
-            try:
-                quotations = quotation_manager.get_all_quotations()
-                quotation_count = len(quotations) if len(quotations) > 0 else 0
-            except:
-                quotation_count = 0
-        
-        # 휴가 및 근무 인원 통계 계산
-        working_employees = 0
-        vacation_employees = 0
-        active_employees = 0
-        
-        vacation_manager = managers.get('vacation_manager')
-        if employee_manager and vacation_manager:
-            try:
-                employees = employee_manager.get_all_employees()
-                if len(employees) > 0:
-                    # 재직 중인 직원 수 계산
-                    active_employees = len(employees[employees['work_status'] == '재직']) if 'work_status' in employees.columns else employee_count
-                    
-                    # 오늘 날짜로 현재 휴가 중인 직원 계산
-                    today = datetime.now().date()
-                    today_str = today.strftime('%Y-%m-%d')
-                    
-                    all_vacations = vacation_manager.get_all_vacation_requests()
-                    if len(all_vacations) > 0:
-                        # 승인된 휴가 중 오늘 날짜에 해당하는 것
-                        approved_vacations = all_vacations[all_vacations['status'] == '승인']
-                        
-                        current_vacation_employees = set()
-                        for _, vacation in approved_vacations.iterrows():
-                            try:
-                                start_date = datetime.strptime(vacation['start_date'], '%Y-%m-%d').date()
-                                end_date = datetime.strptime(vacation['end_date'], '%Y-%m-%d').date()
-                                
-                                if start_date <= today <= end_date:
-                                    current_vacation_employees.add(vacation['employee_id'])
-                            except:
-                                continue
-                        
-                        vacation_employees = len(current_vacation_employees)
-                    
-                    working_employees = max(0, active_employees - vacation_employees)
-            except Exception as e:
-                working_employees = employee_count
-                vacation_employees = 0
-                active_employees = employee_count
+        # 지표 - 백그라운드에서 미리 계산된 스냅샷 사용 (오래됐으면 실시간 계산)
+        kpis, computed_at, snapshot_manager = load_dashboard_kpis(managers)
+        employee_count = int(kpis['employee_count'])
+        customer_count = int(kpis['customer_count'])
+        product_count = int(kpis['product_count'])
+        quotation_count = int(kpis['quotation_count'])
+        active_employees = int(kpis['active_employees'])
+        working_employees = int(kpis['working_employees'])
+        vacation_employees = int(kpis['vacation_employees'])
+        pending_approvals = int(kpis['pending_approvals'])
+        supplier_count = int(kpis['supplier_count'])
+        sales_products = int(kpis['sales_products'])
         
         # 전체 통계 카드 (6개 컬럼)
         col1, col2, col3, col4, col5, col6 = st.columns(6)
@@ -135,35 +65,10 @@ def show_main_dashboard(managers, selected_submenu, get_text):
         
         with col1:
             st.markdown(f"#### 🎯 {get_text('customer_health')}")
-            # 견적 상태별 통계
-            if quotation_manager:
-                try:
-                    quotations = quotation_manager.get_all_quotations()
-                    if len(quotations) > 0:
-                        draft_count = len([q for q in quotations if q.get('status', '') == '임시저장'])
-                        pending_count = len([q for q in quotations if q.get('status', '') == '대기'])
-                        approved_count = len([q for q in quotations if q.get('status', '') == '승인'])
-                    else:
-                        draft_count = pending_count = approved_count = 0
-                except:
-                    draft_count = pending_count = approved_count = 0
-            else:
-                draft_count = pending_count = approved_count = 0
-            
             st.metric(get_text("total_customer_num"), customer_count)
         
         with col2:
             st.markdown(f"#### 💰 {get_text('overdue_tasks_stat')}")
-            # 승인 대기 현황
-            approval_manager = managers.get('approval_manager')
-            pending_approvals = 0
-            if approval_manager:
-                try:
-                    pending_requests = approval_manager.get_pending_requests()
-                    pending_approvals = len(pending_requests) if len(pending_requests) > 0 else 0
-                except:
-                    pending_approvals = 0
-            
             st.metric(get_text("overdue_count"), pending_approvals)
         
         with col3:
@@ -188,48 +93,6 @@ def show_main_dashboard(managers, selected_submenu, get_text):
         # 두 번째 통계 줄
         col5, col6, col7, col8 = st.columns(4)
         
-        # 공급업체 수 계산
-        supplier_count = 0
-        supplier_manager = managers.get('supplier_manager')
-        if supplier_manager:
-            try:
-                suppliers = supplier_manager.get_all_suppliers()
-                supplier_count = len(suppliers) if len(suppliers) > 0 else 0
-            except:
-                supplier_count = 0
-        
-        # 승인 대기 수 계산
-        pending_approvals = 0
-        approval_manager = managers.get('approval_manager')
-        if approval_manager:
-            try:
-                pending_requests = approval_manager.get_pending_requests()
-                pending_approvals = len(pending_requests) if len(pending_requests) > 0 else 0
-            except:
-                pending_approvals = 0
-        
-        # 재직 직원 수 계산
-        active_employees = 0
-        if employee_manager:
-            try:
-                employees = employee_manager.get_all_employees()
-                if len(employees) > 0 and 'work_status' in employees.columns:
-                    active_employees = (employees['work_status'] == '재직').sum()
-                else:
-                    active_employees = employee_count
-            except:
-                active_employees = 0
-        
-        # 판매 제품 수 계산
-        sales_products = 0
-        sales_product_manager = managers.get('sales_product_manager')
-        if sales_product_manager:
-            try:
-                sales_data = sales_product_manager.get_all_prices()
-                sales_products = len(sales_data) if len(sales_data) > 0 else 0
-            except:
-                sales_products = 0
-        
         with col5:
             st.info(f"**🏭 {get_text('supplier_count_label')}**")
             st.metric(label=get_text("registered_suppliers"), value=supplier_count)
@@ -248,6 +111,10 @@ def show_main_dashboard(managers, selected_submenu, get_text):
         
         st.markdown("---")
         
+        show_kpi_trends(snapshot_manager, get_text)
+        if computed_at:
+            st.caption(f"🕒 지표 기준 시각: {computed_at}")
+        
         # 서브메뉴별 안내
         if selected_submenu == "전체 현황":
             st.info(f"💡 {get_text('dashboard_info_overview')}")
@@ -265,6 +132,61 @@ def show_main_dashboard(managers, selected_submenu, get_text):
     except Exception as e:
         st.error(f"대시보드 로딩 중 오류가 발생했습니다: {str(e)}")
 
+def load_dashboard_kpis(managers):
+    """대시보드 지표 (지표 dict, 계산 시각, 스냅샷 매니저)
+    
+    최신 스냅샷이 있으면 한 번 조회로 반환하고, 없거나 오래됐으면 실시간 계산 후 스냅샷으로 저장합니다.
+    """
+    from managers.sqlite.sqlite_kpi_snapshot_manager import (
+        compute_dashboard_kpis, factory_manager_provider, start_kpi_refresher
+    )
+    
+    snapshot_manager = None
+    try:
+        # 갱신 스레드와 스냅샷 매니저는 db_path × 백엔드당 한 번만 생성 (트리거 설치 포함)
+        snapshot_manager = start_kpi_refresher().snapshot_manager
+        kpis, computed_at, fresh = snapshot_manager.get_snapshot()
+        if fresh:
+            return kpis, computed_at, snapshot_manager
+    except Exception as e:
+        print(f"KPI 스냅샷 조회 실패 - 실시간 계산으로 대체: {e}")
+    
+    # 전달받은 매니저 우선, 나머지 지표용 매니저는 ManagerFactory에서
+    live_managers = factory_manager_provider()()
+    live_managers.update({name: manager for name, manager in managers.items() if manager is not None})
+    if snapshot_manager is None:
+        return compute_dashboard_kpis(live_managers), None, None
+    kpis = snapshot_manager.refresh(live_managers)
+    return kpis, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), snapshot_manager
+
+def show_kpi_trends(snapshot_manager, get_text):
+    """주요 지표 30일 추이 (스냅샷 이력)"""
+    if snapshot_manager is None:
+        return
+    trend_metrics = {
+        'employee_count': get_text("total_staff"),
+        'customer_count': get_text("total_customers"),
+        'quotation_count': get_text("total_quotations"),
+        'pending_approvals': get_text("pending_approvals_label"),
+    }
+    try:
+        history = snapshot_manager.get_history(trend_metrics, days=30)
+    except Exception:
+        return
+    if len(history) < 2:
+        return
+    
+    st.subheader("📈 30일 추이")
+    columns = st.columns(len(trend_metrics))
+    for column, (metric, label) in zip(columns, trend_metrics.items()):
+        if metric not in history.columns:
+            continue
+        with column:
+            fig = px.line(history, x='snapshot_date', y=metric, title=label, height=160)
+            fig.update_layout(margin=dict(l=0, r=0, t=30, b=0), xaxis_title=None, yaxis_title=None)
+            st.plotly_chart(fig, use_container_width=True)
+    st.markdown("---")
+
 def show_employee_dashboard(managers, selected_submenu, get_text):
     """직원 관리 대시보드"""
     st.subheader("📊 직원 관리 현황")
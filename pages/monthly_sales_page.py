@@ -8,6 +8,19 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from utils.notification_helper import NotificationHelper
+from utils.revaluation import reporting_rate
+from utils.chart_cache import chart_data, cached_figure
+
+# 환율 미등록 시 사용하는 USD/VND 기본 환율
+DEFAULT_USD_VND_RATE = 24500
+
+
+def usd_vnd_rate(year_month=None):
+    """USD → VND 환율 (목표 월이 있으면 해당 연도 관리 환율, 없으면 최신 환율)"""
+    if year_month:
+        return reporting_rate('USD', 'VND', as_of=f"{str(year_month)[:7]}-01",
+                              method='management', default=DEFAULT_USD_VND_RATE)
+    return reporting_rate('USD', 'VND', default=DEFAULT_USD_VND_RATE)
 
 def show_monthly_sales_page(monthly_sales_manager, customer_manager, exchange_rate_manager):
     """월별 매출관리 메인 페이지"""
@@ -279,7 +292,7 @@ def show_target_vs_actual(monthly_sales_manager):
                 )
             
             with col2:
-                actual_vnd = data.get('actual_amount_vnd', data.get('actual_amount_usd', 0) * 24500)
+                actual_vnd = data.get('actual_amount_vnd', data.get('actual_amount_usd', 0) * usd_vnd_rate())
                 st.metric(
                     "실제 매출 (VND)",
                     f"{actual_vnd:,.0f}₫"
@@ -463,7 +476,7 @@ def show_target_vs_actual(monthly_sales_manager):
                         )
                     
                     if st.form_submit_button("목표 설정"):
-                        target_amount_vnd = target_amount_usd * 24500
+                        target_amount_vnd = target_amount_usd * usd_vnd_rate(target_month)
                         
                         target_id = monthly_sales_manager.add_sales_target(
                             year_month=target_month,
@@ -602,6 +615,8 @@ def show_customer_analysis(monthly_sales_manager):
             
     except Exception as e:
         st.error(f"고객별 매출 분석 중 오류: {str(e)}")
+    
+    show_profitability(monthly_sales_manager, 'customer', st.session_state.get('customer_month', "전체"))
 
 def show_product_analysis(monthly_sales_manager):
     """제품별 매출 분석"""
@@ -747,6 +762,101 @@ def show_product_analysis(monthly_sales_manager):
             
     except Exception as e:
         st.error(f"제품별 매출 분석 중 오류: {str(e)}")
+    
+    show_profitability(monthly_sales_manager, 'product', st.session_state.get('product_month', "전체"))
+
+def show_profitability(monthly_sales_manager, by, analysis_month):
+    """실제 원가(공급 단가 이력·배송비·간접비 배부) 기준 고객/제품별 이익 (수익성 테이블 조회)"""
+    from managers.sqlite.sqlite_profitability_manager import SQLiteProfitabilityManager
+    
+    db_path = getattr(monthly_sales_manager, 'db_path', None)
+    if not db_path:
+        return
+    try:
+        profitability_manager = SQLiteProfitabilityManager(db_path)
+        month_filter = None if analysis_month == "전체" else analysis_month
+        refreshing = profitability_manager.refresh_async() or profitability_manager.is_refreshing()
+        if by == 'customer':
+            df = profitability_manager.get_customer_profitability(month_filter)
+            names = {'customer_name': '고객명'}
+        else:
+            df = profitability_manager.get_product_profitability(month_filter)
+            names = {'product_code': '제품코드', 'product_name': '제품명', 'category': '카테고리', 'quantity': '수량'}
+        
+        st.markdown("### 💹 실제 원가 기준 수익성 (USD)")
+        if refreshing:
+            st.caption("⏳ 변경된 매출/원가를 반영해 수익성을 다시 계산하는 중입니다.")
+        if df.empty:
+            st.info("📋 수익성 데이터가 없습니다.")
+            return
+        
+        display_df = df.drop(columns=['customer_id'], errors='ignore')
+        for column in ('revenue_usd', 'supply_cost_usd', 'shipping_cost_usd', 'overhead_usd', 'total_cost_usd', 'margin_usd'):
+            display_df[column] = display_df[column].apply(lambda x: f"${x:,.0f}")
+        display_df['margin_rate'] = display_df['margin_rate'].apply(lambda x: f"{x:.1%}")
+        st.dataframe(display_df.rename(columns={
+            **names,
+            'line_count': '거래건수',
+            'revenue_usd': '매출',
+            'supply_cost_usd': '공급원가',
+            'shipping_cost_usd': '배송비',
+            'overhead_usd': '간접비',
+            'total_cost_usd': '총원가',
+            'margin_usd': '이익',
+            'margin_rate': '이익률',
+        }), use_container_width=True, hide_index=True)
+        
+        coverage = profitability_manager.get_cost_coverage(month_filter)
+        if not coverage.empty:
+            estimated = coverage.loc[coverage['cost_source'] == 'estimated', 'line_count'].sum()
+            st.caption(f"공급 단가 이력이 없는 {int(estimated)}/{int(coverage['line_count'].sum())}건은 "
+                       f"기본 이익률 추정 원가를 사용했습니다.")
+    except Exception as e:
+        st.error(f"수익성 분석 중 오류: {str(e)}")
+
+def prepare_trend_data(df_trend):
+    """트렌드 차트 데이터 (월 정렬, amount_usd / 3개월 이동평균 / 전월 대비 성장률)"""
+    df_trend = df_trend.rename(columns={'total_usd': 'amount_usd'})
+    df_trend['year_month'] = pd.to_datetime(df_trend['year_month'], format='%Y-%m', errors='coerce')
+    df_trend = df_trend.sort_values('year_month').reset_index(drop=True)
+    df_trend['ma3'] = df_trend['amount_usd'].rolling(window=3).mean()
+    df_trend['growth_rate'] = df_trend['amount_usd'].pct_change() * 100
+    return df_trend
+
+
+def build_trend_figure(df_trend):
+    """월별 매출 + 3개월 이동평균 그림"""
+    fig = go.Figure()
+    
+    # 매출 라인
+    fig.add_trace(go.Scatter(
+        x=df_trend['year_month'],
+        y=df_trend['amount_usd'],
+        mode='lines+markers',
+        name='매출 (USD)',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=8)
+    ))
+    
+    # 이동 평균선 추가
+    if len(df_trend) >= 3:
+        fig.add_trace(go.Scatter(
+            x=df_trend['year_month'],
+            y=df_trend['ma3'],
+            mode='lines',
+            name='3개월 이동평균',
+            line=dict(color='red', dash='dash')
+        ))
+    
+    fig.update_layout(
+        title="월별 매출 트렌드",
+        xaxis_title="월",
+        yaxis_title="매출 (USD)",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
 
 def show_trend_analysis(monthly_sales_manager):
     """트렌드 분석"""
@@ -763,47 +873,20 @@ def show_trend_analysis(monthly_sales_manager):
                 format_func=lambda x: f"최근 {x}개월"
             )
         
-        # 트렌드 데이터 조회
-        trend_data = monthly_sales_manager.get_sales_trend(trend_months)
+        # 트렌드 데이터 조회 (조회 + 변환 결과를 데이터 버전별로 캐시)
+        df_trend = chart_data(
+            'monthly_sales_trend',
+            lambda: monthly_sales_manager.get_sales_trend(trend_months),
+            params={'months': trend_months},
+            transform=prepare_trend_data,
+            source=monthly_sales_manager
+        )
         
-        if len(trend_data) > 0:
-            df_trend = pd.DataFrame(trend_data)
-            df_trend['year_month'] = pd.to_datetime(df_trend['year_month'], format='%Y-%m', errors='coerce')
-            df_trend = df_trend.sort_values('year_month')
-            
+        if len(df_trend) > 0:
             # 매출 트렌드 차트
             st.markdown("### 📊 월별 매출 트렌드")
             
-            fig = go.Figure()
-            
-            # 매출 라인
-            fig.add_trace(go.Scatter(
-                x=df_trend['year_month'],
-                y=df_trend['amount_usd'],
-                mode='lines+markers',
-                name='매출 (USD)',
-                line=dict(color='#1f77b4', width=3),
-                marker=dict(size=8)
-            ))
-            
-            # 이동 평균선 추가
-            if len(df_trend) >= 3:
-                df_trend['ma3'] = df_trend['amount_usd'].rolling(window=3).mean()
-                fig.add_trace(go.Scatter(
-                    x=df_trend['year_month'],
-                    y=df_trend['ma3'],
-                    mode='lines',
-                    name='3개월 이동평균',
-                    line=dict(color='red', dash='dash')
-                ))
-            
-            fig.update_layout(
-                title="월별 매출 트렌드",
-                xaxis_title="월",
-                yaxis_title="매출 (USD)",
-                height=400,
-                hovermode='x unified'
-            )
+            fig = cached_figure('monthly_sales_trend', df_trend, build_trend_figure)
             
             st.plotly_chart(fig, use_container_width=True)
             
@@ -813,20 +896,19 @@ def show_trend_analysis(monthly_sales_manager):
             with col1:
                 st.markdown("### 📈 월별 성장률")
                 
-                # 전월 대비 성장률 계산
-                df_trend['growth_rate'] = df_trend['amount_usd'].pct_change() * 100
-                
-                fig = px.bar(
-                    df_trend.dropna(),
-                    x='year_month',
-                    y='growth_rate',
-                    title="전월 대비 성장률 (%)",
-                    labels={'growth_rate': '성장률 (%)', 'year_month': '월'},
-                    color='growth_rate',
-                    color_continuous_scale=['red', 'yellow', 'green']
+                # 전월 대비 성장률 (prepare_trend_data에서 계산)
+                fig = cached_figure(
+                    'monthly_sales_growth', df_trend,
+                    lambda data: px.bar(
+                        data.dropna(subset=['growth_rate']),
+                        x='year_month',
+                        y='growth_rate',
+                        title="전월 대비 성장률 (%)",
+                        labels={'growth_rate': '성장률 (%)', 'year_month': '월'},
+                        color='growth_rate',
+                        color_continuous_scale=['red', 'yellow', 'green']
+                    ).update_layout(height=300)
                 )
-                
-                fig.update_layout(height=300)
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
@@ -886,10 +968,74 @@ def show_trend_analysis(monthly_sales_manager):
         
         else:
             st.info("📋 트렌드 분석을 위한 데이터가 부족합니다.")
+        
+        show_sales_forecast(monthly_sales_manager)
             
     except Exception as e:
         st.error(f"트렌드 분석 중 오류: {str(e)}")
 
+
+# 예측 차원 표시 이름
+FORECAST_DIMENSIONS = {
+    'total': '전체',
+    'customer': '고객별',
+    'category': '제품 카테고리별',
+    'sales_rep': '영업 담당자별',
+}
+FORECAST_MODEL_NAMES = {
+    'seasonal_naive': '계절 단순 (전년 동월)',
+    'exp_smoothing': '지수평활',
+    'linear_trend': '선형 추세',
+}
+
+
+def show_sales_forecast(monthly_sales_manager):
+    """캐시된 매출 예측 표시 (적합은 백그라운드에서 마감 월이 바뀔 때만 실행)"""
+    from managers.sqlite.sqlite_forecast_manager import SQLiteForecastManager
+    
+    st.markdown("### 🔮 모델 기반 매출 예측 (USD)")
+    forecast_manager = SQLiteForecastManager(getattr(monthly_sales_manager, 'db_path', 'erp_system.db'))
+    if forecast_manager.refresh_async('sales') or forecast_manager.is_refreshing('sales'):
+        st.caption("⏳ 새로 마감된 월을 반영해 예측을 다시 계산하는 중입니다. 잠시 후 새로고침하세요.")
+    
+    run_info = forecast_manager.get_run_info('sales')
+    if not run_info or not run_info['series_count']:
+        st.info("📋 예측 결과가 아직 없습니다. (마감된 월 3개월 이상 필요)")
+        return
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        dimension = st.selectbox("예측 기준", options=list(FORECAST_DIMENSIONS),
+                                 format_func=FORECAST_DIMENSIONS.get, key="sales_forecast_dimension")
+    series_key = ''
+    if dimension != 'total':
+        keys = forecast_manager.get_series_keys('sales', dimension)
+        with col2:
+            series_key = st.selectbox("대상", options=keys, format_func=lambda x: x or '(미지정)',
+                                      key="sales_forecast_key") if keys else ''
+    
+    forecast = forecast_manager.get_forecast('sales', dimension, series_key)
+    if forecast.empty:
+        st.info("📋 선택한 대상의 예측 결과가 없습니다.")
+        return
+    
+    model = forecast['model'].iloc[0]
+    fig = px.bar(forecast, x='period', y='value', labels={'period': '월', 'value': '예측 매출 (USD)'},
+                 title=f"향후 {len(forecast)}개월 예측 - {FORECAST_MODEL_NAMES.get(model, model)}")
+    fig.update_layout(height=350)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{run_info['fitted_through']}까지 마감 데이터로 적합 · 계산 시각 {run_info['computed_at']}")
+    
+    if dimension != 'total':
+        summary = forecast_manager.get_forecast_summary('sales', dimension)
+        summary['selected_model'] = summary['selected_model'].map(lambda x: FORECAST_MODEL_NAMES.get(x, x))
+        summary['forecast_total'] = summary['forecast_total'].map(lambda x: f"${x:,.0f}")
+        st.dataframe(summary.rename(columns={
+            'series_key': FORECAST_DIMENSIONS[dimension].replace('별', ''),
+            'selected_model': '모델', 'forecast_total': '예측 합계',
+            'first_period': '시작 월', 'last_period': '종료 월',
+        }), use_container_width=True, hide_index=True)
+
 def show_sales_management(monthly_sales_manager, customer_manager):
     """매출 관리"""
     st.subheader("⚙️ 매출 데이터 관리")
@@ -1034,7 +1180,7 @@ def show_sales_management(monthly_sales_manager, customer_manager):
             
             if st.form_submit_button("목표 설정"):
                 try:
-                    target_amount_usd = target_amount_vnd / 24500  # VND를 USD로 환산
+                    target_amount_usd = target_amount_vnd / usd_vnd_rate(target_month)  # VND를 USD로 환산
                     
                     target_id = monthly_sales_manager.add_sales_target(
                         year_month=target_month,
@@ -1192,7 +1338,7 @@ def show_target_settings(monthly_sales_manager):
                                 target_type='전체매출',
                                 target_category='전체',
                                 target_amount_vnd=target_vnd,
-                                target_amount_usd=int(target_vnd / 24500),  # 대략적 환율
+                                target_amount_usd=int(target_vnd / usd_vnd_rate(month)),  # 해당 연도 관리 환율
                                 currency='VND',
                                 target_quantity=0,
                                 responsible_person='전체팀',
@@ -1223,7 +1369,7 @@ def show_target_settings(monthly_sales_manager):
                                 target_type='전체매출',
                                 target_category='전체',
                                 target_amount_vnd=target_vnd,
-                                target_amount_usd=int(target_vnd / 24500),
+                                target_amount_usd=int(target_vnd / usd_vnd_rate(month)),
                                 currency='VND',
                                 target_quantity=0,
                                 responsible_person='전체팀',
@@ -1248,7 +1394,7 @@ def show_target_settings(monthly_sales_manager):
                             target_type='전체매출',
                             target_category='전체',
                             target_amount_vnd=target_vnd,
-                            target_amount_usd=int(target_vnd / 24500),
+                            target_amount_usd=int(target_vnd / usd_vnd_rate(specific_month)),
                             currency='VND',
                             target_quantity=0,
                             responsible_person='전체팀',
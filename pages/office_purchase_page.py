@@ -13,6 +13,11 @@ import io
 import json
 from typing import Dict, List, Any
 
+from utils.chart_cache import cached_value, cached_figure, invalidate
+
+# 구매 통계 캐시 유지 시간(초) - 구매 등록/수정/삭제 시 즉시 삭제
+STATISTICS_CACHE_TTL = 300
+
 # 매니저 임포트
 try:
     from managers.postgresql.postgresql_office_purchase_manager import PostgreSQLOfficePurchaseManager
@@ -279,6 +284,7 @@ def render_new_purchase_form():
             success, message = manager.create_purchase_record(purchase_data)
             
             if success:
+                invalidate('office_purchase_statistics')
                 st.success(message)
                 st.session_state.new_purchase_items = []  # 물품 목록 초기화
                 st.rerun()
@@ -485,6 +491,7 @@ def render_purchase_detail(purchase_id: str):
                 if st.session_state.get(f'confirm_delete_{purchase_id}'):
                     success, message = manager.delete_purchase(purchase_id)
                     if success:
+                        invalidate('office_purchase_statistics')
                         st.success(message)
                         st.rerun()
                     else:
@@ -533,6 +540,7 @@ def render_purchase_detail(purchase_id: str):
                     if st.form_submit_button("상태 변경"):
                         success, message = manager.update_purchase_status(purchase_id, new_status, status_notes)
                         if success:
+                            invalidate('office_purchase_statistics')
                             st.success(message)
                             del st.session_state[f'show_status_form_{purchase_id}']
                             st.rerun()
@@ -544,6 +552,44 @@ def render_purchase_detail(purchase_id: str):
                         del st.session_state[f'show_status_form_{purchase_id}']
                         st.rerun()
 
+def build_monthly_purchase_figure(monthly_df):
+    """월별 구매 금액 / 건수 그림"""
+    month_str = pd.to_datetime(monthly_df['month']).dt.strftime('%Y-%m')
+    
+    # 월별 구매 금액 및 건수 차트
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('월별 구매 금액', '월별 구매 건수'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    # 구매 금액 차트
+    fig.add_trace(
+        go.Bar(
+            x=month_str,
+            y=monthly_df['amount'],
+            name='구매 금액',
+            text=[f"{x:,.0f}원" for x in monthly_df['amount']],
+            textposition='outside'
+        ),
+        row=1, col=1
+    )
+    
+    # 구매 건수 차트
+    fig.add_trace(
+        go.Bar(
+            x=month_str,
+            y=monthly_df['count'],
+            name='구매 건수',
+            text=monthly_df['count'],
+            textposition='outside'
+        ),
+        row=1, col=2
+    )
+    
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
 def render_statistics():
     """구매 통계 대시보드"""
     lang = st.session_state.selected_language
@@ -558,10 +604,14 @@ def render_statistics():
     
     with col2:
         if st.button("통계 새로고침"):
+            invalidate('office_purchase_statistics')
             st.rerun()
     
-    # 통계 데이터 조회
-    stats = manager.get_purchase_statistics(period_months)
+    # 통계 데이터 조회 (PostgreSQL은 데이터 버전을 알 수 없어 STATISTICS_CACHE_TTL 동안 캐시)
+    stats = cached_value('office_purchase_statistics',
+                         lambda: manager.get_purchase_statistics(period_months),
+                         params={'period_months': period_months}, source=manager,
+                         ttl=STATISTICS_CACHE_TTL)
     
     if not stats:
         st.info("통계 데이터가 없습니다.")
@@ -588,41 +638,7 @@ def render_statistics():
         st.subheader("월별 구매 현황")
         
         monthly_df = pd.DataFrame(stats['monthly_stats'])
-        monthly_df['month'] = pd.to_datetime(monthly_df['month'])
-        monthly_df['month_str'] = monthly_df['month'].dt.strftime('%Y-%m')
-        
-        # 월별 구매 금액 및 건수 차트
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('월별 구매 금액', '월별 구매 건수'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # 구매 금액 차트
-        fig.add_trace(
-            go.Bar(
-                x=monthly_df['month_str'],
-                y=monthly_df['amount'],
-                name='구매 금액',
-                text=[f"{x:,.0f}원" for x in monthly_df['amount']],
-                textposition='outside'
-            ),
-            row=1, col=1
-        )
-        
-        # 구매 건수 차트
-        fig.add_trace(
-            go.Bar(
-                x=monthly_df['month_str'],
-                y=monthly_df['count'],
-                name='구매 건수',
-                text=monthly_df['count'],
-                textposition='outside'
-            ),
-            row=1, col=2
-        )
-        
-        fig.update_layout(height=400, showlegend=False)
+        fig = cached_figure('office_purchase_monthly', monthly_df, build_monthly_purchase_figure)
         st.plotly_chart(fig, use_container_width=True)
     
     # 카테고리별 통계
@@ -634,25 +650,24 @@ def render_statistics():
             category_df = pd.DataFrame(stats['category_stats'])
             
             if not category_df.empty:
-                fig = px.pie(
-                    category_df, 
+                fig = cached_figure('office_purchase_category_pie', category_df, lambda data: px.pie(
+                    data, 
                     values='amount', 
                     names='category',
                     title="카테고리별 구매 금액 분포"
-                )
+                ))
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("카테고리별 구매 건수")
             
             if not category_df.empty:
-                fig = px.bar(
-                    category_df,
+                fig = cached_figure('office_purchase_category_bar', category_df, lambda data: px.bar(
+                    data,
                     x='category',
                     y='count',
                     title="카테고리별 구매 건수"
-                )
-                fig.update_layout(xaxis_title="카테고리", yaxis_title="구매 건수")
+                ).update_layout(xaxis_title="카테고리", yaxis_title="구매 건수"))
                 st.plotly_chart(fig, use_container_width=True)
     
     # 부서별 통계
@@ -664,15 +679,13 @@ def render_statistics():
             # 상위 10개 부서만 표시
             dept_df_top = dept_df.head(10)
             
-            fig = px.bar(
-                dept_df_top,
+            fig = cached_figure('office_purchase_department', dept_df_top, lambda data: px.bar(
+                data,
                 x='department',
                 y='amount',
                 title="부서별 구매 금액 (상위 10개)",
-                text=[f"{x:,.0f}원" for x in dept_df_top['amount']]
-            )
-            fig.update_traces(textposition='outside')
-            fig.update_layout(xaxis_title="부서", yaxis_title="구매 금액")
+                text=[f"{x:,.0f}원" for x in data['amount']]
+            ).update_traces(textposition='outside').update_layout(xaxis_title="부서", yaxis_title="구매 금액"))
             st.plotly_chart(fig, use_container_width=True)
     
     # 상태별 통계
@@ -685,22 +698,22 @@ def render_statistics():
             
             with col1:
                 # 상태별 건수
-                fig = px.bar(
-                    status_df,
+                fig = cached_figure('office_purchase_status_count', status_df, lambda data: px.bar(
+                    data,
                     x='status',
                     y='count',
                     title="상태별 구매 건수"
-                )
+                ))
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 # 상태별 금액
-                fig = px.bar(
-                    status_df,
+                fig = cached_figure('office_purchase_status_amount', status_df, lambda data: px.bar(
+                    data,
                     x='status',
                     y='amount',
                     title="상태별 구매 금액"
-                )
+                ))
                 st.plotly_chart(fig, use_container_width=True)
 
 def render_export_section():
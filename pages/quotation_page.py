@@ -7,7 +7,9 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 from managers.sqlite.sqlite_quotation_manager import SQLiteQuotationManager
-from managers.sqlite.sqlite_master_product_manager import SQLiteMasterProductManager
+from managers.sqlite.sqlite_quotation_revision_manager import SQLiteQuotationRevisionManager
+from utils.document_renderer import build_quotation_print_html, QUOTATION_PRINT_TEMPLATE, QUOTATION_STAMP_IMAGE
+from utils.render_cache import get_or_render, get_or_render_version, quotation_version, file_digest
 # from managers.sqlite.sqlite_exchange_rate_manager import SQLiteExchangeRateManager  # 비활성화
 
 
@@ -232,18 +234,12 @@ def generate_and_download_quotation_html(quotation_id):
         from managers.sqlite.sqlite_quotation_manager import SQLiteQuotationManager
         quotation_manager = SQLiteQuotationManager()
         
-        # 견적서 정보 조회
-        import sqlite3
-        conn = sqlite3.connect('erp_system.db')
-        quote_df = pd.read_sql_query('''
-            SELECT * FROM quotations WHERE quotation_id = ?
-        ''', conn, params=[quotation_id])
-        
-        if len(quote_df) == 0:
+        # 견적서 헤더만 조회 (품목은 렌더링 캐시 미스일 때만 조회)
+        quote = quotation_manager.get_quotation_by_id(quotation_id)
+        if not quote:
             st.error("Quotation not found")
             return
-            
-        quote = quote_df.iloc[0]
+        quote = dict(quote)
         
         # 디버깅: 데이터 확인
         with st.expander("🔍 Debug: Retrieved quotation data"):
@@ -251,101 +247,23 @@ def generate_and_download_quotation_html(quotation_id):
             for field in debug_fields:
                 st.write(f"{field}: {quote.get(field, 'N/A')}")
         
-        # 견적서 아이템들 조회
-        items_df = pd.read_sql_query('''
-            SELECT * FROM quotation_items WHERE quotation_id = ? ORDER BY line_number
-        ''', conn, params=[quotation_id])
+        # HTML 템플릿 렌더링 (렌더링 버전이 같으면 캐시 재사용)
+        def render_document():
+            document = quotation_manager.load_quotation_document(quotation_id)
+            return build_quotation_print_html(document.header, document.items) if document else None
         
-        conn.close()
-        
-        # HTML 템플릿 로드
-        with open('templates/quotation_print_template.html', 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        # 템플릿 데이터 교체 - 정확한 필드명 사용
-        template_content = template_content.replace('{{quotation_number}}', str(quote.get('quotation_number', '')))
-        template_content = template_content.replace('{{quote_date}}', str(quote.get('quote_date', '')))
-        template_content = template_content.replace('{{customer_company}}', str(quote.get('customer_company', '')))
-        template_content = template_content.replace('{{customer_address}}', str(quote.get('customer_address', '')))
-        template_content = template_content.replace('{{customer_contact_person}}', str(quote.get('customer_contact_person', '')))
-        template_content = template_content.replace('{{customer_phone}}', str(quote.get('customer_phone', '')))
-        template_content = template_content.replace('{{customer_email}}', str(quote.get('customer_email', '')))
-        template_content = template_content.replace('{{currency}}', str(quote.get('currency', 'VND')))
-        template_content = template_content.replace('{{vat_percentage}}', str(quote.get('vat_percentage', 10)))
-        template_content = template_content.replace('{{subtotal_excl_vat}}', f"{quote.get('subtotal_excl_vat', 0):,.0f}")
-        template_content = template_content.replace('{{vat_amount}}', f"{quote.get('vat_amount', 0):,.0f}")
-        template_content = template_content.replace('{{total_incl_vat}}', f"{quote.get('total_incl_vat', 0):,.0f}")
-        template_content = template_content.replace('{{valid_date}}', str(quote.get('valid_date', '')))
-        # Sales Rep 정보 처리 (빈 값일 경우 기본값 설정)
-        sales_rep_name = str(quote.get('sales_representative', '')) or 'Sales Representative'
-        sales_rep_phone = str(quote.get('sales_rep_contact', '')) or ''  # DB에서 전화번호 가져옴
-        sales_rep_email = str(quote.get('sales_rep_email', '')) or ''
-        
-        # 실제 표시 내용 정의 (HTML 템플릿과 매핑)
-        display_sales_rep = sales_rep_name  # Sales Rep: 이름
-        display_contact = sales_rep_email   # Contact: 이메일
-        display_phone = sales_rep_phone     # Phone: 전화번호
-        
-        template_content = template_content.replace('{{sales_representative}}', display_sales_rep)
-        template_content = template_content.replace('{{sales_rep_contact}}', display_contact)  # Contact에 이메일 표시
-        template_content = template_content.replace('{{sales_rep_phone}}', display_phone)  # Phone에 전화번호 표시
-        template_content = template_content.replace('{{sales_rep_email}}', sales_rep_email)
-        template_content = template_content.replace('{{product_name_detail}}', str(quote.get('product_name_detail', '')))
-        template_content = template_content.replace('{{delivery_date}}', str(quote.get('delivery_date', '')))
-        
-        # 추가 프로젝트 정보 필드들
-        template_content = template_content.replace('{{project_name}}', str(quote.get('project_name', '')))
-        template_content = template_content.replace('{{part_name}}', str(quote.get('part_name', '')))
-        template_content = template_content.replace('{{part_weight}}', str(quote.get('part_weight', '')))
-        template_content = template_content.replace('{{mold_number}}', str(quote.get('mold_number', '')))
-        template_content = template_content.replace('{{hrs_info}}', str(quote.get('hrs_info', '')))
-        template_content = template_content.replace('{{resin_type}}', str(quote.get('resin_type', '')))
-        template_content = template_content.replace('{{resin_additive}}', str(quote.get('resin_additive', '')))
-        template_content = template_content.replace('{{sol_material}}', str(quote.get('sol_material', '')))
-        template_content = template_content.replace('{{remark}}', str(quote.get('remark', '')))
-        template_content = template_content.replace('{{payment_terms}}', str(quote.get('payment_terms', '')))
-        template_content = template_content.replace('{{revision_number}}', str(quote.get('revision_number', '00')))
-        
-        # 계좌 정보 처리 - 기본값 설정
-        account_info = quote.get('account', '700-038-038199<br>Shinhan Bank Vietnam')
-        template_content = template_content.replace('{{account}}', account_info)
-        
-        # 아이템 HTML 생성
-        items_html = ""
-        if len(items_df) > 0:
-            for idx, (_, item) in enumerate(items_df.iterrows()):
-                vn_text = str(item.get('item_name_vn', ''))
-                vn_class = "vietnamese-desc" if vn_text else ""
-                row_number = item.get('line_number', idx + 1)
-                
-                items_html += f"""
-                <tr>
-                    <td rowspan="3">{row_number}</td>
-                    <td>{item.get('item_code', '')}</td>
-                    <td>{item.get('item_name_en', '')}</td>
-                    <td>{item.get('quantity', 1)}</td>
-                    <td>{item.get('standard_price', 0):,.0f}</td>
-                    <td>{item.get('discount_rate', 0):.1f}%</td>
-                    <td>{item.get('unit_price', 0):,.0f}</td>
-                    <td>{item.get('amount', 0):,.0f}</td>
-                </tr>
-                <tr>
-                    <td colspan="7" style="text-align: left; padding-left: 10px; font-size: 9px; color: #666;">
-                        VN: {vn_text}
-                    </td>
-                </tr>
-                <tr>
-                    <td colspan="7" style="text-align: left; padding-left: 10px; font-size: 9px; color: #666;">
-                        Remark: {item.get('remark', '')}
-                    </td>
-                </tr>
-            """
-        
-        template_content = template_content.replace('{quotation_items}', items_html)
+        template_content = get_or_render_version(
+            'quotation_print', quotation_id, render_document,
+            version=quotation_version(quotation_id, quotation_manager.db_path),
+            template=QUOTATION_PRINT_TEMPLATE,
+        )
+        if template_content is None:
+            st.error("Quotation not found")
+            return
         
         # HTML 파일로 저장 - 견적서 번호와 고객사명 포함
-        quotation_num = quote.get('quotation_number', 'quotation')
-        customer_name = quote.get('customer_company', '').replace(',', '').replace(' ', '_')
+        quotation_num = quote.get('quotation_number') or 'quotation'
+        customer_name = (quote.get('customer_company') or '').replace(',', '').replace(' ', '_')
         file_name = f"{quotation_num} - {customer_name}.html"
         file_path = f"generated_files/{file_name}"
         
@@ -385,8 +303,6 @@ def generate_and_download_quotation_html(quotation_id):
 
 def show_product_search_modal():
     """제품 검색 모달"""
-    product_manager = SQLiteMasterProductManager()
-    
     # 제품 검색 입력
     col1, col2 = st.columns([3, 1])
     with col1:
@@ -442,42 +358,10 @@ def show_product_search_modal():
 
 
 def search_products(search_term):
-    """제품 검색"""
+    """제품 검색 (제품 코드/한국어명/영문명/베트남어명, 베트남어 부호 무시)"""
     try:
-        product_manager = SQLiteMasterProductManager()
-        products = product_manager.get_all_products()
-        
-        # DataFrame 변환 (안전 처리)
-        if isinstance(products, list):
-            products_df = pd.DataFrame(products) if products else pd.DataFrame()
-        elif isinstance(products, pd.DataFrame):
-            products_df = products
-        else:
-            return []
-        
-        if isinstance(products_df, pd.DataFrame) and not products_df.empty:
-            # 제품 코드 또는 제품명으로 검색 (안전한 검색)
-            try:
-                mask = pd.Series(False, index=products_df.index)
-                
-                # 제품 코드 검색
-                if 'product_code' in products_df.columns:
-                    mask |= products_df['product_code'].astype(str).str.contains(search_term.upper(), na=False, case=False)
-                
-                # 제품명 검색
-                if 'product_name' in products_df.columns:
-                    mask |= products_df['product_name'].astype(str).str.contains(search_term, na=False, case=False)
-                
-                # 한국어 제품명 검색
-                if 'product_name_korean' in products_df.columns:
-                    mask |= products_df['product_name_korean'].astype(str).str.contains(search_term, na=False, case=False)
-                
-                filtered = products_df[mask]
-                filtered_list = filtered.head(10)
-                return filtered_list.to_dict('records')
-            except Exception as e:
-                st.error(f"Search filter error: {e}")
-                return []
+        from utils.product_search_index import search_products as search_product_index
+        return search_product_index(search_term)
     except Exception as e:
         st.error(f"Search error: {e}")
         import traceback
@@ -1122,36 +1006,6 @@ def generate_print_preview():
             
         st.info(f"제품 개수: {len(safe_items)}개")
         
-        # 기존 HTML 템플릿 사용
-        try:
-            with open('Yumold Temp 01.html', 'r', encoding='utf-8') as f:
-                template_content = f.read()
-        except FileNotFoundError:
-            st.error("Yumold Temp 01.html 템플릿 파일을 찾을 수 없습니다.")
-            return
-            
-        # 제품 데이터 HTML 생성
-        items_html = ""
-        for idx, item in enumerate(safe_items):
-            items_html += f"""
-                <tr>
-                    <td rowspan="2" style="text-align: center; vertical-align: middle;">{idx + 1}</td>
-                    <td>{item.get('item_code', 'N/A')}</td>
-                    <td>{item.get('item_name_en', 'N/A')}</td>
-                    <td style="text-align: center;">{item.get('quantity', 1)}</td>
-                    <td style="text-align: right;">{item.get('standard_price', 0):,.0f}</td>
-                    <td style="text-align: center;">{item.get('discount_rate', 0)}%</td>
-                    <td style="text-align: right;">{item.get('unit_price', 0):,.0f}</td>
-                    <td style="text-align: right;">{item.get('amount', 0):,.0f}</td>
-                </tr>
-                <tr>
-                    <td colspan="7" style="padding-left: 20px; font-size: 9px; color: #666;">
-                        VN: {item.get('item_name_vn', '')}
-                        {(' | ' + item.get('remark', '')) if item.get('remark', '') else ''}
-                    </td>
-                </tr>
-            """
-        
         # 총액 계산
         def calculate_totals_local(items, vat_pct):
             subtotal = sum(item.get('amount', 0) for item in items)
@@ -1199,47 +1053,45 @@ def generate_print_preview():
         else:
             delivery_date_str = datetime.now().strftime('%d-%m-%Y')
 
-        # 템플릿 변수 교체 (모든 필드 포함)
-        today = datetime.now()
-        replacements = {
-            '{{quotation_number}}': quotation_number,
-            '{{quote_date}}': today.strftime('%d-%m-%Y'),
-            '{{company_name}}': customer_company,
-            '{{customer_company}}': customer_company,
-            '{{customer_address}}': customer_address,
-            '{{contact_person}}': contact_person,
-            '{{customer_phone}}': customer_phone,
-            '{{customer_email}}': customer_email,
-            '{{project_name}}': project_name,
-            '{{part_name}}': part_name,
-            '{{part_weight}}': part_weight,
-            '{{mold_number}}': mold_number,
-            '{{hrs_info}}': hrs_info,
-            '{{resin_type}}': resin_type,
-            '{{resin_additive}}': resin_additive,
-            '{{sol_material}}': sol_material,
-            '{{remark}}': remark,
-            '{{payment_terms}}': payment_terms,
-            '{{delivery_date}}': delivery_date_str,
-            '{{valid_date}}': valid_date_str,
-            '{{account}}': account,
-            '{{sales_rep_name}}': sales_rep_name,
-            '{{sales_rep_phone}}': sales_rep_phone,
-            '{{sales_rep_email}}': sales_rep_email,
-            '{{items_rows}}': items_html,
-            '{{subtotal}}': f"{subtotal:,.0f}",
-            '{{vat_amount}}': f"{vat_amount:,.0f}",
-            '{{total}}': f"{total:,.0f}",
-            '{{total_incl_vat}}': f"{total:,.0f}",
-            '{{vat_percentage}}': f"{vat_percentage}",
-            '{{revision_number}}': str(st.session_state.get('print_revision_number', '00')),
-            '{{currency}}': 'VND'
+        # 템플릿 컨텍스트용 견적서 헤더 (DB quotations 행과 같은 필드명)
+        quote = {
+            'quotation_number': quotation_number,
+            'quote_date': datetime.now().strftime('%d-%m-%Y'),
+            'customer_company': customer_company,
+            'customer_address': customer_address,
+            'customer_contact_person': contact_person,
+            'customer_phone': customer_phone,
+            'customer_email': customer_email,
+            'project_name': project_name,
+            'part_name': part_name,
+            'part_weight': part_weight,
+            'mold_number': mold_number,
+            'hrs_info': hrs_info,
+            'resin_type': resin_type,
+            'resin_additive': resin_additive,
+            'sol_material': sol_material,
+            'remark': remark,
+            'payment_terms': payment_terms,
+            'delivery_date': delivery_date_str,
+            'valid_date': valid_date_str,
+            'account': account,
+            'sales_representative': sales_rep_name,
+            'sales_rep_contact': sales_rep_phone,
+            'sales_rep_email': sales_rep_email,
+            'subtotal_excl_vat': subtotal,
+            'vat_amount': vat_amount,
+            'total_incl_vat': total,
+            'vat_percentage': vat_percentage,
+            'revision_number': str(st.session_state.get('print_revision_number', '00')),
+            'currency': 'VND',
         }
-        
-        # 모든 변수를 교체
-        final_html = template_content
-        for placeholder, value in replacements.items():
-            final_html = final_html.replace(placeholder, str(value))
+
+        # 입력값(세션) + 품목 + 템플릿 내용이 같으면 캐시된 HTML 사용
+        final_html = get_or_render(
+            'quotation_preview', 'draft',
+            lambda: build_quotation_print_html(quote, safe_items),
+            quotation=quote, items=safe_items, template=QUOTATION_PRINT_TEMPLATE,
+        )
         
         # HTML 파일 저장 (실제 견적번호 사용)
         actual_quotation_number = st.session_state.get('print_quotation_number', quotation_number)
@@ -1477,6 +1329,8 @@ def show_quotation_edit():
             new_revision = f"{base_number}-Rv{max_revision + 1:02d}"
             st.info(f"🆕 New revision will be created as: **{new_revision}**")
             
+            show_revision_history(original_quote['quotation_id'])
+            
             # 편집 모드가 아닐 때만 버튼 표시
             if not st.session_state.get('edit_mode', False):
                 col_btn1, col_btn2 = st.columns(2)
@@ -1862,6 +1716,52 @@ def show_edit_quotation_form():
                 st.rerun()
 
 
+def show_revision_history(quotation_id):
+    """리비전 이력 및 리비전 간 변경 내역"""
+    revision_manager = SQLiteQuotationRevisionManager()
+    chain = revision_manager.get_revision_chain(quotation_id)
+    if len(chain) < 2:
+        return
+    
+    with st.expander(f"🕘 Revision History ({len(chain)})"):
+        history_df = pd.DataFrame(chain)[['sequence', 'quotation_id', 'storage', 'payload_size', 'created_at']]
+        st.dataframe(history_df, use_container_width=True, hide_index=True)
+        
+        options = [entry['quotation_id'] for entry in chain]
+        col1, col2 = st.columns(2)
+        with col1:
+            from_id = st.selectbox("From", options, index=max(len(options) - 2, 0), key=f"rev_from_{quotation_id}")
+        with col2:
+            to_id = st.selectbox("To", options, index=len(options) - 1, key=f"rev_to_{quotation_id}")
+        
+        diff = revision_manager.diff_revisions(from_id, to_id)
+        if not diff:
+            st.warning("리비전을 비교할 수 없습니다.")
+            return
+        if not any(diff.values()):
+            st.info("변경 사항이 없습니다.")
+            return
+        
+        if diff['header']:
+            st.markdown("**Header**")
+            st.dataframe(pd.DataFrame([
+                {'field': field, 'from': str(before), 'to': str(after)}
+                for field, (before, after) in diff['header'].items()
+            ]), use_container_width=True, hide_index=True)
+        
+        rows = []
+        for change, items in (('added', diff['added']), ('removed', diff['removed'])):
+            for item in items:
+                rows.append({'line': item.get('line_number'), 'change': change,
+                             'detail': f"{item.get('item_code') or ''} {item.get('amount') or 0:,.0f}"})
+        for item in diff['changed']:
+            detail = ", ".join(f"{field}: {before} → {after}" for field, (before, after) in item['fields'].items())
+            rows.append({'line': item['line_number'], 'change': 'changed', 'detail': detail})
+        if rows:
+            st.markdown("**Items**")
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+
 def save_as_new_revision(original_quote, customer_company, customer_contact, customer_phone, 
                          customer_email, customer_address, quote_date, currency, vat_percentage):
     """편집된 견적서를 새로운 리비전으로 저장"""
@@ -1930,27 +1830,27 @@ def save_as_new_revision(original_quote, customer_company, customer_contact, cus
         success = quotation_manager.save_quotation(new_revision_data)
         
         if success:
-            # 새 아이템들 저장
-            for idx, item in enumerate(st.session_state.edit_quotation_items):
-                item_data = {
-                    'item_id': f"QI_{datetime.now().strftime('%Y%m%d%H%M%S')}_{idx+1}_REV",
-                    'quotation_id': new_quotation_id,
-                    'line_number': item['line_number'],
-                    'source_product_code': item.get('item_code'),
-                    'item_code': item.get('item_code'),
-                    'item_name_en': item.get('item_name_en'),
-                    'item_name_vn': item.get('item_name_vn'),
-                    'quantity': item.get('quantity', 1),
-                    'standard_price': item.get('standard_price', 0),
-                    'selling_price': item.get('selling_price', 0),
-                    'discount_rate': item.get('discount_rate', 0),
-                    'unit_price': item.get('unit_price', 0),
-                    'amount': item.get('amount', 0),
-                    'remark': item.get('remark', ''),
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
-                }
-                quotation_manager.save_quotation_item(item_data)
+            # 새 아이템 저장 + 리비전 이력에 변경분 기록 + 이전 리비전 품목 행 보관 (한 트랜잭션)
+            current_time = datetime.now().isoformat()
+            new_items = [{
+                'item_id': f"QI_{datetime.now().strftime('%Y%m%d%H%M%S')}_{idx+1}_REV",
+                'line_number': item['line_number'],
+                'source_product_code': item.get('item_code'),
+                'item_code': item.get('item_code'),
+                'item_name_en': item.get('item_name_en'),
+                'item_name_vn': item.get('item_name_vn'),
+                'quantity': item.get('quantity', 1),
+                'standard_price': item.get('standard_price', 0),
+                'selling_price': item.get('selling_price', 0),
+                'discount_rate': item.get('discount_rate', 0),
+                'unit_price': item.get('unit_price', 0),
+                'amount': item.get('amount', 0),
+                'remark': item.get('remark', ''),
+                'created_at': current_time,
+                'updated_at': current_time
+            } for idx, item in enumerate(st.session_state.edit_quotation_items)]
+            SQLiteQuotationRevisionManager().record_revision(
+                new_quotation_id, original_quote['quotation_id'], items=new_items)
             
             st.success(f"✅ 새로운 리비전이 생성되었습니다: {new_revision_number}")
             st.info("📋 Quotation List 탭에서 새로운 리비전을 확인할 수 있습니다.")
@@ -2010,27 +1910,26 @@ def create_quotation_revision(original_quote, new_revision_number):
         success = quotation_manager.save_quotation(revision_data)
         
         if success:
-            # 아이템들도 복사
-            for idx, (_, item) in enumerate(original_items.iterrows()):
-                item_data = {
-                    'item_id': f"QI_{datetime.now().strftime('%Y%m%d%H%M%S')}_{idx+1}_REV",
-                    'quotation_id': new_quotation_id,
-                    'line_number': item['line_number'],
-                    'source_product_code': item.get('source_product_code', ''),
-                    'item_code': item.get('item_code', ''),
-                    'item_name_en': item.get('item_name_en', ''),
-                    'item_name_vn': item.get('item_name_vn', ''),
-                    'quantity': item.get('quantity', 1),
-                    'standard_price': item.get('standard_price', 0),
-                    'selling_price': item.get('selling_price', 0),
-                    'discount_rate': item.get('discount_rate', 0),
-                    'unit_price': item.get('unit_price', 0),
-                    'amount': item.get('amount', 0),
-                    'remark': item.get('remark', ''),
-                    'created_at': current_time,
-                    'updated_at': current_time
-                }
-                quotation_manager.save_quotation_item(item_data)
+            # 아이템 복사 + 리비전 이력에 변경분 기록 + 원본 품목 행 보관 (한 트랜잭션)
+            new_items = [{
+                'item_id': f"QI_{datetime.now().strftime('%Y%m%d%H%M%S')}_{idx+1}_REV",
+                'line_number': item['line_number'],
+                'source_product_code': item.get('source_product_code', ''),
+                'item_code': item.get('item_code', ''),
+                'item_name_en': item.get('item_name_en', ''),
+                'item_name_vn': item.get('item_name_vn', ''),
+                'quantity': item.get('quantity', 1),
+                'standard_price': item.get('standard_price', 0),
+                'selling_price': item.get('selling_price', 0),
+                'discount_rate': item.get('discount_rate', 0),
+                'unit_price': item.get('unit_price', 0),
+                'amount': item.get('amount', 0),
+                'remark': item.get('remark', ''),
+                'created_at': current_time,
+                'updated_at': current_time
+            } for idx, (_, item) in enumerate(original_items.iterrows())]
+            SQLiteQuotationRevisionManager().record_revision(
+                new_quotation_id, original_quote['quotation_id'], items=new_items)
             
             st.success(f"✅ Revision created: {new_revision_number}")
             st.info("💡 New revision has been created in the database. You can view it in the 'Quotation List' tab.")
@@ -2062,13 +1961,11 @@ def open_print_window(quotation_id):
             
         quote = quote_df.iloc[0]
         
-        # 견적서 아이템들 조회
-        items_df = pd.read_sql_query('''
-            SELECT * FROM quotation_items WHERE quotation_id = ? ORDER BY line_number
-        ''', conn, params=[quotation_id])
-        
         conn.close()
         
+        # 견적서 아이템들 조회 (보관된 리비전은 이력에서 복원)
+        items_df = SQLiteQuotationManager().get_quotation_items(quotation_id)
+        
         # 프린트용 HTML 생성
         html_content = f"""
         <div style="background: white; padding: 20px; border: 1px solid #ddd; font-family: Arial, sans-serif;">
@@ -2148,79 +2045,16 @@ def open_print_window(quotation_id):
             quotation_manager = SQLiteQuotationManager()
             
             try:
-                # 템플릿 파일 읽기
-                with open('templates/quotation_print_template.html', 'r', encoding='utf-8') as f:
-                    template_content = f.read()
-                
-                # 견적서 아이템들 조회
-                items_df = pd.read_sql_query('''
-                    SELECT * FROM quotation_items WHERE quotation_id = ? ORDER BY line_number
-                ''', sqlite3.connect('erp_system.db'), params=[quotation_id])
-                
-                # 템플릿에 데이터 삽입
-                template_content = template_content.replace('{quotation_number}', quote.get('quotation_number', ''))
-                template_content = template_content.replace('{quote_date}', quote.get('quote_date', ''))
-                template_content = template_content.replace('{revision_number}', quote.get('revision_number', '00'))
-                template_content = template_content.replace('{currency}', quote.get('currency', 'VND'))
-                template_content = template_content.replace('{customer_company}', quote.get('customer_company', ''))
-                template_content = template_content.replace('{customer_address}', quote.get('customer_address', ''))
-                template_content = template_content.replace('{customer_contact_person}', quote.get('customer_contact_person', ''))
-                template_content = template_content.replace('{customer_phone}', quote.get('customer_phone', ''))
-                template_content = template_content.replace('{customer_email}', quote.get('customer_email', ''))
-                template_content = template_content.replace('{project_name}', quote.get('project_name', ''))
-                template_content = template_content.replace('{part_name}', quote.get('part_name', ''))
-                template_content = template_content.replace('{part_weight}', quote.get('part_weight', ''))
-                template_content = template_content.replace('{mold_number}', quote.get('mold_number', ''))
-                template_content = template_content.replace('{hrs_info}', quote.get('hrs_info', ''))
-                template_content = template_content.replace('{resin_type}', quote.get('resin_type', ''))
-                template_content = template_content.replace('{resin_additive}', quote.get('resin_additive', ''))
-                template_content = template_content.replace('{sol_material}', quote.get('sol_material', ''))
-                template_content = template_content.replace('{remark}', quote.get('remark', ''))
-                template_content = template_content.replace('{valid_date}', quote.get('valid_date', ''))
-                template_content = template_content.replace('{payment_terms}', quote.get('payment_terms', ''))
-                template_content = template_content.replace('{delivery_date}', quote.get('delivery_date', ''))
-                template_content = template_content.replace('{subtotal_excl_vat}', f"{quote.get('subtotal_excl_vat', 0):,.0f}")
-                template_content = template_content.replace('{vat_percentage}', str(quote.get('vat_percentage', 10)))
-                template_content = template_content.replace('{vat_amount}', f"{quote.get('vat_amount', 0):,.0f}")
-                template_content = template_content.replace('{total_incl_vat}', f"{quote.get('total_incl_vat', 0):,.0f}")
-                template_content = template_content.replace('{product_name_detail}', quote.get('product_name_detail', ''))
-                template_content = template_content.replace('{sales_representative}', quote.get('sales_representative', ''))
-                template_content = template_content.replace('{sales_rep_contact}', quote.get('sales_rep_contact', ''))
-                template_content = template_content.replace('{account}', quote.get('account', ''))
-                
-                # 아이템 테이블 생성
-                items_html = ""
-                for idx, (_, item) in enumerate(items_df.iterrows()):
-                    # 베트남어 텍스트 길이에 따른 CSS 클래스 결정
-                    vn_text = str(item.get('item_name_vn', ''))
-                    vn_class = "vietnamese-text"
-                    if len(vn_text) > 80:
-                        vn_class += " very-long-text"
-                    elif len(vn_text) > 50:
-                        vn_class += " long-text"
-                    
-                    row_number = item.get('line_number', idx + 1)
-                    
-                    items_html += f"""
-                    <tr>
-                        <td rowspan="3" style="text-align: center; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; width: 5%; vertical-align: middle;">{row_number}</td>
-                        <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 12%;">{item.get('item_code', '')}</td>
-                        <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 25%;">{item.get('item_name_en', '')}</td>
-                        <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 8%;">{item.get('quantity', 0)}</td>
-                        <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 15%;">{item.get('standard_price', 0):,.0f}</td>
-                        <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 10%;">{item.get('discount_rate', 0):.1f}%</td>
-                        <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 15%;">{item.get('unit_price', 0):,.0f}</td>
-                        <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; width: 15%;">{item.get('amount', 0):,.0f}</td>
-                    </tr>
-                    <tr>
-                        <td colspan="7" style="text-align: left; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white;" class="{vn_class}">VN: {vn_text}</td>
-                    </tr>
-                    <tr>
-                        <td colspan="7" style="text-align: left; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; font-size: 7px;">Remark: {item.get('remark', '')}</td>
-                    </tr>
-                    """
-                
-                template_content = template_content.replace('{quotation_items}', items_html)
+                # 렌더링 버전이 같으면 품목을 조회하지 않고 캐시 재사용
+                # (미스일 때만 품목 조회 - 보관된 리비전은 이력에서 복원)
+                quote_data = dict(quote)
+                template_content = get_or_render_version(
+                    'quotation_print', quotation_id,
+                    lambda: build_quotation_print_html(
+                        quote_data, quotation_manager.get_quotation_items(quotation_id)),
+                    version=quotation_version(quotation_id, quotation_manager.db_path),
+                    template=QUOTATION_PRINT_TEMPLATE,
+                )
                 
                 # 화면에 바로 표시
                 st.markdown("### 📄 Quotation Preview")
@@ -2402,199 +2236,36 @@ def main():
 
 
 
+def build_quotation_display_html(selected_quote, include_stamp=False):
+    """화면 출력용 견적서 HTML (DB에서 최신 헤더/품목 조회 후 인쇄 템플릿으로 렌더링) - 품목이 없으면 None"""
+    quotation_id = selected_quote.get('quotation_id')
+    if not quotation_id:
+        return None
+
+    document = SQLiteQuotationManager().load_quotation_document(quotation_id)
+    if not document or not document.items:
+        return None
+
+    return build_quotation_print_html(document.header, document.items, stamp=include_stamp)
+
 def display_quotation_for_print(selected_quote, include_stamp=False):
     """견적서를 화면에 표시하고 프린트할 수 있게 함"""
     try:
-        import os
-        # 템플릿 파일 읽기
-        template_file_path = 'Yumold Temp 01.html'
-        if not os.path.exists(template_file_path):
-            st.error(f"템플릿 파일이 없습니다: {template_file_path}")
-            return
-            
-        with open(template_file_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        # 견적서 아이템들 조회
-        from managers.sqlite.sqlite_quotation_manager import SQLiteQuotationManager
-        quotation_manager = SQLiteQuotationManager()
-        
-        # 데이터베이스에서 직접 완전한 데이터 재조회
+        # 저장된 견적서는 렌더링 버전(트리거로 관리)이 같으면 캐시된 HTML 재사용
         quotation_id = selected_quote.get('quotation_id')
         if quotation_id:
-            import sqlite3
-            conn = sqlite3.connect('erp_system.db')
-            cursor = conn.cursor()
-            
-            # 완전한 견적서 정보를 직접 조회
-            cursor.execute("SELECT * FROM quotations WHERE quotation_id = ?", (quotation_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                # 컬럼 이름 가져오기
-                cursor.execute("PRAGMA table_info(quotations)")
-                columns = [col[1] for col in cursor.fetchall()]
-                
-                # row 데이터를 딕셔너리로 변환
-                selected_quote = dict(zip(columns, row))
-            
-            conn.close()
-        
-
-        
-        items = quotation_manager.get_quotation_items(selected_quote.get('quotation_id', ''))
+            template_content = get_or_render_version(
+                'quotation_display', quotation_id,
+                lambda: build_quotation_display_html(selected_quote, include_stamp),
+                version=quotation_version(quotation_id),
+                template=QUOTATION_PRINT_TEMPLATE,
+                extra={'stamp': include_stamp,
+                       'stamp_image': file_digest(QUOTATION_STAMP_IMAGE) if include_stamp else None},
+            )
+        else:
+            template_content = build_quotation_display_html(selected_quote, include_stamp)
         
-        if isinstance(items, pd.DataFrame) and not items.empty:
-            # 아이템 행 생성
-            items_html = ""
-            for idx, (_, item) in enumerate(items.iterrows()):
-                vn_text = item.get('item_name_vn', '')
-                
-                # 베트남어 텍스트 길이에 따른 클래스 설정
-                vn_class = ""
-                if len(vn_text) > 80:
-                    vn_class = "very-long-text"
-                elif len(vn_text) > 50:
-                    vn_class = "long-text"
-                
-                row_number = item.get('line_number', idx + 1)
-                
-                items_html += f"""
-                <tr>
-                    <td rowspan="3" style="text-align: center; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; width: 5%; vertical-align: middle;">{row_number}</td>
-                    <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 12%;">{item.get('item_code', '')}</td>
-                    <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 25%;">{item.get('item_name_en', '')}</td>
-                    <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 8%;">{item.get('quantity', 0)}</td>
-                    <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 15%;">{item.get('standard_price', 0):,.0f}</td>
-                    <td style="text-align: center; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 10%;">{item.get('discount_rate', 0):.1f}%</td>
-                    <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; background-color: white; width: 15%;">{item.get('unit_price', 0):,.0f}</td>
-                    <td style="text-align: right; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; width: 15%;">{item.get('amount', 0):,.0f}</td>
-                </tr>
-                <tr>
-                    <td colspan="7" style="text-align: left; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white;" class="{vn_class}">VN: {vn_text}</td>
-                </tr>
-                <tr>
-                    <td colspan="7" style="text-align: left; padding: 3px 5px; border: 1px solid #333; border-right: 1px solid white; background-color: white; font-size: 7px;">Remark: {item.get('remark', '')}</td>
-                </tr>
-                """
-            
-            # 템플릿에 데이터 삽입
-            template_content = template_content.replace('{{quotation_number}}', str(selected_quote.get('quotation_number', '')))
-            template_content = template_content.replace('{{quote_date}}', str(selected_quote.get('quote_date', '')))
-            template_content = template_content.replace('{{revision_number}}', str(selected_quote.get('revision_number', '00')))
-            template_content = template_content.replace('{{currency}}', str(selected_quote.get('currency', 'VND')))
-            
-            # 고객 정보 - 안전한 값 추출과 빈 값 처리
-            customer_company = str(selected_quote.get('customer_company', '') or '')
-            customer_address = str(selected_quote.get('customer_address', '') or '')
-            customer_contact_person = str(selected_quote.get('customer_contact_person', '') or '')
-            customer_phone = str(selected_quote.get('customer_phone', '') or '')
-            customer_email = str(selected_quote.get('customer_email', '') or '')
-            
-            template_content = template_content.replace('{{customer_company}}', customer_company)
-            template_content = template_content.replace('{{customer_address}}', customer_address)
-            template_content = template_content.replace('{{customer_contact_person}}', customer_contact_person)
-            template_content = template_content.replace('{{customer_phone}}', customer_phone)
-            template_content = template_content.replace('{{customer_email}}', customer_email)
-            
-            # 영업 담당자 정보 - 안전한 값 추출
-            sales_representative = str(selected_quote.get('sales_representative', '') or '')
-            sales_rep_contact = str(selected_quote.get('sales_rep_contact', '') or '')
-            sales_rep_email = str(selected_quote.get('sales_rep_email', '') or '')
-            
-            template_content = template_content.replace('{{sales_representative}}', sales_representative)
-            template_content = template_content.replace('{{sales_rep_name}}', sales_representative)  # 동일한 값 매핑
-            template_content = template_content.replace('{{sales_rep_phone}}', sales_rep_contact)
-            template_content = template_content.replace('{{sales_rep_email}}', sales_rep_email)
-            
-            # 프로젝트 정보 - 안전한 값 추출과 빈 값 처리
-            project_name = str(selected_quote.get('project_name', '') or '')
-            part_name = str(selected_quote.get('part_name', '') or '')
-            part_weight = str(selected_quote.get('part_weight', '') or '')
-            mold_number = str(selected_quote.get('mold_number', '') or '')
-            hrs_info = str(selected_quote.get('hrs_info', '') or '')
-            resin_type = str(selected_quote.get('resin_type', '') or '')
-            resin_additive = str(selected_quote.get('resin_additive', '') or '')
-            sol_material = str(selected_quote.get('sol_material', '') or '')
-            remark = str(selected_quote.get('remark', '') or '')
-            payment_terms = str(selected_quote.get('payment_terms', '') or '')
-            valid_date = str(selected_quote.get('valid_date', '') or '')
-            delivery_date = str(selected_quote.get('delivery_date', '') or '')
-            account = str(selected_quote.get('account', '') or '700-038-038199 (Shinhan Bank Vietnam)')
-            
-            template_content = template_content.replace('{{project_name}}', project_name)
-            template_content = template_content.replace('{{part_name}}', part_name)
-            template_content = template_content.replace('{{part_weight}}', part_weight)
-            template_content = template_content.replace('{{mold_number}}', mold_number)
-            template_content = template_content.replace('{{hrs_info}}', hrs_info)
-            template_content = template_content.replace('{{resin_type}}', resin_type)
-            template_content = template_content.replace('{{resin_additive}}', resin_additive)
-            template_content = template_content.replace('{{sol_material}}', sol_material)
-            template_content = template_content.replace('{{remark}}', remark)
-            template_content = template_content.replace('{{payment_terms}}', payment_terms)
-            template_content = template_content.replace('{{valid_date}}', valid_date)
-            template_content = template_content.replace('{{delivery_date}}', delivery_date)
-            template_content = template_content.replace('{{account}}', account)
-            
-            # 스탬프 섹션 처리
-            if include_stamp:
-                # 실제 스탬프 이미지를 Base64로 인코딩하여 삽입
-                import base64
-                import os
-                stamp_path = 'static/images/company_stamp.png'
-                if os.path.exists(stamp_path):
-                    with open(stamp_path, 'rb') as f:
-                        stamp_data = base64.b64encode(f.read()).decode()
-                    stamp_html = f'''
-                        <div style="position: absolute; top: -75px; left: 50%; transform: translateX(-50%); z-index: 10;">
-                            <img src="data:image/png;base64,{stamp_data}" 
-                                 style="width: 180px; height: 180px; opacity: 0.85;" alt="Company Stamp" />
-                        </div>
-                    '''
-                else:
-                    # 스탬프 파일이 없을 경우 CSS로 만든 원형 스탬프 (큰 사이즈, 겹치는 위치)
-                    stamp_html = '''
-                        <div style="position: absolute; top: -75px; left: 50%; transform: translateX(-50%); z-index: 10;">
-                            <div style="width: 180px; height: 180px; border: 4px solid #e74c3c; border-radius: 50%;
-                                        display: flex; flex-direction: column; justify-content: center;
-                                        align-items: center; font-size: 14px; font-weight: bold; color: #e74c3c; text-align: center;
-                                        background: rgba(231, 76, 60, 0.1); opacity: 0.85;">
-                                <div style="font-size: 12px;">M.S.Đ.N: 011146237</div>
-                                <div style="margin: 5px 0; font-size: 14px;">CÔNG TY TNHH</div>
-                                <div style="font-size: 18px; margin: 5px 0; font-weight: 900;">YUMOLD</div>
-                                <div style="font-size: 14px;">VIỆT NAM</div>
-                                <div style="font-size: 10px; margin-top: 5px;">YẾN HÒA - TP. HÀ NỘI</div>
-                            </div>
-                        </div>
-                    '''
-                signature_name_display = ''
-            else:
-                stamp_html = ''
-                signature_name_display = ''
-                
-            template_content = template_content.replace('{{stamp_section}}', stamp_html)
-            template_content = template_content.replace('{{signature_name}}', signature_name_display)
-            
-            # 가격 정보 - 안전한 숫자 변환과 포맷팅
-            try:
-                vat_percentage = float(selected_quote.get('vat_percentage', 10.0) or 10.0)
-                subtotal = float(selected_quote.get('subtotal_excl_vat', 0) or 0)
-                vat_amount = float(selected_quote.get('vat_amount', 0) or 0)
-                total_incl_vat = float(selected_quote.get('total_incl_vat', 0) or 0)
-            except (ValueError, TypeError):
-                vat_percentage = 10.0
-                subtotal = 0
-                vat_amount = 0
-                total_incl_vat = 0
-            
-            template_content = template_content.replace('{{vat_percentage}}', f"{vat_percentage:.1f}")
-            template_content = template_content.replace('{{subtotal}}', f"{subtotal:,.0f}")
-            template_content = template_content.replace('{{vat_amount}}', f"{vat_amount:,.0f}")
-            template_content = template_content.replace('{{total_incl_vat}}', f"{total_incl_vat:,.0f}")
-            
-            # 아이템 리스트 삽입
-            template_content = template_content.replace('{{items_rows}}', items_html)
-            
+        if template_content:
             # 화면에 바로 표시
             st.markdown("### 📄 Quotation Preview")
             
@@ -2612,6 +2283,5 @@ def display_quotation_for_print(selected_quote, include_stamp=False):
         import traceback
         st.code(traceback.format_exc())
 
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,371 @@
+"""
+헤드리스 Streamlit 런타임 스텁
+- 벤치마크/부하 테스트에서 app.py와 pages/* 함수를 브라우저 없이 실행하기 위한 최소 런타임
+- 위젯은 기본값을 반환하고 출력 함수는 아무것도 하지 않음
+- session_state는 스레드별로 분리되어 여러 가상 세션을 동시에 실행 가능
+- render()는 렌더 중 출력/위젯 호출 수와 매니저가 남긴 DB 오류(logging / print)를 스레드별로 기록해
+  DB 오류가 있으면 'db_error', 출력이 없으면(require_output=True) 'empty'로 보고
+"""
+
+import re
+import sys
+import types
+import logging
+import threading
+from datetime import date
+from functools import wraps
+
+
+# 매니저가 로그/print로 남기는 DB 오류 메시지 (sqlite3 / psycopg2 예외 문구)
+DB_ERROR_PATTERN = re.compile(
+    r"no such (table|column)|has no column named|database is locked|unable to open database"
+    r"|syntax error|constraint failed|datatype mismatch"
+    r"|OperationalError|IntegrityError|DatabaseError|ProgrammingError|UndefinedTable|UndefinedColumn"
+)
+
+# render() 결과 중 실패로 보는 상태
+FAILED_STATUSES = ('error', 'db_error', 'empty')
+
+
+class _RenderMonitor(logging.Handler):
+    """렌더 중인 스레드의 DB 오류 로그/출력 수집 (logging 핸들러 + stdout 래퍼)"""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self._local = threading.local()
+
+    def begin(self):
+        self._local.errors = []
+
+    def end(self):
+        errors = getattr(self._local, 'errors', None) or []
+        self._local.errors = None
+        return errors
+
+    def note(self, text):
+        errors = getattr(self._local, 'errors', None)
+        if errors is not None and DB_ERROR_PATTERN.search(text):
+            errors.append(text.strip())
+
+    def emit(self, record):
+        try:
+            self.note(record.getMessage())
+        except Exception:
+            pass
+
+
+class _MonitoredStream:
+    """print 출력은 그대로 내보내고 렌더 중인 스레드의 DB 오류 문구만 기록"""
+
+    def __init__(self, stream, monitor):
+        self._stream = stream
+        self._monitor = monitor
+
+    def write(self, text):
+        self._monitor.note(text)
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class RerunRequested(Exception):
+    """st.rerun() 호출 - 한 번의 렌더가 끝난 것으로 간주"""
+
+
+class StopRequested(Exception):
+    """st.stop() 호출"""
+
+
+class SessionState(dict):
+    """속성 접근을 지원하는 session_state"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class _Element:
+    """출력 요소/컨테이너 스텁 - 컨텍스트 매니저 및 모든 st.* 호출 지원"""
+
+    def __init__(self, runtime):
+        self._runtime = runtime
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        # 컨테이너 내부 호출(col.button 등)은 런타임 함수와 동일하게 동작
+        return getattr(self._runtime, name)
+
+    def __bool__(self):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+
+class _Secrets(dict):
+    """st.secrets 스텁 - 설정되지 않은 키는 KeyError"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class HeadlessStreamlit(types.ModuleType):
+    """sys.modules['streamlit']에 설치되는 스텁 모듈"""
+
+    def __init__(self, secrets=None):
+        super().__init__('streamlit')
+        self._local = threading.local()
+        self._default_session = SessionState()
+        self.secrets = _Secrets(secrets or {})
+        self.sidebar = _Element(self)
+        self.column_config = _Element(self)
+        self.__path__ = []  # streamlit.components.v1 import 지원
+        self.widget_calls = 0
+        self.monitor = _RenderMonitor()
+
+    # ------------------------------------------------------------------
+    # 세션 관리
+    # ------------------------------------------------------------------
+    @property
+    def session_state(self):
+        # 빈 SessionState도 falsy이므로 None일 때만 기본 세션 사용
+        session = getattr(self._local, 'session', None)
+        return session if session is not None else self._default_session
+
+    def use_session(self, session):
+        """현재 스레드에서 사용할 session_state 지정"""
+        self._local.session = session
+
+    def _count_call(self):
+        self._local.calls = getattr(self._local, 'calls', 0) + 1
+
+    def reset_calls(self):
+        """현재 스레드의 출력/위젯 호출 수 초기화 후 이전 값 반환"""
+        calls = getattr(self._local, 'calls', 0)
+        self._local.calls = 0
+        return calls
+
+    # ------------------------------------------------------------------
+    # 캐시 데코레이터 (인자가 해시 가능할 때만 메모이제이션)
+    # ------------------------------------------------------------------
+    def _cache_decorator(self, func=None, **_options):
+        def decorate(f):
+            cache = {}
+            lock = threading.Lock()
+
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                try:
+                    key = (args, tuple(sorted(kwargs.items())))
+                    hash(key)
+                except TypeError:
+                    return f(*args, **kwargs)
+                if key in cache:
+                    return cache[key]
+                with lock:
+                    if key not in cache:
+                        cache[key] = f(*args, **kwargs)
+                    return cache[key]
+
+            wrapper.clear = cache.clear
+            return wrapper
+
+        if func is not None and callable(func):
+            return decorate(func)
+        return decorate
+
+    def cache_data(self, func=None, **options):
+        return self._cache_decorator(func, **options)
+
+    def cache_resource(self, func=None, **options):
+        return self._cache_decorator(func, **options)
+
+    # ------------------------------------------------------------------
+    # 흐름 제어
+    # ------------------------------------------------------------------
+    def rerun(self, *args, **kwargs):
+        raise RerunRequested()
+
+    def experimental_rerun(self, *args, **kwargs):
+        raise RerunRequested()
+
+    def stop(self):
+        raise StopRequested()
+
+    # ------------------------------------------------------------------
+    # 레이아웃
+    # ------------------------------------------------------------------
+    def columns(self, spec, *args, **kwargs):
+        self._count_call()
+        count = spec if isinstance(spec, int) else len(spec)
+        return [_Element(self) for _ in range(count)]
+
+    def tabs(self, labels, *args, **kwargs):
+        self._count_call()
+        return [_Element(self) for _ in labels]
+
+    # ------------------------------------------------------------------
+    # 입력 위젯 - 기본값 반환
+    # ------------------------------------------------------------------
+    def _widget(self):
+        self.widget_calls += 1
+        self._count_call()
+
+    def button(self, *args, **kwargs):
+        self._widget()
+        return False
+
+    form_submit_button = button
+    download_button = button
+    link_button = button
+
+    def checkbox(self, label=None, value=False, *args, **kwargs):
+        self._widget()
+        return bool(value)
+
+    toggle = checkbox
+
+    def selectbox(self, label=None, options=(), index=0, *args, **kwargs):
+        self._widget()
+        options = list(options) if options is not None else []
+        if not options or index is None:
+            return None
+        return options[min(index, len(options) - 1)]
+
+    radio = selectbox
+    select_slider = selectbox
+
+    def multiselect(self, label=None, options=(), default=None, *args, **kwargs):
+        self._widget()
+        if default is None:
+            return []
+        return list(default) if isinstance(default, (list, tuple)) else [default]
+
+    def text_input(self, label=None, value="", *args, **kwargs):
+        self._widget()
+        return value if value is not None else ""
+
+    text_area = text_input
+
+    def number_input(self, label=None, min_value=None, max_value=None, value=None, *args, **kwargs):
+        self._widget()
+        if value is not None:
+            return value
+        return min_value if min_value is not None else 0
+
+    def slider(self, label=None, min_value=None, max_value=None, value=None, *args, **kwargs):
+        self._widget()
+        if value is not None:
+            return value
+        return min_value if min_value is not None else 0
+
+    def date_input(self, label=None, value=None, *args, **kwargs):
+        self._widget()
+        return value if value is not None else date.today()
+
+    def color_picker(self, label=None, value="#000000", *args, **kwargs):
+        self._widget()
+        return value
+
+    def file_uploader(self, *args, **kwargs):
+        self._widget()
+        return None
+
+    def data_editor(self, data=None, *args, **kwargs):
+        self._widget()
+        return data
+
+    # ------------------------------------------------------------------
+    # 그 외 모든 출력 함수/컨테이너 (markdown, metric, expander, form, ...)
+    # ------------------------------------------------------------------
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        self._count_call()
+        return _Element(self)
+
+
+def _components_module(runtime):
+    """streamlit.components.v1 스텁"""
+    components = types.ModuleType('streamlit.components')
+    components.__path__ = []
+    v1 = types.ModuleType('streamlit.components.v1')
+    v1.html = lambda *args, **kwargs: None
+    v1.iframe = lambda *args, **kwargs: None
+    v1.declare_component = lambda *args, **kwargs: (lambda *a, **k: None)
+    components.v1 = v1
+    return components, v1
+
+
+def install(secrets=None):
+    """스텁 런타임을 sys.modules에 설치하고 반환 (이미 설치된 경우 재사용)"""
+    runtime = sys.modules.get('streamlit')
+    if isinstance(runtime, HeadlessStreamlit):
+        return runtime
+
+    runtime = HeadlessStreamlit(secrets=secrets)
+    logging.getLogger().addHandler(runtime.monitor)
+    sys.stdout = _MonitoredStream(sys.stdout, runtime.monitor)
+    components, v1 = _components_module(runtime)
+    runtime.components = components
+    sys.modules['streamlit'] = runtime
+    sys.modules['streamlit.components'] = components
+    sys.modules['streamlit.components.v1'] = v1
+    return runtime
+
+
+def render(func, *args, require_output=False, **kwargs):
+    """페이지 함수 1회 렌더 - rerun/stop은 정상 종료로 처리
+
+    반환값: (상태, 오류 메시지) - 상태는 'ok', 'rerun', 'stop', 'error',
+    'db_error'(매니저가 DB 오류를 로그/출력), 'empty'(require_output=True인데 st 호출이 없음)
+    """
+    runtime = sys.modules.get('streamlit')
+    monitor = getattr(runtime, 'monitor', None) if isinstance(runtime, HeadlessStreamlit) else None
+    if monitor is not None:
+        runtime.reset_calls()
+        monitor.begin()
+    try:
+        func(*args, **kwargs)
+        status, error = 'ok', None
+    except RerunRequested:
+        status, error = 'rerun', None
+    except StopRequested:
+        status, error = 'stop', None
+    except Exception as e:
+        status, error = 'error', f"{type(e).__name__}: {e}"
+    if monitor is None:
+        return status, error
+
+    db_errors = monitor.end()
+    calls = runtime.reset_calls()
+    if status == 'error':
+        return status, error
+    if db_errors:
+        return 'db_error', db_errors[0]
+    if require_output and status == 'ok' and calls == 0:
+        return 'empty', 'st 출력 없음'
+    return status, error
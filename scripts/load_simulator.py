@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+동시 사용자 부하 시뮬레이터
+- 스텁 Streamlit 런타임(scripts/headless_streamlit.py)에서 스레드마다 별도 session_state로
+  여러 가상 사용자가 견적 작성 / 승인 처리 / 지출요청 / 대시보드 흐름을 동시에 실행
+- 흐름별 지연 백분위(p50/p90/p95/p99), erp_system.db 쓰기 잠금 대기,
+  PostgreSQL 연결 풀 대기(BasePostgreSQLManager 통계)를 측정해 보고서 작성
+
+사용 예:
+    python -m scripts.load_simulator --users 30 --duration 120 --output load_report.json
+    python -m scripts.load_simulator --users 50 --iterations 20 --synthetic-profile dev
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import sqlite3
+import argparse
+import platform
+import threading
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from scripts.startup_benchmark import (
+    prepare_workspace, bootstrap_sqlite_schema, seed_sqlite_database, login_as_master
+)
+
+# 흐름 이름: 가중치 (업무 시간대 실제 사용 비율 기준)
+DEFAULT_FLOW_MIX = {
+    'quotation': 35,
+    'approval': 20,
+    'expense': 20,
+    'dashboard': 25,
+}
+# 이 시간 이상 걸린 SQLite 쓰기 문장은 잠금 경합으로 집계
+LOCK_WAIT_THRESHOLD_MS = 50.0
+_WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'ALTER', 'DROP')
+
+
+def percentile(samples, pct):
+    """최근접 순위 백분위"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize_latencies(samples_ms):
+    """지연 요약 (ms)"""
+    if not samples_ms:
+        return {'count': 0}
+    return {
+        'count': len(samples_ms),
+        'p50_ms': round(percentile(samples_ms, 50), 2),
+        'p90_ms': round(percentile(samples_ms, 90), 2),
+        'p95_ms': round(percentile(samples_ms, 95), 2),
+        'p99_ms': round(percentile(samples_ms, 99), 2),
+        'max_ms': round(max(samples_ms), 2),
+        'mean_ms': round(sum(samples_ms) / len(samples_ms), 2),
+    }
+
+
+# ----------------------------------------------------------------------
+# 측정 수집기
+# ----------------------------------------------------------------------
+class LoadMetrics:
+    """스레드 안전 측정값 수집"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.flow_latencies = {}
+        self.step_latencies = {}
+        self.flow_errors = {}
+        self.sqlite_writes = []
+        self.sqlite_lock_errors = 0
+        self.pool_acquire = []
+
+    def record_flow(self, flow, elapsed_ms, error=None):
+        with self._lock:
+            self.flow_latencies.setdefault(flow, []).append(elapsed_ms)
+            if error:
+                errors = self.flow_errors.setdefault(flow, {})
+                errors[error] = errors.get(error, 0) + 1
+
+    def record_step(self, step, elapsed_ms):
+        with self._lock:
+            self.step_latencies.setdefault(step, []).append(elapsed_ms)
+
+    def record_sqlite_write(self, elapsed_ms, locked=False):
+        with self._lock:
+            self.sqlite_writes.append(elapsed_ms)
+            if locked:
+                self.sqlite_lock_errors += 1
+
+    def record_pool_acquire(self, elapsed_ms):
+        with self._lock:
+            self.pool_acquire.append(elapsed_ms)
+
+
+class _InstrumentedCursor(sqlite3.Cursor):
+    """쓰기 문장 실행 시간과 'database is locked' 오류 기록"""
+
+    metrics = None
+
+    def _timed(self, method, sql, *args):
+        if self.metrics is None or not sql.lstrip().upper().startswith(_WRITE_PREFIXES):
+            return method(sql, *args)
+        start = time.perf_counter()
+        locked = False
+        try:
+            return method(sql, *args)
+        except sqlite3.OperationalError as e:
+            locked = 'locked' in str(e)
+            raise
+        finally:
+            self.metrics.record_sqlite_write((time.perf_counter() - start) * 1000, locked=locked)
+
+    def execute(self, sql, *args):
+        return self._timed(super().execute, sql, *args)
+
+    def executemany(self, sql, *args):
+        return self._timed(super().executemany, sql, *args)
+
+
+class _InstrumentedConnection(sqlite3.Connection):
+    """sqlite3.connect 대체 연결 - 커서/직접 실행을 계측"""
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or _InstrumentedCursor)
+
+    def execute(self, sql, *args):
+        return self.cursor().execute(sql, *args)
+
+    def executemany(self, sql, *args):
+        return self.cursor().executemany(sql, *args)
+
+
+def instrument_sqlite(metrics):
+    """sqlite3.connect를 계측 연결로 교체 (매니저는 호출 시점에 sqlite3.connect를 조회)"""
+    original_connect = sqlite3.connect
+    _InstrumentedCursor.metrics = metrics
+
+    def connect(*args, **kwargs):
+        kwargs.setdefault('factory', _InstrumentedConnection)
+        return original_connect(*args, **kwargs)
+
+    sqlite3.connect = connect
+    return lambda: setattr(sqlite3, 'connect', original_connect)
+
+
+def instrument_postgresql(metrics):
+    """BasePostgreSQLManager.get_connection 대기 시간 측정 + 풀 통계 기준값 기록"""
+    try:
+        from managers.postgresql.base_postgresql_manager import BasePostgreSQLManager
+    except Exception as e:
+        print(f"⚠️ PostgreSQL 계측 생략: {e}")
+        return None, lambda: None
+
+    original_get_connection = BasePostgreSQLManager.get_connection
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_get_connection(self, *args, **kwargs)
+        finally:
+            metrics.record_pool_acquire((time.perf_counter() - start) * 1000)
+
+    with BasePostgreSQLManager._stats_lock:
+        before = dict(BasePostgreSQLManager._pool_stats)
+    BasePostgreSQLManager.get_connection = get_connection
+
+    def restore():
+        BasePostgreSQLManager.get_connection = original_get_connection
+
+    return (BasePostgreSQLManager, before), restore
+
+
+# ----------------------------------------------------------------------
+# 업무 흐름
+# ----------------------------------------------------------------------
+class VirtualUser:
+    """가상 사용자 1명 - 독립 session_state로 흐름 실행"""
+
+    def __init__(self, index, user_count, app, st, metrics, rng):
+        from scripts.headless_streamlit import SessionState
+
+        self.index = index
+        self.user_count = user_count
+        self.app = app
+        self.st = st
+        self.metrics = metrics
+        self.rng = rng
+        self.session = SessionState()
+        self.user_id = f"loadtest_{index:03d}"
+
+    def login(self):
+        self.st.use_session(self.session)
+        login_as_master(self.st)
+        self.session.user_id = self.user_id
+        self.session.user_name = f"Load Test {self.index:03d}"
+
+    def _step(self, name, func, *args, require_output=False):
+        """한 단계 실행 (페이지 렌더 또는 매니저 호출), 오류 메시지 반환
+
+        예외뿐 아니라 매니저가 로그로 남긴 DB 오류(db_error)와 빈 페이지(empty)도 오류로 집계
+        """
+        from scripts.headless_streamlit import render, FAILED_STATUSES
+
+        start = time.perf_counter()
+        status, error = render(func, *args, require_output=require_output)
+        self.metrics.record_step(name, (time.perf_counter() - start) * 1000)
+        return f"{status}: {error}" if status in FAILED_STATUSES else None
+
+    def _page(self, menu_key):
+        self.session.selected_system = menu_key
+        return self._step(f"page:{menu_key}", self.app.show_page_for_menu, menu_key,
+                          require_output=True)
+
+    def _manager(self, key):
+        from config.database_config import ManagerFactory
+        return ManagerFactory.get_manager(key)
+
+    # 견적 작성: 목록 → 견적 저장(헤더 + 품목) → 합계 갱신 → 목록
+    def flow_quotation(self):
+        error = self._page('quotation_management')
+        error = error or self._step('action:save_quotation', self._create_quotation)
+        return error or self._page('quotation_management')
+
+    def _create_quotation(self):
+        manager = self._manager('quotation')
+        quotation_id = f"LT{uuid.uuid4().hex[:14].upper()}"
+        now = datetime.now().isoformat()
+        manager.save_quotation({
+            'quotation_id': quotation_id,
+            'quote_date': datetime.now().strftime('%Y-%m-%d'),
+            'currency': 'VND',
+            'customer_company': f"Load Test Customer {self.rng.randrange(1000):03d}",
+            'project_name': 'load-test',
+            'sales_representative': self.user_id,
+            'quotation_status': 'draft',
+        })
+        for line in range(1, self.rng.randint(2, 8) + 1):
+            quantity = self.rng.randint(1, 20)
+            price = round(self.rng.uniform(1_000_000, 50_000_000), 0)
+            manager.save_quotation_item({
+                'item_id': f"{quotation_id}-{line:03d}",
+                'quotation_id': quotation_id,
+                'line_number': line,
+                'item_code': f"LT-{line:03d}",
+                'item_name_en': f"Load test item {line}",
+                'quantity': quantity,
+                'standard_price': price,
+                'selling_price': price,
+                'discount_rate': 0,
+                'unit_price': price,
+                'amount': price * quantity,
+                'created_at': now,
+                'updated_at': now,
+            })
+
+    # 승인 처리: 승인 페이지 → 대기 목록 조회 → 첫 건 승인
+    def flow_approval(self):
+        error = self._page('approval_management')
+        return error or self._step('action:process_approval', self._process_approval)
+
+    def _process_approval(self):
+        manager = self._manager('expense_request')
+        pending = manager.get_pending_approvals(self.user_id)
+        if pending:
+            target = pending[self.rng.randrange(len(pending))]
+            manager.process_approval(target['approval_id'], self.user_id, '승인', 'load test')
+
+    # 지출요청: 요청 페이지 → 요청 제출 (다른 가상 사용자가 승인자)
+    def flow_expense(self):
+        error = self._page('expense_request_management')
+        return error or self._step('action:create_expense_request', self._create_expense_request)
+
+    def _create_expense_request(self):
+        manager = self._manager('expense_request')
+        approver_index = self.rng.randrange(self.user_count)
+        manager.create_expense_request({
+            'requester_id': self.user_id,
+            'requester_name': self.session.user_name,
+            'expense_title': 'Load test expense',
+            'category': '기타',
+            'amount': round(self.rng.uniform(100_000, 20_000_000), 0),
+            'currency': 'VND',
+            'expected_date': (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d'),
+            'expense_description': 'load-test',
+            'first_approver': {
+                'approver_id': f"loadtest_{approver_index:03d}",
+                'approver_name': f"Load Test {approver_index:03d}",
+            },
+        })
+
+    def flow_dashboard(self):
+        return self._page('dashboard')
+
+    def run(self, flow_mix, stop_at=None, iterations=None, think_time=(0.2, 1.0)):
+        """흐름 반복 실행 (stop_at 시각 또는 iterations 횟수까지)"""
+        self.login()
+        flows, weights = zip(*flow_mix.items())
+        count = 0
+        while True:
+            if iterations is not None and count >= iterations:
+                break
+            if stop_at is not None and time.perf_counter() >= stop_at:
+                break
+            flow = self.rng.choices(flows, weights=weights, k=1)[0]
+            start = time.perf_counter()
+            try:
+                error = getattr(self, f"flow_{flow}")()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            self.metrics.record_flow(flow, (time.perf_counter() - start) * 1000, error)
+            count += 1
+            if think_time:
+                time.sleep(self.rng.uniform(*think_time))
+
+
+# ----------------------------------------------------------------------
+# 실행 / 보고서
+# ----------------------------------------------------------------------
+def run_load_test(users=30, duration=60.0, iterations=None, ramp_up=5.0, seed=42,
+                  flow_mix=None, think_time=(0.2, 1.0), rows=200, synthetic_profile=None,
+                  workspace=None):
+    """부하 테스트 실행 후 보고서 딕셔너리 반환
+
+    DATABASE_URL이 설정되어 있으면 PostgreSQL 백엔드를, 없으면 작업 디렉토리의
+    SQLite(erp_system.db 사본)를 사용합니다.
+    """
+    from scripts import headless_streamlit
+
+    flow_mix = flow_mix or dict(DEFAULT_FLOW_MIX)
+    backend = 'postgresql' if os.getenv('DATABASE_URL') else 'sqlite'
+    workspace = prepare_workspace(workspace)
+    original_cwd = os.getcwd()
+    os.chdir(workspace)
+
+    metrics = LoadMetrics()
+    restorers = []
+    try:
+        st = headless_streamlit.install()
+        login_as_master(st)
+        import app
+        headless_streamlit.render(app.initialize_session_state)
+        login_as_master(st)
+
+        if backend == 'sqlite':
+            db_path = os.path.join(workspace, 'erp_system.db')
+            from config.database_config import ManagerFactory, MANAGER_REGISTRY
+            for key in MANAGER_REGISTRY:
+                headless_streamlit.render(ManagerFactory.get_manager, key)
+            bootstrap_sqlite_schema(db_path)
+            if synthetic_profile:
+                from scripts.synthetic_data_generator import (
+                    PROFILES, SyntheticDataGenerator, SQLiteBulkLoader, load_dataset
+                )
+                load_dataset(SyntheticDataGenerator(PROFILES[synthetic_profile], seed=seed),
+                             SQLiteBulkLoader(db_path))
+            seed_sqlite_database(db_path, rows=rows, seed=seed)
+            restorers.append(instrument_sqlite(metrics))
+            pool_info = None
+        else:
+            pool_info, restore = instrument_postgresql(metrics)
+            restorers.append(restore)
+
+        rng = random.Random(seed)
+        virtual_users = [VirtualUser(i, users, app, st, metrics, random.Random(rng.random()))
+                         for i in range(users)]
+        start = time.perf_counter()
+        stop_at = start + duration if iterations is None else None
+        threads = []
+        for i, user in enumerate(virtual_users):
+            thread = threading.Thread(
+                target=user.run, name=f"vu-{i:03d}",
+                kwargs={'flow_mix': flow_mix, 'stop_at': stop_at,
+                        'iterations': iterations, 'think_time': think_time},
+                daemon=True,
+            )
+            threads.append(thread)
+            thread.start()
+            if ramp_up and users > 1:
+                time.sleep(ramp_up / users)
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        return build_report(metrics, backend, pool_info, {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'backend': backend,
+            'users': users,
+            'duration_s': round(elapsed, 2),
+            'iterations_per_user': iterations,
+            'ramp_up_s': ramp_up,
+            'think_time_s': list(think_time) if think_time else None,
+            'flow_mix': flow_mix,
+            'seed': seed,
+            'synthetic_profile': synthetic_profile,
+        })
+    finally:
+        for restore in restorers:
+            restore()
+        os.chdir(original_cwd)
+
+
+def build_report(metrics, backend, pool_info, meta):
+    """측정값을 보고서 딕셔너리로 정리"""
+    total_flows = sum(len(v) for v in metrics.flow_latencies.values())
+    report = {
+        'meta': meta,
+        'throughput_flows_per_s': round(total_flows / meta['duration_s'], 2) if meta['duration_s'] else None,
+        'flows': {},
+        'steps': {name: summarize_latencies(samples)
+                  for name, samples in sorted(metrics.step_latencies.items())},
+    }
+    for flow, samples in sorted(metrics.flow_latencies.items()):
+        summary = summarize_latencies(samples)
+        errors = metrics.flow_errors.get(flow, {})
+        summary['errors'] = sum(errors.values())
+        summary['error_rate'] = round(summary['errors'] / len(samples), 4)
+        if errors:
+            summary['top_errors'] = sorted(errors.items(), key=lambda x: -x[1])[:5]
+        report['flows'][flow] = summary
+
+    if backend == 'sqlite':
+        writes = metrics.sqlite_writes
+        contended = [ms for ms in writes if ms >= LOCK_WAIT_THRESHOLD_MS]
+        report['sqlite_locks'] = {
+            'write_statements': summarize_latencies(writes),
+            'contended_writes': len(contended),
+            'contended_ratio': round(len(contended) / len(writes), 4) if writes else 0,
+            'contended_wait_ms_total': round(sum(contended), 1),
+            'lock_threshold_ms': LOCK_WAIT_THRESHOLD_MS,
+            'database_locked_errors': metrics.sqlite_lock_errors,
+        }
+    else:
+        pool = {'acquire': summarize_latencies(metrics.pool_acquire)}
+        if pool_info:
+            manager_class, before = pool_info
+            with manager_class._stats_lock:
+                after = dict(manager_class._pool_stats)
+            pool['stats_delta'] = {key: after.get(key, 0) - before.get(key, 0) for key in after}
+        report['postgresql_pool'] = pool
+    return report
+
+
+def format_report(report):
+    """콘솔 출력용 보고서 텍스트"""
+    meta = report['meta']
+    lines = [
+        f"📊 부하 테스트 결과 ({meta['backend']}, 사용자 {meta['users']}명, {meta['duration_s']}초)",
+        f"   처리량: {report['throughput_flows_per_s']} flows/s",
+        "",
+        f"{'흐름':<12}{'건수':>7}{'p50':>10}{'p90':>10}{'p95':>10}{'p99':>10}{'max':>10}{'오류':>7}",
+    ]
+    for flow, s in report['flows'].items():
+        lines.append(f"{flow:<12}{s['count']:>7}{s['p50_ms']:>10}{s['p90_ms']:>10}"
+                     f"{s['p95_ms']:>10}{s['p99_ms']:>10}{s['max_ms']:>10}{s['errors']:>7}")
+    if 'sqlite_locks' in report:
+        locks = report['sqlite_locks']
+        writes = locks['write_statements']
+        lines += [
+            "",
+            f"🔒 SQLite 쓰기 {writes.get('count', 0)}건, p95 {writes.get('p95_ms')}ms, "
+            f"경합(≥{locks['lock_threshold_ms']}ms) {locks['contended_writes']}건 "
+            f"({locks['contended_ratio'] * 100:.1f}%), 'database is locked' {locks['database_locked_errors']}건",
+        ]
+    if 'postgresql_pool' in report:
+        pool = report['postgresql_pool']
+        acquire = pool['acquire']
+        delta = pool.get('stats_delta', {})
+        lines += [
+            "",
+            f"🐘 연결 획득 {acquire.get('count', 0)}건, p95 {acquire.get('p95_ms')}ms, "
+            f"풀 고갈 대기 {delta.get('pool_exhausted_waits', 0)}건, "
+            f"대기 타임아웃 {delta.get('pool_wait_timeouts', 0)}건",
+        ]
+    return "\n".join(lines)
+
+
+def _parse_flow_mix(value):
+    """'quotation=40,dashboard=60' 형식 파싱"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_FLOW_MIX:
+            raise argparse.ArgumentTypeError(f"알 수 없는 흐름: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='YMV ERP 동시 사용자 부하 시뮬레이터')
+    parser.add_argument('--users', type=int, default=30, help='동시 가상 사용자 수')
+    parser.add_argument('--duration', type=float, default=60.0, help='실행 시간(초)')
+    parser.add_argument('--iterations', type=int, help='사용자당 흐름 반복 횟수 (지정 시 duration 무시)')
+    parser.add_argument('--ramp-up', type=float, default=5.0, help='전체 사용자 시작까지 걸리는 시간(초)')
+    parser.add_argument('--think-min', type=float, default=0.2, help='흐름 사이 최소 대기(초)')
+    parser.add_argument('--think-max', type=float, default=1.0, help='흐름 사이 최대 대기(초)')
+    parser.add_argument('--flows', type=_parse_flow_mix, help="흐름 비율 (예: quotation=40,approval=20)")
+    parser.add_argument('--rows', type=int, default=200, help='테이블당 시드 행 수')
+    parser.add_argument('--synthetic-profile', help='scripts/synthetic_data_generator 프로필로 추가 적재')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workspace', help='작업 디렉토리 (기본: 임시 디렉토리)')
+    parser.add_argument('--output', help='보고서 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        users=args.users,
+        duration=args.duration,
+        iterations=args.iterations,
+        ramp_up=args.ramp_up,
+        seed=args.seed,
+        flow_mix=args.flows,
+        think_time=(args.think_min, args.think_max),
+        rows=args.rows,
+        synthetic_profile=args.synthetic_profile,
+        workspace=args.workspace,
+    )
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 보고서 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+시작 시간 / 페이지 렌더 벤치마크
+- 스텁 Streamlit 런타임(scripts/headless_streamlit.py)과 시드된 SQLite DB로 app.py를 헤드리스 실행
+- app 모듈 import, 매니저 생성, 각 메뉴 페이지(show_page_for_menu), 각 대시보드 렌더 시간을 측정
+- 결과를 JSON으로 저장하고 기준(baseline) 결과 대비 회귀를 표시
+
+사용 예 (배포 전):
+    python -m scripts.startup_benchmark --output bench.json --baseline bench_baseline.json
+    python -m scripts.startup_benchmark --save-baseline bench_baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import sqlite3
+import argparse
+import platform
+import statistics
+import tempfile
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# 작업 디렉토리에 복사(쓰기 가능) / 링크(읽기 전용)할 경로
+COPY_DIRS = ('data',)
+LINK_DIRS = ('locales', 'languages', 'templates', 'static')
+
+
+def prepare_workspace(workspace=None):
+    """벤치마크 전용 작업 디렉토리 준비 (저장소 data/를 건드리지 않음)"""
+    workspace = workspace or tempfile.mkdtemp(prefix='erp_bench_')
+    os.makedirs(workspace, exist_ok=True)
+    for name in COPY_DIRS:
+        src = os.path.join(REPO_ROOT, name)
+        dst = os.path.join(workspace, name)
+        if os.path.isdir(src) and not os.path.exists(dst):
+            shutil.copytree(src, dst)
+    for name in LINK_DIRS:
+        src = os.path.join(REPO_ROOT, name)
+        dst = os.path.join(workspace, name)
+        if os.path.isdir(src) and not os.path.exists(dst):
+            try:
+                os.symlink(src, dst, target_is_directory=True)
+            except OSError:
+                shutil.copytree(src, dst)
+    return workspace
+
+
+def _seed_value(column, col_type, row_index, rng, base_date):
+    """컬럼 이름/타입에 맞는 결정적 시드 값"""
+    name = column.lower()
+    col_type = (col_type or '').upper()
+    if 'date' in name or name.endswith('_at'):
+        return (base_date - timedelta(days=rng.randint(0, 720))).strftime('%Y-%m-%d')
+    if 'currency' in name:
+        return rng.choice(['VND', 'USD', 'KRW'])
+    if 'status' in name:
+        return rng.choice(['active', 'draft', 'approved', 'pending'])
+    if 'INT' in col_type:
+        return rng.randint(0, 1000)
+    if any(t in col_type for t in ('REAL', 'FLOA', 'DOUB', 'NUM', 'DEC')):
+        return round(rng.uniform(1, 100000), 2)
+    return f"{column}_{row_index:06d}"
+
+
+def bootstrap_sqlite_schema(db_path):
+    """레거시 DatabaseManager 스키마 생성 (employees, customers, expense_approvals 등)
+
+    레지스트리 매니저 DDL에 없는 테이블이라 시드 전에 만들지 않으면 페이지가 DB 오류만 남기고
+    빈 화면으로 끝남 (scripts/synthetic_data_generator.py의 init_schemas와 동일)
+    """
+    from managers.legacy.database_manager import DatabaseManager
+
+    DatabaseManager(db_path=db_path)
+
+
+def seed_sqlite_database(db_path, rows=200, seed=42):
+    """모든 테이블에 결정적 시드 행 삽입 (테이블 스키마는 매니저 DDL 기준)"""
+    rng = random.Random(seed)
+    base_date = datetime(2025, 1, 1)
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        tables = [row[0] for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        seeded = {}
+        for table in tables:
+            columns = cursor.execute(f'PRAGMA table_info("{table}")').fetchall()
+            # INTEGER PRIMARY KEY(자동 증가)는 제외
+            insert_cols = [c for c in columns if not (c[5] and 'INT' in (c[2] or '').upper())]
+            if not insert_cols:
+                continue
+            names = ', '.join(f'"{c[1]}"' for c in insert_cols)
+            placeholders = ', '.join('?' for _ in insert_cols)
+            values = [
+                tuple(_seed_value(c[1], c[2], i, rng, base_date) for c in insert_cols)
+                for i in range(rows)
+            ]
+            try:
+                cursor.executemany(
+                    f'INSERT OR IGNORE INTO "{table}" ({names}) VALUES ({placeholders})', values
+                )
+                seeded[table] = cursor.rowcount
+            except sqlite3.Error as e:
+                seeded[table] = f"error: {e}"
+        conn.commit()
+        return seeded
+    finally:
+        conn.close()
+
+
+def _summarize(samples_ms, status='ok', error=None):
+    """측정값 요약 (ms)"""
+    summary = {
+        'status': status,
+        'runs': len(samples_ms),
+        'min_ms': round(min(samples_ms), 3) if samples_ms else None,
+        'median_ms': round(statistics.median(samples_ms), 3) if samples_ms else None,
+        'mean_ms': round(statistics.mean(samples_ms), 3) if samples_ms else None,
+        'max_ms': round(max(samples_ms), 3) if samples_ms else None,
+    }
+    if error:
+        summary['error'] = error
+    return summary
+
+
+def _timed(func, repeat, require_output=False):
+    """func를 repeat회 실행해 ms 단위 측정값과 상태 반환 (한 번이라도 실패하면 첫 실패 상태)"""
+    from scripts.headless_streamlit import render, FAILED_STATUSES
+
+    samples, status, error = [], 'ok', None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_status, run_error = render(func, require_output=require_output)
+        samples.append((time.perf_counter() - start) * 1000)
+        if status not in FAILED_STATUSES:
+            status, error = run_status, run_error
+    return _summarize(samples, status, error)
+
+
+def login_as_master(st):
+    """벤치마크 세션을 마스터로 로그인 상태로 설정"""
+    st.session_state.logged_in = True
+    st.session_state.user_id = 'master'
+    st.session_state.user_type = 'master'
+    st.session_state.login_type = 'master'
+    st.session_state.access_level = 'master'
+    st.session_state.language = 'ko'
+    st.session_state.selected_system = 'dashboard'
+
+
+def bench_managers(repeat):
+    """매니저 생성 시간 (메모이제이션 없이 매번 새 인스턴스 - DDL 포함)"""
+    from config.database_config import ManagerFactory, MANAGER_REGISTRY
+
+    results = {}
+    for key in MANAGER_REGISTRY:
+        def construct(key=key):
+            ManagerFactory.get_manager_class(key, 'sqlite')()
+        results[key] = _timed(construct, repeat)
+    return results
+
+
+def bench_pages(app, st, repeat):
+    """각 메뉴 페이지 렌더 시간 (show_page_for_menu 경유)"""
+    from config_files.ui_config import SIDEBAR_MENU_STRUCTURE, INDIVIDUAL_PAGES
+
+    results = {}
+    for menu_key in list(SIDEBAR_MENU_STRUCTURE) + list(INDIVIDUAL_PAGES):
+        if menu_key in results:
+            continue
+
+        def render_page(menu_key=menu_key):
+            st.session_state.selected_system = menu_key
+            app.show_page_for_menu(menu_key)
+
+        results[menu_key] = _timed(render_page, repeat, require_output=True)
+    return results
+
+
+def bench_dashboards(app, repeat):
+    """pages/menu_dashboard.py의 show_*_dashboard 렌더 시간"""
+    import pages.menu_dashboard as menu_dashboard
+    from config.database_config import ManagerFactory
+
+    def safe_manager(key):
+        try:
+            return ManagerFactory.get_manager(key, 'sqlite')
+        except Exception as e:
+            print(f"⚠️ {key} 매니저 생성 실패: {e}")
+            return None
+
+    managers = {
+        f'{key}_manager': safe_manager(key)
+        for key in ('employee', 'customer', 'product', 'supplier', 'business_process',
+                    'approval', 'exchange_rate', 'sales_product', 'vacation',
+                    'system_config', 'quotation', 'order', 'shipping', 'cash_flow')
+    }
+    managers['supply_product_manager'] = None
+
+    results = {}
+    for name in sorted(dir(menu_dashboard)):
+        func = getattr(menu_dashboard, name)
+        if not (name.startswith('show_') and name.endswith('_dashboard') and callable(func)):
+            continue
+
+        def render_dashboard(func=func):
+            func(managers, None, app.get_text)
+
+        results[name] = _timed(render_dashboard, repeat, require_output=True)
+    return results
+
+
+def run_benchmark(rows=200, repeat=3, seed=42, workspace=None):
+    """전체 벤치마크 실행 후 결과 딕셔너리 반환"""
+    from scripts import headless_streamlit
+
+    workspace = prepare_workspace(workspace)
+    os.environ.pop('DATABASE_URL', None)
+    original_cwd = os.getcwd()
+    os.chdir(workspace)
+
+    try:
+        st = headless_streamlit.install()
+        login_as_master(st)
+
+        # 1. app 모듈 import (콜드 스타트)
+        start = time.perf_counter()
+        import app
+        import_ms = (time.perf_counter() - start) * 1000
+
+        # 2. 매니저 생성 (DDL) + 시드 데이터
+        managers = bench_managers(repeat)
+        db_path = os.path.join(workspace, 'erp_system.db')
+        bootstrap_sqlite_schema(db_path)
+        seeded = seed_sqlite_database(db_path, rows=rows, seed=seed)
+
+        # 3. 세션 초기화 후 페이지/대시보드 렌더
+        headless_streamlit.render(app.initialize_session_state)
+        login_as_master(st)
+        pages = bench_pages(app, st, repeat)
+        dashboards = bench_dashboards(app, repeat)
+
+        return {
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'rows_per_table': rows,
+                'repeat': repeat,
+                'seed': seed,
+                'seeded_tables': len(seeded),
+                'widget_calls': st.widget_calls,
+            },
+            'results': {
+                'startup': {'import_app': _summarize([import_ms])},
+                'managers': managers,
+                'pages': pages,
+                'dashboards': dashboards,
+            },
+        }
+    finally:
+        os.chdir(original_cwd)
+
+
+def compare_with_baseline(current, baseline, tolerance=0.25, min_delta_ms=5.0):
+    """기준 결과 대비 회귀 목록 반환
+
+    중앙값이 기준보다 tolerance 비율 이상, 그리고 min_delta_ms 이상 느려진 항목과
+    기준에서 정상이던 항목이 오류로 바뀐 경우를 회귀로 판단합니다.
+    """
+    from scripts.headless_streamlit import FAILED_STATUSES
+
+    regressions = []
+    for group, items in current.get('results', {}).items():
+        base_items = baseline.get('results', {}).get(group, {})
+        for name, result in items.items():
+            base = base_items.get(name)
+            if not base:
+                continue
+            if base.get('status') not in FAILED_STATUSES and result.get('status') in FAILED_STATUSES:
+                regressions.append({
+                    'group': group, 'name': name, 'kind': 'error',
+                    'error': result.get('error'),
+                })
+                continue
+            cur_ms, base_ms = result.get('median_ms'), base.get('median_ms')
+            if cur_ms is None or base_ms is None:
+                continue
+            if cur_ms - base_ms >= min_delta_ms and cur_ms > base_ms * (1 + tolerance):
+                regressions.append({
+                    'group': group, 'name': name, 'kind': 'slower',
+                    'baseline_ms': base_ms, 'current_ms': cur_ms,
+                    'ratio': round(cur_ms / base_ms, 2) if base_ms else None,
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='YMV ERP 시작/렌더 벤치마크')
+    parser.add_argument('--rows', type=int, default=200, help='테이블당 시드 행 수')
+    parser.add_argument('--repeat', type=int, default=3, help='항목별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='시드 데이터 난수 시드')
+    parser.add_argument('--workspace', help='작업 디렉토리 (기본: 임시 디렉토리)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--save-baseline', help='이번 결과를 기준 결과로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 지연 비율 (기본 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help='회귀로 볼 최소 지연 (ms)')
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(rows=args.rows, repeat=args.repeat, seed=args.seed,
+                           workspace=args.workspace)
+
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        result['regressions'] = compare_with_baseline(
+            result, baseline, tolerance=args.tolerance, min_delta_ms=args.min_delta_ms
+        )
+
+    payload = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        print(f"✅ 벤치마크 결과 저장: {args.output}")
+    else:
+        print(payload)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        print(f"✅ 기준 결과 저장: {args.save_baseline}")
+
+    regressions = result.get('regressions', [])
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}건 감지")
+        for item in regressions:
+            if item['kind'] == 'error':
+                print(f"  - [{item['group']}] {item['name']}: 오류 발생 ({item['error']})")
+            else:
+                print(f"  - [{item['group']}] {item['name']}: "
+                      f"{item['baseline_ms']}ms → {item['current_ms']}ms (x{item['ratio']})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
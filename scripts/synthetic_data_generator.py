@@ -0,0 +1,736 @@
+#!/usr/bin/env python3
+"""
+부하 테스트용 합성 데이터 생성기
+- 운영 규모(고객 5만, 견적 품목 50만, 5년치 현금 거래 등)의 결정적(seed 고정) 데이터셋 생성
+- 스키마는 SQLite/PostgreSQL 매니저의 실제 DDL을 실행한 뒤 DB에서 직접 읽어 사용
+- 외래키 일관성 유지 (견적 → 고객/제품/영업담당, 매출 → 견적, 휴가 → 직원)
+- executemany / execute_values 배치 삽입으로 적재
+
+주의: 운영 DB에는 절대 사용하지 마세요 (더미 데이터 금지 정책).
+기본 대상은 별도 파일(erp_system_synthetic.db)이며 운영 DB 경로는 --force 없이는 거부합니다.
+
+사용 예:
+    python -m scripts.synthetic_data_generator --profile production --db erp_system_synthetic.db
+    python -m scripts.synthetic_data_generator --profile dev --customers 2000 --seed 7
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import sqlite3
+import argparse
+import itertools
+from bisect import bisect_left
+from datetime import date, timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_DB_PATH = 'erp_system_synthetic.db'
+PROTECTED_DB_PATHS = {'erp_system.db'}
+
+# 데이터 규모 프로필
+PROFILES = {
+    'dev': {
+        'employees': 40,
+        'customers': 1_000,
+        'products': 2_000,
+        'quotations': 5_000,
+        'avg_items_per_quotation': 5,
+        'years': 2,
+        'cash_transactions_per_day': 10,
+        'vacation_requests': 400,
+    },
+    'production': {
+        'employees': 150,
+        'customers': 50_000,
+        'products': 20_000,
+        'quotations': 100_000,
+        'avg_items_per_quotation': 5,
+        'years': 5,
+        'cash_transactions_per_day': 60,
+        'vacation_requests': 8_000,
+    },
+}
+
+DEPARTMENTS = ['영업', '기술', '총무', '회계', '생산', '물류']
+POSITIONS = ['사원', '주임', '대리', '과장', '차장', '부장']
+CITIES = [
+    ('Vietnam', 'Hanoi'), ('Vietnam', 'Ho Chi Minh'), ('Vietnam', 'Hai Phong'),
+    ('Vietnam', 'Bac Ninh'), ('Vietnam', 'Binh Duong'), ('Vietnam', 'Dong Nai'),
+    ('Vietnam', 'Da Nang'), ('Korea', 'Seoul'), ('Korea', 'Incheon'), ('China', 'Shenzhen'),
+]
+BUSINESS_TYPES = ['사출', '금형', '자동차부품', '전자', '포장', '가전', '의료기기']
+COMPANY_WORDS = ['Viet', 'Sai Gon', 'Hoa Phat', 'Minh', 'Tan', 'Phu', 'An', 'Thanh', 'Dong', 'Kim',
+                 'Han', 'Sung', 'Dae', 'Mirae', 'Plastic', 'Mold', 'Tech', 'Precision', 'Vina', 'Global']
+VN_SURNAMES = ['Nguyễn', 'Trần', 'Lê', 'Phạm', 'Hoàng', 'Vũ', 'Đặng', 'Bùi', 'Đỗ', 'Lưu']
+VN_NAMES = ['Văn An', 'Thị Hằng', 'Trung Thành', 'Minh Tuấn', 'Thu Trang', 'Quốc Bảo', 'Ngọc Lan', 'Đức Anh']
+KR_SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤']
+KR_NAMES = ['충성', '민수', '지훈', '서연', '현우', '지민', '수빈', '도윤']
+
+# 제품 카테고리: (코드, 가격 로그 평균 USD, 로그 표준편차, 선택 가중치)
+CATEGORIES = [
+    ('HR', math.log(2500), 0.8, 30),
+    ('HRC', math.log(900), 0.6, 20),
+    ('MB', math.log(4000), 0.9, 10),
+    ('SPARE', math.log(60), 1.1, 35),
+    ('SERVICE', math.log(300), 0.7, 5),
+]
+QUOTATION_STATUSES = [('draft', 15), ('sent', 35), ('accepted', 30), ('rejected', 15), ('expired', 5)]
+CASH_CATEGORIES = {
+    'income': ['매출입금', '선수금', '이자수익', '기타수입'],
+    'expense': ['급여', '임대료', '자재구매', '운송비', '공과금', '세금', '출장비', '소모품'],
+}
+VACATION_TYPES = [('ANNUAL', 70), ('SICK', 15), ('PERSONAL', 10), ('EMERGENCY', 5)]
+# 기준 통화 대비 초기 환율 / 일간 변동성 (USD 기준)
+RATE_SEEDS = {'VND': (23000.0, 0.0015), 'KRW': (1180.0, 0.004), 'CNY': (6.5, 0.002),
+              'EUR': (0.85, 0.004), 'JPY': (110.0, 0.004)}
+
+
+def _weighted(rng, choices):
+    """(값, 가중치) 목록에서 하나 선택"""
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+class _CumulativePicker:
+    """인덱스별 가중치(파레토/지프) 기반 O(log n) 선택기"""
+
+    def __init__(self, weights):
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+
+    def pick(self, rng):
+        return bisect_left(self.cumulative, rng.random() * self.total)
+
+
+class SyntheticDataGenerator:
+    """결정적 합성 데이터 생성기 (모든 생성 메서드는 dict 행을 yield)"""
+
+    def __init__(self, volumes=None, seed=42, end_date=None):
+        self.volumes = dict(PROFILES['dev'])
+        self.volumes.update(volumes or {})
+        self.seed = seed
+        self.end_date = end_date or date(2025, 9, 30)
+        self.start_date = self.end_date - timedelta(days=365 * self.volumes['years'])
+        self.span_days = (self.end_date - self.start_date).days
+
+        rng = random.Random(seed)
+        self.employee_ids = [f"E{2000000 + i:07d}" for i in range(self.volumes['employees'])]
+        self.sales_rep_ids = self.employee_ids[:max(1, len(self.employee_ids) // 4)]
+        self.customer_ids = [f"C{i + 1:06d}" for i in range(self.volumes['customers'])]
+        self.product_codes = [f"P{i + 1:06d}" for i in range(self.volumes['products'])]
+        # 소수 고객/제품에 거래가 집중되는 분포
+        self._customer_picker = _CumulativePicker(
+            [rng.paretovariate(1.2) for _ in self.customer_ids])
+        self._product_picker = _CumulativePicker(
+            [1.0 / (rank + 1) ** 0.9 for rank in range(len(self.product_codes))])
+        self._product_info = {}
+        self._customer_names = {}
+        self._rates = self._build_rate_paths(random.Random(seed + 1))
+
+    # ------------------------------------------------------------------
+    # 공통 도우미
+    # ------------------------------------------------------------------
+    def _rng(self, stream):
+        """엔티티별 독립 난수열 (엔티티 순서와 무관하게 결정적)"""
+        return random.Random(f"{self.seed}:{stream}")
+
+    def _random_day(self, rng):
+        """기간 내 날짜 (주말 가중치 낮음)"""
+        while True:
+            day = self.start_date + timedelta(days=rng.randrange(self.span_days + 1))
+            if day.weekday() < 5 or rng.random() < 0.15:
+                return day
+
+    def _build_rate_paths(self, rng):
+        """통화별 일간 USD 환율 랜덤워크 {통화: [일자별 환율]}"""
+        paths = {}
+        for currency, (initial, volatility) in RATE_SEEDS.items():
+            rate, path = initial, []
+            for _ in range(self.span_days + 1):
+                rate *= math.exp(rng.gauss(0.00005, volatility))
+                path.append(rate)
+            paths[currency] = path
+        paths['USD'] = [1.0] * (self.span_days + 1)
+        return paths
+
+    def usd_rate(self, currency, day):
+        """해당 일자의 1 USD 당 통화 환율"""
+        index = min(max((day - self.start_date).days, 0), self.span_days)
+        return self._rates.get(currency, self._rates['USD'])[index]
+
+    def _person_name(self, rng):
+        if rng.random() < 0.7:
+            return f"{rng.choice(VN_SURNAMES)} {rng.choice(VN_NAMES)}"
+        return f"{rng.choice(KR_SURNAMES)}{rng.choice(KR_NAMES)}"
+
+    # ------------------------------------------------------------------
+    # 마스터 데이터
+    # ------------------------------------------------------------------
+    def employees(self):
+        rng = self._rng('employees')
+        for i, employee_id in enumerate(self.employee_ids):
+            name = self._person_name(rng)
+            hire = self.start_date - timedelta(days=rng.randrange(0, 3650))
+            yield {
+                'employee_id': employee_id,
+                'name': name,
+                'english_name': name,
+                'email': f"{employee_id.lower()}@yumold.test",
+                'phone': f"09{rng.randrange(10**7, 10**8)}",
+                'position': rng.choice(POSITIONS),
+                'department': '영업' if employee_id in self.sales_rep_ids else rng.choice(DEPARTMENTS),
+                'hire_date': hire.isoformat(),
+                'status': 'active' if rng.random() < 0.92 else 'inactive',
+                'region': rng.choice(CITIES)[1],
+                'access_level': 'admin' if i % 20 == 0 else 'user',
+                'work_status': '재직',
+                'created_date': hire.isoformat(),
+                'updated_date': hire.isoformat(),
+            }
+
+    def customers(self):
+        rng = self._rng('customers')
+        for customer_id in self.customer_ids:
+            country, city = rng.choice(CITIES)
+            company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {customer_id[1:]} Co., Ltd"
+            created = self._random_day(rng).isoformat()
+            self._customer_names[customer_id] = company
+            yield {
+                'customer_id': customer_id,
+                'company_name': company,
+                'contact_person': self._person_name(rng),
+                'email': f"contact@{customer_id.lower()}.test",
+                'phone': f"02{rng.randrange(10**7, 10**8)}",
+                'country': country,
+                'city': city,
+                'address': f"{rng.randrange(1, 500)} Industrial Zone, {city}",
+                'business_type': rng.choice(BUSINESS_TYPES),
+                'status': 'active' if rng.random() < 0.9 else 'inactive',
+                'notes': '',
+                'created_date': created,
+                'updated_date': created,
+            }
+
+    def master_products(self):
+        rng = self._rng('products')
+        for i, code in enumerate(self.product_codes):
+            category, mu, sigma, _ = _weighted(rng, [(c, c[3]) for c in CATEGORIES])
+            price_usd = round(rng.lognormvariate(mu, sigma), 2)
+            cost_usd = round(price_usd * rng.uniform(0.45, 0.85), 2)
+            self._product_info[code] = (category, price_usd, cost_usd)
+            yield {
+                'master_product_id': f"MP{i + 1:07d}",
+                'product_id': f"MP{i + 1:07d}",
+                'product_code': code,
+                'product_name': f"{category} Item {code}",
+                'product_name_en': f"{category} Item {code}",
+                'product_name_vi': f"Sản phẩm {category} {code}",
+                'category_name': category,
+                'category': category,
+                'unit': 'EA',
+                'unit_price': price_usd,
+                'cost_price': cost_usd,
+                'currency': 'USD',
+                'status': 'active',
+                'created_date': self.start_date.isoformat(),
+                'updated_date': self.start_date.isoformat(),
+            }
+
+    def _customer_name(self, customer_id):
+        """고객사명 (customers()를 먼저 적재하지 않아도 동일한 값)"""
+        if customer_id not in self._customer_names:
+            for _ in self.customers():
+                pass
+        return self._customer_names[customer_id]
+
+    def _product(self, code):
+        """제품 정보 (master_products()를 먼저 적재하지 않아도 동일한 값)"""
+        if code not in self._product_info:
+            for _ in self.master_products():
+                pass
+        return self._product_info[code]
+
+    # ------------------------------------------------------------------
+    # 거래 데이터
+    # ------------------------------------------------------------------
+    def quotation_documents(self):
+        """(견적 헤더, 품목 목록, 월별 매출 행 목록) 튜플 생성"""
+        rng = self._rng('quotations')
+        avg_items = self.volumes['avg_items_per_quotation']
+        for i in range(self.volumes['quotations']):
+            quotation_id = f"Q{i + 1:08d}"
+            customer_id = self.customer_ids[self._customer_picker.pick(rng)]
+            customer_name = self._customer_name(customer_id)
+            sales_rep = rng.choice(self.sales_rep_ids)
+            quote_day = self._random_day(rng)
+            currency = _weighted(rng, [('VND', 55), ('USD', 40), ('KRW', 5)])
+            rate = self.usd_rate(currency, quote_day)
+            status = _weighted(rng, QUOTATION_STATUSES)
+            vat_percentage = 10.0
+
+            # 품목 수: 로그정규 (대형 금형 견적은 수십~수백 품목)
+            item_count = max(1, min(300, int(rng.lognormvariate(math.log(avg_items) - 0.3, 0.8))))
+            items, subtotal = [], 0.0
+            for line in range(1, item_count + 1):
+                code = self.product_codes[self._product_picker.pick(rng)]
+                category, price_usd, _ = self._product(code)
+                quantity = max(1, int(rng.lognormvariate(1.0, 1.0)))
+                discount = rng.choice([0, 0, 0, 5, 10, 15])
+                unit_price = round(price_usd * rate * (1 - discount / 100), 2)
+                amount = round(unit_price * quantity, 2)
+                subtotal += amount
+                items.append({
+                    'item_id': f"{quotation_id}-{line:03d}",
+                    'quotation_id': quotation_id,
+                    'line_number': line,
+                    'item_number': line,
+                    'source_product_code': code,
+                    'item_code': code,
+                    'product_code': code,
+                    'item_name_en': f"{category} Item {code}",
+                    'item_name_vn': f"Sản phẩm {category} {code}",
+                    'product_name': f"{category} Item {code}",
+                    'quantity': quantity,
+                    'standard_price': round(price_usd * rate, 2),
+                    'selling_price': unit_price,
+                    'discount_rate': discount,
+                    'unit_price': unit_price,
+                    'amount': amount,
+                    'total_price': amount,
+                    'unit': 'EA',
+                    'created_at': quote_day.isoformat(),
+                    'updated_at': quote_day.isoformat(),
+                    '_category': category,
+                })
+
+            subtotal = round(subtotal, 2)
+            vat_amount = round(subtotal * vat_percentage / 100, 2)
+            quotation = {
+                'quotation_id': quotation_id,
+                'quotation_number': f"YMV-Q{quote_day.strftime('%y%m%d')}-{i + 1:06d}",
+                'customer_id': customer_id,
+                'quote_date': quote_day.isoformat(),
+                'quotation_date': quote_day.isoformat(),
+                'valid_date': (quote_day + timedelta(days=30)).isoformat(),
+                'delivery_date': (quote_day + timedelta(days=rng.randrange(14, 90))).isoformat(),
+                'revision_number': '00',
+                'currency': currency,
+                'exchange_rate': round(rate, 4),
+                'customer_company': customer_name,
+                'customer_company_name': customer_name,
+                'vat_percentage': vat_percentage,
+                'subtotal_excl_vat': subtotal,
+                'vat_amount': vat_amount,
+                'total_incl_vat': round(subtotal + vat_amount, 2),
+                'total_amount': round(subtotal + vat_amount, 2),
+                'project_name': f"Project {rng.randrange(1, 5000):04d}",
+                'sales_representative': sales_rep,
+                'sales_rep_name': sales_rep,
+                'quotation_status': status,
+                'status': status,
+                'created_at': quote_day.isoformat(),
+                'updated_at': quote_day.isoformat(),
+                'created_date': quote_day.isoformat(),
+                'updated_date': quote_day.isoformat(),
+            }
+
+            sales = []
+            if status == 'accepted':
+                sales_day = min(quote_day + timedelta(days=rng.randrange(7, 60)), self.end_date)
+                vnd_rate = self.usd_rate('VND', sales_day)
+                for item in items:
+                    category, _, cost_usd = self._product(item['product_code'])
+                    amount_usd = item['amount'] / self.usd_rate(currency, sales_day)
+                    cost_amount = round(cost_usd * item['quantity'], 2)
+                    sales.append({
+                        'sales_id': f"S{item['item_id']}",
+                        'year_month': sales_day.strftime('%Y-%m'),
+                        'customer_id': customer_id,
+                        'customer_name': customer_name,
+                        'product_code': item['product_code'],
+                        'product_name': item['product_name'],
+                        'category': category,
+                        'quantity': item['quantity'],
+                        'unit_price': item['unit_price'],
+                        'total_amount': item['amount'],
+                        'currency': currency,
+                        'amount_vnd': round(amount_usd * vnd_rate, 0),
+                        'amount_usd': round(amount_usd, 2),
+                        'sales_date': sales_day.isoformat(),
+                        'quotation_id': quotation_id,
+                        'payment_status': 'paid' if rng.random() < 0.8 else 'pending',
+                        'sales_rep': sales_rep,
+                        'cost_amount': cost_amount,
+                        'profit_margin': round(1 - cost_amount / amount_usd, 4) if amount_usd else 0,
+                    })
+
+            for item in items:
+                item.pop('_category', None)
+            yield quotation, items, sales
+
+    def exchange_rates(self):
+        """일별 USD 기준 환율 (exchange_rates 테이블)"""
+        for offset in range(self.span_days + 1):
+            day = self.start_date + timedelta(days=offset)
+            for currency in RATE_SEEDS:
+                yield {
+                    'rate_id': f"R{day.strftime('%Y%m%d')}{currency}",
+                    'base_currency': 'USD',
+                    'target_currency': currency,
+                    'rate': round(self._rates[currency][offset], 6),
+                    'rate_date': day.isoformat(),
+                    'source': 'synthetic',
+                    'is_active': 1,
+                }
+
+    def yearly_management_rates(self):
+        """연도별 평균 환율 (yearly_management_rates 테이블)"""
+        for year in range(self.start_date.year, self.end_date.year + 1):
+            for currency in RATE_SEEDS:
+                values = [self._rates[currency][offset] for offset in range(self.span_days + 1)
+                          if (self.start_date + timedelta(days=offset)).year == year]
+                if not values:
+                    continue
+                yield {
+                    'management_rate_id': f"MR{year}{currency}",
+                    'year': year,
+                    'base_currency': 'USD',
+                    'target_currency': currency,
+                    'rate': round(sum(values) / len(values), 6),
+                    'source': 'synthetic',
+                    'description': f"{year} 평균 환율 (합성)",
+                    'is_active': 1,
+                }
+
+    def cash_transactions(self):
+        """기간 전체의 일별 현금 거래 (포아송 근사 건수)"""
+        rng = self._rng('cash')
+        per_day = self.volumes['cash_transactions_per_day']
+        sequence = 0
+        for offset in range(self.span_days + 1):
+            day = self.start_date + timedelta(days=offset)
+            weekday_factor = 1.0 if day.weekday() < 5 else 0.15
+            count = max(0, int(rng.gauss(per_day * weekday_factor, math.sqrt(per_day))))
+            for _ in range(count):
+                sequence += 1
+                transaction_type = 'income' if rng.random() < 0.4 else 'expense'
+                currency = _weighted(rng, [('VND', 80), ('USD', 18), ('KRW', 2)])
+                amount_usd = rng.lognormvariate(math.log(800), 1.4)
+                rate = self.usd_rate(currency, day)
+                counterparty = (self.customer_ids[self._customer_picker.pick(rng)]
+                                if transaction_type == 'income' else '')
+                yield {
+                    'transaction_id': f"T{sequence:09d}",
+                    'transaction_date': day.isoformat(),
+                    'transaction_type': transaction_type,
+                    'category': rng.choice(CASH_CATEGORIES[transaction_type]),
+                    'description': f"{transaction_type} #{sequence}",
+                    'amount': round(amount_usd * rate, 2),
+                    'currency': currency,
+                    'amount_vnd': round(amount_usd * self.usd_rate('VND', day), 0),
+                    'amount_usd': round(amount_usd, 2),
+                    'exchange_rate': round(rate, 6),
+                    'account_id': f"ACC-{currency}",
+                    'counterparty_id': counterparty,
+                    'status': 'completed',
+                    'created_by': rng.choice(self.employee_ids),
+                    'created_date': day.isoformat(),
+                }
+
+    def vacation_requests(self):
+        rng = self._rng('vacations')
+        for i in range(self.volumes['vacation_requests']):
+            employee_id = rng.choice(self.employee_ids)
+            start = self._random_day(rng)
+            days = max(1, int(rng.expovariate(1 / 2.0)))
+            yield {
+                'request_id': f"V{i + 1:07d}",
+                'vacation_id': f"V{i + 1:07d}",
+                'employee_id': employee_id,
+                'vacation_type': _weighted(rng, VACATION_TYPES),
+                'start_date': start.isoformat(),
+                'end_date': (start + timedelta(days=days - 1)).isoformat(),
+                'total_days': days,
+                'days_count': days,
+                'business_days': days,
+                'reason': '개인 사유',
+                'status': _weighted(rng, [('approved', 80), ('pending', 12), ('rejected', 8)]),
+                'created_date': (start - timedelta(days=rng.randrange(1, 30))).isoformat(),
+            }
+
+
+# ----------------------------------------------------------------------
+# 적재기
+# ----------------------------------------------------------------------
+class SQLiteBulkLoader:
+    """SQLite 적재기 - 실제 매니저 DDL로 스키마 생성 후 executemany 배치 삽입"""
+
+    backend = 'sqlite'
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, batch_size=5000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._columns = {}
+
+    def init_schemas(self):
+        from managers.sqlite.sqlite_quotation_manager import SQLiteQuotationManager
+        from managers.sqlite.sqlite_master_product_manager import SQLiteMasterProductManager
+        from managers.sqlite.sqlite_cash_transaction_manager import SQLiteCashTransactionManager
+        from managers.sqlite.sqlite_exchange_rate_manager import SQLiteExchangeRateManager
+        from managers.sqlite.sqlite_vacation_manager import SQLiteVacationManager
+        from managers.sqlite.sqlite_monthly_sales_manager import SQLiteMonthlySalesManager
+        from managers.legacy.database_manager import DatabaseManager
+
+        for manager_class in (SQLiteQuotationManager, SQLiteMasterProductManager,
+                              SQLiteCashTransactionManager, SQLiteExchangeRateManager,
+                              SQLiteVacationManager, SQLiteMonthlySalesManager):
+            manager_class(db_path=self.db_path)
+        # employees / customers 기본 스키마
+        DatabaseManager(db_path=self.db_path)
+
+    def table_columns(self, table):
+        """{컬럼: (NOT NULL 여부, 기본값 존재 여부, 타입)} - 자동 증가 PK 제외"""
+        if table not in self._columns:
+            with sqlite3.connect(self.db_path) as conn:
+                info = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+            self._columns[table] = {
+                row[1]: (bool(row[3]), row[4] is not None, (row[2] or '').upper())
+                for row in info
+                if not (row[5] and 'INT' in (row[2] or '').upper())
+            }
+        return self._columns[table]
+
+    def load(self, table, rows):
+        """행 이터러블을 배치로 삽입하고 삽입 건수 반환"""
+        columns = _insert_columns(self.table_columns(table), table)
+        if not columns:
+            return 0
+        names = ', '.join(f'"{c}"' for c in columns)
+        placeholders = ', '.join('?' for _ in columns)
+        sql = f'INSERT OR IGNORE INTO "{table}" ({names}) VALUES ({placeholders})'
+
+        total = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            for batch in _batched(rows, self.batch_size):
+                conn.executemany(sql, [_row_values(row, columns, self.table_columns(table)) for row in batch])
+                total += len(batch)
+            conn.commit()
+        finally:
+            conn.close()
+        return total
+
+
+class PostgreSQLBulkLoader:
+    """PostgreSQL 적재기 - PostgreSQL 매니저 DDL 실행 후 execute_values 배치 삽입"""
+
+    backend = 'postgresql'
+
+    def __init__(self, batch_size=5000):
+        self.batch_size = batch_size
+        self._columns = {}
+        self._manager = None
+
+    def init_schemas(self):
+        from managers.postgresql.postgresql_employee_manager import PostgreSQLEmployeeManager
+        from managers.postgresql.postgresql_customer_manager import PostgreSQLCustomerManager
+        from managers.postgresql.postgresql_quotation_manager import PostgreSQLQuotationManager
+        from managers.postgresql.postgresql_master_product_manager import PostgreSQLMasterProductManager
+        from managers.postgresql.postgresql_cash_transaction_manager import PostgreSQLCashTransactionManager
+        from managers.postgresql.postgresql_exchange_rate_manager import PostgreSQLExchangeRateManager
+        from managers.postgresql.postgresql_vacation_manager import PostgreSQLVacationManager
+        from managers.postgresql.postgresql_monthly_sales_manager import PostgreSQLMonthlySalesManager
+
+        for manager_class in (PostgreSQLEmployeeManager, PostgreSQLCustomerManager,
+                              PostgreSQLQuotationManager, PostgreSQLMasterProductManager,
+                              PostgreSQLCashTransactionManager, PostgreSQLExchangeRateManager,
+                              PostgreSQLVacationManager, PostgreSQLMonthlySalesManager):
+            self._manager = manager_class()
+
+    def table_columns(self, table):
+        if table not in self._columns:
+            conn = self._manager.get_connection()
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT column_name, is_nullable, column_default, data_type
+                        FROM information_schema.columns
+                        WHERE table_name = %s
+                    """, (table,))
+                    self._columns[table] = {
+                        name: (nullable == 'NO', default is not None, data_type.upper())
+                        for name, nullable, default, data_type in cursor.fetchall()
+                        if not (default or '').startswith('nextval(')
+                    }
+            finally:
+                self._manager.return_connection(conn)
+        return self._columns[table]
+
+    def load(self, table, rows):
+        import psycopg2.extras
+
+        table_columns = self.table_columns(table)
+        columns = _insert_columns(table_columns, table)
+        if not columns:
+            return 0
+        names = ', '.join(f'"{c}"' for c in columns)
+        sql = f'INSERT INTO "{table}" ({names}) VALUES %s ON CONFLICT DO NOTHING'
+
+        total = 0
+        conn = self._manager.get_connection()
+        try:
+            with conn.cursor() as cursor:
+                for batch in _batched(rows, self.batch_size):
+                    psycopg2.extras.execute_values(
+                        cursor, sql, [_row_values(row, columns, table_columns) for row in batch],
+                        page_size=self.batch_size
+                    )
+                    total += len(batch)
+            conn.commit()
+        finally:
+            self._manager.return_connection(conn)
+        return total
+
+
+# 생성 행 키와 테이블 컬럼 간 교집합이 이보다 적으면 스키마가 다른 테이블로 보고 건너뜀
+_MIN_MATCHING_COLUMNS = 2
+_generated_keys = {}
+
+
+def _insert_columns(table_columns, table):
+    """삽입할 컬럼 = 생성 행 키 ∩ 테이블 컬럼 + (기본값 없는 NOT NULL 컬럼)"""
+    keys = _generated_keys.get(table, set())
+    matching = [c for c in table_columns if c in keys]
+    if len([c for c in matching if c not in ('created_date', 'updated_date', 'status')]) < _MIN_MATCHING_COLUMNS:
+        print(f"⚠️ {table}: 생성 데이터와 스키마가 맞지 않아 건너뜀")
+        return []
+    required = [c for c, (not_null, has_default, _) in table_columns.items()
+                if not_null and not has_default and c not in keys]
+    return matching + required
+
+
+def _row_values(row, columns, table_columns):
+    values = []
+    for column in columns:
+        if column in row:
+            values.append(row[column])
+            continue
+        # 생성기에 없는 NOT NULL 컬럼: 타입별 기본값
+        col_type = table_columns[column][2]
+        if any(t in col_type for t in ('INT', 'REAL', 'NUM', 'DEC', 'FLOA', 'DOUB')):
+            values.append(0)
+        elif 'DATE' in col_type or 'TIME' in col_type:
+            values.append(row.get('created_date') or date.today().isoformat())
+        else:
+            values.append('')
+    return values
+
+
+def _batched(rows, size):
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _peek_keys(table, rows):
+    """첫 행을 읽어 키를 기록하고 원래 이터러블을 복원"""
+    iterator = iter(rows)
+    first = next(iterator, None)
+    if first is None:
+        return iter(())
+    _generated_keys[table] = set(first)
+    return itertools.chain([first], iterator)
+
+
+def load_dataset(generator, loader, log=print):
+    """생성기 → 적재기 전체 적재. {테이블: 건수} 반환"""
+    loader.init_schemas()
+    counts = {}
+
+    def run(table, rows):
+        start = time.perf_counter()
+        counts[table] = counts.get(table, 0) + loader.load(table, _peek_keys(table, rows))
+        log(f"✅ {table}: {counts[table]:,}건 ({time.perf_counter() - start:.1f}초)")
+
+    run('employees', generator.employees())
+    run('customers', generator.customers())
+    run('master_products', generator.master_products())
+    run('exchange_rates', generator.exchange_rates())
+    run('yearly_management_rates', generator.yearly_management_rates())
+
+    # 견적/품목/매출은 한 번의 순회로 생성해 세 테이블에 나눠 적재
+    start = time.perf_counter()
+    quotation_buffer, item_buffer, sales_buffer = [], [], []
+    totals = {'quotations': 0, 'quotation_items': 0, 'monthly_sales': 0}
+
+    def flush():
+        for table, buffer in (('quotations', quotation_buffer),
+                              ('quotation_items', item_buffer),
+                              ('monthly_sales', sales_buffer)):
+            if buffer:
+                totals[table] += loader.load(table, _peek_keys(table, buffer))
+                buffer.clear()
+
+    for quotation, items, sales in generator.quotation_documents():
+        quotation_buffer.append(quotation)
+        item_buffer.extend(items)
+        sales_buffer.extend(sales)
+        if len(item_buffer) >= loader.batch_size * 4:
+            flush()
+    flush()
+    counts.update(totals)
+    log(f"✅ quotations/items/sales: {totals['quotations']:,} / {totals['quotation_items']:,} / "
+        f"{totals['monthly_sales']:,}건 ({time.perf_counter() - start:.1f}초)")
+
+    run('cash_transactions', generator.cash_transactions())
+    run('vacation_requests', generator.vacation_requests())
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='YMV ERP 합성 데이터 생성기 (부하 테스트 전용)')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='dev')
+    parser.add_argument('--backend', choices=['sqlite', 'postgresql'], default='sqlite')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite 파일 경로')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--force', action='store_true', help='운영 DB 경로/PostgreSQL 적재 허용')
+    for key in PROFILES['dev']:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, dest=key,
+                            help=f"{key} (프로필 값 덮어쓰기)")
+    args = parser.parse_args(argv)
+
+    volumes = dict(PROFILES[args.profile])
+    volumes.update({key: getattr(args, key) for key in PROFILES['dev'] if getattr(args, key) is not None})
+
+    if args.backend == 'sqlite':
+        if os.path.basename(args.db) in PROTECTED_DB_PATHS and not args.force:
+            print(f"❌ {args.db}는 운영 DB입니다. 별도 파일을 지정하거나 --force를 사용하세요.")
+            return 1
+        loader = SQLiteBulkLoader(args.db, batch_size=args.batch_size)
+    else:
+        if not args.force:
+            print("❌ PostgreSQL 적재는 DATABASE_URL 대상 DB에 직접 씁니다. 테스트 DB 확인 후 --force를 사용하세요.")
+            return 1
+        loader = PostgreSQLBulkLoader(batch_size=args.batch_size)
+
+    print(f"🚀 합성 데이터 생성 시작 (profile={args.profile}, seed={args.seed}, backend={args.backend})")
+    print(f"   규모: {volumes}")
+    start = time.perf_counter()
+    counts = load_dataset(SyntheticDataGenerator(volumes, seed=args.seed), loader)
+    print(f"🎉 완료: 총 {sum(counts.values()):,}건, {time.perf_counter() - start:.1f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
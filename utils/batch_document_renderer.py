@@ -0,0 +1,426 @@
+"""
+문서 일괄 출력 서비스
+월말 견적서/송장/배송증 수백 건을 프로세스 풀에서 병렬 렌더링
+
+- 작업 프로세스 풀은 프로세스 안에서 한 번 만들어 재사용 (spawn 방식이라 fork 안전)
+- 작업 프로세스는 초기화 시 PDF 런타임(폰트, 문단 스타일)을 준비하고 PDF 설정을 한 번 전달받음
+  (크기/설정이 바뀌거나 풀이 깨지면 새 풀을 내주고, 이전 풀은 사용 중인 일괄 출력이 끝난 뒤 종료)
+- 저장된 견적서는 렌더링 캐시(utils.render_cache, 렌더링 버전 키)에 있으면 다시 렌더링하지 않음
+- 완료되는 순서대로 ZIP(또는 병합 PDF)에 기록해 메모리에 전체 결과를 쌓지 않음
+- progress_callback(완료 수, 전체 수, 문서 ID)으로 페이지에 진행률 전달
+"""
+
+import io
+import os
+import json
+import atexit
+import threading
+import zipfile
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from utils import render_cache
+from utils.document_renderer import (
+    QUOTATION_PRINT_TEMPLATE,
+    register_unicode_fonts,
+    load_pdf_settings,
+    build_quotation_context,
+    build_quotation_print_html,
+    build_document_context,
+    render_document_html,
+    render_pdf,
+)
+
+# 이 건수 이하면 프로세스 풀 없이 현재 프로세스에서 렌더링
+INLINE_THRESHOLD = 4
+
+_pool = None
+_pool_size = 0
+_pool_settings = None
+_pool_lock = threading.Lock()
+# 풀 → 사용 중인 일괄 출력 수 (교체된 풀은 0이 되면 종료)
+_pool_users = {}
+
+
+class BatchJob:
+    """일괄 출력 작업 1건 (문서 타입, 문서 ID, 렌더링 데이터)"""
+
+    __slots__ = ('doc_type', 'doc_id', 'data', 'items', 'file_name', 'version')
+
+    def __init__(self, doc_type, doc_id, data, items=None, file_name=None, version=None):
+        self.doc_type = doc_type
+        self.doc_id = doc_id
+        self.data = data
+        self.items = items
+        self.file_name = file_name or str(doc_id)
+        # 렌더링 캐시 버전 (저장된 견적서만, None이면 캐시 사용 안 함)
+        self.version = version
+
+
+def _job_file_name(quote, quotation_id):
+    customer = str(quote.get('customer_company') or '').replace(',', '').replace(' ', '_')
+    return f"{quote.get('quotation_number') or quotation_id} - {customer}".strip(' -')
+
+
+def _attach_versions(quotation_manager, jobs):
+    """SQLite 견적서 작업에 렌더링 버전 지정 (한 번에 조회)"""
+    db_path = getattr(quotation_manager, 'db_path', None)
+    if not jobs or not isinstance(db_path, str):
+        return jobs
+    try:
+        versions = render_cache.quotation_versions([job.doc_id for job in jobs], db_path)
+    except Exception as e:
+        print(f"렌더링 버전 조회 오류: {e}")
+        return jobs
+    for job in jobs:
+        job.version = versions.get(str(job.doc_id))
+    return jobs
+
+
+def load_quotation_jobs(quotation_manager, quotation_ids):
+    """견적서 ID 목록 → BatchJob 목록 (조회 실패 ID는 건너뜀)"""
+    # 일괄 로더가 있으면 헤더/품목을 한 연결에서 묶음 조회
+    if hasattr(quotation_manager, 'load_quotation_documents'):
+        documents = quotation_manager.load_quotation_documents(quotation_ids)
+        found = {document.quotation_id for document in documents}
+        for quotation_id in quotation_ids:
+            if quotation_id not in found:
+                print(f"견적서를 찾을 수 없음: {quotation_id}")
+        return _attach_versions(quotation_manager, [
+            BatchJob('quotation', document.quotation_id, document.header, document.items,
+                     _job_file_name(document.header, document.quotation_id))
+            for document in documents])
+
+    jobs = []
+    for quotation_id in quotation_ids:
+        try:
+            quote = quotation_manager.get_quotation_by_id(quotation_id)
+            if not quote:
+                print(f"견적서를 찾을 수 없음: {quotation_id}")
+                continue
+            items = quotation_manager.get_quotation_items(quotation_id)
+            if hasattr(items, 'to_dict'):
+                items = items.to_dict('records')
+            jobs.append(BatchJob('quotation', quotation_id, dict(quote), list(items or []),
+                                 _job_file_name(quote, quotation_id)))
+        except Exception as e:
+            print(f"견적서 로드 오류 ({quotation_id}): {e}")
+    return _attach_versions(quotation_manager, jobs)
+
+
+def _shipment_products(shipment):
+    """배송 products_json → 배송증 품목 (키 이름이 다른 견적 품목 형식도 허용)"""
+    try:
+        products = json.loads(shipment.get('products_json') or '[]')
+    except (TypeError, ValueError):
+        products = []
+    return [{
+        'product_name': product.get('product_name') or product.get('item_name_en')
+                        or product.get('item_name') or product.get('product_code') or '',
+        'quantity': product.get('quantity'),
+        'unit': product.get('unit') or '',
+        'packaging': product.get('packaging') or '',
+        'notes': product.get('notes') or product.get('remark') or '',
+    } for product in products if isinstance(product, dict)]
+
+
+def load_invoice_jobs(invoice_manager, invoice_ids):
+    """인보이스 ID 목록 → BatchJob 목록 (invoice 템플릿 필드로 변환)"""
+    invoices = invoice_manager.get_invoices()
+    if hasattr(invoices, 'to_dict'):
+        invoices = invoices.to_dict('records')
+    by_id = {invoice['invoice_id']: invoice for invoice in invoices or []}
+
+    jobs = []
+    for invoice_id in invoice_ids:
+        invoice = by_id.get(invoice_id)
+        if not invoice:
+            print(f"인보이스를 찾을 수 없음: {invoice_id}")
+            continue
+        try:
+            data = dict(invoice)
+            data.update({
+                'invoice_no': invoice.get('invoice_number'),
+                'date': invoice.get('issue_date'),
+                'customer_phone': invoice.get('customer_contact'),
+            })
+            items = invoice_manager.get_invoice_items(invoice_id)
+            if hasattr(items, 'to_dict'):
+                items = items.to_dict('records')
+            customer = str(invoice.get('customer_name') or '').replace(',', '').replace(' ', '_')
+            jobs.append(BatchJob('invoice', invoice_id, data, list(items or []),
+                                 f"{invoice.get('invoice_number') or invoice_id} - {customer}".strip(' -')))
+        except Exception as e:
+            print(f"인보이스 로드 오류 ({invoice_id}): {e}")
+    return jobs
+
+
+def load_delivery_note_jobs(shipping_manager, shipping_ids, quotation_manager=None):
+    """배송 ID 목록 → 배송증 BatchJob 목록
+
+    배송에 저장된 품목(products_json)이 없으면 연결된 견적서 품목을 사용합니다.
+    """
+    jobs = []
+    for shipping_id in shipping_ids:
+        try:
+            shipment = shipping_manager.get_shipment_by_id(shipping_id)
+            if not shipment:
+                print(f"배송 정보를 찾을 수 없음: {shipping_id}")
+                continue
+            items = _shipment_products(shipment)
+            if not items and quotation_manager is not None and shipment.get('quotation_id'):
+                quotation_items = quotation_manager.get_quotation_items(shipment['quotation_id'])
+                if hasattr(quotation_items, 'to_dict'):
+                    quotation_items = quotation_items.to_dict('records')
+                items = _shipment_products({'products_json': json.dumps(
+                    list(quotation_items or []), ensure_ascii=False, default=str)})
+            data = dict(shipment)
+            data.update({
+                'delivery_no': shipment.get('shipping_id'),
+                'delivery_date': shipment.get('delivery_date') or shipment.get('shipping_date'),
+                'delivery_address': shipment.get('customer_address'),
+                'carrier': shipment.get('shipping_company'),
+                'contact_phone': shipment.get('customer_contact'),
+            })
+            customer = str(shipment.get('customer_name') or '').replace(',', '').replace(' ', '_')
+            jobs.append(BatchJob('delivery_note', shipping_id, data, items,
+                                 f"{shipping_id} - {customer}".strip(' -')))
+        except Exception as e:
+            print(f"배송증 로드 오류 ({shipping_id}): {e}")
+    return jobs
+
+
+# 작업 프로세스에 초기화 시 전달된 PDF 설정
+_worker_settings = None
+
+
+def _init_worker(cwd, settings):
+    """작업 프로세스 초기화 - 작업 디렉토리, PDF 런타임 사전 준비, PDF 설정 보관"""
+    global _worker_settings
+    from utils.pdf_runtime import warm_up
+    os.chdir(cwd)
+    register_unicode_fonts()
+    warm_up()
+    _worker_settings = settings
+
+
+def _settings_signature(settings):
+    return json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _retire(pool):
+    """공유에서 빠진 풀 종료 - 사용 중이면 마지막 사용자가 반납할 때 종료 (잠금 보유 상태에서 호출)"""
+    if _pool_users.get(pool, 0) > 0:
+        return
+    _pool_users.pop(pool, None)
+    pool.shutdown(wait=False)
+
+
+def get_render_pool(max_workers=None, settings=None):
+    """공유 작업 프로세스 풀 (크기나 PDF 설정이 달라질 때만 새로 생성)
+
+    받은 풀은 사용이 끝나면 release_render_pool()로 반납합니다.
+    """
+    global _pool, _pool_size, _pool_settings
+    max_workers = max_workers or os.cpu_count() or 1
+    settings = settings if settings is not None else load_pdf_settings()
+    signature = _settings_signature(settings)
+    with _pool_lock:
+        if _pool is not None and (_pool_size != max_workers or _pool_settings != signature):
+            previous, _pool = _pool, None
+            _retire(previous)
+        if _pool is None:
+            # Streamlit 서버 스레드가 fork되지 않도록 spawn 사용
+            context = multiprocessing.get_context('spawn')
+            _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                        initializer=_init_worker, initargs=(os.getcwd(), settings))
+            _pool_size = max_workers
+            _pool_settings = signature
+        _pool_users[_pool] = _pool_users.get(_pool, 0) + 1
+        return _pool
+
+
+def release_render_pool(pool, broken=False):
+    """get_render_pool()로 받은 풀 반납 (broken이면 공유에서 빼서 다음 호출에 새 풀 생성)"""
+    global _pool, _pool_size
+    with _pool_lock:
+        _pool_users[pool] = max(_pool_users.get(pool, 0) - 1, 0)
+        if broken and _pool is pool:
+            _pool, _pool_size = None, 0
+        if pool is not _pool:
+            _retire(pool)
+
+
+def shutdown_render_pool():
+    """모든 작업 프로세스 풀 종료 (프로세스 종료 시)"""
+    global _pool, _pool_size
+    with _pool_lock:
+        pools = set(_pool_users) | ({_pool} if _pool is not None else set())
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pool_users.clear()
+        _pool, _pool_size = None, 0
+
+
+atexit.register(shutdown_render_pool)
+
+
+def _render_job(job, output_format, settings=None):
+    """작업 1건 렌더링 → (문서 ID, 파일명, bytes, 오류) - settings가 없으면 작업 프로세스 설정 사용"""
+    settings = settings if settings is not None else _worker_settings
+    try:
+        if job.doc_type == 'quotation':
+            if output_format == 'html':
+                content = build_quotation_print_html(job.data, job.items).encode('utf-8')
+            else:
+                content = render_pdf('quotation', build_quotation_context(job.data, job.items),
+                                     settings)
+        else:
+            data = dict(job.data)
+            if job.items is not None:
+                data['items'] = job.items
+            if output_format == 'html':
+                content = render_document_html(job.doc_type, data).encode('utf-8')
+            else:
+                content = render_pdf(job.doc_type, build_document_context(
+                    data, amount=job.doc_type != 'delivery_note'), settings)
+        return job.doc_id, f"{job.file_name}.{output_format}", content, None
+    except Exception as e:
+        return job.doc_id, None, None, f"{type(e).__name__}: {e}"
+
+
+def _cache_key(job, output_format, settings):
+    """렌더링 캐시 키 (버전이 없는 작업은 None) - HTML은 견적서 화면 인쇄('quotation_print')와 같은 키"""
+    if job.doc_type != 'quotation' or job.version is None:
+        return None
+    if output_format == 'html':
+        return render_cache.version_key('quotation_print', job.doc_id, job.version,
+                                        template=QUOTATION_PRINT_TEMPLATE)
+    return render_cache.version_key('quotation_pdf', job.doc_id, job.version, extra=settings)
+
+
+def _iter_results(indexed_jobs, output_format, max_workers, settings):
+    """완료 순서대로 (작업 순번, 렌더링 결과) 생성 - indexed_jobs: [(작업 순번, 작업)]"""
+    if not indexed_jobs:
+        return
+    if len(indexed_jobs) <= INLINE_THRESHOLD or max_workers == 1:
+        from utils.pdf_runtime import warm_up
+        warm_up()
+        for index, job in indexed_jobs:
+            yield index, _render_job(job, output_format, settings)
+        return
+
+    # 설정은 풀 초기화 시 한 번 전달 (작업마다 직렬화하지 않음)
+    executor = get_render_pool(max_workers, settings)
+    broken = False
+    try:
+        futures = {executor.submit(_render_job, job, output_format): index
+                   for index, job in indexed_jobs}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    except BrokenProcessPool:
+        # 작업 프로세스가 비정상 종료되면 다음 호출에서 새 풀 사용 (다른 일괄 출력은 영향 없음)
+        broken = True
+        raise
+    finally:
+        release_render_pool(executor, broken)
+
+
+def _merge_pdfs(parts):
+    """PDF 병합 (pypdf 필요) - 실패 시 None"""
+    try:
+        from pypdf import PdfWriter, PdfReader
+    except ImportError:
+        print("pypdf가 설치되지 않아 PDF 병합 대신 ZIP으로 출력합니다. (pip install pypdf)")
+        return None
+
+    writer = PdfWriter()
+    for content in parts:
+        for page in PdfReader(io.BytesIO(content)).pages:
+            writer.add_page(page)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def render_batch(jobs, output_format='pdf', bundle='zip', max_workers=None,
+                 progress_callback=None, settings=None):
+    """문서 일괄 렌더링
+
+    Args:
+        jobs: BatchJob 목록
+        output_format: 'pdf' 또는 'html'
+        bundle: 'zip' 또는 'merged' (PDF 한 파일로 병합, 입력 순서 유지)
+        max_workers: 프로세스 수 (기본: CPU 수, 공유 풀을 재사용하도록 건수와 무관하게 고정)
+        progress_callback: (완료 수, 전체 수, 문서 ID) 콜백
+
+    Returns:
+        dict: {'content': bytes, 'file_name': str, 'mime': str,
+               'rendered': int, 'errors': {문서 ID: 오류 메시지}}
+    """
+    settings = settings if settings is not None else load_pdf_settings()
+    max_workers = max_workers or os.cpu_count() or 1
+    merge = bundle == 'merged' and output_format == 'pdf'
+
+    # 캐시에 있는 견적서는 바로 기록하고 나머지만 렌더링
+    cached, pending, keys = [], [], {}
+    for index, job in enumerate(jobs):
+        try:
+            key = _cache_key(job, output_format, settings)
+            content = render_cache.get(job.doc_id, key, output_format) if key else None
+        except Exception as e:
+            print(f"렌더링 캐시 조회 오류 ({job.doc_id}): {e}")
+            key, content = None, None
+        if content is not None:
+            cached.append((index, (job.doc_id, f"{job.file_name}.{output_format}", content, None)))
+        else:
+            pending.append((index, job))
+            keys[index] = key
+
+    def results():
+        yield from cached
+        yield from _iter_results(pending, output_format, max_workers, settings)
+
+    errors, merged_parts, rendered = {}, {}, 0
+    with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as spool:
+        with zipfile.ZipFile(spool, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            used_names = set()
+            for done, (index, (doc_id, file_name, content, error)) in enumerate(results(), start=1):
+                if error:
+                    errors[doc_id] = error
+                else:
+                    rendered += 1
+                    if keys.get(index):
+                        try:
+                            render_cache.put(doc_id, keys[index], content, output_format)
+                        except Exception as e:
+                            print(f"렌더링 캐시 저장 오류 ({doc_id}): {e}")
+                    if merge:
+                        merged_parts[index] = content
+                    else:
+                        name = file_name
+                        suffix = 2
+                        while name in used_names:
+                            base, ext = os.path.splitext(file_name)
+                            name = f"{base} ({suffix}){ext}"
+                            suffix += 1
+                        used_names.add(name)
+                        archive.writestr(name, content)
+                if progress_callback:
+                    progress_callback(done, len(jobs), doc_id)
+
+            # 병합 PDF: 입력 순서대로 합치기 (실패 시 ZIP으로 대체)
+            merged = _merge_pdfs([merged_parts[i] for i in sorted(merged_parts)]) if merge else None
+            if merge and merged is None:
+                for index in sorted(merged_parts):
+                    archive.writestr(f"{jobs[index].file_name}.pdf", merged_parts[index])
+
+        if merged is not None:
+            return {'content': merged, 'file_name': 'documents.pdf', 'mime': 'application/pdf',
+                    'rendered': rendered, 'errors': errors}
+
+        spool.seek(0)
+        return {'content': spool.read(), 'file_name': f'documents_{output_format}.zip',
+                'mime': 'application/zip', 'rendered': rendered, 'errors': errors}
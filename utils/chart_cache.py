@@ -0,0 +1,247 @@
+"""
+분석 화면 차트 데이터 / 그림 캐시
+차트마다 데이터 조회(query)와 변환(transform)을 선언하고, 결과 데이터와 Plotly 그림(dict)을
+조회 지문(차트 이름 + 파라미터) + 데이터 버전으로 메모리에 캐싱
+
+- 데이터 버전: SQLite는 PRAGMA data_version(다른 연결의 커밋마다 바뀜), CSV 등은 파일 수정 시각,
+  그 밖의 저장소(PostgreSQL 등)는 version 인자 또는 ttl(초) 만료
+- max_points를 주면 x/y 기준 LTTB(Largest-Triangle-Three-Buckets)로 점 수를 줄여 브라우저 전송량 감소
+- cached_figure()는 fig.to_dict() 결과를 캐싱 → st.plotly_chart(dict)로 그대로 표시 (Figure 재생성 없음)
+- 같은 프로세스의 모든 세션이 공유, 항목 수 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+MAX_ENTRIES = 256
+DEFAULT_MAX_POINTS = 500
+# 데이터 버전을 알 수 없을 때(db_path/files/version 모두 없음) 적용하는 만료 시간(초)
+DEFAULT_TTL = 60
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+_version_connections = {}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        return value.isoformat()
+    if hasattr(value, 'item'):  # numpy 스칼라
+        return value.item()
+    return str(value)
+
+
+def fingerprint(*parts):
+    """캐시 키 (JSON 직렬화 후 SHA-256)"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ---------- 데이터 버전 ----------
+
+def sqlite_data_version(db_path='erp_system.db'):
+    """SQLite 데이터 버전 (다른 연결이 커밋할 때마다 바뀌는 값, 파일이 없으면 None)"""
+    if not db_path or not os.path.exists(db_path):
+        return None
+    with _lock:
+        conn = _version_connections.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            _version_connections[db_path] = conn
+        return conn.execute('PRAGMA data_version').fetchone()[0]
+
+
+def files_version(paths):
+    """파일 수정 시각/크기 목록 (CSV 기반 매니저용)"""
+    version = []
+    for path in paths or ():
+        try:
+            stat = os.stat(path)
+            version.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            version.append((path, None, None))
+    return version
+
+
+# ---------- LTTB 다운샘플 ----------
+
+def _numeric(values):
+    array = np.asarray(values)
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    if array.dtype.kind == 'm':
+        return array.astype('timedelta64[ns]').astype(np.int64).astype(np.float64)
+    return pd.to_numeric(pd.Series(array), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def lttb_indices(x, y, threshold):
+    """LTTB로 남길 점의 위치 (x 오름차순 가정, 처음/마지막 점은 항상 포함)"""
+    x, y = _numeric(x), _numeric(y)
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    every = (length - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, length - 1
+    anchor = 0
+    for bucket in range(threshold - 2):
+        # 다음 버킷 평균점
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, length)
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+
+        # 현재 버킷에서 (이전 선택점, 다음 버킷 평균점)과 만드는 삼각형 넓이가 가장 큰 점
+        start, end = int(bucket * every) + 1, int((bucket + 1) * every) + 1
+        area = np.abs((x[anchor] - avg_x) * (y[start:end] - y[anchor])
+                      - (x[anchor] - x[start:end]) * (avg_y - y[anchor]))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def downsample(df, x, y, max_points=DEFAULT_MAX_POINTS, by=None):
+    """DataFrame을 x 기준 정렬 후 LTTB로 max_points 이하로 축소 (by가 있으면 시계열별로)"""
+    if df is None or df.empty or not max_points or len(df) <= max_points:
+        return df
+    data = df.dropna(subset=[x, y]).sort_values(x, kind='stable')
+    if by is None:
+        return data.iloc[lttb_indices(data[x], data[y], max_points)].reset_index(drop=True)
+    parts = [group.iloc[lttb_indices(group[x], group[y], max_points)]
+             for _, group in data.groupby(by, sort=False)]
+    return pd.concat(parts, ignore_index=True) if parts else data.iloc[:0]
+
+
+# ---------- 캐시 ----------
+
+def _get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        if entry['expires_at'] is not None and entry['expires_at'] < time.monotonic():
+            del _entries[key]
+            return None
+        _entries.move_to_end(key)
+        return entry['value']
+
+
+def _put(key, value, ttl, name=None):
+    with _lock:
+        _entries[key] = {
+            'name': name,
+            'value': value,
+            'expires_at': time.monotonic() + ttl if ttl else None,
+        }
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def source_version(manager):
+    """매니저 저장소 버전 인자 (SQLite는 db_path, CSV 매니저는 data_file / *_file 속성)"""
+    db_path = getattr(manager, 'db_path', None)
+    files = [value for attr, value in vars(manager).items()
+             if attr.endswith('_file') and isinstance(value, str)] if hasattr(manager, '__dict__') else []
+    return {'db_path': db_path if isinstance(db_path, str) else None, 'files': files}
+
+
+def _version_key(source=None, db_path=None, files=None, version=None, ttl=None):
+    """(데이터 버전 키, 적용할 ttl)"""
+    if source is not None:
+        derived = source_version(source)
+        db_path = db_path or derived['db_path']
+        files = list(files or []) + derived['files']
+    if ttl is None and not (db_path or files or version is not None):
+        ttl = DEFAULT_TTL
+    return (sqlite_data_version(db_path) if db_path else None, files_version(files), version), ttl
+
+
+def cached_value(name, compute, params=None, source=None, db_path=None, files=None, version=None, ttl=None):
+    """임의 값(통계 dict 등) 캐시 - 키와 버전 규칙은 chart_data와 같음"""
+    data_version, ttl = _version_key(source, db_path, files, version, ttl)
+    key = fingerprint('value', name, params, data_version)
+    cached = _get(key)
+    if cached is not None:
+        return cached
+    value = compute()
+    if value is not None:
+        _put(key, value, ttl, name)
+    return value
+
+
+def chart_data(name, query, params=None, transform=None, source=None, db_path=None, files=None,
+               version=None, ttl=None, max_points=None, x=None, y=None, by=None):
+    """차트 데이터 (조회 + 변환 + 다운샘플 결과를 캐싱)
+
+    Args:
+        name: 차트 이름 (캐시 키 구분)
+        query: 원본 DataFrame(또는 dict 리스트)을 반환하는 함수
+        params: 조회/변환에 영향을 주는 값 (기간, 통화 등)
+        transform: DataFrame → 차트용 DataFrame 함수
+        source: 데이터를 읽는 매니저 (source_version으로 db_path / files 결정)
+        db_path / files / version: 데이터 버전 (바뀌면 다시 조회)
+        ttl: 만료 시간(초) - 버전 정보가 없으면 DEFAULT_TTL
+        max_points, x, y, by: LTTB 다운샘플 설정
+
+    Returns:
+        DataFrame: attrs['chart_key']에 캐시 키 (cached_figure에서 사용), 세션 간 공유되므로 수정하지 말 것
+    """
+    data_version, ttl = _version_key(source, db_path, files, version, ttl)
+    key = fingerprint('data', name, params, data_version, max_points)
+    cached = _get(key)
+    if cached is not None:
+        return cached
+
+    data = query()
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data if data is not None else [])
+    if transform is not None and not data.empty:
+        data = transform(data)
+    if max_points and x and y and not data.empty:
+        data = downsample(data, x, y, max_points, by)
+    data.attrs['chart_key'] = key
+    _put(key, data, ttl, name)
+    return data
+
+
+def cached_figure(name, data, build, params=None, ttl=None):
+    """Plotly 그림 dict 캐시 (data는 chart_data 결과 권장 - 없으면 내용 해시로 키 생성)
+
+    build(data)는 plotly Figure를 반환하고, 반환값은 st.plotly_chart에 그대로 전달할 수 있는 dict
+    """
+    data_key = getattr(data, 'attrs', {}).get('chart_key')
+    # attrs는 파생 DataFrame에도 복사되므로 캐시된 객체 그대로일 때만 키로 사용
+    if data_key is not None and _get(data_key) is not data:
+        data_key = None
+    if data_key is None and isinstance(data, pd.DataFrame):
+        try:
+            data_key = int(pd.util.hash_pandas_object(data, index=False).sum()) if not data.empty else 'empty'
+        except TypeError:  # list/dict 등 해시할 수 없는 값이 있으면 캐시하지 않음
+            return build(data).to_dict()
+    key = fingerprint('figure', name, params, data_key)
+    cached = _get(key)
+    if cached is not None:
+        return cached
+    figure = build(data).to_dict()
+    _put(key, figure, ttl, name)
+    return figure
+
+
+def invalidate(*names):
+    """캐시 항목 삭제 (이름을 주면 해당 차트만, 없으면 전체) - 새로고침 버튼 / 일괄 변경 후"""
+    with _lock:
+        if not names:
+            _entries.clear()
+            return
+        for key in [key for key, entry in _entries.items() if entry['name'] in names]:
+            del _entries[key]
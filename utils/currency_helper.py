@@ -8,7 +8,7 @@ class CurrencyHelper:
     def __init__(self):
         self.exchange_rate_manager = None
         try:
-            from sqlite_exchange_rate_manager import SQLiteExchangeRateManager
+            from managers.sqlite.sqlite_exchange_rate_manager import SQLiteExchangeRateManager
             self.exchange_rate_manager = SQLiteExchangeRateManager()
         except:
             pass
@@ -0,0 +1,278 @@
+"""
+문서 렌더러
+견적서/송장/구매 주문서/배송증의 HTML 및 PDF 생성 (Streamlit 비의존)
+
+- HTML: utils.template_engine의 컴파일된 템플릿 사용
+- PDF: reportlab platypus, 유니코드 폰트는 프로세스당 한 번만 등록
+- 페이지, 일괄 출력 서비스(utils.batch_document_renderer) 작업 프로세스가 함께 사용
+"""
+
+import io
+import os
+import base64
+from datetime import datetime
+
+from utils.template_engine import render_template
+
+QUOTATION_PRINT_TEMPLATE = 'quotation_print_template.html'
+QUOTATION_STAMP_IMAGE = 'static/images/company_stamp.png'
+DEFAULT_ACCOUNT_INFO = '700-038-038199<br>Shinhan Bank Vietnam'
+SIMPLE_PDF_SETTINGS_FILE = 'data/simple_pdf_settings.json'
+
+# 문서 타입별 HTML 템플릿과 PDF 제목
+DOCUMENT_TEMPLATES = {
+    'invoice': ('invoice_print_template.html', 'INVOICE'),
+    'quotation_summary': ('quotation_summary_print_template.html', 'QUOTATION'),
+    'purchase_order': ('purchase_order_print_template.html', 'PURCHASE ORDER'),
+    'delivery_note': ('delivery_note_print_template.html', 'DELIVERY NOTE'),
+}
+
+DEFAULT_COMPANY_INFO = {
+    'name': 'HRC Vietnam Co., Ltd.',
+    'address': '베트남 하노이시 롱비엔구',
+    'phone': '+84-24-1234-5678',
+    'email': 'info@hrcvietnam.com',
+    'tax_id': 'VN-123456789'
+}
+
+FONT_PATHS = {
+    'DejaVuSans': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    'DejaVuSans-Bold': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+}
+
+_registered_fonts = None
+
+
+def register_unicode_fonts():
+    """유니코드 폰트 등록 (프로세스당 1회) - (일반, 굵게) 폰트 이름 반환"""
+    global _registered_fonts
+    if _registered_fonts is not None:
+        return _registered_fonts
+
+    regular, bold = 'Helvetica', 'Helvetica-Bold'
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        registered = pdfmetrics.getRegisteredFontNames()
+        for name, path in FONT_PATHS.items():
+            if name not in registered and os.path.exists(path):
+                pdfmetrics.registerFont(TTFont(name, path))
+        registered = pdfmetrics.getRegisteredFontNames()
+        if 'DejaVuSans' in registered:
+            regular = 'DejaVuSans'
+            bold = 'DejaVuSans-Bold' if 'DejaVuSans-Bold' in registered else regular
+    except Exception as e:
+        print(f"폰트 등록 실패: {e}")
+
+    _registered_fonts = (regular, bold)
+    return _registered_fonts
+
+
+def load_pdf_settings():
+    """data/simple_pdf_settings.json 로드 (없으면 빈 설정, 파일이 바뀌지 않았으면 캐시 사용)"""
+    from utils.pdf_runtime import load_json
+    return load_json(SIMPLE_PDF_SETTINGS_FILE, {})
+
+
+def _clean(record):
+    """pandas NaN을 None으로 변환한 dict"""
+    return {k: (None if isinstance(v, float) and v != v else v) for k, v in dict(record).items()}
+
+
+def _records(items):
+    if items is None:
+        return []
+    if hasattr(items, 'to_dict'):
+        items = items.to_dict('records')
+    return [_clean(item) for item in items]
+
+
+def _number(value):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# ----------------------------------------------------------------------
+# HTML
+# ----------------------------------------------------------------------
+def _stamp_image(path=QUOTATION_STAMP_IMAGE):
+    """회사 직인 이미지 base64 (파일이 없으면 빈 문자열 - 템플릿이 CSS 직인 사용)"""
+    if not os.path.exists(path):
+        return ''
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def build_quotation_context(quote, items, stamp=False):
+    """견적서 템플릿 컨텍스트 (quotations 행 + quotation_items 행, stamp=True면 회사 직인 표시)"""
+    quote = _clean(quote)
+    # Sales Rep 표시: Contact 칸에는 이메일, Phone 칸에는 DB의 연락처
+    sales_rep_email = str(quote.get('sales_rep_email') or '')
+    context = dict(quote)
+    context.update({
+        'sales_representative': str(quote.get('sales_representative') or '') or 'Sales Representative',
+        'sales_rep_contact': sales_rep_email,
+        'sales_rep_phone': str(quote.get('sales_rep_contact') or ''),
+        'sales_rep_email': sales_rep_email,
+        'currency': quote.get('currency') or 'VND',
+        'revision_number': quote.get('revision_number') or '00',
+        'account': quote.get('account') or DEFAULT_ACCOUNT_INFO,
+        'include_stamp': stamp,
+        'stamp_image': _stamp_image() if stamp else '',
+    })
+
+    rows = []
+    for idx, row in enumerate(_records(items)):
+        vn_text = str(row.get('item_name_vn') or '')
+        row['vn_class'] = "vietnamese-desc" if vn_text else ""
+        if not row.get('line_number'):
+            row['line_number'] = idx + 1
+        rows.append(row)
+    context['items'] = rows
+    return context
+
+
+def build_quotation_print_html(quote, items, stamp=False):
+    """견적서 인쇄용 HTML 생성 (컴파일된 템플릿으로 한 번에 렌더링)"""
+    return render_template(QUOTATION_PRINT_TEMPLATE, build_quotation_context(quote, items, stamp))
+
+
+def build_document_context(data, company_info=None, amount=True):
+    """송장/주문서/배송증 템플릿 컨텍스트 - 품목 금액과 총액 계산"""
+    rows, total_amount = [], 0
+    for row in _records(data.get('items')):
+        if amount:
+            row['amount'] = _number(row.get('quantity')) * _number(row.get('unit_price'))
+            total_amount += row['amount']
+        rows.append(row)
+
+    return {
+        'company': company_info or DEFAULT_COMPANY_INFO,
+        'doc': data,
+        'items': rows,
+        'total_amount': total_amount,
+        'today': datetime.now().strftime('%Y-%m-%d'),
+    }
+
+
+def render_document_html(doc_type, data, company_info=None):
+    """문서 타입별 HTML 렌더링"""
+    template_name, _ = DOCUMENT_TEMPLATES[doc_type]
+    context = build_document_context(data, company_info, amount=doc_type != 'delivery_note')
+    return render_template(template_name, context)
+
+
+# ----------------------------------------------------------------------
+# PDF
+# ----------------------------------------------------------------------
+def _pdf_rows(doc_type, context):
+    """PDF 표 헤더/행/합계 (문서 타입별)"""
+    items = context['items']
+    if doc_type == 'quotation':
+        header = ['No', 'Item Code', 'Item Name', 'Qty', 'Unit Price', 'Amount']
+        rows = [[str(i.get('line_number', '')), i.get('item_code') or '', i.get('item_name_en') or '',
+                 f"{_number(i.get('quantity')):,.0f}", f"{_number(i.get('unit_price')):,.0f}",
+                 f"{_number(i.get('amount')):,.0f}"] for i in items]
+        currency = context.get('currency', '')
+        totals = [
+            (f"TOTAL {currency} Excl. VAT", f"{_number(context.get('subtotal_excl_vat')):,.0f}"),
+            (f"VAT {context.get('vat_percentage') or 10}%", f"{_number(context.get('vat_amount')):,.0f}"),
+            (f"TOTAL {currency} Incl. VAT", f"{_number(context.get('total_incl_vat')):,.0f}"),
+        ]
+    elif doc_type == 'delivery_note':
+        header = ['Item', 'Qty', 'Unit', 'Packaging', 'Notes']
+        rows = [[i.get('product_name') or '', f"{_number(i.get('quantity')):,.0f}", i.get('unit') or '',
+                 i.get('packaging') or '', i.get('notes') or ''] for i in items]
+        totals = []
+    else:
+        header = ['Code', 'Item', 'Qty', 'Unit Price', 'Amount']
+        rows = [[i.get('product_code') or '', i.get('product_name') or '',
+                 f"{_number(i.get('quantity')):,.0f}", f"{_number(i.get('unit_price')):,.2f}",
+                 f"{_number(i.get('amount')):,.2f}"] for i in items]
+        totals = [('TOTAL', f"{context.get('total_amount', 0):,.2f}")]
+    return header, rows, totals
+
+
+def _pdf_header_lines(doc_type, context, settings):
+    """회사/문서/고객 정보 문단 목록"""
+    if doc_type == 'quotation':
+        company = [settings.get('company_name', ''), settings.get('company_address', ''),
+                   settings.get('company_phone', ''), settings.get('company_email', '')]
+        meta = [f"Quote No.: {context.get('quotation_number') or ''}",
+                f"Date: {context.get('quote_date') or ''}",
+                f"Rev. No.: {context.get('revision_number') or ''}"]
+        customer = [context.get('customer_company') or '', context.get('customer_address') or '',
+                    context.get('customer_contact_person') or '', context.get('customer_phone') or '']
+    else:
+        info, doc = context['company'], context['doc']
+        company = [info.get('name', ''), info.get('address', ''), info.get('phone', ''), info.get('email', '')]
+        number_key = {'invoice': 'invoice_no', 'purchase_order': 'po_no',
+                      'delivery_note': 'delivery_no', 'quotation_summary': 'quote_no'}[doc_type]
+        meta = [f"No.: {doc.get(number_key) or ''}",
+                f"Date: {doc.get('date') or doc.get('order_date') or doc.get('delivery_date') or context['today']}"]
+        customer = [doc.get('customer_name') or doc.get('supplier_name') or '',
+                    doc.get('customer_address') or doc.get('delivery_address') or doc.get('supplier_address') or '']
+    return [line for line in company if line], meta, [line for line in customer if line]
+
+
+def render_pdf(doc_type, context, settings=None):
+    """문서 PDF 생성 (bytes). context는 build_quotation_context / build_document_context 결과"""
+    from xml.sax.saxutils import escape
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from utils.pdf_runtime import paragraph_styles
+
+    settings = settings if settings is not None else load_pdf_settings()
+    font, font_bold = register_unicode_fonts()
+    table_size = settings.get('font_size_table', 10)
+    # 폰트/스타일은 프로세스 안에서 재사용 (문서마다 새로 만들지 않음)
+    styles = paragraph_styles(settings)
+    base, title_style, company_style = styles['base'], styles['title'], styles['company']
+
+    title = DOCUMENT_TEMPLATES.get(doc_type, (None, settings.get('quotation_title', 'QUOTATION')))[1]
+    company, meta, customer = _pdf_header_lines(doc_type, context, settings)
+    header, rows, totals = _pdf_rows(doc_type, context)
+
+    def paragraphs(lines, first_style=None):
+        return [Paragraph(escape(str(line)), first_style if i == 0 and first_style else base)
+                for i, line in enumerate(lines)]
+
+    story = [Paragraph(escape(title), title_style), Spacer(1, 4 * mm)]
+    story.append(Table([[paragraphs(company, company_style), paragraphs(meta)]],
+                       colWidths=[110 * mm, 70 * mm], style=[('VALIGN', (0, 0), (-1, -1), 'TOP')]))
+    story += [Spacer(1, 4 * mm)] + paragraphs(customer, company_style) + [Spacer(1, 4 * mm)]
+
+    header_color = colors.HexColor(settings.get('table_header_color', '#F5F3F0'))
+    header_text = colors.white if sum(header_color.rgb()) < 1.5 else colors.black
+    table = Table([header] + [[Paragraph(escape(str(c)), base) for c in row] for row in rows],
+                  repeatRows=1)
+    table_style = [
+        ('FONTNAME', (0, 0), (-1, 0), font_bold),
+        ('FONTSIZE', (0, 0), (-1, -1), table_size - 1),
+        ('BACKGROUND', (0, 0), (-1, 0), header_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), header_text),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]
+    if settings.get('show_border', True):
+        table_style.append(('GRID', (0, 0), (-1, -1), 0.5,
+                            colors.HexColor(settings.get('border_color', '#CCCCCC'))))
+    table.setStyle(TableStyle(table_style))
+    story.append(table)
+
+    if totals:
+        story.append(Spacer(1, 3 * mm))
+        story.append(Table([[label, value] for label, value in totals], hAlign='RIGHT',
+                           style=[('FONTNAME', (0, 0), (-1, -1), font_bold),
+                                  ('ALIGN', (1, 0), (1, -1), 'RIGHT')]))
+    if settings.get('footer_text'):
+        story += [Spacer(1, 8 * mm), Paragraph(escape(settings['footer_text']), base)]
+
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=A4, leftMargin=15 * mm, rightMargin=15 * mm,
+                      topMargin=15 * mm, bottomMargin=15 * mm).build(story)
+    return buffer.getvalue()
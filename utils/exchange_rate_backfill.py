@@ -0,0 +1,285 @@
+"""
+과거 환율 백필 엔진
+기간 내 날짜별 USD 기준 환율을 동시에 수집하고, 마지막에 한 번만 저장
+
+- 환율 소스 교체 가능: OpenExchangeRatesSource(API), FileRateSource(JSON/CSV 파일, 오프라인)
+- ThreadPoolExecutor(max_workers) + RateLimiter(초당 요청 수)로 동시 요청 수와 속도 제한
+- 실패한 날짜는 max_retries까지 재시도, 그래도 실패하면 결과의 failed 목록에 기록
+- 체크포인트(JSON)에 수집한 날짜를 주기적으로 기록 → 중단 후 다시 실행하면 남은 날짜만 수집
+- 저장(writer)이 성공하면 체크포인트 삭제, 저장이 실패하면 다음 실행에서 수집 없이 저장만 재시도
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+
+# 기본 수집 통화 (USD 기준)
+DEFAULT_CURRENCIES = ('KRW', 'VND', 'THB', 'CNY', 'EUR', 'JPY', 'SGD', 'MYR', 'IDR')
+DEFAULT_CHECKPOINT_FILE = os.path.join('data', 'exchange_rate_backfill.json')
+
+
+def to_date(value):
+    """문자열/date/datetime → date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def date_range(start_date, end_date):
+    """start_date ~ end_date (양끝 포함) 날짜 문자열 목록"""
+    current, end = to_date(start_date), to_date(end_date)
+    days = []
+    while current <= end:
+        days.append(current.strftime('%Y-%m-%d'))
+        current += timedelta(days=1)
+    return days
+
+
+# ---------- 환율 소스 ----------
+
+class RateSource(ABC):
+    """환율 소스 기본 클래스 - fetch(day)는 {통화: USD 기준 환율} 반환 (데이터 없으면 빈 dict)"""
+
+    name = 'source'
+
+    @abstractmethod
+    def fetch(self, day):
+        """하루치 환율 {통화: USD 기준 환율}"""
+
+
+class OpenExchangeRatesSource(RateSource):
+    """openexchangerates.org historical API"""
+
+    name = 'OpenExchangeRates API (Historical)'
+
+    def __init__(self, api_key, base_url='https://openexchangerates.org/api', timeout=10):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def fetch(self, day):
+        import requests
+
+        response = requests.get(
+            f"{self.base_url}/historical/{day}.json",
+            params={'app_id': self.api_key, 'base': 'USD'},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json().get('rates', {}) or {}
+
+
+class FileRateSource(RateSource):
+    """파일 기반 환율 소스 (테스트/오프라인 백필)
+
+    - JSON: {"2025-01-01": {"VND": 25400, "KRW": 1470}, ...}
+    - CSV: rate_date, currency_code(또는 target_currency), rate 컬럼
+      (data/exchange_rates.csv 형식, base_currency 컬럼이 있으면 USD 행만 사용)
+    """
+
+    name = 'file'
+
+    def __init__(self, path):
+        self.path = path
+        self.name = f"file:{os.path.basename(path)}"
+        self._rates = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self.path.lower().endswith('.json'):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {str(day)[:10]: dict(rates or {}) for day, rates in data.items()}
+
+        rates = {}
+        with open(self.path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                if (row.get('base_currency') or 'USD') != 'USD':
+                    continue
+                currency = row.get('currency_code') or row.get('target_currency')
+                day = (row.get('rate_date') or '')[:10]
+                try:
+                    rate = float(row.get('rate'))
+                except (TypeError, ValueError):
+                    continue
+                if currency and day:
+                    rates.setdefault(day, {})[currency] = rate
+        return rates
+
+    def fetch(self, day):
+        if self._rates is None:
+            with self._lock:
+                if self._rates is None:
+                    self._rates = self._load()
+        return dict(self._rates.get(day, {}))
+
+
+# ---------- 속도 제한 / 체크포인트 ----------
+
+class RateLimiter:
+    """초당 요청 수 제한 (스레드 공용, 요청 시작 간격을 1/per_second 이상으로 유지)"""
+
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+class BackfillCheckpoint:
+    """수집 진행 상태 파일 {'source', 'completed': {날짜: 환율}, 'failed': {날짜: 오류}}"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, source_name):
+        """이전 실행의 수집 결과 (소스가 다르면 무시)"""
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"백필 체크포인트 읽기 실패 - 처음부터 수집: {e}")
+            return {}
+        if state.get('source') != source_name:
+            return {}
+        return state.get('completed', {})
+
+    def save(self, source_name, completed, failed):
+        """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 파일이 깨지지 않음)"""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': source_name,
+                'saved_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'completed': completed,
+                'failed': failed,
+            }, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ---------- 백필 엔진 ----------
+
+class ExchangeRateBackfill:
+    """과거 환율 동시 수집 + 체크포인트 + 일괄 저장"""
+
+    def __init__(self, source, checkpoint_path=DEFAULT_CHECKPOINT_FILE, max_workers=4,
+                 requests_per_second=5.0, max_retries=2, retry_delay=0.5, checkpoint_every=20):
+        self.source = source
+        self.checkpoint = BackfillCheckpoint(checkpoint_path)
+        self.max_workers = max(1, int(max_workers))
+        self.limiter = RateLimiter(requests_per_second)
+        self.max_retries = max(0, int(max_retries))
+        self.retry_delay = retry_delay
+        self.checkpoint_every = max(1, int(checkpoint_every))
+
+    def _fetch_day(self, day, currencies):
+        """하루치 환율 (재시도 포함, 요청 통화만 반환)"""
+        attempt = 0
+        while True:
+            self.limiter.wait()
+            try:
+                rates = self.source.fetch(day) or {}
+                break
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self.retry_delay * (2 ** attempt))
+                attempt += 1
+        if currencies:
+            rates = {code: rates[code] for code in currencies if rates.get(code) is not None}
+        return {code: float(rate) for code, rate in rates.items()}
+
+    def run(self, start_date, end_date=None, currencies=DEFAULT_CURRENCIES, writer=None):
+        """기간 백필 실행
+
+        Args:
+            start_date, end_date: 수집 기간 (end_date 기본값은 오늘)
+            currencies: 수집 통화 (None이면 소스가 준 전체 통화)
+            writer: 수집 결과 {날짜: {통화: 환율}}를 한 번에 저장하는 함수 (저장 건수 반환)
+
+        Returns:
+            dict: requested, resumed, fetched, empty, failed({날짜: 오류}), saved, rates
+        """
+        days = date_range(start_date, end_date or date.today())
+        source_name = self.source.name
+        completed = {day: rates for day, rates in self.checkpoint.load(source_name).items() if day in days}
+        resumed = len(completed)
+        pending = [day for day in days if day not in completed]
+        failed = {}
+
+        print(f"환율 백필 시작: {days[0] if days else '-'} ~ {days[-1] if days else '-'} "
+              f"({len(days)}일, 재개 {resumed}일, 수집 {len(pending)}일)")
+
+        lock = threading.Lock()
+        done_since_save = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(self._fetch_day, day, currencies): day for day in pending}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    rates = future.result()
+                except Exception as e:
+                    with lock:
+                        failed[day] = str(e)
+                    print(f"{day} 환율 수집 실패: {e}")
+                    continue
+                with lock:
+                    completed[day] = rates
+                    done_since_save += 1
+                    if done_since_save >= self.checkpoint_every:
+                        self.checkpoint.save(source_name, completed, failed)
+                        done_since_save = 0
+            executor.shutdown(wait=True)
+        except BaseException:
+            # 중단(Ctrl+C 등) 시 대기 중인 요청은 취소하고, 실행 중인 요청은 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            # 중단/예외 시에도 지금까지 수집한 날짜는 남김
+            self.checkpoint.save(source_name, completed, failed)
+
+        collected = {day: completed[day] for day in days if completed.get(day)}
+        saved = 0
+        if writer is not None and collected:
+            saved = writer(collected)
+        if not failed:
+            self.checkpoint.clear()
+
+        print(f"환율 백필 완료: 수집 {len(completed) - resumed}일, 실패 {len(failed)}일, 저장 {saved}건")
+        return {
+            'requested': len(days),
+            'resumed': resumed,
+            'fetched': len(completed) - resumed,
+            'empty': sum(1 for day in completed if not completed[day]),
+            'failed': failed,
+            'saved': saved,
+            'rates': collected,
+        }
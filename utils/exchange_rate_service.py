@@ -0,0 +1,354 @@
+"""
+환율 서비스
+일별/수동 환율(exchange_rates), 분기 기준 환율(quarterly_exchange_rates),
+연도별 관리 환율(yearly_management_rates)을 메모리 행렬로 올려 기준일 조회
+
+- 통화쌍별로 (적용일, 환율)을 날짜순 NumPy 배열로 보관하고 이분 탐색으로 조회
+- 직접 환율이 없으면 역환율, 그래도 없으면 USD 경유 교차 환율 사용
+- convert_many()로 금액/통화/날짜 컬럼 전체를 한 번에 변환
+- 환율 저장 시 invalidate(), 다른 프로세스의 변경은 REFRESH_INTERVAL마다
+  테이블별 (건수, 최종 수정일) 비교로 감지해 다시 로드
+- get_rate_service()에 db_path를 주지 않으면 활성 백엔드 기준:
+  PostgreSQL이면 PostgreSQL 환율 매니저 테이블에서 적재 (PostgreSQL 스키마에는 관리 환율만 있음)
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+# 환율 종류: daily = 일별/수동 입력 환율, quarterly = 분기 기준 환율, management = 연도별 관리 환율
+RATE_KINDS = ('daily', 'quarterly', 'management')
+PIVOT_CURRENCY = 'USD'
+REFRESH_INTERVAL = 30.0
+
+# 종류별 적재 쿼리 (적용일 순, 같은 날짜는 나중에 입력된 값이 우선)
+_LOAD_QUERIES = {
+    'daily': '''
+        SELECT base_currency, target_currency, substr(rate_date, 1, 10), rate
+        FROM exchange_rates
+        WHERE is_active = 1 AND rate > 0
+        ORDER BY rate_date, created_date
+    ''',
+    'quarterly': '''
+        SELECT base_currency, target_currency,
+               printf('%04d-%02d-01', year, (quarter - 1) * 3 + 1), rate
+        FROM quarterly_exchange_rates
+        WHERE is_active = 1 AND rate > 0
+        ORDER BY year, quarter, updated_date
+    ''',
+    'management': '''
+        SELECT base_currency, target_currency, printf('%04d-01-01', year), rate
+        FROM yearly_management_rates
+        WHERE is_active = 1 AND rate > 0
+        ORDER BY year, updated_date
+    ''',
+}
+_SIGNATURE_TABLES = {
+    'daily': 'exchange_rates',
+    'quarterly': 'quarterly_exchange_rates',
+    'management': 'yearly_management_rates',
+}
+
+# PostgreSQL 환율 소스 키 (get_rate_service / invalidate_rates)
+POSTGRESQL_SOURCE = 'postgresql'
+
+# PostgreSQL 적재 쿼리 - exchange_rates에는 환율 컬럼이 없고 분기 환율 테이블도 없어
+# 관리 환율(yearly_management_rates, USD 기준)만 적재
+_PG_LOAD_QUERIES = {
+    'management': f'''
+        SELECT '{PIVOT_CURRENCY}' AS base_currency, target_currency,
+               LPAD(year::TEXT, 4, '0') || '-01-01' AS rate_day, rate
+        FROM yearly_management_rates
+        WHERE rate > 0
+        ORDER BY year, updated_date
+    ''',
+}
+
+_NAT = np.datetime64('NaT', 'D')
+
+
+def to_day(value):
+    """날짜 값(문자열/date/datetime/Timestamp/None) → numpy datetime64[D] (None은 NaT)"""
+    if value is None:
+        return _NAT
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[D]')
+    text = str(value)[:10]
+    if not text or text in ('NaT', 'nan', 'None'):
+        return _NAT
+    return np.datetime64(text, 'D')
+
+
+def to_days(values):
+    """날짜 컬럼 → datetime64[D] 배열 (해석할 수 없는 값은 NaT)"""
+    array = np.asarray(values)
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[D]')
+    # 문자열/date/Timestamp 모두 앞 10자리(YYYY-MM-DD)로 한 번에 파싱
+    text = pd.Series(array.ravel(), dtype=object).astype(str).str.slice(0, 10)
+    parsed = pd.to_datetime(text, format='ISO8601', errors='coerce')
+    return parsed.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').reshape(array.shape)
+
+
+class _RateSeries:
+    """통화쌍 1개의 날짜순 환율 (같은 날짜는 마지막 값만 유지)"""
+
+    __slots__ = ('dates', 'rates')
+
+    def __init__(self, dates, rates):
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        rates = np.asarray(rates, dtype=np.float64)
+        order = np.argsort(dates, kind='stable')
+        dates, rates = dates[order], rates[order]
+        # 같은 날짜가 여러 번이면 마지막(가장 나중에 입력된) 값
+        keep = np.append(dates[1:] != dates[:-1], True)
+        self.dates, self.rates = dates[keep], rates[keep]
+
+    def at(self, days, latest_if_missing=True):
+        """기준일 환율 배열 (기준일 이전 환율이 없으면 최신 환율 또는 NaN, NaT는 최신 환율)"""
+        positions = np.searchsorted(self.dates, days, side='right') - 1
+        result = self.rates[np.clip(positions, 0, None)]
+        undated = np.isnat(days)
+        missing = (positions < 0) & ~undated
+        if undated.any():
+            result = np.where(undated, self.rates[-1], result)
+        if missing.any():
+            result = np.where(missing, self.rates[-1] if latest_if_missing else np.nan, result)
+        return result
+
+
+class ExchangeRateService:
+    """환율 행렬 (DB별 1개, get_rate_service()로 공유)"""
+
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+        self._series = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    # ---------- 적재 ----------
+
+    def _read_signature(self, conn):
+        signature = []
+        for kind in RATE_KINDS:
+            try:
+                signature.append(tuple(conn.execute(
+                    f"SELECT COUNT(*), MAX(updated_date) FROM {_SIGNATURE_TABLES[kind]}").fetchone()))
+            except sqlite3.Error:
+                signature.append(None)
+        return tuple(signature)
+
+    def _fetch_signature(self):
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return self._read_signature(conn)
+
+    def _fetch_rows(self):
+        """종류별 (기준 통화, 대상 통화, 적용일, 환율) 행과 서명"""
+        rows = {}
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            for kind in RATE_KINDS:
+                try:
+                    rows[kind] = conn.execute(_LOAD_QUERIES[kind]).fetchall()
+                except sqlite3.Error:
+                    continue
+            return rows, self._read_signature(conn)
+
+    def load(self):
+        """전체 환율 다시 적재"""
+        series = {kind: {} for kind in RATE_KINDS}
+        rows_by_kind, signature = self._fetch_rows()
+        for kind, rows in rows_by_kind.items():
+            grouped = {}
+            for base, target, day, rate in rows:
+                dates, rates = grouped.setdefault((base, target), ([], []))
+                dates.append(day)
+                rates.append(float(rate))
+            for pair, (dates, rates) in grouped.items():
+                series[kind][pair] = _RateSeries(dates, rates)
+
+        with self._lock:
+            self._series = series
+            self._signature = signature
+            self._checked_at = time.monotonic()
+        return series
+
+    def invalidate(self):
+        """환율 저장 후 호출 - 다음 조회 때 다시 적재"""
+        with self._lock:
+            self._series = None
+
+    def version(self):
+        """현재 적재된 환율 서명 (환산 결과 캐시 키용, 필요 시 다시 적재)"""
+        self._ensure_loaded()
+        return self._signature
+
+    def _ensure_loaded(self):
+        """적재된 환율 {종류: {(기준, 대상): _RateSeries}} (필요 시 다시 적재)"""
+        series = self._series
+        if series is None:
+            return self.load()
+        now = time.monotonic()
+        if now - self._checked_at < REFRESH_INTERVAL:
+            return series
+        self._checked_at = now
+        signature = self._fetch_signature()
+        if signature != self._signature:
+            return self.load()
+        return series
+
+    # ---------- 조회 ----------
+
+    def _leg(self, series, base, target, days, latest_if_missing):
+        """직접 또는 역환율 1구간 (없으면 None)"""
+        direct = series.get((base, target))
+        if direct is not None:
+            return direct.at(days, latest_if_missing)
+        inverse = series.get((target, base))
+        if inverse is not None:
+            return 1.0 / inverse.at(days, latest_if_missing)
+        return None
+
+    def rates(self, from_currency, to_currency, dates, kind='daily', latest_if_missing=True):
+        """기준일 배열에 대한 from → to 환율 배열 (환율이 없으면 None)
+
+        직접/역환율이 없으면 USD 경유 교차 환율을 사용합니다.
+        latest_if_missing=False면 기준일 이전 환율이 없는 날짜는 NaN입니다.
+        """
+        days = to_days(dates)
+        if from_currency == to_currency:
+            return np.ones(days.shape)
+        series = self._ensure_loaded().get(kind, {})
+
+        result = self._leg(series, from_currency, to_currency, days, latest_if_missing)
+        if result is not None:
+            return result
+        if PIVOT_CURRENCY in (from_currency, to_currency):
+            return None
+        first = self._leg(series, from_currency, PIVOT_CURRENCY, days, latest_if_missing)
+        second = self._leg(series, PIVOT_CURRENCY, to_currency, days, latest_if_missing)
+        if first is None or second is None:
+            return None
+        return first * second
+
+    def rate(self, from_currency, to_currency, as_of=None, kind='daily', latest_if_missing=True):
+        """기준일(as_of, None이면 최신) 환율 1개 (없으면 None)"""
+        result = self.rates(from_currency, to_currency, [to_day(as_of)], kind, latest_if_missing)
+        if result is None or np.isnan(result[0]):
+            return None
+        return float(result[0])
+
+    def convert(self, amount, from_currency, to_currency, as_of=None, kind='daily'):
+        """금액 1건 변환 (환율이 없으면 None)"""
+        rate = self.rate(from_currency, to_currency, as_of, kind)
+        return None if rate is None else amount * rate
+
+    def convert_many(self, amounts, from_currencies, to_currency, dates=None, kind='daily',
+                     latest_if_missing=True):
+        """금액 컬럼 전체 변환 → float 배열 (환율이 없는 행은 NaN)
+
+        Args:
+            amounts: 금액 배열/Series
+            from_currencies: 통화 코드 1개 또는 행별 통화 코드 배열
+            to_currency: 변환 대상 통화
+            dates: 행별 기준일 배열 (None이면 최신 환율)
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        days = np.full(amounts.shape, _NAT) if dates is None else to_days(dates)
+        if isinstance(from_currencies, str):
+            from_currencies = np.full(amounts.shape, from_currencies, dtype=object)
+        else:
+            from_currencies = np.asarray(from_currencies, dtype=object)
+
+        result = np.full(amounts.shape, np.nan)
+        for currency in set(from_currencies.tolist()):
+            mask = from_currencies == currency
+            rates = self.rates(currency, to_currency, days[mask], kind, latest_if_missing)
+            if rates is not None:
+                result[mask] = amounts[mask] * rates
+        return result
+
+    def pairs(self, kind='daily'):
+        """적재된 통화쌍 목록"""
+        return sorted(self._ensure_loaded().get(kind, {}))
+
+
+class PostgreSQLExchangeRateService(ExchangeRateService):
+    """PostgreSQL 환율 매니저 테이블에서 적재하는 환율 행렬 (관리 환율만)"""
+
+    def __init__(self):
+        super().__init__(db_path=None)
+        self._manager = None
+
+    def _get_manager(self):
+        if self._manager is None:
+            from config.database_config import ManagerFactory
+            self._manager = ManagerFactory.get_manager('exchange_rate', 'postgresql')
+        return self._manager
+
+    def _fetch_signature(self):
+        signature = []
+        for kind in RATE_KINDS:
+            if kind not in _PG_LOAD_QUERIES:
+                signature.append(None)
+                continue
+            try:
+                row = self._get_manager().execute_query(
+                    f"SELECT COUNT(*) AS count, MAX(updated_date) AS updated FROM {_SIGNATURE_TABLES[kind]}",
+                    fetch_one=True)
+                signature.append((row['count'], str(row['updated'])) if row else None)
+            except Exception:
+                signature.append(None)
+        return tuple(signature)
+
+    def _fetch_rows(self):
+        rows = {}
+        for kind, query in _PG_LOAD_QUERIES.items():
+            try:
+                result = self._get_manager().execute_query(query, fetch_all=True) or []
+            except Exception:
+                continue
+            rows[kind] = [(row['base_currency'], row['target_currency'], row['rate_day'], row['rate'])
+                          for row in result]
+        return rows, self._fetch_signature()
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def _resolve_source(db_path):
+    """db_path가 없으면 활성 백엔드 기준 (PostgreSQL이면 POSTGRESQL_SOURCE, 아니면 기본 SQLite DB)"""
+    if db_path:
+        return db_path
+    from config.database_config import ManagerFactory
+    if ManagerFactory.resolve_db_type() == 'postgresql':
+        return POSTGRESQL_SOURCE
+    return 'erp_system.db'
+
+
+def get_rate_service(db_path=None):
+    """DB별 공유 환율 서비스 (프로세스 내 1개, db_path가 없으면 활성 백엔드)"""
+    source = _resolve_source(db_path)
+    service = _services.get(source)
+    if service is None:
+        with _services_lock:
+            service = _services.get(source)
+            if service is None:
+                if source == POSTGRESQL_SOURCE:
+                    service = PostgreSQLExchangeRateService()
+                else:
+                    service = ExchangeRateService(source)
+                _services[source] = service
+    return service
+
+
+def invalidate_rates(db_path=None):
+    """환율 변경 알림 - 이미 만들어진 서비스만 다시 적재하도록 표시"""
+    service = _services.get(_resolve_source(db_path))
+    if service is not None:
+        service.invalidate()
@@ -0,0 +1,140 @@
+"""
+월별 시계열 예측 (경량 모델, 여러 시계열을 행렬로 한 번에 적합)
+
+- 입력: (시계열 수 × 월 수) 행렬, 빈 달은 0
+- 모델: seasonal_naive(작년 같은 달), exp_smoothing(단순 지수평활, 시계열별 alpha 선택),
+  linear_trend(최소제곱 직선)
+- 시계열별로 마지막 holdout 개월을 가린 MAE가 가장 작은 모델을 선택한 뒤 전체 기간으로 다시 적합
+- fit_batch(): 시계열이 많으면 ProcessPoolExecutor로 나눠 적합
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+MODELS = ('seasonal_naive', 'exp_smoothing', 'linear_trend')
+SEASON_LENGTH = 12
+DEFAULT_HORIZON = 6
+SMOOTHING_ALPHAS = np.linspace(0.1, 0.9, 9)
+
+# 이 수 이하의 시계열은 현재 프로세스에서 적합 (프로세스 시작 비용이 더 큼)
+PARALLEL_MIN_SERIES = 200
+
+
+def seasonal_naive(y, horizon, season=SEASON_LENGTH):
+    """작년 같은 달 값 (기간이 한 시즌보다 짧으면 마지막 값)"""
+    n, length = y.shape
+    if length == 0:
+        return np.zeros((n, horizon))
+    if length < season:
+        return np.repeat(y[:, -1:], horizon, axis=1)
+    steps = np.arange(horizon) % season
+    return y[:, length - season + steps]
+
+
+def exp_smoothing(y, horizon, alphas=SMOOTHING_ALPHAS):
+    """단순 지수평활 - 시계열별로 1단계 예측 오차 제곱합이 가장 작은 alpha 사용"""
+    n, length = y.shape
+    if length == 0:
+        return np.zeros((n, horizon))
+    alphas = np.asarray(alphas)[None, :]
+    level = np.repeat(y[:, :1], alphas.shape[1], axis=1)
+    sse = np.zeros_like(level)
+    for t in range(1, length):
+        error = y[:, t:t + 1] - level
+        sse += error ** 2
+        level = level + alphas * error
+    best = np.argmin(sse, axis=1)
+    return np.repeat(level[np.arange(n), best][:, None], horizon, axis=1)
+
+
+def linear_trend(y, horizon):
+    """최소제곱 직선 추세 (음수 예측은 0으로 자름)"""
+    n, length = y.shape
+    if length == 0:
+        return np.zeros((n, horizon))
+    if length == 1:
+        return np.repeat(y, horizon, axis=1)
+    x = np.arange(length, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = y.mean(axis=1, keepdims=True)
+    slope = ((x - x_mean) * (y - y_mean)).sum(axis=1, keepdims=True) / ((x - x_mean) ** 2).sum()
+    future = np.arange(length, length + horizon, dtype=np.float64)[None, :]
+    return np.maximum(y_mean + slope * (future - x_mean), 0.0)
+
+
+_MODEL_FUNCTIONS = {
+    'seasonal_naive': seasonal_naive,
+    'exp_smoothing': exp_smoothing,
+    'linear_trend': linear_trend,
+}
+
+
+def holdout_length(length):
+    """모델 선택용으로 가리는 개월 수 (기간의 1/4, 1~3개월)"""
+    return int(min(3, max(1, length // 4)))
+
+
+def fit_models(y, horizon=DEFAULT_HORIZON):
+    """시계열 행렬 적합
+
+    Returns:
+        dict: forecasts({모델: (n × horizon)}), mae({모델: (n,)}), selected((n,) 모델 이름)
+    """
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    if y.ndim == 1:
+        y = y[None, :]
+    holdout = holdout_length(y.shape[1])
+    train, actual = y[:, :-holdout], y[:, -holdout:]
+
+    forecasts, mae = {}, {}
+    for name in MODELS:
+        model = _MODEL_FUNCTIONS[name]
+        mae[name] = np.abs(model(train, holdout) - actual).mean(axis=1)
+        forecasts[name] = model(y, horizon)
+
+    errors = np.vstack([mae[name] for name in MODELS])
+    selected = np.asarray(MODELS, dtype=object)[np.argmin(errors, axis=0)]
+    return {'forecasts': forecasts, 'mae': mae, 'selected': selected}
+
+
+def _fit_chunk(args):
+    y, horizon = args
+    return fit_models(y, horizon)
+
+
+def fit_batch(y, horizon=DEFAULT_HORIZON, max_workers=None, chunk_size=PARALLEL_MIN_SERIES):
+    """시계열이 많으면 행을 나눠 프로세스 풀에서 적합한 뒤 합침 (결과 형식은 fit_models와 같음)"""
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    if y.ndim == 1:
+        y = y[None, :]
+    if len(y) <= chunk_size or max_workers == 1:
+        return fit_models(y, horizon)
+
+    chunks = [(y[start:start + chunk_size], horizon) for start in range(0, len(y), chunk_size)]
+    # spawn: Streamlit 서버의 스레드/잠금 상태를 fork로 복제하지 않음
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        results = list(executor.map(_fit_chunk, chunks))
+    return {
+        'forecasts': {name: np.vstack([r['forecasts'][name] for r in results]) for name in MODELS},
+        'mae': {name: np.concatenate([r['mae'][name] for r in results]) for name in MODELS},
+        'selected': np.concatenate([r['selected'] for r in results]),
+    }
+
+
+def month_range(start, end):
+    """'YYYY-MM' start ~ end (양끝 포함) 월 목록"""
+    year, month = int(start[:4]), int(start[5:7])
+    end_year, end_month = int(end[:4]), int(end[5:7])
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def add_months(period, count):
+    """'YYYY-MM' + count개월"""
+    index = int(period[:4]) * 12 + int(period[5:7]) - 1 + count
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
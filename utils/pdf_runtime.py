@@ -0,0 +1,99 @@
+"""
+PDF 런타임
+PDF 생성에 필요한 폰트, 설정 JSON, 문단 스타일을 프로세스당 한 번만 준비
+
+- 폰트: utils.document_renderer.register_unicode_fonts() (프로세스당 1회 등록)
+- 설정 JSON (data/simple_pdf_settings.json): 파일 (mtime, 크기)가 같으면 이전 파싱 결과 재사용
+- 문단 스타일: 폰트와 스타일 관련 설정값이 같으면 재사용
+- warm_up(): reportlab import, 폰트 등록, 설정/스타일 준비를 미리 수행
+  (앱 시작 시 백그라운드 스레드, 일괄 출력 작업 프로세스 초기화에서 호출)
+"""
+
+import os
+import copy
+import json
+import threading
+
+SIMPLE_PDF_SETTINGS_FILE = os.path.join('data', 'simple_pdf_settings.json')
+
+_lock = threading.Lock()
+_json_cache = {}
+_style_cache = {}
+_warmed = False
+
+
+def load_json(path, default=None):
+    """JSON 파일 파싱 결과 (파일이 바뀌지 않았으면 캐시 사용, 반환값은 복사본)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return copy.deepcopy(default)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != signature:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"설정 파일 로드 실패 ({path}): {e}")
+            return copy.deepcopy(default)
+        with _lock:
+            _json_cache[path] = cached = (signature, data)
+    return copy.deepcopy(cached[1])
+
+
+def load_pdf_settings():
+    """data/simple_pdf_settings.json (없으면 빈 설정)"""
+    return load_json(SIMPLE_PDF_SETTINGS_FILE, {})
+
+
+def paragraph_styles(settings=None):
+    """PDF 문단 스타일 {'base', 'title', 'company'} - 같은 폰트/설정이면 같은 객체 반환"""
+    from utils.document_renderer import register_unicode_fonts
+
+    settings = settings if settings is not None else load_pdf_settings()
+    font, font_bold = register_unicode_fonts()
+    key = (
+        font, font_bold,
+        settings.get('font_size_table', 10),
+        settings.get('font_size_title', 24),
+        settings.get('title_color', '#2B4F3E'),
+        settings.get('font_size_company', 14),
+    )
+    styles = _style_cache.get(key)
+    if styles is not None:
+        return styles
+
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+
+    _, _, table_size, title_size, title_color, company_size = key
+    base = ParagraphStyle('doc_base', fontName=font, fontSize=table_size - 1, leading=table_size + 2)
+    styles = {
+        'base': base,
+        'title': ParagraphStyle('doc_title', parent=base, fontName=font_bold,
+                                fontSize=title_size, leading=title_size + 4,
+                                textColor=colors.HexColor(title_color)),
+        'company': ParagraphStyle('doc_company', parent=base, fontName=font_bold,
+                                  fontSize=company_size),
+    }
+    with _lock:
+        _style_cache[key] = styles
+    return styles
+
+
+def warm_up():
+    """PDF 생성 준비 (프로세스당 1회) - reportlab 모듈, 폰트, 설정 JSON, 기본 스타일"""
+    global _warmed
+    if _warmed:
+        return
+    try:
+        import reportlab.platypus  # noqa: F401 - 첫 PDF 생성 시 import 비용 제거
+        from utils.document_renderer import register_unicode_fonts
+
+        register_unicode_fonts()
+        paragraph_styles()  # PDF 설정 JSON 파싱 포함
+    except Exception as e:
+        print(f"PDF 런타임 사전 준비 실패: {e}")
+    _warmed = True
@@ -0,0 +1,165 @@
+"""
+권한 엔진 - 로그인 시 권한 매트릭스를 한 번 컴파일해 세션에 캐싱
+
+역할(access_level) 기반 메뉴 권한과 사용자별 개별 권한(auth_manager.get_user_permissions)을
+로그인 후 한 번 계산해 두고 사이드바 메뉴 / 메뉴·페이지 접근 확인(can_access_menu) /
+페이지 권한 딕셔너리로 재사용합니다.
+권한이 수정되면 invalidate_permissions()로 버전을 올려 다음 rerun에서 다시 컴파일합니다.
+(직원은 다시 컴파일할 때 auth_manager.get_access_level로 현재 권한 레벨을 다시 읽음)
+"""
+
+import threading
+
+import streamlit as st
+
+from config_files.ui_config import (
+    SIDEBAR_MENU_STRUCTURE,
+    ACCESS_LEVEL_HIERARCHY,
+    MENU_REQUIRED_ACCESS_LEVELS,
+)
+
+SESSION_KEY = 'permission_matrix'
+
+# 권한 레벨이 정의된 메뉴 키 (그 밖의 키는 'user' 레벨로 판단)
+MENU_KEYS = frozenset(SIDEBAR_MENU_STRUCTURE) | frozenset(MENU_REQUIRED_ACCESS_LEVELS)
+
+# 마스터 계정의 개별 권한 (기존 app.py 하드코딩 값과 동일)
+MASTER_PERMISSIONS = {
+    'can_access_employee_management': True,
+    'can_access_customer_management': True,
+    'can_access_product_management': True,
+    'can_access_supplier_management': True,
+    'can_access_purchase_order_management': True,
+    'can_access_inventory_management': True,
+    'can_access_shipping_management': True,
+    'can_access_approval_management': True,
+    'can_access_monthly_sales_management': True,
+    'can_access_cash_flow_management': True,
+    'can_access_invoice_management': True,
+    'can_access_sales_product_management': True,
+    'can_access_order_management': True,
+    'can_access_exchange_rate_management': True,
+    'can_access_personal_status': True,
+    'can_access_vacation_management': True,
+    'can_delete_data': True
+}
+
+# 권한 수정 시 증가하는 버전 (전역 + 사용자별)
+_version_lock = threading.Lock()
+_global_version = 0
+_user_versions = {}
+
+
+def _level_rank(access_level):
+    """권한 레벨을 숫자로 변환"""
+    return ACCESS_LEVEL_HIERARCHY.get(access_level, 0)
+
+
+def current_version(user_id):
+    """사용자 권한 버전 반환 (전역 버전, 사용자 버전)"""
+    return (_global_version, _user_versions.get(str(user_id), 0))
+
+
+def invalidate_permissions(user_id=None):
+    """권한 변경 알림 - user_id가 없으면 모든 사용자의 매트릭스를 무효화"""
+    global _global_version
+    with _version_lock:
+        if user_id is None:
+            _global_version += 1
+        else:
+            key = str(user_id)
+            _user_versions[key] = _user_versions.get(key, 0) + 1
+
+
+class PermissionMatrix:
+    """컴파일된 사용자 권한 매트릭스 (읽기 전용)"""
+
+    __slots__ = ('user_id', 'user_type', 'access_level', 'version', 'menus', 'permission_values')
+
+    def __init__(self, user_id, user_type, access_level, version, menus, permission_values):
+        self.user_id = user_id
+        self.user_type = user_type
+        self.access_level = access_level
+        self.version = version
+        self.menus = menus
+        self.permission_values = permission_values
+
+    def can_access_menu(self, menu_key):
+        """메뉴/페이지 접근 가능 여부 (컴파일된 메뉴 집합 조회)"""
+        if menu_key in MENU_KEYS:
+            return menu_key in self.menus
+        return self.meets_level('user')
+
+    def has_permission(self, permission_key):
+        """개별 권한(can_access_* 등) 보유 여부"""
+        return bool(self.permission_values.get(permission_key))
+
+    def meets_level(self, required_level):
+        """필요 권한 레벨 이상인지 확인"""
+        return _level_rank(self.access_level) >= _level_rank(required_level)
+
+    def visible_menus(self):
+        """사이드바에 표시할 메뉴 키 (SIDEBAR_MENU_STRUCTURE 순서)"""
+        return [key for key in SIDEBAR_MENU_STRUCTURE if key in self.menus]
+
+    def to_dict(self):
+        """페이지 함수에 전달하는 기존 user_permissions 딕셔너리 형식"""
+        return dict(self.permission_values)
+
+
+def _compile_menus(access_level):
+    """역할 기반 메뉴 접근 집합 계산"""
+    rank = _level_rank(access_level)
+    return frozenset(
+        key for key in MENU_KEYS
+        if rank >= _level_rank(MENU_REQUIRED_ACCESS_LEVELS.get(key, 'user'))
+    )
+
+
+def compile_permission_matrix(user_id, user_type, access_level, auth_manager=None):
+    """역할 + 사용자별 개별 권한을 하나의 매트릭스로 컴파일"""
+    version = current_version(user_id)
+
+    if user_type == 'master':
+        permission_values = dict(MASTER_PERMISSIONS)
+    else:
+        permission_values = {}
+        if auth_manager is not None:
+            try:
+                permission_values = auth_manager.get_user_permissions(user_id, user_type) or {}
+            except Exception as e:
+                print(f"사용자 권한 조회 오류: {e}")
+
+    return PermissionMatrix(
+        user_id=user_id,
+        user_type=user_type,
+        access_level=access_level or 'user',
+        version=version,
+        menus=_compile_menus(access_level or 'user'),
+        permission_values=permission_values,
+    )
+
+
+def get_permission_matrix():
+    """현재 세션의 권한 매트릭스 반환 (없거나 무효화된 경우에만 다시 컴파일)"""
+    user_id = st.session_state.get('user_id')
+    user_type = st.session_state.get('user_type')
+    access_level = st.session_state.get('access_level') or 'user'
+
+    matrix = st.session_state.get(SESSION_KEY)
+    if (matrix is not None
+            and matrix.user_id == user_id
+            and matrix.user_type == user_type
+            and matrix.access_level == access_level
+            and matrix.version == current_version(user_id)):
+        return matrix
+
+    auth_manager = st.session_state.get('auth_manager')
+    if matrix is not None and user_type == 'employee' and hasattr(auth_manager, 'get_access_level'):
+        # 무효화된 경우 관리자가 바꾼 권한 레벨을 반영
+        access_level = auth_manager.get_access_level(user_id) or access_level
+        st.session_state.access_level = access_level
+
+    matrix = compile_permission_matrix(user_id, user_type, access_level, auth_manager=auth_manager)
+    st.session_state[SESSION_KEY] = matrix
+    return matrix
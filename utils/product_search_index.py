@@ -0,0 +1,324 @@
+"""
+제품 검색 인덱스
+견적서 품목 입력용 master_products 검색을 메모리 인덱스로 처리
+
+- 제품 코드, 제품명(한국어), 영문명, 베트남어명을 정규화해 3-gram 역색인 구성
+- 베트남어 성조/발음 부호와 đ를 제거해 부호 없이 입력해도 검색 ("khuon" → "khuôn")
+- 코드/단어 접두어는 정렬 목록에서 이분 탐색, 부분 일치는 역색인 후보만 확인
+- 제품 추가/수정/삭제 시 notify_product_changed()로 해당 제품만 갱신
+- 다른 프로세스의 변경은 REFRESH_INTERVAL마다 (건수, 최종 수정일) 비교로 감지해 재구축
+"""
+
+import bisect
+import heapq
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import closing
+
+# 인덱스에 보관하는 필드 (검색 결과 표시 및 견적서 품목 추가에 필요한 값)
+RESULT_FIELDS = (
+    'master_product_id', 'product_code', 'product_name', 'product_name_en',
+    'product_name_vi', 'category_name', 'sales_price_vnd',
+)
+# 검색 대상 필드
+SEARCH_FIELDS = ('product_code', 'product_name', 'product_name_en', 'product_name_vi')
+
+REFRESH_INTERVAL = 30.0
+DEFAULT_LIMIT = 10
+
+_NGRAM = 3
+
+
+class _FoldTable(dict):
+    """문자별 정규화 테이블 (str.translate용, 처음 나온 문자만 계산해 캐싱)"""
+
+    def __missing__(self, code_point):
+        ch = chr(code_point)
+        if ch in 'đĐ':
+            folded = 'd'
+        else:
+            decomposed = unicodedata.normalize('NFD', ch)
+            folded = unicodedata.normalize(
+                'NFC', ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')).lower()
+        self[code_point] = folded
+        return folded
+
+
+_FOLD = _FoldTable()
+
+
+def normalize(text):
+    """검색용 정규화 - 소문자, 베트남어 부호 제거 (한글은 유지)"""
+    if text is None:
+        return ''
+    text = str(text)
+    if text.isascii():
+        return text.lower().strip()
+    return text.translate(_FOLD).strip()
+
+
+def _ngrams(text):
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class _Entry:
+    __slots__ = ('key', 'record', 'code', 'words', 'text')
+
+    def __init__(self, record):
+        self.key = record['master_product_id']
+        self.record = record
+        self.code = normalize(record.get('product_code'))
+        values = [normalize(record.get(field)) for field in SEARCH_FIELDS]
+        self.words = sorted({word for value in values for word in value.split()})
+        self.text = ' | '.join(value for value in values if value)
+
+
+def _sorted_remove(items, item):
+    position = bisect.bisect_left(items, item)
+    if position < len(items) and items[position] == item:
+        del items[position]
+
+
+class ProductSearchIndex:
+    """master_products 메모리 검색 인덱스
+
+    문서 번호(doc) 기준으로 3-gram 역색인, 코드 정렬 목록, 단어 정렬 목록을 유지합니다.
+    수정/삭제된 문서 번호는 역색인에 남아 있다가 검색 시 걸러지고,
+    일정량 이상 쌓이면 메모리 안에서 역색인을 다시 만듭니다.
+    """
+
+    def __init__(self, db_path='erp_system.db'):
+        self.db_path = db_path
+        self._docs = []
+        self._doc_ids = {}
+        self._grams = {}
+        self._codes = []
+        self._words = []
+        self._stale = 0
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+
+    # ---------- 구축 / 갱신 ----------
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return closing(conn)
+
+    def _read_signature(self, conn):
+        row = conn.execute(
+            "SELECT COUNT(*), MAX(updated_date) FROM master_products WHERE status = 'active'"
+        ).fetchone()
+        return tuple(row)
+
+    @staticmethod
+    def _to_record(row):
+        keys = row.keys()
+        record = {field: row[field] if field in keys else None for field in RESULT_FIELDS}
+        # 기존 검색 결과와 같은 키 (get_all_products 별칭)
+        record['product_name_korean'] = record['product_name']
+        record['main_category'] = record['category_name']
+        return record
+
+    def _build(self, entries):
+        """Entry 목록으로 색인 전체 구성 (잠금 보유 상태에서 호출)"""
+        grams = {}
+        for doc, entry in enumerate(entries):
+            for gram in _ngrams(entry.text):
+                postings = grams.get(gram)
+                if postings is None:
+                    grams[gram] = [doc]
+                else:
+                    postings.append(doc)
+        self._docs = list(entries)
+        self._doc_ids = {entry.key: doc for doc, entry in enumerate(entries)}
+        self._grams = grams
+        self._codes = sorted((entry.code, doc) for doc, entry in enumerate(entries))
+        self._words = sorted((word, doc) for doc, entry in enumerate(entries) for word in entry.words)
+        self._stale = 0
+
+    def rebuild(self):
+        """DB에서 전체 재구축"""
+        started = time.perf_counter()
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM master_products WHERE status = 'active'").fetchall()
+            signature = self._read_signature(conn)
+
+        entries = [_Entry(self._to_record(row)) for row in rows]
+        with self._lock:
+            self._build(entries)
+            self._signature = signature
+            self._checked_at = time.monotonic()
+        print(f"제품 검색 인덱스 구축: {len(entries)}건 ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    def _remove(self, key):
+        doc = self._doc_ids.pop(key, None)
+        if doc is None:
+            return
+        entry = self._docs[doc]
+        self._docs[doc] = None
+        _sorted_remove(self._codes, (entry.code, doc))
+        for word in entry.words:
+            _sorted_remove(self._words, (word, doc))
+        self._stale += 1
+
+    def _add(self, entry):
+        doc = len(self._docs)
+        self._docs.append(entry)
+        self._doc_ids[entry.key] = doc
+        for gram in _ngrams(entry.text):
+            self._grams.setdefault(gram, []).append(doc)
+        bisect.insort(self._codes, (entry.code, doc))
+        for word in entry.words:
+            bisect.insort(self._words, (word, doc))
+
+    def refresh_product(self, master_product_id):
+        """제품 1건 다시 읽어 반영 (삭제/비활성화된 제품은 제거)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM master_products WHERE master_product_id = ? AND status = 'active'",
+                (master_product_id,)
+            ).fetchone()
+            signature = self._read_signature(conn)
+
+        with self._lock:
+            self._remove(master_product_id)
+            if row is not None:
+                self._add(_Entry(self._to_record(row)))
+            # 지워진 문서 번호가 많이 쌓이면 메모리 안에서 역색인 재구성
+            if self._stale > max(1000, len(self._doc_ids) // 4):
+                self._build([entry for entry in self._docs if entry is not None])
+            self._signature = signature
+
+    def ensure_fresh(self):
+        """최초 구축 및 외부 변경 감지 (사전 구축용으로도 호출)"""
+        if self._signature is None:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._checked_at < REFRESH_INTERVAL:
+            return
+        self._checked_at = now
+        with self._connect() as conn:
+            signature = self._read_signature(conn)
+        if signature != self._signature:
+            self.rebuild()
+
+    # ---------- 검색 ----------
+
+    def _prefix_range(self, items, query):
+        """정렬 목록에서 query로 시작하는 (값, doc) 생성"""
+        position = bisect.bisect_left(items, (query, -1))
+        while position < len(items) and items[position][0].startswith(query):
+            yield items[position]
+            position += 1
+
+    def _gram_candidates(self, tokens):
+        """모든 토큰의 3-gram을 포함하는 문서 (3글자 미만 토큰만 있으면 None = 전체)"""
+        grams = set()
+        for token in tokens:
+            grams |= _ngrams(token)
+        if not grams:
+            return None
+        postings = sorted((self._grams.get(gram, ()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return candidates
+
+    def search(self, search_term, limit=DEFAULT_LIMIT):
+        """검색어와 일치하는 제품을 순위순으로 반환 (dict 목록)
+
+        순위: 코드 일치/코드 접두어 > 모든 검색 단어가 단어 접두어 > 코드 부분 일치
+        > 문구 포함 > 모든 검색 단어 포함, 같은 순위는 제품 코드순. 상위 순위에서 limit건이 차면 하위 순위는 계산하지 않습니다.
+        """
+        query = normalize(search_term)
+        if not query:
+            return []
+        self.ensure_fresh()
+
+        with self._lock:
+            docs = self._docs
+            taken, results = set(), []
+
+            def take(doc_list):
+                for doc in doc_list:
+                    if len(results) >= limit:
+                        return
+                    if doc not in taken and docs[doc] is not None:
+                        taken.add(doc)
+                        results.append(doc)
+
+            # 1) 코드 접두어 (정렬 목록이 코드순이므로 앞에서부터 limit건)
+            take(doc for _, doc in self._prefix_range(self._codes, query))
+
+            # 2) 모든 검색 단어가 제품 단어의 접두어 (적은 쪽 단어부터 교집합)
+            tokens = query.split()
+            if len(results) < limit:
+                matches = None
+                for token in sorted(tokens, key=len, reverse=True):
+                    docs_for_token = {doc for _, doc in self._prefix_range(self._words, token)}
+                    matches = docs_for_token if matches is None else matches & docs_for_token
+                    if not matches:
+                        break
+                matches = (matches or set()) - taken
+                take(heapq.nsmallest(limit - len(results), matches, key=lambda doc: docs[doc].code))
+
+            # 3) 코드/텍스트 부분 일치 (여러 단어는 모두 포함해야 일치)
+            if len(results) < limit:
+                candidates = self._gram_candidates(tokens)
+                if candidates is None:
+                    candidates = range(len(docs))
+                ranked = []
+                for doc in candidates:
+                    entry = docs[doc]
+                    if entry is None or doc in taken:
+                        continue
+                    if query in entry.code:
+                        ranked.append((0, entry.code, doc))
+                    elif query in entry.text:
+                        ranked.append((1, entry.code, doc))
+                    elif all(token in entry.text for token in tokens):
+                        ranked.append((2, entry.code, doc))
+                take(doc for _, _, doc in heapq.nsmallest(limit - len(results), ranked))
+
+            return [dict(docs[doc].record) for doc in results]
+
+    def __len__(self):
+        return len(self._doc_ids)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_product_index(db_path='erp_system.db'):
+    """DB별 공유 인덱스 (프로세스 내 1개)"""
+    index = _indexes.get(db_path)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(db_path)
+            if index is None:
+                index = _indexes[db_path] = ProductSearchIndex(db_path)
+    return index
+
+
+def search_products(search_term, limit=DEFAULT_LIMIT, db_path='erp_system.db'):
+    """제품 검색 (top-k)"""
+    return get_product_index(db_path).search(search_term, limit)
+
+
+def notify_product_changed(master_product_id, db_path='erp_system.db'):
+    """제품 변경 알림 - 이미 구축된 인덱스만 해당 제품을 갱신"""
+    index = _indexes.get(db_path)
+    if index is None or index._signature is None:
+        return
+    try:
+        index.refresh_product(master_product_id)
+    except Exception as e:
+        print(f"제품 검색 인덱스 갱신 오류: {e}")
@@ -0,0 +1,308 @@
+"""
+렌더링 문서 캐시
+견적서 미리보기/인쇄/다운로드 결과(HTML/PDF)를 입력 내용의 해시로 디스크에 캐싱
+
+- 키: 견적서 행 + 품목 행 + 템플릿 버전 + 언어 + 회사/PDF 설정
+  (data/simple_pdf_settings.json, templates/pdf_designs.json) 의 SHA-256
+- 입력이 하나라도 바뀌면 키가 달라지므로 오래된 결과는 재사용되지 않음
+- 용량 초과 시 가장 오래 사용하지 않은 파일부터 삭제 (LRU, 파일 mtime 기준)
+- 견적서 수정(update_quotation, save_quotation_item 등) 시 invalidate_quotation(),
+  설정 저장 시 invalidate_all()로 해당 파일을 즉시 정리
+- 저장된 견적서는 get_or_render_version()으로 행을 읽지 않고 렌더링 버전만 조회
+  (quotations / quotation_items 트리거가 quotation_render_versions.version을 올림)
+"""
+
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+from datetime import date, datetime
+
+from utils.template_engine import TEMPLATE_DIR
+
+CACHE_DIR = os.path.join('data', 'render_cache')
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+SETTINGS_FILES = (
+    os.path.join('data', 'simple_pdf_settings.json'),
+    os.path.join('templates', 'pdf_designs.json'),
+)
+
+_lock = threading.Lock()
+_total_bytes = None
+_file_digests = {}
+_versioned_dbs = set()
+
+_RENDER_VERSIONS_SQL = '''
+    CREATE TABLE IF NOT EXISTS quotation_render_versions (
+        quotation_id TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+'''
+
+# 견적서 헤더/품목이 바뀌면 렌더링 버전 증가 (트리거 이름 → 정의)
+_BUMP_SQL = '''
+    INSERT INTO quotation_render_versions (quotation_id, version) VALUES ({row}.quotation_id, 1)
+    ON CONFLICT(quotation_id) DO UPDATE SET version = version + 1;
+'''
+RENDER_VERSION_TRIGGERS = {
+    f"trg_render_version_{table}_{event.lower()}": f'''
+        CREATE TRIGGER IF NOT EXISTS trg_render_version_{table}_{event.lower()}
+        AFTER {event} ON {table}
+        BEGIN {_BUMP_SQL.format(row=row)} END
+    '''
+    for table in ('quotations', 'quotation_items')
+    for event, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD'))
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, float) and value != value:
+        return None
+    if hasattr(value, 'item'):  # numpy 스칼라
+        return value.item()
+    return str(value)
+
+
+def _records(items):
+    if items is None:
+        return []
+    if hasattr(items, 'to_dict'):
+        return items.to_dict('records')
+    return list(items)
+
+
+def file_digest(path):
+    """파일 내용 해시 (mtime/크기가 같으면 재계산하지 않음)"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_digests.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    _file_digests[path] = (signature, digest)
+    return digest
+
+
+def _template_digest(template):
+    if template and not os.path.dirname(template):
+        template = os.path.join(TEMPLATE_DIR, template)
+    return file_digest(template) if template else None
+
+
+def _hash_payload(payload):
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def cache_key(kind, quotation, items=None, template=None, language=None, extra=None):
+    """렌더링 입력 전체의 해시 키 (template: 파일 경로 또는 templates/ 아래 파일명)"""
+    return _hash_payload({
+        'kind': kind,
+        'quotation': dict(quotation or {}),
+        'items': _records(items),
+        'template': _template_digest(template),
+        'language': language,
+        'settings': [file_digest(path) for path in SETTINGS_FILES],
+        'extra': extra,
+    })
+
+
+def version_key(kind, quotation_id, version, template=None, language=None, extra=None):
+    """저장된 견적서용 키 - 행 내용 대신 렌더링 버전 사용"""
+    return _hash_payload({
+        'kind': kind,
+        'quotation_id': str(quotation_id),
+        'version': version,
+        'template': _template_digest(template),
+        'language': language,
+        'settings': [file_digest(path) for path in SETTINGS_FILES],
+        'extra': extra,
+    })
+
+
+def ensure_render_versions(conn):
+    """렌더링 버전 테이블/트리거 설치 (견적서 테이블이 없으면 건너뜀)"""
+    conn.execute(_RENDER_VERSIONS_SQL)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    installed = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    for name, sql in RENDER_VERSION_TRIGGERS.items():
+        table = 'quotation_items' if '_quotation_items_' in name else 'quotations'
+        if name not in installed and table in tables:
+            conn.execute(sql)
+    conn.commit()
+
+
+def quotation_version(quotation_id, db_path='erp_system.db'):
+    """견적서 렌더링 버전 (행 1개 조회) - 트리거 설치 전 생성된 견적서는 0"""
+    with sqlite3.connect(db_path) as conn:
+        if db_path not in _versioned_dbs:
+            ensure_render_versions(conn)
+            _versioned_dbs.add(db_path)
+        row = conn.execute(
+            "SELECT version FROM quotation_render_versions WHERE quotation_id = ?", (str(quotation_id),)
+        ).fetchone()
+    return row[0] if row else 0
+
+
+def quotation_versions(quotation_ids, db_path='erp_system.db'):
+    """여러 견적서의 렌더링 버전을 한 번에 조회 → {견적서 ID: 버전}"""
+    ids = [str(quotation_id) for quotation_id in quotation_ids]
+    versions = dict.fromkeys(ids, 0)
+    with sqlite3.connect(db_path) as conn:
+        if db_path not in _versioned_dbs:
+            ensure_render_versions(conn)
+            _versioned_dbs.add(db_path)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            versions.update(conn.execute(
+                f"SELECT quotation_id, version FROM quotation_render_versions WHERE quotation_id IN ({placeholders})",
+                chunk).fetchall())
+    return versions
+
+
+def _owner_prefix(quotation_id):
+    """파일명에 쓰는 견적서 식별자 (견적서별 무효화용)"""
+    return re.sub(r'[^A-Za-z0-9_-]', '_', str(quotation_id or 'draft'))
+
+
+def _path(quotation_id, key, ext):
+    return os.path.join(CACHE_DIR, f"{_owner_prefix(quotation_id)}__{key}.{ext}")
+
+
+def _ensure_total():
+    global _total_bytes
+    if _total_bytes is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _total_bytes = sum(entry.stat().st_size for entry in os.scandir(CACHE_DIR) if entry.is_file())
+    return _total_bytes
+
+
+def get(quotation_id, key, ext='html'):
+    """캐시 조회 (적중 시 mtime을 갱신해 LRU 순서 유지)"""
+    path = _path(quotation_id, key, ext)
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        os.utime(path, None)
+        return content
+    except OSError:
+        return None
+
+
+def put(quotation_id, key, content, ext='html', max_bytes=None):
+    """캐시 저장 후 용량 초과분 정리"""
+    global _total_bytes
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    path = _path(quotation_id, key, ext)
+    with _lock:
+        _ensure_total()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        previous = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        _total_bytes += len(content) - previous
+        _evict(max_bytes or MAX_CACHE_BYTES)
+
+
+def _evict(max_bytes):
+    """가장 오래 사용하지 않은 파일부터 삭제 (잠금 보유 상태에서 호출)"""
+    global _total_bytes
+    if _total_bytes <= max_bytes:
+        return
+    entries = sorted((entry for entry in os.scandir(CACHE_DIR) if entry.is_file()),
+                     key=lambda entry: entry.stat().st_mtime)
+    _total_bytes = sum(entry.stat().st_size for entry in entries)
+    for entry in entries:
+        if _total_bytes <= max_bytes * 0.9:
+            break
+        try:
+            size = entry.stat().st_size
+            os.remove(entry.path)
+            _total_bytes -= size
+        except OSError:
+            pass
+
+
+def _get_or_render(key, quotation_id, render, ext):
+    try:
+        content = get(quotation_id, key, ext) if key is not None else None
+    except Exception as e:
+        print(f"렌더링 캐시 조회 오류: {e}")
+        key, content = None, None
+
+    if content is None:
+        content = render()
+        if content is None:
+            return None
+        if key is not None:
+            try:
+                put(quotation_id, key, content, ext)
+            except Exception as e:
+                print(f"렌더링 캐시 저장 오류: {e}")
+        return content
+
+    return content.decode('utf-8') if ext == 'html' else content
+
+
+def get_or_render(kind, quotation_id, render, quotation=None, items=None, template=None,
+                  language=None, extra=None, ext='html'):
+    """캐시에 있으면 반환, 없으면 render()로 생성해 저장 (작성 중인 견적서 등 입력 내용 해시 키)
+
+    render()는 str 또는 bytes를 반환하며 None이면 캐싱하지 않습니다.
+    반환 타입은 ext가 'html'이면 str, 그 외는 bytes입니다.
+    """
+    try:
+        key = cache_key(kind, quotation, items, template, language, extra)
+    except Exception as e:
+        print(f"렌더링 캐시 키 오류: {e}")
+        key = None
+    return _get_or_render(key, quotation_id, render, ext)
+
+
+def get_or_render_version(kind, quotation_id, render, version, template=None, language=None,
+                          extra=None, ext='html'):
+    """저장된 견적서 캐시 - 적중 시 행을 읽지 않음 (render()가 직접 조회)
+
+    version은 quotation_version() 값을 사용합니다.
+    """
+    try:
+        key = version_key(kind, quotation_id, version, template, language, extra)
+    except Exception as e:
+        print(f"렌더링 캐시 키 오류: {e}")
+        key = None
+    return _get_or_render(key, quotation_id, render, ext)
+
+
+def invalidate_quotation(quotation_id):
+    """견적서 관련 캐시 파일 삭제"""
+    _remove(lambda name: name.startswith(f"{_owner_prefix(quotation_id)}__"))
+
+
+def invalidate_all():
+    """전체 캐시 삭제 (회사/PDF 설정 변경 시)"""
+    _remove(lambda name: True)
+
+
+def _remove(predicate):
+    global _total_bytes
+    if not os.path.isdir(CACHE_DIR):
+        return
+    with _lock:
+        for entry in os.scandir(CACHE_DIR):
+            if entry.is_file() and predicate(entry.name):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+        _total_bytes = None
@@ -0,0 +1,146 @@
+"""
+보고서용 다중 통화 재평가
+(금액, 통화, 날짜) 컬럼이 있는 DataFrame을 보고 통화(VND/USD/KRW)로 한 번에 환산
+
+- method='transaction': 거래일 기준 일별 환율 (exchange_rates)
+- method='management': 거래 연도의 관리 환율 (yearly_management_rates,
+  get_management_rate_by_year_currency()와 같은 USD 기준 값)
+  year를 지정하면 모든 행에 해당 연도(보고 기간)의 관리 환율 적용
+  해당 연도 이전 관리 환율이 없으면 이후 연도 환율을 쓰지 않고 NaN
+- 환율 조회는 utils.exchange_rate_service의 메모리 행렬을 통화별로 한 번씩 사용
+  (db_path를 주지 않으면 활성 백엔드의 환율 - PostgreSQL은 관리 환율만 있음)
+- 환율이 없는 행은 NaN (fill_missing=True면 원래 금액 유지)
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.exchange_rate_service import get_rate_service, to_days
+
+REPORTING_CURRENCIES = ('VND', 'USD', 'KRW')
+DEFAULT_REPORTING_CURRENCY = 'VND'
+
+# 재평가 방식 → 환율 서비스 종류
+RATE_METHODS = {
+    'transaction': 'daily',
+    'management': 'management',
+}
+
+# 보고 통화 표시 형식 (기호, 소수 자릿수)
+CURRENCY_FORMATS = {
+    'VND': ('₫', 0),
+    'USD': ('$', 2),
+    'KRW': ('₩', 0),
+}
+
+
+def amount_column(to_currency):
+    """재평가 금액 컬럼 이름 (예: amount_vnd)"""
+    return f"amount_{to_currency.lower()}"
+
+
+def format_amount(value, currency):
+    """보고 통화 금액 표시 문자열"""
+    symbol, digits = CURRENCY_FORMATS.get(currency, ('', 2))
+    if value is None or value != value:
+        return '-'
+    return f"{symbol}{value:,.{digits}f}"
+
+
+def revalue(df, to_currency=DEFAULT_REPORTING_CURRENCY, amount_col='amount', currency_col='currency',
+            date_col=None, method='transaction', year=None, output_col=None, rate_col='fx_rate',
+            default_currency=DEFAULT_REPORTING_CURRENCY, fill_missing=False, db_path=None):
+    """DataFrame 금액 컬럼을 보고 통화로 재평가 (원본은 변경하지 않음)
+
+    Args:
+        df: 금액/통화(/날짜) 컬럼이 있는 DataFrame
+        to_currency: 보고 통화 (VND, USD, KRW)
+        date_col: 환율 기준일 컬럼 (None이면 최신 환율)
+        method: 'transaction'(거래일 환율) 또는 'management'(관리 환율)
+        year: method='management'일 때 모든 행에 적용할 관리 환율 연도
+        output_col: 재평가 금액 컬럼 (기본 amount_<통화>)
+        rate_col: 적용 환율 컬럼 (None이면 추가하지 않음)
+        default_currency: 통화가 비어 있는 행의 통화
+        fill_missing: 환율이 없는 행을 원래 금액으로 채울지 여부
+
+    Returns:
+        DataFrame: output_col, rate_col 컬럼이 추가된 복사본
+    """
+    if to_currency not in REPORTING_CURRENCIES:
+        raise ValueError(f"지원하지 않는 보고 통화: {to_currency}")
+    if method not in RATE_METHODS:
+        raise ValueError(f"지원하지 않는 재평가 방식: {method}")
+
+    output_col = output_col or amount_column(to_currency)
+    result = df.copy()
+    if result.empty:
+        result[output_col] = np.array([], dtype=np.float64)
+        if rate_col:
+            result[rate_col] = np.array([], dtype=np.float64)
+        return result
+
+    rates = revaluation_rates(
+        result[currency_col] if currency_col in result.columns else None,
+        to_currency,
+        dates=result[date_col] if date_col and date_col in result.columns else None,
+        method=method, year=year, default_currency=default_currency,
+        size=len(result), db_path=db_path,
+    )
+    amounts = _to_float(result[amount_col])
+    converted = amounts * rates
+    if fill_missing:
+        converted = np.where(np.isnan(rates), amounts, converted)
+
+    result[output_col] = converted
+    if rate_col:
+        result[rate_col] = rates
+    return result
+
+
+def revaluation_rates(currencies, to_currency, dates=None, method='transaction', year=None,
+                      default_currency=DEFAULT_REPORTING_CURRENCY, size=None, db_path=None):
+    """행별 환율 배열 (통화별로 환율 서비스 1회 조회, 환율이 없으면 NaN)"""
+    if currencies is None:
+        currencies = np.full(size, default_currency, dtype=object)
+    else:
+        # 문자열이 아니거나 빈 값은 기본 통화
+        codes = pd.Series(np.asarray(currencies, dtype=object), dtype=object).str.strip().str.upper()
+        currencies = codes.where(codes.notna() & (codes != ''), default_currency).to_numpy(dtype=object)
+
+    kind = RATE_METHODS[method]
+    if method == 'management' and year is not None:
+        days = np.full(currencies.shape, np.datetime64(f"{int(year):04d}-12-31", 'D'))
+    elif dates is None:
+        days = np.full(currencies.shape, np.datetime64('NaT', 'D'))
+    else:
+        days = to_days(dates)
+
+    service = get_rate_service(db_path)
+    rates = np.full(currencies.shape, np.nan)
+    for currency in set(currencies.tolist()):
+        mask = currencies == currency
+        found = service.rates(currency, to_currency, days[mask], kind, _latest_if_missing(method))
+        if found is not None:
+            rates[mask] = found
+    return rates
+
+
+def reporting_rate(from_currency, to_currency, as_of=None, method='transaction', default=None,
+                   db_path=None):
+    """환율 1개 (보고 화면의 단일 환산용, 없으면 default)"""
+    rate = get_rate_service(db_path).rate(from_currency, to_currency, as_of, RATE_METHODS[method],
+                                          _latest_if_missing(method))
+    return default if rate is None else rate
+
+
+def _latest_if_missing(method):
+    """기준일 이전 환율이 없을 때 최신 환율을 쓸지 (관리 환율은 이후 연도 값을 쓰지 않음)"""
+    return method != 'management'
+
+
+def _to_float(values):
+    """금액 컬럼 → float 배열 (숫자가 아니면 0)"""
+    array = np.asarray(values)
+    if array.dtype.kind not in 'iuf':
+        array = pd.to_numeric(pd.Series(array, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+    return np.nan_to_num(array.astype(np.float64))
@@ -0,0 +1,252 @@
+"""
+문서 템플릿 엔진
+견적서, 송장, 구매 주문서, 배송증 등 인쇄용 HTML 문서가 공유하는 템플릿 렌더러
+
+- 템플릿은 한 번만 파싱해 노드 트리로 컴파일하고 파일 수정 시각(mtime) 기준으로 캐싱
+- 렌더링은 노드 트리를 한 번 순회하며 조각을 모아 마지막에 한 번만 join (단일 패스)
+- 변수 출력은 기본적으로 HTML 이스케이프, |raw 필터로만 원문 출력
+
+문법:
+    {{ name }}, {{ item.amount|money }}, {{ due_date|default:"N/A" }}, {{ date|default:today }}
+    {% for item in items %} ... {{ loop.index }} ... {% endfor %}
+    {% if notes %} ... {% else %} ... {% endif %}
+"""
+
+import os
+import re
+import html
+import math
+import threading
+
+TEMPLATE_DIR = 'templates'
+
+_TOKEN_RE = re.compile(r'({{.*?}}|{%.*?%})', re.S)
+_FOR_RE = re.compile(r'^for\s+(\w+)\s+in\s+([\w.]+)$')
+_IF_RE = re.compile(r'^if\s+(not\s+)?([\w.]+)$')
+_FILTER_RE = re.compile(r'^(\w+)(?::(?:"(.*)"|([\w.]+)))?$', re.S)
+
+
+class TemplateError(Exception):
+    """템플릿 문법 오류"""
+
+
+def _is_missing(value):
+    """None / NaN / 빈 문자열을 값 없음으로 처리"""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and value == ''
+
+
+def _to_number(value):
+    if _is_missing(value):
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _text(value):
+    if _is_missing(value):
+        return ''
+    return str(value)
+
+
+# 필터: (값, 인자) -> 값. 출력은 이후 이스케이프됨 (raw 제외)
+FILTERS = {
+    'money': lambda value, arg: f"{_to_number(value):,.0f}",
+    'money2': lambda value, arg: f"{_to_number(value):,.2f}",
+    'number': lambda value, arg: f"{int(_to_number(value)):,}",
+    'percent': lambda value, arg: f"{_to_number(value):.1f}",
+    'default': lambda value, arg: arg if _is_missing(value) else value,
+    'upper': lambda value, arg: _text(value).upper(),
+}
+
+
+def _resolve(context, path):
+    """점 표기 경로 조회 (dict 키 또는 속성)"""
+    value = context
+    for part in path.split('.'):
+        if value is None:
+            return None
+        if isinstance(value, dict) or hasattr(value, 'get'):
+            try:
+                value = value.get(part)
+                continue
+            except TypeError:
+                pass
+        value = getattr(value, part, None)
+    return value
+
+
+def _truthy(value):
+    if _is_missing(value):
+        return False
+    if hasattr(value, 'empty'):
+        return not value.empty
+    return bool(value)
+
+
+class _Var:
+    __slots__ = ('path', 'filters', 'raw')
+
+    def __init__(self, expression):
+        parts = [p.strip() for p in expression.split('|')]
+        self.path = parts[0]
+        self.filters = []
+        self.raw = False
+        for spec in parts[1:]:
+            if spec == 'raw':
+                self.raw = True
+                continue
+            match = _FILTER_RE.match(spec)
+            if not match or match.group(1) not in FILTERS:
+                raise TemplateError(f"알 수 없는 필터: {spec}")
+            # 인자: "문자열" 또는 컨텍스트 변수 경로
+            self.filters.append((FILTERS[match.group(1)], match.group(2), match.group(3)))
+
+    def render(self, context, out):
+        value = _resolve(context, self.path)
+        for func, literal, arg_path in self.filters:
+            value = func(value, _resolve(context, arg_path) if arg_path else literal)
+        text = _text(value)
+        out.append(text if self.raw else html.escape(text))
+
+
+class _For:
+    __slots__ = ('name', 'path', 'body')
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.body = []
+
+    def render(self, context, out):
+        items = _resolve(context, self.path)
+        if _is_missing(items):
+            return
+        if hasattr(items, 'to_dict'):  # pandas DataFrame
+            items = items.to_dict('records')
+        items = list(items)
+        total = len(items)
+        scope = dict(context)
+        for index, item in enumerate(items):
+            scope[self.name] = item
+            scope['loop'] = {'index': index + 1, 'index0': index,
+                             'first': index == 0, 'last': index == total - 1}
+            _render_nodes(self.body, scope, out)
+
+
+class _If:
+    __slots__ = ('negate', 'path', 'body', 'orelse')
+
+    def __init__(self, negate, path):
+        self.negate = negate
+        self.path = path
+        self.body = []
+        self.orelse = []
+
+    def render(self, context, out):
+        condition = _truthy(_resolve(context, self.path))
+        if self.negate:
+            condition = not condition
+        _render_nodes(self.body if condition else self.orelse, context, out)
+
+
+def _render_nodes(nodes, context, out):
+    for node in nodes:
+        if type(node) is str:
+            out.append(node)
+        else:
+            node.render(context, out)
+
+
+def _parse(source, name):
+    """소스를 노드 트리로 변환"""
+    root = []
+    stack = [(None, root)]
+    for token in _TOKEN_RE.split(source):
+        if not token:
+            continue
+        current = stack[-1][1]
+        if token.startswith('{{') and token.endswith('}}'):
+            current.append(_Var(token[2:-2].strip()))
+        elif token.startswith('{%') and token.endswith('%}'):
+            tag = token[2:-2].strip()
+            for_match = _FOR_RE.match(tag)
+            if_match = _IF_RE.match(tag)
+            if for_match:
+                node = _For(for_match.group(1), for_match.group(2))
+                current.append(node)
+                stack.append((node, node.body))
+            elif if_match:
+                node = _If(bool(if_match.group(1)), if_match.group(2))
+                current.append(node)
+                stack.append((node, node.body))
+            elif tag == 'else':
+                node = stack[-1][0]
+                if not isinstance(node, _If):
+                    raise TemplateError(f"{name}: else 위치 오류")
+                stack[-1] = (node, node.orelse)
+            elif tag in ('endfor', 'endif'):
+                node = stack.pop()[0]
+                expected = _For if tag == 'endfor' else _If
+                if not isinstance(node, expected):
+                    raise TemplateError(f"{name}: {tag} 짝이 맞지 않음")
+            else:
+                raise TemplateError(f"{name}: 알 수 없는 태그 {tag}")
+        else:
+            current.append(token)
+    if len(stack) != 1:
+        raise TemplateError(f"{name}: 닫히지 않은 블록")
+    return root
+
+
+class Template:
+    """컴파일된 템플릿"""
+
+    def __init__(self, source, name='<string>'):
+        self.name = name
+        self.nodes = _parse(source, name)
+
+    def render(self, context=None, **kwargs):
+        scope = dict(context or {})
+        scope.update(kwargs)
+        out = []
+        _render_nodes(self.nodes, scope, out)
+        return ''.join(out)
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def get_template(name):
+    """템플릿 파일을 컴파일해 반환 (파일이 바뀌지 않았으면 캐시 사용)"""
+    path = name if os.path.isabs(name) or os.path.dirname(name) else os.path.join(TEMPLATE_DIR, name)
+    mtime = os.path.getmtime(path)
+    cached = _cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            template = Template(f.read(), name=path)
+        _cache[path] = (mtime, template)
+        return template
+
+
+def render_template(name, context=None, **kwargs):
+    """템플릿 파일 렌더링"""
+    return get_template(name).render(context, **kwargs)
+
+
+def clear_template_cache():
+    """컴파일된 템플릿 캐시 비우기"""
+    with _cache_lock:
+        _cache.clear()